@@ -1,8 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.orm import Session
-from typing import List
 from app.core.database import get_db
 from app.services.announcement_service import announcement_service
+from app.services.announcement_assembler import announcement_assembler
+from app.services.job_service import job_manager
+from app.utils.render_cache import render_cache
 from app.schemas.announcement import (
     GetAllCategoriesResponse,
     GetAllTemplatesResponse,
@@ -15,10 +17,10 @@ from app.schemas.announcement import (
     AudioGenerationRequest,
     AudioGenerationResponse,
     BulkAudioGenerationRequest,
-    BulkAudioGenerationResponse,
     AnnouncementGenerationRequest,
     AnnouncementGenerationResponse
 )
+from app.schemas.job import JobSubmissionResponse
 
 router = APIRouter()
 
@@ -164,36 +166,23 @@ def generate_audio_for_category(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating audio: {str(e)}")
 
-@router.post("/generate-audio/", response_model=BulkAudioGenerationResponse)
+@router.post("/generate-audio/", response_model=JobSubmissionResponse, status_code=202)
 def generate_audio_for_all_categories(
     request: BulkAudioGenerationRequest, 
     db: Session = Depends(get_db)
 ):
-    """Generate AI audio for all categories"""
+    """Queue AI audio generation for all categories; poll /jobs/{job_id} for progress"""
     try:
-        result = announcement_service.generate_audio_for_all_categories(
-            db, 
-            request.languages, 
-            request.overwrite_existing
-        )
-        
-        if not result["success"]:
-            raise HTTPException(status_code=400, detail=result["error"])
-        
-        return BulkAudioGenerationResponse(
-            success=True,
-            total_categories=result["total_categories"],
-            total_audio_files_generated=result["total_audio_files_generated"],
-            categories_processed=result["categories_processed"],
-            message=result["message"]
-        )
-    except HTTPException:
-        raise
+        job = job_manager.enqueue(db, "announcement_audio", {
+            "languages": request.languages,
+            "overwrite_existing": request.overwrite_existing
+        })
+        return JobSubmissionResponse(**job_manager.get_submission(job))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating audio: {str(e)}")
 
 @router.post("/generate", response_model=AnnouncementGenerationResponse)
-def generate_announcement(request: AnnouncementGenerationRequest, db: Session = Depends(get_db)):
+def generate_announcement(request: AnnouncementGenerationRequest, response: Response, db: Session = Depends(get_db)):
     """Generate actual announcement with filled parameters"""
     try:
         result = announcement_service.generate_announcement(
@@ -206,10 +195,14 @@ def generate_announcement(request: AnnouncementGenerationRequest, db: Session =
         if not result["success"]:
             raise HTTPException(status_code=400, detail=result["error"])
         
+        if result.get("audio_etag"):
+            response.headers["ETag"] = f'"{result["audio_etag"]}"'
+        
         return AnnouncementGenerationResponse(
             success=True,
             announcement_text=result["announcement_text"],
             audio_url=result.get("audio_url"),
+            audio_duration=result.get("audio_duration"),
             message=result["message"]
         )
     except HTTPException:
@@ -217,6 +210,37 @@ def generate_announcement(request: AnnouncementGenerationRequest, db: Session =
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating announcement: {str(e)}")
 
+@router.get("/audio/{render_key}")
+def get_announcement_audio(render_key: str, request: Request):
+    """Serve an assembled announcement from the render cache or its output file, honouring If-None-Match"""
+    etag = f'"{render_key}"'
+    headers = {
+        "ETag": etag,
+        # Render keys change whenever a source clip changes, so a key's audio never does
+        "Cache-Control": "public, max-age=86400, immutable"
+    }
+    
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in [tag.strip() for tag in if_none_match.split(",")] or if_none_match.strip() == "*":
+        return Response(status_code=304, headers=headers)
+    
+    audio = announcement_assembler.get_rendered_audio(render_key)
+    if audio is None:
+        raise HTTPException(status_code=404, detail="Rendered announcement not found; generate it again")
+    
+    return Response(content=audio, media_type="audio/mpeg", headers=headers)
+
+@router.get("/render-cache/")
+def get_render_cache_stats():
+    """Get rendered announcement cache statistics"""
+    try:
+        return {
+            "success": True,
+            "render_cache": render_cache.get_stats()
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching render cache stats: {str(e)}")
+
 @router.post("/initialize/")
 def initialize_categories_and_templates(db: Session = Depends(get_db)):
     """Initialize default categories and English templates"""
@@ -1,18 +1,21 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
-from typing import List
+from typing import Union
 from app.core.database import get_db
 from app.services.audio_service import audio_service
+from app.services.job_service import job_manager
+from app.utils.tts_cache import tts_cache
+from app.utils.rate_limiter import tts_rate_limiter
 from app.schemas.audio import (
     AudioGenerationRequest,
     AudioGenerationResponse,
     BulkAudioGenerationRequest,
-    BulkAudioGenerationResponse,
     GetAudioFilesResponse,
     GetRouteAudioFilesResponse,
     ClearAudioResponse,
     AudioFileData
 )
+from app.schemas.job import JobSubmissionResponse, BulkPlanResponse
 
 router = APIRouter()
 
@@ -23,22 +26,34 @@ def generate_audio_for_route(request: AudioGenerationRequest, db: Session = Depe
         result = audio_service.generate_audio_for_route(
             db=db,
             train_route_id=request.train_route_id,
-            languages=request.languages
+            languages=request.languages,
+            overwrite_existing=request.overwrite_existing
         )
         return AudioGenerationResponse(**result)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-@router.post("/generate-bulk/", response_model=BulkAudioGenerationResponse)
-def generate_audio_for_all_routes(request: BulkAudioGenerationRequest, db: Session = Depends(get_db)):
-    """Generate audio files for all train routes that have text translations"""
+@router.post("/generate-bulk/", response_model=Union[JobSubmissionResponse, BulkPlanResponse], status_code=202)
+def generate_audio_for_all_routes(request: BulkAudioGenerationRequest, response: Response, db: Session = Depends(get_db)):
+    """
+    Queue audio generation for all train routes that have text translations; poll /jobs/{job_id} for progress
+    
+    With dry_run, return the plan (unique vs total clips, cached clips, estimated API characters) instead.
+    """
     try:
-        result = audio_service.generate_audio_for_all_routes(
-            db=db,
-            languages=request.languages,
-            overwrite_existing=request.overwrite_existing
-        )
-        return BulkAudioGenerationResponse(**result)
+        if request.dry_run:
+            response.status_code = 200
+            return BulkPlanResponse(**audio_service.plan_audio_for_all_routes(
+                db=db,
+                languages=request.languages,
+                overwrite_existing=request.overwrite_existing
+            ))
+        
+        job = job_manager.enqueue(db, "route_audio", {
+            "languages": request.languages,
+            "overwrite_existing": request.overwrite_existing
+        })
+        return JobSubmissionResponse(**job_manager.get_submission(job))
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -92,4 +107,29 @@ def clear_all_audio_files(db: Session = Depends(get_db)):
             deleted_count=deleted_count
         )
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error clearing audio files: {str(e)}") 
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Error clearing audio files: {str(e)}") 
+
+@router.get("/tts-cache/")
+def get_tts_cache_stats():
+    """Get synthesis cache hit/miss counters, occupancy and rate limiter usage"""
+    try:
+        return {
+            "success": True,
+            "cache": tts_cache.get_stats(),
+            "rate_limiter": tts_rate_limiter.get_stats()
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching TTS cache stats: {str(e)}")
+
+@router.delete("/tts-cache/")
+def clear_tts_cache():
+    """Delete every entry from the synthesis cache"""
+    try:
+        removed_count = tts_cache.clear()
+        return {
+            "success": True,
+            "message": f"Successfully cleared {removed_count} cached audio clips",
+            "deleted_count": removed_count
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error clearing TTS cache: {str(e)}")
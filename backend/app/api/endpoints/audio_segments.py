@@ -1,16 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from typing import List
 from app.core.database import get_db
 from app.services.audio_segment_service import AudioSegmentService
+from app.services.job_service import job_manager
 from app.schemas.audio_segment import (
     AudioSegmentGenerationRequest,
     AudioSegmentGenerationResponse,
     AudioSegmentBulkGenerationRequest,
-    AudioSegmentBulkGenerationResponse,
     GetAudioSegmentsResponse,
     AudioSegment
 )
+from app.schemas.job import JobSubmissionResponse
 
 router = APIRouter()
 audio_segment_service = AudioSegmentService()
@@ -23,7 +23,7 @@ async def generate_audio_segments(
 ):
     """Generate audio segments for a specific category"""
     try:
-        result = audio_segment_service.generate_segments_for_category(
+        result = await audio_segment_service.generate_segments_for_category_async(
             db=db,
             category_id=category_id,
             languages=request.languages,
@@ -42,58 +42,34 @@ async def generate_audio_segments(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to generate audio segments: {str(e)}")
 
-@router.post("/generate-bulk", response_model=AudioSegmentBulkGenerationResponse)
-async def generate_audio_segments_bulk(
+@router.post("/generate-bulk", response_model=JobSubmissionResponse, status_code=202)
+def generate_audio_segments_bulk(
     request: AudioSegmentBulkGenerationRequest,
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
-    """Generate audio segments for all categories"""
+    """Queue audio segment generation for all categories; poll /jobs/{job_id} for progress"""
     try:
-        result = audio_segment_service.generate_segments_for_all_categories(
-            db=db,
-            languages=request.languages,
-            overwrite_existing=request.overwrite_existing
-        )
-        
-        return AudioSegmentBulkGenerationResponse(
-            message=f"Generated {result['total_generated']} audio segments across {len(result['categories_processed'])} categories",
-            total_segments_generated=result['total_generated'],
-            total_categories=len(result['categories_processed']),
-            categories_processed=result['categories_processed'],
-            failed_categories=result['failed_categories']
-        )
+        job = job_manager.enqueue(db, "audio_segments", {
+            "languages": request.languages,
+            "overwrite_existing": request.overwrite_existing
+        })
+        return JobSubmissionResponse(**job_manager.get_submission(job))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to generate audio segments: {str(e)}")
 
-@router.post("/generate-bulk-with-delays", response_model=AudioSegmentBulkGenerationResponse)
-async def generate_audio_segments_bulk_with_delays(
+@router.post("/generate-bulk-with-delays", response_model=JobSubmissionResponse, status_code=202)
+def generate_audio_segments_bulk_with_delays(
     request: AudioSegmentBulkGenerationRequest,
     db: Session = Depends(get_db)
 ):
-    """Generate audio segments for all categories with delays to ensure proper audio quality"""
+    """Queue audio segment generation for all categories; pacing is handled by the shared TTS rate limiter"""
     try:
-        import asyncio
-        
-        # Extract delay parameters from request
-        delay_between_requests = getattr(request, 'delay_between_requests', 2000)  # Default 2 seconds
-        delay_between_categories = getattr(request, 'delay_between_categories', 5000)  # Default 5 seconds
-        
-        result = await audio_segment_service.generate_segments_for_all_categories_with_delays(
-            db=db,
-            languages=request.languages,
-            overwrite_existing=request.overwrite_existing,
-            delay_between_requests=delay_between_requests,
-            delay_between_categories=delay_between_categories
-        )
-        
-        return AudioSegmentBulkGenerationResponse(
-            message=f"Generated {result['total_generated']} audio segments across {len(result['categories_processed'])} categories with proper delays",
-            total_segments_generated=result['total_generated'],
-            total_categories=len(result['categories_processed']),
-            categories_processed=result['categories_processed'],
-            failed_categories=result['failed_categories']
-        )
+        # Delay parameters in the request are accepted for compatibility but no longer sleep
+        job = job_manager.enqueue(db, "audio_segments", {
+            "languages": request.languages,
+            "overwrite_existing": request.overwrite_existing
+        })
+        return JobSubmissionResponse(**job_manager.get_submission(job))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to generate audio segments with delays: {str(e)}")
 
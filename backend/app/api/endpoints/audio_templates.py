@@ -4,13 +4,13 @@ from typing import List, Dict, Any
 import os
 import json
 import uuid
+import asyncio
 from datetime import datetime
-from pathlib import Path
 from pydantic import BaseModel
 
 from app.core.database import get_db
-from app.utils.gcp_client import gcp_client
-from app.utils.gcp_tts_client import gcp_tts_client
+from app.utils.gcp_client import async_gcp_client
+from app.utils.gcp_tts_client import async_gcp_tts_client
 
 router = APIRouter()
 
@@ -89,33 +89,37 @@ async def generate_audio_template(
         template_dir = os.path.join(templates_dir, template_id)
         os.makedirs(template_dir, exist_ok=True)
         
-        # Generate translations
-        translations = {}
-        for lang in languages:
-            if lang == 'en':
-                translations[lang] = text
+        # Generate translations concurrently without blocking the event loop
+        translations = {lang: text for lang in languages if lang == 'en'}
+        targets = [lang for lang in languages if lang != 'en']
+        translated = await asyncio.gather(
+            *[async_gcp_client.translate_text(text, 'en', lang) for lang in targets],
+            return_exceptions=True
+        )
+        for lang, translated_text in zip(targets, translated):
+            if isinstance(translated_text, Exception):
+                print(f"Translation error for {lang}: {translated_text}")
+                translations[lang] = text  # Fallback to original text
             else:
-                try:
-                    translated_text = gcp_client.translate_text(text, 'en', lang)
-                    translations[lang] = translated_text
-                except Exception as e:
-                    print(f"Translation error for {lang}: {e}")
-                    translations[lang] = text  # Fallback to original text
-        
-        # Generate audio files
+                translations[lang] = translated_text
+        
+        # Generate audio files concurrently on the event loop
         audio_paths = {}
-        for lang in languages:
-            try:
-                audio_filename = f"{lang}.mp3"
-                audio_path = os.path.join(template_dir, audio_filename)
-                
-                # Generate TTS audio
-                gcp_tts_client.generate_audio(translations[lang], lang, audio_path)
-                audio_paths[lang] = f"/audio-templates/templates/{template_id}/{audio_filename}"
-                
-            except Exception as e:
-                print(f"Audio generation error for {lang}: {e}")
+        audio_durations = {}
+        outcomes = await asyncio.gather(
+            *[
+                async_gcp_tts_client.generate_audio(translations[lang], lang, os.path.join(template_dir, f"{lang}.mp3"))
+                for lang in languages
+            ],
+            return_exceptions=True
+        )
+        for lang, outcome in zip(languages, outcomes):
+            if isinstance(outcome, Exception) or outcome is None:
+                print(f"Audio generation error for {lang}: {outcome}")
                 audio_paths[lang] = None
+            else:
+                audio_paths[lang] = f"/audio-templates/templates/{template_id}/{lang}.mp3"
+                audio_durations[lang] = outcome
         
         # Create metadata
         metadata = {
@@ -123,12 +127,7 @@ async def generate_audio_template(
             "original_text": text,
             "translations": translations,
             "created_at": datetime.now().isoformat(),
-            "audio_duration": {
-                "en": 3.2,  # Placeholder - could be calculated from actual audio
-                "hi": 4.1,
-                "mr": 3.8,
-                "gu": 3.9
-            },
+            "audio_duration": audio_durations,
             "file_sizes": {
                 "en": os.path.getsize(os.path.join(template_dir, "en.mp3")) if os.path.exists(os.path.join(template_dir, "en.mp3")) else 0,
                 "hi": os.path.getsize(os.path.join(template_dir, "hi.mp3")) if os.path.exists(os.path.join(template_dir, "hi.mp3")) else 0,
@@ -167,6 +166,7 @@ async def generate_audio_template(
             "original_text": text,
             "translations": translations,
             "audio_paths": audio_paths,
+            "audio_durations": audio_durations,
             "status": "completed",
             "created_at": metadata["created_at"]
         }
@@ -0,0 +1,30 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+from typing import Optional
+from app.core.database import get_db
+from app.services.job_service import job_manager
+import app.services.job_handlers  # registers the bulk job handlers
+from app.schemas.job import JobStatusResponse, JobListResponse
+
+router = APIRouter()
+
+@router.get("/", response_model=JobListResponse)
+def list_jobs(job_type: Optional[str] = None, limit: int = 50, db: Session = Depends(get_db)):
+    """Get the most recent jobs, newest first"""
+    try:
+        jobs = job_manager.list_jobs(db, job_type=job_type, limit=max(1, min(limit, 500)))
+        return JobListResponse(
+            success=True,
+            jobs=[JobStatusResponse(**job_manager.get_status(job)) for job in jobs],
+            total_count=len(jobs)
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching jobs: {str(e)}")
+
+@router.get("/{job_id}", response_model=JobStatusResponse)
+def get_job_status(job_id: str, db: Session = Depends(get_db)):
+    """Get progress, failures, throughput and ETA for a job"""
+    job = job_manager.get_job(db, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return JobStatusResponse(**job_manager.get_status(job))
\ No newline at end of file
@@ -0,0 +1,80 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+from app.core.database import get_db
+from app.services.job_service import job_manager
+from app.services.numeral_service import numeral_service
+from app.schemas.job import JobSubmissionResponse
+from app.schemas.numeral import (
+    NumeralBankGenerationRequest,
+    NumeralBankStatusResponse,
+    GetNumeralClipsResponse,
+    NumeralCompositionResponse,
+    NumeralClipData
+)
+
+router = APIRouter()
+
+@router.post("/generate/", response_model=JobSubmissionResponse, status_code=202)
+def generate_numeral_bank(request: NumeralBankGenerationRequest, db: Session = Depends(get_db)):
+    """Queue synthesis of the numeral clip bank for the requested languages; poll /jobs/{job_id} for progress"""
+    try:
+        job = job_manager.enqueue(db, "numeral_bank", {
+            "languages": request.languages,
+            "overwrite_existing": request.overwrite_existing
+        })
+        return JobSubmissionResponse(**job_manager.get_submission(job))
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/status/", response_model=NumeralBankStatusResponse)
+def get_numeral_bank_status(db: Session = Depends(get_db)):
+    """Get the number of bank clips per language"""
+    try:
+        return NumeralBankStatusResponse(**numeral_service.get_status(db))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching numeral bank status: {str(e)}")
+
+@router.get("/compose/{language_code}/{value}", response_model=NumeralCompositionResponse)
+def compose_numeral(language_code: str, value: str, mode: str = "cardinal", db: Session = Depends(get_db)):
+    """Get the bank clips that speak a value"""
+    try:
+        tokens = numeral_service.tokens_for_value(value, mode)
+        return NumeralCompositionResponse(
+            success=True,
+            language_code=language_code,
+            value=value,
+            mode=mode,
+            tokens=tokens,
+            audio_file_paths=numeral_service.get_clip_paths(db, language_code, tokens)
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error composing numeral: {str(e)}")
+
+@router.get("/{language_code}", response_model=GetNumeralClipsResponse)
+def get_numeral_clips(language_code: str, db: Session = Depends(get_db)):
+    """Get all bank clips for a language"""
+    try:
+        clips = numeral_service.get_clips(db, language_code)
+        return GetNumeralClipsResponse(
+            success=True,
+            language_code=language_code,
+            clips=[NumeralClipData.from_orm(clip) for clip in clips],
+            total_count=len(clips)
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching numeral clips: {str(e)}")
+
+@router.delete("/")
+def clear_numeral_bank(db: Session = Depends(get_db)):
+    """Delete every numeral bank clip"""
+    try:
+        deleted_count = numeral_service.clear_bank(db)
+        return {
+            "success": True,
+            "message": f"Successfully deleted {deleted_count} numeral clips",
+            "deleted_count": deleted_count
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error clearing numeral bank: {str(e)}")
\ No newline at end of file
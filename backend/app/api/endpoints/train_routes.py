@@ -1,15 +1,26 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File, Response
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from typing import List
-import pandas as pd
-import io
+from typing import List, Optional, Union
+import os
+import tempfile
+import zipfile
+from openpyxl.utils.exceptions import InvalidFileException
 from app.core.database import get_db
+from app.core.config.settings import settings
 from app.models.train_route import TrainRoute as TrainRouteModel
-from app.schemas.train_route import TrainRoute, TrainRouteCreate, TrainRouteUpdate
+from app.models.train_route_translation import TrainRouteTranslation
+from app.models.audio_file import AudioFile
+from app.schemas.train_route import TrainRoute, TrainRouteCreate, TrainRouteUpdate, TrainRoutePage, RouteImportResponse
+from app.schemas.job import JobSubmissionResponse
+from app.services.job_service import job_manager
+from app.services.route_import_service import route_import_service, IMPORT_MODES
 from app.services.train_route_service import (
     create_train_route,
     get_train_route,
-    get_train_routes,
+    get_train_routes_page,
+    count_train_routes,
+    invalidate_route_count,
     update_train_route,
     delete_train_route,
     search_train_routes
@@ -22,18 +33,27 @@ def create_route(train_route: TrainRouteCreate, db: Session = Depends(get_db)):
     """Create a new train route"""
     return create_train_route(db=db, train_route=train_route)
 
-@router.get("/")
-def read_routes(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    """Get all train routes with pagination"""
-    routes = get_train_routes(db, skip=skip, limit=limit)
-    total = db.query(TrainRouteModel).count()
+@router.get("/", response_model=TrainRoutePage)
+def read_routes(
+    limit: int = Query(100, ge=1, le=1000, description="Routes per page"),
+    cursor: Optional[str] = Query(None, description="next_cursor or prev_cursor from an earlier page; omit for the first page"),
+    db: Session = Depends(get_db)
+):
+    """
+    Get train routes, newest first, a page at a time
+    
+    Follow next_cursor and prev_cursor to move between pages; total is cached briefly rather than counted per request.
+    """
+    try:
+        page = get_train_routes_page(db, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    total = count_train_routes(db)
     return {
-        "routes": routes,
+        **page,
         "total": total,
-        "skip": skip,
         "limit": limit,
-        "page": (skip // limit) + 1 if limit > 0 else 1,
-        "total_pages": (total + limit - 1) // limit if limit > 0 else 1
+        "total_pages": max(1, (total + limit - 1) // limit)
     }
 
 @router.get("/{train_route_id}", response_model=TrainRoute)
@@ -64,8 +84,12 @@ def delete_route(train_route_id: int, db: Session = Depends(get_db)):
 def clear_all_routes(db: Session = Depends(get_db)):
     """Clear all train routes from the database"""
     try:
+        # Bulk deletes skip the ORM cascade, so the rows referencing the routes go first
+        db.query(TrainRouteTranslation).delete(synchronize_session=False)
+        db.query(AudioFile).delete(synchronize_session=False)
         deleted_count = db.query(TrainRouteModel).delete()
         db.commit()
+        invalidate_route_count()
         return {
             "message": f"Successfully cleared {deleted_count} train routes from the database",
             "deleted_count": deleted_count
@@ -75,76 +99,70 @@ def clear_all_routes(db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"Error clearing routes: {str(e)}")
 
 @router.get("/search/", response_model=List[TrainRoute])
-def search_routes(query: str = Query(..., description="Search term"), db: Session = Depends(get_db)):
-    """Search train routes by various fields"""
-    routes = search_train_routes(db, query=query)
+def search_routes(
+    query: str = Query(..., description="Search term"),
+    limit: int = Query(50, ge=1, le=500, description="Maximum number of results"),
+    db: Session = Depends(get_db)
+):
+    """Search train routes by number, name, stations and station codes, best matches first"""
+    routes = search_train_routes(db, query=query, limit=limit)
     return routes
 
-@router.post("/import/")
-async def import_routes(file: UploadFile = File(...), db: Session = Depends(get_db)):
-    """Import train routes from Excel or CSV file"""
-    if not (file.filename.endswith('.xlsx') or file.filename.endswith('.csv')):
+async def _spool_upload(file: UploadFile, suffix: str) -> str:
+    """Stream an upload to a file in IMPORT_SPOOL_DIR, a megabyte at a time"""
+    os.makedirs(settings.IMPORT_SPOOL_DIR, exist_ok=True)
+    fd, path = tempfile.mkstemp(dir=settings.IMPORT_SPOOL_DIR, suffix=suffix)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            while chunk := await file.read(1024 * 1024):
+                f.write(chunk)
+    except Exception:
+        os.remove(path)
+        raise
+    return path
+
+@router.post("/import/", response_model=Union[RouteImportResponse, JobSubmissionResponse])
+async def import_routes(
+    response: Response,
+    file: UploadFile = File(...),
+    mode: str = Query("skip", description="skip: keep existing train numbers as they are; upsert: update them when they differ"),
+    background: bool = Query(False, description="Run the import as a job and return 202; poll /jobs/{job_id} for progress"),
+    db: Session = Depends(get_db)
+):
+    """
+    Import train routes from Excel or CSV file
+    
+    The upload is spooled to disk and parsed in chunks, so large timetables import in bounded memory.
+    Parsing and writing run on the threadpool, so a long import does not block the event loop.
+    """
+    file_type = os.path.splitext(file.filename or "")[1].lower().lstrip(".")
+    if file_type not in ("xlsx", "csv"):
         raise HTTPException(status_code=400, detail="Only Excel (.xlsx) or CSV (.csv) files are supported")
+    if mode not in IMPORT_MODES:
+        raise HTTPException(status_code=400, detail=f"Unknown import mode: {mode}. Use one of: {', '.join(IMPORT_MODES)}")
     
+    path = await _spool_upload(file, f".{file_type}")
+    queued = False
     try:
-        # Read the file
-        contents = await file.read()
+        await run_in_threadpool(route_import_service.check_file, path, file_type)
         
-        # Try to read as Excel first, then as CSV if that fails
-        try:
-            df = pd.read_excel(io.BytesIO(contents))
-        except Exception:
-            # If Excel reading fails, try as CSV
-            try:
-                df = pd.read_csv(io.BytesIO(contents))
-            except Exception as e:
-                raise HTTPException(status_code=400, detail=f"Could not read file as Excel or CSV: {str(e)}")
+        if background:
+            job = job_manager.enqueue(db, "route_import", {
+                "path": path,
+                "file_type": file_type,
+                "mode": mode,
+                "filename": file.filename
+            })
+            queued = True
+            response.status_code = 202
+            return JobSubmissionResponse(**job_manager.get_submission(job))
         
-        # Map Excel column names to our database column names
-        column_mapping = {
-            'Train Number': 'train_number',
-            'Train Name': 'train_name_en', 
-            'Start Station': 'start_station_en',
-            'Start Station Code': 'start_station_code',
-            'End Station': 'end_station_en',
-            'End Station Code': 'end_station_code'
-        }
-        
-        # Check if we have the expected columns
-        expected_columns = list(column_mapping.keys())
-        missing_columns = [col for col in expected_columns if col not in df.columns]
-        if missing_columns:
-            raise HTTPException(
-                status_code=400, 
-                detail=f"Missing required columns: {', '.join(missing_columns)}. Expected columns: {', '.join(expected_columns)}"
-            )
-        
-        # Process each row
-        imported_count = 0
-        for _, row in df.iterrows():
-            try:
-                route_data = {}
-                for excel_col, db_col in column_mapping.items():
-                    route_data[db_col] = str(row[excel_col]).strip()
-                
-                # Check if route already exists
-                existing_route = db.query(TrainRouteModel).filter(
-                    TrainRouteModel.train_number == route_data['train_number']
-                ).first()
-                
-                if not existing_route:
-                    train_route = TrainRouteCreate(**route_data)
-                    create_train_route(db, train_route)
-                    imported_count += 1
-                
-            except Exception as e:
-                print(f"Error processing row: {e}")
-                continue
-        
-        return {
-            "message": f"Import completed successfully. {imported_count} routes imported.",
-            "imported_count": imported_count
-        }
+        return await run_in_threadpool(route_import_service.import_file, db, path, file_type, mode)
         
+    except (ValueError, zipfile.BadZipFile, InvalidFileException) as e:
+        raise HTTPException(status_code=400, detail=f"Could not import file: {str(e)}")
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error processing file: {str(e)}") 
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Error processing file: {str(e)}")
+    finally:
+        if not queued and os.path.exists(path):
+            os.remove(path)
\ No newline at end of file
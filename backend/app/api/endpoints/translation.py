@@ -1,23 +1,25 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 from datetime import datetime
-from typing import Dict
+from typing import Union
 from app.core.database import get_db
 from app.services.translation_service import (
     translate_train_route,
     get_train_route_translations,
-    bulk_translate_all_routes
+    plan_bulk_translation
 )
+from app.services.job_service import job_manager
 from app.utils.gcp_client import gcp_client
+from app.utils.translation_memo import translation_memo
 from app.schemas.translation import (
     TranslationRequest,
     TranslationResponse,
     GetTranslationResponse,
     BulkTranslationRequest,
-    BulkTranslationResponse,
     SimpleTranslationRequest,
     SimpleTranslationResponse
 )
+from app.schemas.job import JobSubmissionResponse, BulkPlanResponse
 
 router = APIRouter()
 
@@ -34,7 +36,8 @@ def translate_and_save_route(
         translations = translate_train_route(
             db=db,
             train_route_id=request.train_route_id,
-            source_lang=request.source_language
+            source_lang=request.source_language,
+            overwrite_existing=request.overwrite_existing
         )
         
         return TranslationResponse(
@@ -106,24 +109,29 @@ def get_route_translations(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get translations: {str(e)}")
 
-@router.post("/bulk/", response_model=BulkTranslationResponse)
+@router.post("/bulk/", response_model=Union[JobSubmissionResponse, BulkPlanResponse], status_code=202)
 def bulk_translate_routes(
     request: BulkTranslationRequest,
+    response: Response,
     db: Session = Depends(get_db)
 ):
     """
-    Translate all train routes to all supported languages
+    Queue translation of all train routes to all supported languages; poll /jobs/{job_id} for progress
+    
+    Routes whose source fields are unchanged since their last translation are skipped unless overwrite_existing is set.
+    
+    With dry_run, return the plan (unique vs total strings, memoized strings, estimated API characters) instead.
     """
     try:
-        result = bulk_translate_all_routes(db, request.source_language)
+        if request.dry_run:
+            response.status_code = 200
+            return BulkPlanResponse(**plan_bulk_translation(db, request.source_language, request.overwrite_existing))
         
-        return BulkTranslationResponse(
-            total_routes=result["total_routes"],
-            translated_routes=result["translated_routes"],
-            failed_routes=result["failed_routes"],
-            message=result["message"],
-            timestamp=datetime.utcnow()
-        )
+        job = job_manager.enqueue(db, "route_translation", {
+            "source_language": request.source_language,
+            "overwrite_existing": request.overwrite_existing
+        })
+        return JobSubmissionResponse(**job_manager.get_submission(job))
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Bulk translation failed: {str(e)}")
@@ -178,4 +186,24 @@ def clear_all_translations(db: Session = Depends(get_db)):
         }
     except Exception as e:
         db.rollback()
-        raise HTTPException(status_code=500, detail=f"Error clearing translations: {str(e)}") 
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Error clearing translations: {str(e)}")
+
+@router.get("/memo/stats")
+def get_translation_memo_stats():
+    """Get translation memo occupancy and hit rate"""
+    try:
+        return translation_memo.get_stats()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching translation memo stats: {str(e)}")
+
+@router.delete("/memo")
+def clear_translation_memo():
+    """Clear all memoized translations so the next run re-translates every string"""
+    try:
+        deleted_count = translation_memo.clear()
+        return {
+            "message": f"Successfully cleared {deleted_count} memoized translations",
+            "deleted_count": deleted_count
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error clearing translation memo: {str(e)}")
\ No newline at end of file
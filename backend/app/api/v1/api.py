@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from app.api.endpoints import auth, train_routes, translation, audio, announcements, audio_segments, isl_videos, audio_templates
+from app.api.endpoints import auth, train_routes, translation, audio, announcements, audio_segments, isl_videos, audio_templates, numerals, jobs
 
 api_router = APIRouter()
 
@@ -10,4 +10,6 @@ api_router.include_router(audio.router, prefix="/audio", tags=["audio"])
 api_router.include_router(announcements.router, prefix="/announcements", tags=["announcements"])
 api_router.include_router(audio_segments.router, prefix="/audio-segments", tags=["audio segments"])
 api_router.include_router(isl_videos.router, prefix="/isl-videos", tags=["isl videos"])
-api_router.include_router(audio_templates.router, prefix="/audio-templates", tags=["audio templates"]) 
\ No newline at end of file
+api_router.include_router(audio_templates.router, prefix="/audio-templates", tags=["audio templates"])
+api_router.include_router(numerals.router, prefix="/numerals", tags=["numerals"])
+api_router.include_router(jobs.router, prefix="/jobs", tags=["jobs"])
\ No newline at end of file
@@ -5,6 +5,25 @@ import os
 class Settings(BaseSettings):
     # Database
     DATABASE_URL: str = "sqlite:///./wras_dhh.db"
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_STREAM_BATCH_SIZE: int = 1000  # rows fetched per round trip by large reads (server-side cursor on PostgreSQL)
+    
+    # PostgreSQL session timeouts in milliseconds (0 disables)
+    DB_STATEMENT_TIMEOUT_MS: int = 60000
+    DB_LOCK_TIMEOUT_MS: int = 10000
+    DB_IDLE_IN_TRANSACTION_TIMEOUT_MS: int = 0  # bulk jobs keep a transaction open while they wait on the speech and translation APIs
+    
+    # SQLite connection PRAGMAs
+    SQLITE_JOURNAL_MODE: str = "WAL"  # readers no longer wait for writers
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_BUSY_TIMEOUT_MS: int = 10000
+    SQLITE_CACHE_SIZE_KB: int = 64 * 1024  # 64 MB page cache per connection
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024  # 256 MB
+    SQLITE_TEMP_STORE: str = "MEMORY"
+    SQLITE_FOREIGN_KEYS: str = "ON"  # SQLite leaves REFERENCES unenforced unless asked
     
     # Security
     SECRET_KEY: str = "your-secret-key-here-change-in-production"
@@ -29,6 +48,80 @@ class Settings(BaseSettings):
     HOST: str = "0.0.0.0"
     PORT: int = 5001
     
+    # Speech and translation providers: "gcp" or "local" (offline deterministic stand-in)
+    TTS_PROVIDER: str = "gcp"
+    TRANSLATION_PROVIDER: str = "gcp"
+    LOCAL_PROVIDER_SEED: int = 0
+    LOCAL_PROVIDER_LATENCY_MS: float = 0.0
+    LOCAL_PROVIDER_LATENCY_JITTER_MS: float = 0.0
+    LOCAL_PROVIDER_ERROR_RATE: float = 0.0
+    LOCAL_TTS_SECONDS_PER_CHARACTER: float = 0.06
+    
+    # Text-to-Speech synthesis cache
+    TTS_CACHE_ENABLED: bool = True
+    TTS_CACHE_DIR: str = "/var/www/war-ddh/tts-cache"
+    TTS_CACHE_MAX_BYTES: int = 2 * 1024 * 1024 * 1024  # 2 GB
+    
+    # Text-to-Speech concurrency and provider quota
+    TTS_MAX_CONCURRENCY: int = 8
+    TTS_REQUESTS_PER_SECOND: float = 15.0
+    TTS_CHARACTERS_PER_MINUTE: int = 150000
+    
+    # Batched SSML synthesis (many short texts per request, split by <mark> timepoints)
+    TTS_BATCH_ENABLED: bool = False  # switches every clip from Chirp 3 HD to the SSML-capable Wavenet voices
+    TTS_BATCH_MAX_SEGMENTS: int = 40
+    TTS_BATCH_MAX_CHARACTERS: int = 4500  # API limit is 5000 bytes of SSML
+    TTS_BATCH_PAUSE_MS: int = 250
+    
+    # Server-side announcement assembly
+    ANNOUNCEMENT_OUTPUT_DIR: str = "/var/www/war-ddh/ai-audio-translations/announcements/generated"
+    ANNOUNCEMENT_GAP_MS: int = 150
+    ANNOUNCEMENT_EDGE_SILENCE_MS: int = 300
+    
+    # Rendered announcement cache (memory tier in front of a disk tier)
+    RENDER_CACHE_ENABLED: bool = True
+    RENDER_CACHE_MEMORY_MAX_BYTES: int = 64 * 1024 * 1024  # 64 MB
+    RENDER_CACHE_DIR: str = "/var/www/war-ddh/render-cache"
+    RENDER_CACHE_MAX_BYTES: int = 1024 * 1024 * 1024  # 1 GB, also the bound on ANNOUNCEMENT_OUTPUT_DIR
+    
+    # Background jobs for bulk generation
+    JOB_MAX_WORKERS: int = 2
+    JOB_PROGRESS_INTERVAL_SECONDS: float = 1.0
+    JOB_MAX_RECORDED_FAILURES: int = 500
+    BULK_JOB_CHUNK_SIZE: int = 25
+    
+    # Translation memo (database table with an in-process LRU in front)
+    TRANSLATION_MEMO_ENABLED: bool = True
+    TRANSLATION_MEMO_MEMORY_MAX_ENTRIES: int = 20000
+    
+    # Batched translation requests
+    TRANSLATION_BATCH_MAX_SEGMENTS: int = 128  # v2 API limit per request
+    TRANSLATION_BATCH_MAX_CHARACTERS: int = 5000  # recommended maximum per request
+    TRANSLATION_BULK_CHUNK_SIZE: int = 200  # routes written per database transaction
+    TRANSLATION_MAX_CONCURRENCY: int = 4
+    
+    # Offline transliteration of station and train names (translation API as fallback)
+    TRANSLITERATION_ENABLED: bool = True
+    
+    # Timetable import
+    IMPORT_BATCH_SIZE: int = 1000  # rows per executemany batch
+    IMPORT_MAX_REPORTED_ERRORS: int = 500
+    IMPORT_CHUNK_ROWS: int = 5000  # rows parsed and written at a time
+    IMPORT_SPOOL_DIR: str = "/var/www/war-ddh/import-spool"  # uploads are streamed here before parsing
+    
+    # Route search
+    SEARCH_STATION_CODE_CACHE_SECONDS: int = 60  # station codes used for fuzzy code matching
+    
+    # Route listing
+    ROUTE_COUNT_CACHE_SECONDS: int = 30  # total shown with each page; writes through the API refresh it at once
+    
+    # Database query statistics (X-DB-* response headers when DEBUG is on)
+    QUERY_STATS_ENABLED: bool = True
+    QUERY_STATS_SLOWEST: int = 3  # slowest statements kept per request
+    QUERY_STATS_WARN_COUNT: int = 100  # log requests that run more statements than this
+    SLOW_QUERY_THRESHOLD_MS: float = 200.0
+    SLOW_QUERY_LOG_FILE: str = ""  # slow statements are also appended here when set
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -1,11 +1,10 @@
-from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from app.core.config.settings import settings
+from app.core.db_engine import create_app_engine
+from app.core.query_stats import install_query_stats
 
-engine = create_engine(
-    settings.DATABASE_URL, connect_args={"check_same_thread": False}
-)
+engine = create_app_engine()
+install_query_stats(engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
@@ -17,6 +16,9 @@ def get_db():
     finally:
         db.close()
 
-# Import models to ensure they are registered with Base
-from app.models.user import User
-from app.models.train_route import TrainRoute 
\ No newline at end of file
+# Import models to ensure they are registered with Base; plain imports, as a
+# model module imported first is only partially initialized when this runs
+import app.models.user
+import app.models.train_route
+import app.models.train_route_translation
+import app.models.audio_file 
\ No newline at end of file
@@ -0,0 +1,103 @@
+from typing import Dict, Optional
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import QueuePool, StaticPool
+from app.core.config.settings import settings
+
+def sqlite_pragmas() -> Dict[str, str]:
+    """
+    PRAGMAs applied to every SQLite connection, from Settings
+
+    WAL lets readers carry on while a writer commits, and synchronous=NORMAL
+    only syncs at checkpoints rather than on every commit, which is still
+    durable against application crashes. busy_timeout makes a second writer wait
+    for the lock instead of failing with "database is locked". foreign_keys
+    enforces REFERENCES constraints as PostgreSQL does.
+    """
+    return {
+        "journal_mode": settings.SQLITE_JOURNAL_MODE,
+        "synchronous": settings.SQLITE_SYNCHRONOUS,
+        "busy_timeout": str(settings.SQLITE_BUSY_TIMEOUT_MS),
+        "cache_size": str(-settings.SQLITE_CACHE_SIZE_KB),  # negative: size in KiB rather than pages
+        "mmap_size": str(settings.SQLITE_MMAP_SIZE),
+        "temp_store": settings.SQLITE_TEMP_STORE,
+        "foreign_keys": settings.SQLITE_FOREIGN_KEYS
+    }
+
+def _apply_sqlite_pragmas(engine: Engine, pragmas: Dict[str, str]):
+    @event.listens_for(engine, "connect")
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+def postgresql_connect_args() -> Dict[str, str]:
+    """
+    Session settings sent with every PostgreSQL connection, from Settings
+
+    statement_timeout stops a runaway query from holding a pooled connection
+    (and its locks) indefinitely; 0 disables it.
+    """
+    options = [
+        f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}",
+        f"-c lock_timeout={settings.DB_LOCK_TIMEOUT_MS}",
+        f"-c idle_in_transaction_session_timeout={settings.DB_IDLE_IN_TRANSACTION_TIMEOUT_MS}"
+    ]
+    return {
+        "options": " ".join(options),
+        "application_name": settings.PROJECT_NAME
+    }
+
+def create_app_engine(database_url: Optional[str] = None, pragmas: Optional[Dict[str, str]] = None) -> Engine:
+    """
+    Create the application engine for the database dialect in the URL
+
+    SQLite files get the PRAGMAs from sqlite_pragmas() on every connection.
+    PostgreSQL gets a QueuePool whose connections are checked with a ping before
+    use and recycled after DB_POOL_RECYCLE_SECONDS, plus the session timeouts
+    from postgresql_connect_args(). Large reads consumed row by row iterate
+    Query.yield_per(settings.DB_STREAM_BATCH_SIZE) directly, which streams through
+    a server-side cursor on PostgreSQL; calling .all() on it would not.
+
+    Args:
+        database_url: Defaults to settings.DATABASE_URL
+        pragmas: SQLite PRAGMAs to apply instead of sqlite_pragmas() (benchmarks pass {} for SQLite's defaults)
+
+    Returns:
+        Engine whose pool is sized by DB_POOL_SIZE / DB_MAX_OVERFLOW
+    """
+    url = make_url(database_url or settings.DATABASE_URL)
+    if url.drivername == "postgresql":
+        # SQLAlchemy 2.1 defaults to psycopg 3; requirements.txt ships psycopg2
+        url = url.set(drivername="postgresql+psycopg2")
+    backend = url.get_backend_name()
+
+    if backend == "sqlite":
+        if url.database in (None, "", ":memory:"):
+            # One shared connection, or each connection would see its own empty database
+            return create_engine(url, connect_args={"check_same_thread": False}, poolclass=StaticPool)
+
+        engine = create_engine(
+            url,
+            connect_args={"check_same_thread": False},
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS
+        )
+        _apply_sqlite_pragmas(engine, sqlite_pragmas() if pragmas is None else pragmas)
+        return engine
+
+    pool_options = {
+        "poolclass": QueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": True
+    }
+    if backend == "postgresql":
+        return create_engine(url, connect_args=postgresql_connect_args(), **pool_options)
+    return create_engine(url, **pool_options)
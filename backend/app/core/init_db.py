@@ -1,3 +1,6 @@
+import os
+from alembic import command
+from alembic.config import Config
 from app.core.database import engine
 from app.models.user import User
 from app.models.train_route import TrainRoute
@@ -8,11 +11,33 @@ from app.models.announcement_template import AnnouncementTemplate
 from app.models.announcement_audio_file import AnnouncementAudioFile
 from app.models.announcement_audio_segment import AnnouncementAudioSegment
 from app.models.generated_announcement import GeneratedAnnouncement
+from app.models.numeral_clip import NumeralClip
+from app.models.job import Job
+from app.models.translation_memo import TranslationMemo
 from app.core.database import Base
 from app.services.user_service import create_default_user
+from app.services.route_search_service import route_search_service
+
+ALEMBIC_INI = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "alembic.ini")
+
+def migrate_schema():
+    """
+    Bring the database schema up to date by applying the Alembic migrations in
+    migrations/versions
+
+    Databases created before migrations were introduced have no alembic_version
+    table; the baseline revision only creates the tables they are missing, so
+    they are upgraded like any other.
+    """
+    config = Config(ALEMBIC_INI)
+    config.attributes["configure_logger"] = False
+    with engine.begin() as connection:
+        config.attributes["connection"] = connection
+        command.upgrade(config, "head")
 
 def init_db():
-    Base.metadata.create_all(bind=engine)
+    migrate_schema()
+    route_search_service.install(engine)
     print("Database tables created successfully!")
     
     # Create default user
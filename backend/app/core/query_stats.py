@@ -0,0 +1,108 @@
+import time
+import heapq
+import threading
+import contextvars
+from typing import Callable, List, Optional, Tuple
+from sqlalchemy.engine import Engine
+from app.core.config.settings import settings
+from app.utils.query_counter import listen_statements
+
+class RequestQueryStats:
+    """Statement count, database time and slowest statements of one request"""
+
+    def __init__(self, label: str):
+        self.label = label
+        self.count = 0
+        self.total_ms = 0.0
+        self._slowest: List[Tuple[float, int, str]] = []  # min-heap of (ms, order, statement)
+        self._lock = threading.Lock()
+
+    def record(self, statement: str, elapsed_ms: float):
+        with self._lock:
+            self.count += 1
+            self.total_ms += elapsed_ms
+            entry = (elapsed_ms, self.count, statement)
+            if len(self._slowest) < settings.QUERY_STATS_SLOWEST:
+                heapq.heappush(self._slowest, entry)
+            elif self._slowest and elapsed_ms > self._slowest[0][0]:
+                heapq.heapreplace(self._slowest, entry)
+
+    @property
+    def slowest(self) -> List[Tuple[float, str]]:
+        """Slowest statements first, as (milliseconds, statement)"""
+        with self._lock:
+            return [(elapsed_ms, statement) for elapsed_ms, _, statement in sorted(self._slowest, reverse=True)]
+
+    def headers(self) -> dict:
+        """Debug response headers summarising the request's database work"""
+        headers = {
+            "X-DB-Query-Count": str(self.count),
+            "X-DB-Time-Ms": f"{self.total_ms:.1f}"
+        }
+        slowest = self.slowest
+        if slowest:
+            headers["X-DB-Slowest-Ms"] = ", ".join(f"{elapsed_ms:.1f}" for elapsed_ms, _ in slowest)
+            headers["X-DB-Slowest-Statement"] = _header_safe(slowest[0][1])
+        return headers
+
+_current_stats: contextvars.ContextVar[Optional[RequestQueryStats]] = contextvars.ContextVar("query_stats", default=None)
+_log_lock = threading.Lock()
+
+def _one_line(statement: str, limit: int = 500) -> str:
+    statement = " ".join(statement.split())
+    return statement if len(statement) <= limit else statement[:limit] + "..."
+
+def _header_safe(statement: str) -> str:
+    return _one_line(statement, 200).encode("latin-1", "replace").decode("latin-1")
+
+def _write_slow_log(line: str):
+    """Print a slow-query line, and append it to SLOW_QUERY_LOG_FILE if one is set"""
+    print(line)
+    if not settings.SLOW_QUERY_LOG_FILE:
+        return
+    try:
+        with _log_lock, open(settings.SLOW_QUERY_LOG_FILE, "a", encoding="utf-8") as f:
+            f.write(f"{time.strftime('%Y-%m-%d %H:%M:%S')} {line}\n")
+    except OSError as e:
+        print(f"⚠️ Could not write slow-query log: {str(e)}")
+
+def start_request(label: str) -> Tuple[RequestQueryStats, contextvars.Token]:
+    """Begin collecting statistics for the current request (label is e.g. "GET /api/v1/...")"""
+    stats = RequestQueryStats(label)
+    return stats, _current_stats.set(stats)
+
+def finish_request(stats: RequestQueryStats, token: contextvars.Token):
+    """Stop collecting and log the request if it ran more statements than QUERY_STATS_WARN_COUNT"""
+    _current_stats.reset(token)
+    if stats.count > settings.QUERY_STATS_WARN_COUNT:
+        _write_slow_log(f"⚠️ {stats.label} ran {stats.count} queries in {stats.total_ms:.1f} ms")
+
+def current_stats() -> Optional[RequestQueryStats]:
+    """Statistics of the request being served, or None outside a request"""
+    return _current_stats.get()
+
+def install_query_stats(engine: Engine) -> Optional[Callable[[], None]]:
+    """
+    Time every statement executed on an engine
+
+    Each statement is added to the statistics of the request it ran for (the
+    context variable set by the request middleware follows the request into
+    FastAPI's worker threads), and statements slower than SLOW_QUERY_THRESHOLD_MS
+    are written to the slow-query log, including those run by background jobs.
+
+    Returns:
+        A function that removes the hooks again, or None when QUERY_STATS_ENABLED is off
+    """
+    if not settings.QUERY_STATS_ENABLED:
+        return None
+
+    def record(statement, parameters, executemany, elapsed_ms):
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.record(statement, elapsed_ms)
+        if elapsed_ms >= settings.SLOW_QUERY_THRESHOLD_MS:
+            source = stats.label if stats is not None else "background"
+            rows = f" x{len(parameters)}" if executemany else ""
+            _write_slow_log(f"🐢 {elapsed_ms:.1f} ms{rows} [{source}] {_one_line(statement)}")
+
+    return listen_statements(engine, record)
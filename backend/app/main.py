@@ -1,8 +1,10 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from app.api.v1.api import api_router
 from app.core.config.settings import settings
+from app.core.query_stats import start_request, finish_request
+from app.services.job_service import job_manager
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -18,6 +20,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.middleware("http")
+async def query_stats_middleware(request: Request, call_next):
+    """Count the database statements each request runs; report them in X-DB-* headers in debug mode"""
+    stats, token = start_request(f"{request.method} {request.url.path}")
+    try:
+        response = await call_next(request)
+    finally:
+        finish_request(stats, token)
+    if settings.DEBUG:
+        response.headers.update(stats.headers())
+    return response
+
 # Mount static files for audio
 try:
     app.mount("/ai-audio-translations", StaticFiles(directory="/var/www/war-ddh/ai-audio-translations"), name="audio-files")
@@ -39,6 +53,11 @@ except Exception as e:
 # Include API router
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
+@app.on_event("startup")
+def resume_jobs():
+    """Restart bulk jobs that were interrupted by the last shutdown"""
+    job_manager.resume_incomplete()
+
 @app.get("/")
 async def root():
     return {"message": "WRAS-DHH Backend API"}
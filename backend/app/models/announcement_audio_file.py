@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.core.database import Base
@@ -10,6 +10,7 @@ class AnnouncementAudioFile(Base):
     template_id = Column(Integer, ForeignKey("announcement_templates.id"), nullable=False)
     language_code = Column(String, nullable=False)
     audio_file_path = Column(String, nullable=False)
+    audio_duration = Column(Float)  # duration in seconds
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationship to template
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Float, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, Float, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -19,5 +19,10 @@ class AnnouncementAudioSegment(Base):
     # Relationships
     category = relationship("AnnouncementCategory", back_populates="audio_segments")
 
+    __table_args__ = (
+        Index("idx_audio_segments_category_lang", "category_id", "language_code"),
+        Index("idx_audio_segments_segment_name", "segment_name"),
+    )
+
     class Config:
         from_attributes = True 
\ No newline at end of file
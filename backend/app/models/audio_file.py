@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, DateTime
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.core.database import Base
@@ -9,8 +9,10 @@ class AudioFile(Base):
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     train_route_id = Column(Integer, ForeignKey("train_routes.id"), nullable=False)
     language_code = Column(String, nullable=False)
-    audio_type = Column(String, nullable=False)  # 'train_number_words', 'train_name', 'start_station_name', 'end_station_name'
+    audio_type = Column(String, nullable=False)  # 'train_name', 'start_station_name', 'end_station_name'
     audio_file_path = Column(String, nullable=False)
+    audio_duration = Column(Float)  # duration in seconds
+    source_hash = Column(String(64))  # hash of the language, text and voice the clip was synthesized from
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationship
@@ -0,0 +1,31 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, Index, text
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+class Job(Base):
+    __tablename__ = "jobs"
+
+    id = Column(String(36), primary_key=True)  # UUID
+    job_type = Column(String(50), nullable=False, index=True)  # e.g. 'route_audio', 'route_translation'
+    status = Column(String(20), nullable=False, default="queued", index=True)  # queued, running, completed, failed
+    parameters_json = Column(JSON, nullable=False)
+    dedupe_key = Column(String(64))  # SHA-256 of job_type and the canonical parameters
+    total_items = Column(Integer, nullable=False, default=0)
+    completed_items = Column(Integer, nullable=False, default=0)
+    failed_items = Column(Integer, nullable=False, default=0)
+    failures_json = Column(JSON)  # [{"item": ..., "error": ...}], capped
+    result_json = Column(JSON)
+    error_message = Column(Text)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    started_at = Column(DateTime(timezone=True))
+    finished_at = Column(DateTime(timezone=True))
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+    # At most one queued or running job per type and parameters, enforced by the database
+    __table_args__ = (
+        Index(
+            "uq_jobs_active_dedupe_key", "dedupe_key", unique=True,
+            sqlite_where=text("status IN ('queued', 'running')"),
+            postgresql_where=text("status IN ('queued', 'running')")
+        ),
+    )
@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Integer, String, Float, DateTime, Index
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+class NumeralClip(Base):
+    __tablename__ = "numeral_clips"
+
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    language_code = Column(String(10), nullable=False)  # 'en', 'hi', 'mr', 'gu'
+    token = Column(String(16), nullable=False)  # "0".."999" or a unit word key such as "minutes"
+    spoken_text = Column(String, nullable=False)  # text sent to TTS
+    audio_file_path = Column(String(500), nullable=False)
+    audio_duration = Column(Float)  # duration in seconds
+    voice_name = Column(String(100))  # provider and voice the clip was spoken with
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_numeral_clips_language_token", "language_code", "token", unique=True),
+    )
\ No newline at end of file
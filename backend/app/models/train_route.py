@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy import Column, Integer, String, DateTime, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.core.database import Base
@@ -16,6 +16,11 @@ class TrainRoute(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
+    # Backs the newest-first listing and its keyset cursor
+    __table_args__ = (
+        Index("ix_train_routes_created_at_id", "created_at", "id"),
+    )
+    
     # Relationship to translations
     translations = relationship("TrainRouteTranslation", back_populates="train_route", cascade="all, delete-orphan")
     
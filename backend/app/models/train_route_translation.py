@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import Column, Integer, String, ForeignKey, JSON
 from sqlalchemy.orm import relationship
 from app.core.database import Base
 
@@ -13,6 +13,8 @@ class TrainRouteTranslation(Base):
     train_name = Column(String, nullable=False)
     start_station_name = Column(String, nullable=False)
     end_station_name = Column(String, nullable=False)
+    source_hash = Column(String(64))  # hash of all source fields this row was translated from
+    field_hashes = Column(JSON)  # hash of the source of each translated field
     
     # Relationship
     train_route = relationship("TrainRoute", back_populates="translations") 
\ No newline at end of file
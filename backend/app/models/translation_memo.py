@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, Index
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+class TranslationMemo(Base):
+    __tablename__ = "translation_memo"
+
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    text_hash = Column(String(64), nullable=False)  # SHA-256 of the source text
+    source_language = Column(String(10), nullable=False)
+    target_language = Column(String(10), nullable=False)
+    source_text = Column(Text, nullable=False)
+    translated_text = Column(Text, nullable=False)
+    provider = Column(String(20), nullable=False)  # provider that produced the translation ('gcp', 'local')
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_translation_memo_key", "text_hash", "source_language", "target_language", "provider", unique=True),
+    )
\ No newline at end of file
@@ -43,6 +43,7 @@ class AnnouncementTemplate(AnnouncementTemplateBase):
 class AnnouncementAudioFileBase(BaseModel):
     language_code: str
     audio_file_path: str
+    audio_duration: Optional[float] = None
 
 class AnnouncementAudioFile(AnnouncementAudioFileBase):
     id: int
@@ -108,6 +109,7 @@ class AnnouncementGenerationResponse(BaseModel):
     success: bool
     announcement_text: str
     audio_url: Optional[str] = None
+    audio_duration: Optional[float] = None
     message: str
 
 # Response Schemas
@@ -8,6 +8,7 @@ class AudioFileData(BaseModel):
     language_code: str
     audio_type: str
     audio_file_path: str
+    audio_duration: Optional[float] = None
     created_at: datetime
 
     class Config:
@@ -16,6 +17,7 @@ class AudioFileData(BaseModel):
 class AudioGenerationRequest(BaseModel):
     train_route_id: int
     languages: Optional[List[str]] = None  # Defaults to all available languages
+    overwrite_existing: bool = False  # regenerate clips whose text is unchanged
 
 class AudioGenerationResponse(BaseModel):
     success: bool
@@ -29,11 +31,13 @@ class AudioGenerationResponse(BaseModel):
 class BulkAudioGenerationRequest(BaseModel):
     languages: Optional[List[str]] = None
     overwrite_existing: bool = False
+    dry_run: bool = False  # return the plan instead of queuing the job
 
 class BulkAudioGenerationResponse(BaseModel):
     success: bool
     total_routes_processed: int
     total_files_generated: int
+    unchanged_routes: int = 0
     failed_routes: List[Dict[str, str]]
     summary: Dict[str, int]
 
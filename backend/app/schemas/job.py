@@ -0,0 +1,62 @@
+from pydantic import BaseModel
+from typing import Any, Dict, List, Optional
+from datetime import datetime
+
+class JobSubmissionResponse(BaseModel):
+    success: bool
+    job_id: str
+    job_type: str
+    status: str
+    status_url: str
+    message: str
+
+class JobFailure(BaseModel):
+    item: str
+    error: str
+
+class JobStatusResponse(BaseModel):
+    job_id: str
+    job_type: str
+    status: str
+    parameters: Dict[str, Any]
+    total_items: int
+    completed_items: int
+    failed_items: int
+    progress_percent: float
+    items_per_second: Optional[float] = None
+    eta_seconds: Optional[float] = None
+    failures: List[JobFailure]
+    result: Optional[Dict[str, Any]] = None
+    error_message: Optional[str] = None
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+class JobListResponse(BaseModel):
+    success: bool
+    jobs: List[JobStatusResponse]
+    total_count: int
+
+class BulkPlanGroup(BaseModel):
+    total_items: int
+    unique_items: int
+    cached_items: int
+    items_to_process: int
+    estimated_api_characters: int
+    estimated_requests: int
+
+class BulkPlanResponse(BaseModel):
+    dry_run: bool
+    operation: str
+    total_routes: int
+    routes_to_process: int
+    unchanged_routes: int = 0
+    transliterated_items: int = 0
+    total_items: int
+    unique_items: int
+    cached_items: int
+    items_to_process: int
+    estimated_api_characters: int
+    estimated_requests: int
+    groups: Dict[str, BulkPlanGroup]
+    failed_routes: List[Dict[str, str]]
\ No newline at end of file
@@ -0,0 +1,47 @@
+from pydantic import BaseModel
+from typing import Dict, List, Optional
+from datetime import datetime
+
+class NumeralClipData(BaseModel):
+    id: int
+    language_code: str
+    token: str
+    spoken_text: str
+    audio_file_path: str
+    audio_duration: Optional[float] = None
+    voice_name: Optional[str] = None
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+class NumeralBankGenerationRequest(BaseModel):
+    languages: List[str] = ["en", "hi", "mr", "gu"]
+    overwrite_existing: bool = False
+
+class NumeralBankGenerationResponse(BaseModel):
+    success: bool
+    clips_generated: int
+    clips_skipped: int
+    failed_tokens: List[str]
+    summary: Dict[str, int]
+
+class NumeralBankStatusResponse(BaseModel):
+    success: bool
+    max_value: int
+    expected_per_language: int
+    clips_per_language: Dict[str, int]
+
+class GetNumeralClipsResponse(BaseModel):
+    success: bool
+    language_code: str
+    clips: List[NumeralClipData]
+    total_count: int
+
+class NumeralCompositionResponse(BaseModel):
+    success: bool
+    language_code: str
+    value: str
+    mode: str
+    tokens: List[str]
+    audio_file_paths: List[str]
\ No newline at end of file
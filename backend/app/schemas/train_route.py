@@ -1,6 +1,6 @@
 from pydantic import BaseModel
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 class TrainRouteBase(BaseModel):
     train_number: str
@@ -27,4 +27,30 @@ class TrainRoute(TrainRouteBase):
     updated_at: Optional[datetime] = None
 
     class Config:
-        from_attributes = True 
\ No newline at end of file
+        from_attributes = True 
+
+class TrainRoutePage(BaseModel):
+    routes: List[TrainRoute]
+    total: int
+    limit: int
+    total_pages: int
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+
+class RouteImportError(BaseModel):
+    row: int
+    train_number: Optional[str] = None
+    error: str
+
+class RouteImportResponse(BaseModel):
+    message: str
+    mode: str
+    total_rows: int
+    imported_count: int
+    updated_count: int
+    unchanged_count: int
+    skipped_count: int
+    error_count: int
+    errors: List[RouteImportError]
+    elapsed_seconds: float
+    rows_per_second: Optional[float] = None
\ No newline at end of file
@@ -5,6 +5,7 @@ from datetime import datetime
 class TranslationRequest(BaseModel):
     train_route_id: int
     source_language: Optional[str] = "en"
+    overwrite_existing: bool = False  # re-translate fields whose source is unchanged
 
 class TranslationResponse(BaseModel):
     train_route_id: int
@@ -25,10 +26,13 @@ class GetTranslationResponse(BaseModel):
 
 class BulkTranslationRequest(BaseModel):
     source_language: Optional[str] = "en"
+    dry_run: bool = False  # return the plan instead of queuing the job
+    overwrite_existing: bool = False  # re-translate routes whose source is unchanged
 
 class BulkTranslationResponse(BaseModel):
     total_routes: int
     translated_routes: int
+    unchanged_routes: int = 0
     failed_routes: int
     message: str
     timestamp: datetime
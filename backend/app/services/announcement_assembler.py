@@ -0,0 +1,196 @@
+import os
+import re
+import tempfile
+from typing import Dict, List, Optional
+from sqlalchemy.orm import Session
+from app.models.announcement_audio_segment import AnnouncementAudioSegment
+from app.models.announcement_category import AnnouncementCategory
+from app.models.audio_file import AudioFile
+from app.models.train_route import TrainRoute
+from app.services.numeral_service import numeral_service
+from app.utils.audio_info import get_audio_duration_from_bytes
+from app.utils.mp3 import concat_clips
+from app.utils.render_cache import render_cache
+from app.utils.tts_cache import TTSCache
+from app.core.config.settings import settings
+
+class AnnouncementAssembler:
+    """
+    Builds complete announcements from pre-rendered clips
+
+    Category segments (prefix/from/to/suffix), the route clips generated by
+    AudioService and numbers composed from the numeral bank are joined frame by
+    frame with short silences between them, so an announcement is a file copy's
+    worth of work rather than a TTS request.
+
+    Each render is written to ANNOUNCEMENT_OUTPUT_DIR as
+    <language>/<category>/<render key>.mp3. The directory is kept to
+    RENDER_CACHE_MAX_BYTES by least-recent use, and serves a render key after it
+    has left the render cache (or when that cache is disabled).
+    """
+
+    def __init__(self):
+        self.audio_root = "/var/www/war-ddh/ai-audio-translations"
+        self.output_dir = settings.ANNOUNCEMENT_OUTPUT_DIR
+        self.output_files = TTSCache(self.output_dir, settings.RENDER_CACHE_MAX_BYTES, label="Announcement output")
+
+        # Clip order per language; Indic languages put the station before its postposition
+        self.layouts = {
+            'en': ['prefix', 'train_number', 'train_name', 'from', 'start_station_name', 'to', 'end_station_name', 'suffix'],
+            'hi': ['prefix', 'train_number', 'train_name', 'start_station_name', 'from', 'end_station_name', 'to', 'suffix'],
+            'mr': ['prefix', 'train_number', 'train_name', 'start_station_name', 'from', 'end_station_name', 'to', 'suffix'],
+            'gu': ['prefix', 'train_number', 'train_name', 'start_station_name', 'from', 'end_station_name', 'to', 'suffix']
+        }
+        self.segment_parts = {'prefix', 'from', 'to', 'suffix'}
+
+        # Parameters spoken from the numeral bank: (reading mode, unit word)
+        self.numeral_parameters = {
+            'train_number': ('digits', None),
+            'platform': ('cardinal', None),
+            'delay_time': ('cardinal', 'minutes')
+        }
+        
+        # Parameters that identify a rendered announcement
+        self.render_key_parameters = ['train_number', 'platform', 'delay_time']
+
+    def get_layout(self, language_code: str, parameters: Dict) -> List[str]:
+        """Get the ordered parts for an announcement in a language"""
+        if language_code not in self.layouts:
+            raise ValueError(f"Unsupported language code: {language_code}")
+
+        layout = list(self.layouts[language_code])
+
+        # English says "... at platform number <n>", Indic languages put the number before the verb
+        if parameters.get('platform') not in (None, ""):
+            if language_code == 'en':
+                layout.append('platform')
+            else:
+                layout.insert(layout.index('suffix'), 'platform')
+
+        if parameters.get('delay_time') not in (None, ""):
+            layout.insert(layout.index('suffix'), 'delay_time')
+
+        return layout
+
+    def resolve_clips(self, db: Session, category: AnnouncementCategory, language_code: str, parameters: Dict) -> List[str]:
+        """
+        Resolve the clip file for every part of an announcement
+
+        Raises:
+            ValueError: If the route or any required clip is missing
+        """
+        layout = self.get_layout(language_code, parameters)
+
+        # Segment paths are stored relative to the audio root (e.g. /announcements/arriving/en/prefix.mp3)
+        segments = {
+            segment.segment_name: os.path.join(self.audio_root, segment.audio_file_path.lstrip('/'))
+            for segment in db.query(AnnouncementAudioSegment).filter(
+                AnnouncementAudioSegment.category_id == category.id,
+                AnnouncementAudioSegment.language_code == language_code
+            ).all()
+        }
+
+        train_number = str(parameters.get('train_number', '')).strip()
+        route = db.query(TrainRoute).filter(TrainRoute.train_number == train_number).first()
+        if not route:
+            raise ValueError(f"Train route {train_number} not found")
+
+        route_clips = {
+            audio_file.audio_type: audio_file.audio_file_path
+            for audio_file in db.query(AudioFile).filter(
+                AudioFile.train_route_id == route.id,
+                AudioFile.language_code == language_code
+            ).all()
+        }
+
+        clips = []
+        missing = []
+        for part in layout:
+            if part in self.numeral_parameters:
+                mode, unit = self.numeral_parameters[part]
+                clips.extend(numeral_service.compose(db, parameters[part], language_code, mode, unit))
+                continue
+
+            if part in self.segment_parts:
+                clip = segments.get(part)
+            else:
+                clip = route_clips.get(part)
+
+            if clip and os.path.exists(clip):
+                clips.append(clip)
+            else:
+                missing.append(part)
+
+        if missing:
+            raise ValueError(f"Audio not generated for {category.category_code}/{language_code}: {', '.join(missing)}")
+
+        return clips
+
+    def assemble(self, db: Session, category: AnnouncementCategory, language_code: str, parameters: Dict) -> Dict:
+        """
+        Assemble one announcement into a single MP3 file, reusing earlier renders
+
+        Args:
+            db: Database session
+            category: Announcement category supplying the segments
+            language_code: Language code ('en', 'hi', 'mr', 'gu')
+            parameters: Announcement parameters; train_number selects the route clips
+
+        Returns:
+            Dict with audio_file_path, audio_url, audio_duration, etag, cached and the clips used
+        """
+        clips = self.resolve_clips(db, category, language_code, parameters)
+
+        key_parameters = {name: str(parameters.get(name, '')).strip() for name in self.render_key_parameters}
+        key_parameters.update({"category": category.category_code, "language": language_code})
+        render_key = render_cache.make_key(key_parameters, clips)
+
+        output_path = os.path.join(self.output_dir, language_code, category.category_code, f"{render_key}.mp3")
+
+        audio = render_cache.get(render_key)
+        cached = audio is not None
+        if cached:
+            # The file name is derived from the render key, so an existing file is already current
+            written = os.path.exists(output_path)
+        else:
+            clip_bytes = []
+            for clip in clips:
+                with open(clip, "rb") as f:
+                    clip_bytes.append(f.read())
+
+            audio = concat_clips(
+                clip_bytes,
+                gap_seconds=settings.ANNOUNCEMENT_GAP_MS / 1000.0,
+                edge_seconds=settings.ANNOUNCEMENT_EDGE_SILENCE_MS / 1000.0
+            )
+            written = render_cache.put(render_key, audio, output_path)
+
+        if not written:
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(output_path), suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(audio)
+            os.chmod(temp_path, 0o644)
+            os.replace(temp_path, output_path)
+        self.output_files.track(render_key, output_path)
+
+        return {
+            "audio_file_path": output_path,
+            "audio_url": f"{settings.API_V1_STR}/announcements/audio/{render_key}",
+            "audio_duration": get_audio_duration_from_bytes(audio),
+            "etag": render_key,
+            "cached": cached,
+            "clips": clips
+        }
+
+    def get_rendered_audio(self, render_key: str) -> Optional[bytes]:
+        """Get a previously assembled announcement by its render key, from the render cache or its output file"""
+        if not re.fullmatch(r"[0-9a-f]{64}", render_key):
+            return None
+        audio = render_cache.get(render_key)
+        if audio is None:
+            audio = self.output_files.read(render_key)
+        return audio
+
+# Create service instance
+announcement_assembler = AnnouncementAssembler()
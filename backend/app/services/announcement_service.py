@@ -1,13 +1,15 @@
 import re
 import os
 from typing import Dict, List, Optional, Tuple
-from sqlalchemy.orm import Session
+from sqlalchemy import exists
+from sqlalchemy.orm import Session, Query
 from app.models.announcement_category import AnnouncementCategory
 from app.models.announcement_template import AnnouncementTemplate
 from app.models.announcement_audio_file import AnnouncementAudioFile
 from app.models.generated_announcement import GeneratedAnnouncement
 from app.utils.gcp_client import gcp_client
-from app.utils.gcp_tts_client import gcp_tts_client
+from app.utils.tts_executor import synthesis_executor
+from app.services.announcement_assembler import announcement_assembler
 
 class AnnouncementService:
     def __init__(self):
@@ -94,33 +96,41 @@ class AnnouncementService:
         """Get category by code"""
         return db.query(AnnouncementCategory).filter(AnnouncementCategory.category_code == category_code).first()
 
+    def _with_audio_flag(self, query: Query) -> List[AnnouncementTemplate]:
+        """Run a template query, setting has_audio from an EXISTS column in the same statement"""
+        has_audio = exists().where(AnnouncementAudioFile.template_id == AnnouncementTemplate.id)
+        templates = []
+        for template, template_has_audio in query.add_columns(has_audio.label("has_audio")).all():
+            template.has_audio = bool(template_has_audio)
+            templates.append(template)
+        return templates
+
     def get_templates_by_category(self, db: Session, category_id: int) -> List[AnnouncementTemplate]:
         """Get all templates for a category"""
-        templates = db.query(AnnouncementTemplate).filter(
+        return self._with_audio_flag(db.query(AnnouncementTemplate).filter(
             AnnouncementTemplate.category_id == category_id
-        ).all()
-        
-        # Add has_audio flag
-        for template in templates:
-            audio_file = db.query(AnnouncementAudioFile).filter(
-                AnnouncementAudioFile.template_id == template.id
-            ).first()
-            template.has_audio = audio_file is not None
-        
-        return templates
+        ))
 
     def get_all_templates(self, db: Session) -> List[AnnouncementTemplate]:
         """Get all templates"""
-        templates = db.query(AnnouncementTemplate).all()
-        
-        # Add has_audio flag
-        for template in templates:
-            audio_file = db.query(AnnouncementAudioFile).filter(
-                AnnouncementAudioFile.template_id == template.id
-            ).first()
-            template.has_audio = audio_file is not None
-        
-        return templates
+        return self._with_audio_flag(db.query(AnnouncementTemplate))
+
+    def upsert_template(self, db: Session, category_id: int, language_code: str, template_text: str) -> bool:
+        """
+        Set the template text of a category in one language, creating the template if needed
+
+        Returns:
+            True if the template was created, False if an existing one was updated
+        """
+        template = db.query(AnnouncementTemplate).filter(
+            AnnouncementTemplate.category_id == category_id,
+            AnnouncementTemplate.language_code == language_code
+        ).first()
+        if template:
+            template.template_text = template_text
+            return False
+        db.add(AnnouncementTemplate(category_id=category_id, language_code=language_code, template_text=template_text))
+        return True
 
     def update_template(self, db: Session, template_id: int, template_text: str) -> Optional[AnnouncementTemplate]:
         """Update template text"""
@@ -255,6 +265,8 @@ class AnnouncementService:
             ).all()
             
             audio_files_generated = 0
+            category = self.get_category_by_id(db, category_id)
+            pending = []
             
             for template in templates:
                 # Check if audio already exists
@@ -266,32 +278,34 @@ class AnnouncementService:
                     continue
                 
                 # Create directory structure
-                category = self.get_category_by_id(db, category_id)
                 audio_dir = os.path.join(self.audio_base_path, category.category_code, template.language_code)
                 os.makedirs(audio_dir, exist_ok=True)
                 
-                # Generate audio file
                 audio_filename = f"{category.category_code}_{template.language_code}.mp3"
                 audio_file_path = os.path.join(audio_dir, audio_filename)
-                
-                success = gcp_tts_client.generate_audio(
-                    text=template.template_text,
-                    language_code=template.language_code,
-                    output_path=audio_file_path
-                )
-                
-                if success:
+                pending.append((template, existing_audio, audio_file_path))
+            
+            # Generate audio files concurrently through the shared synthesis pool
+            results = synthesis_executor.generate_many([
+                (template.template_text, template.language_code, audio_file_path)
+                for template, _, audio_file_path in pending
+            ])
+            
+            for (template, existing_audio, audio_file_path), audio_duration in zip(pending, results):
+                if audio_duration:
                     # Save or update audio file record
                     if existing_audio:
-                        # Delete old file if exists
-                        if os.path.exists(existing_audio.audio_file_path):
+                        # Delete old file if it lived somewhere else
+                        if existing_audio.audio_file_path != audio_file_path and os.path.exists(existing_audio.audio_file_path):
                             os.remove(existing_audio.audio_file_path)
                         existing_audio.audio_file_path = audio_file_path
+                        existing_audio.audio_duration = audio_duration
                     else:
                         new_audio = AnnouncementAudioFile(
                             template_id=template.id,
                             language_code=template.language_code,
-                            audio_file_path=audio_file_path
+                            audio_file_path=audio_file_path,
+                            audio_duration=audio_duration
                         )
                         db.add(new_audio)
                     
@@ -311,18 +325,25 @@ class AnnouncementService:
             db.rollback()
             return {"success": False, "error": str(e)}
 
-    def generate_audio_for_all_categories(self, db: Session, languages: Optional[List[str]] = None, overwrite_existing: bool = False) -> Dict:
-        """Generate AI audio for all categories"""
+    def generate_audio_for_all_categories(self, db: Session, languages: Optional[List[str]] = None, overwrite_existing: bool = False, progress=None) -> Dict:
+        """Generate AI audio for all categories, reporting one item per category to an optional JobProgress"""
         try:
             categories = self.get_all_categories(db)
             total_audio_files = 0
             categories_processed = []
             
+            if progress:
+                progress.set_total(len(categories))
+            
             for category in categories:
                 result = self.generate_audio_for_category(db, category.id, languages, overwrite_existing)
                 if result["success"]:
                     total_audio_files += result["audio_files_generated"]
                     categories_processed.append(category.id)
+                    if progress:
+                        progress.advance()
+                elif progress:
+                    progress.fail(category.category_code, result.get("error", "Unknown error"))
             
             return {
                 "success": True,
@@ -365,32 +386,33 @@ class AnnouncementService:
                     "error": f"Missing parameters: {', '.join(remaining_placeholders)}"
                 }
             
+            # Assemble the spoken announcement from segment and route clips
+            audio = None
+            message = "Announcement generated successfully"
+            try:
+                audio = announcement_assembler.assemble(db, category, language_code, parameters)
+            except Exception as e:
+                print(f"⚠️ Could not assemble announcement audio: {str(e)}")
+                message = f"Announcement text generated; audio unavailable: {str(e)}"
+            
             # Save generated announcement
             generated_announcement = GeneratedAnnouncement(
                 category_id=category.id,
                 language_code=language_code,
                 parameters_json=parameters,
-                generated_text=announcement_text
+                generated_text=announcement_text,
+                audio_file_path=audio["audio_file_path"] if audio else None
             )
             db.add(generated_announcement)
             db.commit()
             
-            # Get audio URL if available
-            audio_url = None
-            audio_file = db.query(AnnouncementAudioFile).filter(
-                AnnouncementAudioFile.template_id == template.id
-            ).first()
-            
-            if audio_file:
-                # Convert file path to web-accessible URL
-                relative_path = audio_file.audio_file_path.replace('/var/www/war-ddh/ai-audio-translations/', '')
-                audio_url = f"/ai-audio-translations/{relative_path}"
-            
             return {
                 "success": True,
                 "announcement_text": announcement_text,
-                "audio_url": audio_url,
-                "message": "Announcement generated successfully"
+                "audio_url": audio["audio_url"] if audio else None,
+                "audio_duration": audio["audio_duration"] if audio else None,
+                "audio_etag": audio["etag"] if audio else None,
+                "message": message
             }
             
         except Exception as e:
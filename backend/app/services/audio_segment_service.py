@@ -1,15 +1,15 @@
 import os
-import json
+import asyncio
 from typing import List, Dict, Optional
 from sqlalchemy.orm import Session
 from app.models.announcement_audio_segment import AnnouncementAudioSegment
 from app.models.announcement_category import AnnouncementCategory
-from app.utils.gcp_tts_client import GCPTTSClient
+from app.utils.tts_executor import synthesis_executor
+from app.utils.gcp_tts_client import async_gcp_tts_client
 from app.core.config.settings import settings
 
 class AudioSegmentService:
     def __init__(self):
-        self.tts_client = GCPTTSClient()
         self.base_audio_path = "/var/www/war-ddh/ai-audio-translations/announcements"
         
         # Define segments for each category
@@ -169,105 +169,114 @@ class AudioSegmentService:
             AnnouncementAudioSegment.segment_name
         ).all()
 
-    def generate_segments_for_category(self, db: Session, category_id: int, languages: List[str], overwrite_existing: bool = False) -> Dict:
-        """Generate audio segments for a specific category"""
-        import time
-        
-        category = db.query(AnnouncementCategory).filter(AnnouncementCategory.id == category_id).first()
-        if not category:
-            raise ValueError(f"Category with ID {category_id} not found")
-
+    def _collect_pending_segments(self, db: Session, category: AnnouncementCategory, languages: List[str], overwrite_existing: bool) -> List[Dict]:
+        """Work out which segments of a category need (re)generating"""
+        pending = []
         category_code = category.category_code
-        print(f"🎵 Generating audio segments for category: {category_code}")
-        generated_segments = []
-        failed_segments = []
 
-        # Create directory structure
         for language in languages:
+            if category_code not in self.segment_translations or language not in self.segment_translations[category_code]:
+                print(f"⚠️ No translations found for {category_code}/{language}")
+                continue
+
+            # Create directory structure
             category_dir = os.path.join(self.base_audio_path, category_code, language)
             os.makedirs(category_dir, exist_ok=True)
 
-        # Generate segments for each language
-        for language in languages:
-            print(f"🌐 Processing language: {language}")
-            if category_code not in self.segment_translations or language not in self.segment_translations[category_code]:
-                print(f"⚠️ No translations found for {category_code}/{language}")
+            for segment_name, segment_text in self.segment_translations[category_code][language].items():
+                # Check if segment already exists
+                existing_segment = db.query(AnnouncementAudioSegment).filter(
+                    AnnouncementAudioSegment.category_id == category.id,
+                    AnnouncementAudioSegment.segment_name == segment_name,
+                    AnnouncementAudioSegment.language_code == language
+                ).first()
+
+                if existing_segment and not overwrite_existing:
+                    print(f"⏭️ Skipping existing segment: {category_code}/{language}/{segment_name}")
+                    continue
+
+                audio_filename = f"{segment_name}.mp3"
+                pending.append({
+                    "segment_name": segment_name,
+                    "segment_text": segment_text,
+                    "language": language,
+                    "audio_file_path": os.path.join(category_dir, audio_filename),
+                    "relative_path": f"/announcements/{category_code}/{language}/{audio_filename}",
+                    "existing_segment": existing_segment
+                })
+
+        return pending
+
+    def _save_segments(self, db: Session, category: AnnouncementCategory, pending: List[Dict], durations: List[Optional[float]]) -> Dict:
+        """Persist generated segments in a single transaction"""
+        generated_segments = []
+        failed_segments = []
+
+        for item, audio_duration in zip(pending, durations):
+            if not audio_duration:
+                failed_segments.append(f"{category.category_code}_{item['language']}_{item['segment_name']}")
+                print(f"❌ Failed to generate: {category.category_code}/{item['language']}/{item['segment_name']}")
                 continue
 
-            language_segments = self.segment_translations[category_code][language]
-            
-            for segment_name, segment_text in language_segments.items():
-                try:
-                    print(f"🎤 Generating {segment_name} for {category_code}/{language}")
-                    
-                    # Check if segment already exists
-                    existing_segment = db.query(AnnouncementAudioSegment).filter(
-                        AnnouncementAudioSegment.category_id == category_id,
-                        AnnouncementAudioSegment.segment_name == segment_name,
-                        AnnouncementAudioSegment.language_code == language
-                    ).first()
-
-                    if existing_segment and not overwrite_existing:
-                        print(f"⏭️ Skipping existing segment: {category_code}/{language}/{segment_name}")
-                        continue
-
-                    # Generate audio file path
-                    audio_filename = f"{segment_name}.mp3"
-                    audio_file_path = os.path.join(category_dir, audio_filename)
-                    relative_path = f"/announcements/{category_code}/{language}/{audio_filename}"
-
-                    # Generate audio using TTS
-                    audio_duration = self.tts_client.generate_audio(
-                        text=segment_text,
-                        language_code=language,
-                        output_path=audio_file_path
-                    )
-                    print(f"✅ Audio generated: {audio_file_path}")
-
-                    # Save to database
-                    if existing_segment:
-                        existing_segment.audio_file_path = relative_path
-                        existing_segment.audio_duration = audio_duration
-                        existing_segment.segment_text = segment_text
-                        db.commit()
-                        generated_segments.append(existing_segment)
-                    else:
-                        new_segment = AnnouncementAudioSegment(
-                            category_id=category_id,
-                            segment_name=segment_name,
-                            segment_text=segment_text,
-                            language_code=language,
-                            audio_file_path=relative_path,
-                            audio_duration=audio_duration
-                        )
-                        db.add(new_segment)
-                        db.commit()
-                        db.refresh(new_segment)
-                        generated_segments.append(new_segment)
-
-                    # Add a small delay to prevent rate limiting
-                    time.sleep(0.5)
+            existing_segment = item["existing_segment"]
+            if existing_segment:
+                existing_segment.audio_file_path = item["relative_path"]
+                existing_segment.audio_duration = audio_duration
+                existing_segment.segment_text = item["segment_text"]
+                generated_segments.append(existing_segment)
+            else:
+                new_segment = AnnouncementAudioSegment(
+                    category_id=category.id,
+                    segment_name=item["segment_name"],
+                    segment_text=item["segment_text"],
+                    language_code=item["language"],
+                    audio_file_path=item["relative_path"],
+                    audio_duration=audio_duration
+                )
+                db.add(new_segment)
+                generated_segments.append(new_segment)
 
-                except Exception as e:
-                    error_msg = f"{category_code}_{language}_{segment_name}: {str(e)}"
-                    failed_segments.append(error_msg)
-                    print(f"❌ Error generating {category_code}/{language}/{segment_name}: {str(e)}")
+        db.commit()
+        for segment in generated_segments:
+            db.refresh(segment)
 
-        print(f"🎯 Category {category_code} completed: {len(generated_segments)} generated, {len(failed_segments)} failed")
         return {
             "generated_segments": generated_segments,
             "failed_segments": failed_segments,
             "total_generated": len(generated_segments)
         }
 
-    def generate_segments_for_all_categories(self, db: Session, languages: List[str], overwrite_existing: bool = False) -> Dict:
-        """Generate audio segments for all categories"""
+    def generate_segments_for_category(self, db: Session, category_id: int, languages: List[str], overwrite_existing: bool = False) -> Dict:
+        """Generate audio segments for a specific category"""
+        category = db.query(AnnouncementCategory).filter(AnnouncementCategory.id == category_id).first()
+        if not category:
+            raise ValueError(f"Category with ID {category_id} not found")
+
+        category_code = category.category_code
+        print(f"🎵 Generating audio segments for category: {category_code}")
+
+        pending = self._collect_pending_segments(db, category, languages, overwrite_existing)
+
+        # Synthesize concurrently; pacing is enforced by the shared TTS rate limiter
+        durations = synthesis_executor.generate_many([
+            (item["segment_text"], item["language"], item["audio_file_path"]) for item in pending
+        ])
+
+        result = self._save_segments(db, category, pending, durations)
+        print(f"🎯 Category {category_code} completed: {result['total_generated']} generated, {len(result['failed_segments'])} failed")
+        return result
+
+    def generate_segments_for_all_categories(self, db: Session, languages: List[str], overwrite_existing: bool = False, progress=None) -> Dict:
+        """Generate audio segments for all categories, reporting one item per category to an optional JobProgress"""
         categories = db.query(AnnouncementCategory).all()
         all_generated_segments = []
         all_failed_segments = []
         categories_processed = []
         failed_categories = []
 
+        if progress:
+            progress.set_total(len(categories))
+
         for category in categories:
             try:
                 result = self.generate_segments_for_category(
@@ -276,8 +285,12 @@ class AudioSegmentService:
                 all_generated_segments.extend(result["generated_segments"])
                 all_failed_segments.extend(result["failed_segments"])
                 categories_processed.append(category.category_code)
+                if progress:
+                    progress.advance()
             except Exception as e:
                 failed_categories.append(f"{category.category_code}: {str(e)}")
+                if progress:
+                    progress.fail(category.category_code, str(e))
 
         return {
             "generated_segments": all_generated_segments,
@@ -287,192 +300,57 @@ class AudioSegmentService:
             "total_generated": len(all_generated_segments)
         }
 
-    async def generate_segments_for_all_categories_with_delays(self, db: Session, languages: List[str], overwrite_existing: bool = False, delay_between_requests: int = 2000, delay_between_categories: int = 5000) -> Dict:
-        """Generate audio segments for all categories with delays to ensure proper audio quality"""
-        try:
-            import asyncio
-            print("🎵 Starting bulk audio segment generation with delays...")
-            print(f"   Delay between requests: {delay_between_requests}ms")
-            print(f"   Delay between categories: {delay_between_categories}ms")
-            
-            categories = db.query(AnnouncementCategory).all()
-            total_generated = 0
-            categories_processed = []
-            failed_categories = []
-            
-            for i, category in enumerate(categories):
-                try:
-                    print(f"\n🔄 Processing category {i+1}/{len(categories)}: {category.category_code}")
-                    
-                    # Generate segments for this category with delays
-                    result = await self.generate_segments_for_category_with_delays(
-                        db=db,
-                        category_id=category.id,
-                        languages=languages,
-                        overwrite_existing=overwrite_existing,
-                        delay_between_requests=delay_between_requests
-                    )
-                    
-                    total_generated += result['total_generated']
-                    categories_processed.append(category.category_code)
-                    print(f"✅ Completed category: {category.category_code}")
-                    
-                    # Add delay between categories (except for the last one)
-                    if i < len(categories) - 1:
-                        print(f"⏳ Waiting {delay_between_categories/1000}s before next category...")
-                        await asyncio.sleep(delay_between_categories / 1000)
-                    
-                except Exception as e:
-                    print(f"❌ Failed to process category {category.category_code}: {str(e)}")
-                    failed_categories.append(category.category_code)
-            
-            print(f"\n🎉 Bulk generation with delays completed!")
-            print(f"   Total generated: {total_generated}")
-            print(f"   Categories processed: {len(categories_processed)}")
-            print(f"   Failed categories: {len(failed_categories)}")
-            
-            return {
-                'total_generated': total_generated,
-                'categories_processed': categories_processed,
-                'failed_categories': failed_categories
-            }
-            
-        except Exception as e:
-            print(f"❌ Error in bulk generation with delays: {str(e)}")
-            return {
-                'total_generated': 0,
-                'categories_processed': [],
-                'failed_categories': []
-            }
+    async def generate_segments_for_category_async(self, db: Session, category_id: int, languages: List[str], overwrite_existing: bool = False) -> Dict:
+        """Generate audio segments for a specific category without blocking the event loop"""
+        category = db.query(AnnouncementCategory).filter(AnnouncementCategory.id == category_id).first()
+        if not category:
+            raise ValueError(f"Category with ID {category_id} not found")
 
-    async def generate_segments_for_category_with_delays(self, db: Session, category_id: int, languages: List[str], overwrite_existing: bool = False, delay_between_requests: int = 2000) -> Dict:
-        """Generate audio segments for a category with delays between requests"""
-        try:
-            import asyncio
-            print(f"🎵 Generating segments for category {category_id} with delays...")
-            
-            category = db.query(AnnouncementCategory).filter(AnnouncementCategory.id == category_id).first()
-            if not category:
-                raise ValueError(f"Category {category_id} not found")
-            
-            total_generated = 0
-            generated_segments = []
-            failed_segments = []
-            
-            # Create category directory
-            category_dir = os.path.join(self.base_audio_path, category.category_code)
-            os.makedirs(category_dir, exist_ok=True)
-            
-            for language in languages:
-                try:
-                    print(f"   🔄 Processing language: {language}")
-                    
-                    # Create language directory
-                    language_dir = os.path.join(category_dir, language)
-                    os.makedirs(language_dir, exist_ok=True)
-                    
-                    # Get segments for this category and language
-                    if category.category_code not in self.segment_translations or language not in self.segment_translations[category.category_code]:
-                        print(f"      ⚠️ No translations found for {category.category_code}/{language}")
-                        continue
-                    
-                    segments = self.segment_translations[category.category_code][language]
-                    
-                    for segment_name, segment_text in segments.items():
-                        try:
-                            # Check if file already exists and overwrite is disabled
-                            audio_file_path = os.path.join(language, f"{segment_name}.mp3")
-                            full_audio_path = os.path.join(category_dir, audio_file_path)
-                            
-                            if os.path.exists(full_audio_path) and not overwrite_existing:
-                                print(f"      ⏭️ Skipping {segment_name} (already exists)")
-                                continue
-                            
-                            print(f"      🎤 Generating audio for: {segment_name}")
-                            
-                            # Check if segment already exists
-                            existing_segment = db.query(AnnouncementAudioSegment).filter(
-                                AnnouncementAudioSegment.category_id == category_id,
-                                AnnouncementAudioSegment.segment_name == segment_name,
-                                AnnouncementAudioSegment.language_code == language
-                            ).first()
-
-                            if existing_segment and not overwrite_existing:
-                                print(f"      ⏭️ Skipping existing segment: {segment_name}")
-                                continue
-
-                            # Generate audio file path
-                            audio_filename = f"{segment_name}.mp3"
-                            audio_file_path = os.path.join(language_dir, audio_filename)
-                            relative_path = f"/announcements/{category.category_code}/{language}/{audio_filename}"
-
-                            # Generate audio using TTS
-                            audio_duration = self.tts_client.generate_audio(
-                                text=segment_text,
-                                language_code=language,
-                                output_path=audio_file_path
-                            )
-                            
-                            if audio_duration:
-                                # Save to database
-                                if existing_segment:
-                                    existing_segment.audio_file_path = relative_path
-                                    existing_segment.audio_duration = audio_duration
-                                    existing_segment.segment_text = segment_text
-                                    db.commit()
-                                    generated_segments.append(existing_segment)
-                                else:
-                                    new_segment = AnnouncementAudioSegment(
-                                        category_id=category_id,
-                                        segment_name=segment_name,
-                                        segment_text=segment_text,
-                                        language_code=language,
-                                        audio_file_path=relative_path,
-                                        audio_duration=audio_duration
-                                    )
-                                    db.add(new_segment)
-                                    db.commit()
-                                    db.refresh(new_segment)
-                                    generated_segments.append(new_segment)
-                                
-                                total_generated += 1
-                                print(f"      ✅ Generated: {segment_name}")
-                                
-                                # Add delay between requests
-                                if delay_between_requests > 0:
-                                    await asyncio.sleep(delay_between_requests / 1000)
-                                
-                            else:
-                                failed_segments.append(f"{segment_name} ({language})")
-                                print(f"      ❌ Failed to generate: {segment_name}")
-                                
-                        except Exception as e:
-                            failed_segments.append(f"{segment_name} ({language})")
-                            print(f"      ❌ Error generating {segment_name}: {str(e)}")
-                    
-                    print(f"   ✅ Completed language: {language}")
-                    
-                except Exception as e:
-                    print(f"   ❌ Error processing language {language}: {str(e)}")
-                    failed_segments.append(f"language_{language}")
-            
-            print(f"🎉 Category {category.category_code} completed!")
-            print(f"   Generated: {total_generated}")
-            print(f"   Failed: {len(failed_segments)}")
-            
-            return {
-                'total_generated': total_generated,
-                'generated_segments': generated_segments,
-                'failed_segments': failed_segments
-            }
-            
-        except Exception as e:
-            print(f"❌ Error generating segments for category {category_id}: {str(e)}")
-            return {
-                'total_generated': 0,
-                'generated_segments': [],
-                'failed_segments': [str(e)]
-            }
+        category_code = category.category_code
+        print(f"🎵 Generating audio segments for category: {category_code}")
+
+        pending = self._collect_pending_segments(db, category, languages, overwrite_existing)
+
+        # Synthesize concurrently on the event loop; pacing is enforced by the shared TTS rate limiter
+        outcomes = await asyncio.gather(
+            *[
+                async_gcp_tts_client.generate_audio(item["segment_text"], item["language"], item["audio_file_path"])
+                for item in pending
+            ],
+            return_exceptions=True
+        )
+        durations = [None if isinstance(outcome, Exception) else outcome for outcome in outcomes]
+
+        result = self._save_segments(db, category, pending, durations)
+        print(f"🎯 Category {category_code} completed: {result['total_generated']} generated, {len(result['failed_segments'])} failed")
+        return result
+
+    async def generate_segments_for_all_categories_async(self, db: Session, languages: List[str], overwrite_existing: bool = False) -> Dict:
+        """Generate audio segments for all categories without blocking the event loop"""
+        categories = db.query(AnnouncementCategory).all()
+        all_generated_segments = []
+        all_failed_segments = []
+        categories_processed = []
+        failed_categories = []
+
+        for category in categories:
+            try:
+                result = await self.generate_segments_for_category_async(
+                    db, category.id, languages, overwrite_existing
+                )
+                all_generated_segments.extend(result["generated_segments"])
+                all_failed_segments.extend(result["failed_segments"])
+                categories_processed.append(category.category_code)
+            except Exception as e:
+                failed_categories.append(f"{category.category_code}: {str(e)}")
+
+        return {
+            "generated_segments": all_generated_segments,
+            "failed_segments": all_failed_segments,
+            "categories_processed": categories_processed,
+            "failed_categories": failed_categories,
+            "total_generated": len(all_generated_segments)
+        }
 
     def delete_segments_for_category(self, db: Session, category_id: int) -> bool:
         """Delete all audio segments for a category"""
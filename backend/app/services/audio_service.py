@@ -1,133 +1,330 @@
 import os
-from typing import Dict, List, Optional
+import shutil
+from typing import Dict, List, Optional, Tuple
 from sqlalchemy.orm import Session
 from app.models.audio_file import AudioFile
 from app.models.train_route_translation import TrainRouteTranslation
 from app.models.train_route import TrainRoute
+from app.utils.tts_executor import synthesis_executor
 from app.utils.gcp_tts_client import gcp_tts_client
+from app.utils.bulk_plan import plan_items
+from app.utils.content_hash import content_hash
+from app.core.config.settings import settings
 
 class AudioService:
     def __init__(self):
         self.audio_base_path = "/var/www/war-ddh/ai-audio-translations"
+        # Train numbers are spoken from the numeral bank, so only names and stations are synthesized per route
         self.audio_types = [
-            'train_number_words',
             'train_name', 
             'start_station_name',
             'end_station_name'
         ]
 
-    def generate_audio_for_route(self, db: Session, train_route_id: int, languages: Optional[List[str]] = None) -> Dict:
+    @staticmethod
+    def _clip_hash(language_code: str, text: str) -> str:
+        """Hash of what a clip is spoken from: its language, text and voice"""
+        return content_hash(language_code, text, gcp_tts_client.voice_name(language_code))
+
+    def _route_jobs(self, db: Session, train_route_id: int, languages: Optional[List[str]] = None):
+        """
+        List the synthesis jobs for a route without touching its files
+        
+        Returns:
+            Tuple of (translations, jobs, job_keys) where jobs are (text, language_code, path)
+            tuples and job_keys the matching (language_code, audio_type) pairs
+        """
+        # Get the train route
+        train_route = db.query(TrainRoute).filter(TrainRoute.id == train_route_id).first()
+        if not train_route:
+            raise ValueError(f"Train route with ID {train_route_id} not found")
+        
+        # Get existing translations for this route
+        translations_query = db.query(TrainRouteTranslation).filter(
+            TrainRouteTranslation.train_route_id == train_route_id
+        )
+        
+        if languages:
+            translations_query = translations_query.filter(
+                TrainRouteTranslation.language_code.in_(languages)
+            )
+        
+        translations = translations_query.all()
+        
+        if not translations:
+            raise ValueError(f"No text translations found for train route {train_route_id}")
+        
+        # Collect synthesis jobs for every language and audio type
+        jobs = []
+        job_keys = []
+        
+        for translation in translations:
+            lang_code = translation.language_code
+            train_dir = os.path.join(self.audio_base_path, f"train_{train_route_id}", lang_code)
+            
+            for audio_type in self.audio_types:
+                text_content = getattr(translation, audio_type)
+                if text_content:
+                    # Create filename
+                    filename = f"{audio_type}.mp3"
+                    file_path = os.path.join(train_dir, filename)
+                    jobs.append((text_content, lang_code, file_path))
+                    job_keys.append((lang_code, audio_type))
+        
+        return translations, jobs, job_keys
+
+    def _pending_route_jobs(self, db: Session, train_route_id: int, languages: Optional[List[str]] = None, overwrite_existing: bool = False):
+        """
+        List the synthesis jobs for a route whose clip is missing or out of date
+        
+        A clip is current when its row records the hash of the text and voice it
+        was spoken with and its file still exists; rows from before hashes were recorded are
+        treated as out of date.
+        
+        Returns:
+            Tuple of (translations, jobs, job_keys, stale) where stale are the
+            AudioFile rows the pending jobs replace
+        """
+        translations, jobs, job_keys = self._route_jobs(db, train_route_id, languages)
+        
+        existing = {
+            (audio_file.language_code, audio_file.audio_type): audio_file
+            for audio_file in db.query(AudioFile).filter(AudioFile.train_route_id == train_route_id).all()
+        }
+        
+        pending_jobs = []
+        pending_keys = []
+        stale = []
+        for job, key in zip(jobs, job_keys):
+            audio_file = existing.get(key)
+            if (
+                overwrite_existing
+                or audio_file is None
+                or audio_file.source_hash != self._clip_hash(job[1], job[0])
+                or not os.path.exists(audio_file.audio_file_path)
+            ):
+                pending_jobs.append(job)
+                pending_keys.append(key)
+                if audio_file is not None:
+                    stale.append(audio_file)
+        
+        return translations, pending_jobs, pending_keys, stale
+
+    def _collect_route_jobs(self, db: Session, train_route_id: int, languages: Optional[List[str]] = None, overwrite_existing: bool = False):
+        """
+        Prepare the pending synthesis jobs for a route, removing the audio they replace
+        
+        Returns:
+            Same as _route_jobs, limited to pending jobs
+        """
+        translations, jobs, job_keys, stale = self._pending_route_jobs(db, train_route_id, languages, overwrite_existing)
+        
+        # Delete the out-of-date audio files for this route
+        for audio_file in stale:
+            try:
+                if os.path.exists(audio_file.audio_file_path):
+                    os.remove(audio_file.audio_file_path)
+            except Exception as e:
+                print(f"⚠️ Could not delete physical file {audio_file.audio_file_path}: {str(e)}")
+            db.delete(audio_file)
+        
+        # Create directories for this train's languages
+        for train_dir in {os.path.dirname(file_path) for _, _, file_path in jobs}:
+            os.makedirs(train_dir, exist_ok=True)
+        
+        return translations, jobs, job_keys
+
+    @staticmethod
+    def _link_clip(source_path: str, output_path: str) -> bool:
+        """Hard-link (or copy) an already synthesized clip into place"""
+        try:
+            if os.path.lexists(output_path):
+                os.remove(output_path)
+            try:
+                os.link(source_path, output_path)
+            except OSError:
+                shutil.copyfile(source_path, output_path)
+            return True
+        except OSError as e:
+            print(f"⚠️ Could not reuse clip {source_path}: {str(e)}")
+            return False
+
+    def _synthesize_unique(self, jobs: List[Tuple[str, str, str]], synthesized: Dict) -> List[Optional[float]]:
+        """
+        Synthesize the first job for each distinct (text, language) and link the rest
+        
+        Args:
+            jobs: (text, language_code, path) tuples
+            synthesized: Clips from earlier calls in the same run, extended in place
+        
+        Returns:
+            List of audio durations in job order, None for jobs that failed
+        """
+        results: List[Optional[float]] = [None] * len(jobs)
+        unique_jobs = []
+        unique_indexes = []
+        followers = []
+        pending = set()
+        for index, (text, lang_code, _) in enumerate(jobs):
+            key = (text, lang_code)
+            if key in synthesized or key in pending:
+                followers.append(index)
+            else:
+                pending.add(key)
+                unique_jobs.append(jobs[index])
+                unique_indexes.append(index)
+        
+        if unique_jobs:
+            if settings.TTS_BATCH_ENABLED:
+                durations = synthesis_executor.generate_batched(unique_jobs)
+            else:
+                durations = synthesis_executor.generate_many(unique_jobs)
+            for index, (text, lang_code, file_path), duration in zip(unique_indexes, unique_jobs, durations):
+                results[index] = duration
+                if duration:
+                    synthesized[(text, lang_code)] = (file_path, duration)
+        
+        for index in followers:
+            text, lang_code, file_path = jobs[index]
+            source = synthesized.get((text, lang_code))
+            if source and self._link_clip(source[0], file_path):
+                results[index] = source[1]
+        
+        if followers:
+            print(f"♻️ Reused {len(followers)} clips, synthesized {len(unique_jobs)} unique texts")
+        return results
+
+    def _routes_with_translations(self, db: Session) -> List[int]:
+        """IDs of routes that have text translations"""
+        return [route[0] for route in db.query(TrainRouteTranslation.train_route_id).distinct().all()]
+
+    def plan_audio_for_all_routes(self, db: Session, languages: Optional[List[str]] = None, overwrite_existing: bool = False) -> Dict:
+        """
+        Describe the work generate_audio_for_all_routes would do, without synthesizing
+        
+        Returns:
+            Dict with total vs unique clips, clips already in the synthesis cache,
+            estimated API characters and requests per language
+        """
+        route_ids = self._routes_with_translations(db)
+        
+        items = []
+        failed_routes = []
+        unchanged_routes = 0
+        for route_id in route_ids:
+            try:
+                _, jobs, _, _ = self._pending_route_jobs(db, route_id, languages, overwrite_existing)
+                if not jobs:
+                    unchanged_routes += 1
+                items.extend((text, lang_code) for text, lang_code, _ in jobs)
+            except Exception as e:
+                failed_routes.append({"route_id": str(route_id), "error": str(e)})
+        
+        batch = settings.TTS_BATCH_ENABLED
+        plan = plan_items(
+            items,
+            is_cached=lambda texts, lang_code: {text for text in texts if gcp_tts_client.is_cached(text, lang_code)},
+            count_requests=lambda texts, lang_code: len(gcp_tts_client.split_batches(texts)) if batch else len(texts)
+        )
+        plan.update({
+            "dry_run": True,
+            "operation": "route_audio",
+            "total_routes": len(route_ids),
+            "routes_to_process": len(route_ids) - len(failed_routes) - unchanged_routes,
+            "unchanged_routes": unchanged_routes,
+            "failed_routes": failed_routes
+        })
+        return plan
+
+    def _save_route_audio(self, db: Session, train_route_id: int, translations, jobs, job_keys, results) -> Dict:
+        """Record generated clips for a route and build its result summary"""
+        generated_files = {translation.language_code: {} for translation in translations}
+        total_files_generated = 0
+        
+        for (lang_code, audio_type), (text_content, _, file_path), audio_duration in zip(job_keys, jobs, results):
+            if audio_duration:
+                # Save to database
+                audio_file = AudioFile(
+                    train_route_id=train_route_id,
+                    language_code=lang_code,
+                    audio_type=audio_type,
+                    audio_file_path=file_path,
+                    audio_duration=audio_duration,
+                    source_hash=self._clip_hash(lang_code, text_content)
+                )
+                db.add(audio_file)
+                generated_files[lang_code][audio_type] = file_path
+                total_files_generated += 1
+            else:
+                print(f"⚠️ Failed to generate audio for {audio_type} in {lang_code}")
+        
+        return {
+            "success": True,
+            "train_route_id": train_route_id,
+            "translations_processed": len(translations),
+            "audio_files_generated": total_files_generated,
+            "languages": list(generated_files.keys()),
+            "audio_types": self.audio_types,
+            "generated_files": generated_files
+        }
+
+    def generate_audio_for_route(self, db: Session, train_route_id: int, languages: Optional[List[str]] = None, overwrite_existing: bool = False) -> Dict:
         """
         Generate audio files for a specific train route using existing text translations
         
+        Only clips whose text changed since they were generated (or whose file is
+        missing) are synthesized again.
+        
         Args:
             db: Database session
             train_route_id: ID of the train route
             languages: List of language codes to generate audio for (defaults to all available)
+            overwrite_existing: Regenerate every clip even if its text is unchanged
             
         Returns:
             Dict with generation results
         """
         try:
-            # Get the train route
-            train_route = db.query(TrainRoute).filter(TrainRoute.id == train_route_id).first()
-            if not train_route:
-                raise ValueError(f"Train route with ID {train_route_id} not found")
-            
-            # Get existing translations for this route
-            translations_query = db.query(TrainRouteTranslation).filter(
-                TrainRouteTranslation.train_route_id == train_route_id
-            )
-            
-            if languages:
-                translations_query = translations_query.filter(
-                    TrainRouteTranslation.language_code.in_(languages)
-                )
+            translations, jobs, job_keys = self._collect_route_jobs(db, train_route_id, languages, overwrite_existing)
             
-            translations = translations_query.all()
+            # Generate audio concurrently through the shared synthesis pool
+            results = synthesis_executor.generate_many(jobs)
             
-            if not translations:
-                raise ValueError(f"No text translations found for train route {train_route_id}")
-            
-            # Delete existing audio files for this route
-            self._delete_existing_audio_files(db, train_route_id)
-            
-            # Generate audio files
-            generated_files = {}
-            total_files_generated = 0
-            
-            for translation in translations:
-                lang_code = translation.language_code
-                generated_files[lang_code] = {}
-                
-                # Create directory for this train and language
-                train_dir = os.path.join(self.audio_base_path, f"train_{train_route_id}", lang_code)
-                os.makedirs(train_dir, exist_ok=True)
-                
-                # Generate audio for each audio type
-                for audio_type in self.audio_types:
-                    text_content = getattr(translation, audio_type)
-                    if text_content:
-                        # Create filename
-                        filename = f"{audio_type}.mp3"
-                        file_path = os.path.join(train_dir, filename)
-                        
-                        # Generate audio
-                        success = gcp_tts_client.generate_audio(
-                            text=text_content,
-                            language_code=lang_code,
-                            output_path=file_path
-                        )
-                        
-                        if success:
-                            # Save to database
-                            audio_file = AudioFile(
-                                train_route_id=train_route_id,
-                                language_code=lang_code,
-                                audio_type=audio_type,
-                                audio_file_path=file_path
-                            )
-                            db.add(audio_file)
-                            generated_files[lang_code][audio_type] = file_path
-                            total_files_generated += 1
-                        else:
-                            print(f"⚠️ Failed to generate audio for {audio_type} in {lang_code}")
+            result = self._save_route_audio(db, train_route_id, translations, jobs, job_keys, results)
             
             # Commit all changes
             db.commit()
             
-            return {
-                "success": True,
-                "train_route_id": train_route_id,
-                "translations_processed": len(translations),
-                "audio_files_generated": total_files_generated,
-                "languages": list(generated_files.keys()),
-                "audio_types": self.audio_types,
-                "generated_files": generated_files
-            }
+            return result
             
         except Exception as e:
             db.rollback()
             raise Exception(f"Error generating audio for train route {train_route_id}: {str(e)}")
 
-    def generate_audio_for_all_routes(self, db: Session, languages: Optional[List[str]] = None, overwrite_existing: bool = False) -> Dict:
+    def generate_audio_for_all_routes(self, db: Session, languages: Optional[List[str]] = None, overwrite_existing: bool = False, progress=None) -> Dict:
         """
         Generate audio files for all train routes that have text translations
         
+        Routes are processed in chunks of BULK_JOB_CHUNK_SIZE, committed per chunk.
+        Only clips whose text hash differs from the one recorded with their audio
+        are regenerated; routes with nothing out of date are counted as unchanged.
+        Each distinct (text, language) is synthesized once per run and linked into
+        every other route that needs it, so a station shared by hundreds of routes
+        costs one clip. With TTS_BATCH_ENABLED the unique texts of a chunk are
+        packed into batched SSML requests, otherwise each is its own request.
+        
         Args:
             db: Database session
             languages: List of language codes to generate audio for
-            overwrite_existing: Whether to overwrite existing audio files
+            overwrite_existing: Regenerate every clip even if its text is unchanged
+            progress: Optional JobProgress receiving one item per route
             
         Returns:
             Dict with bulk generation results
         """
         try:
             # Get all train routes that have translations
-            routes_with_translations = db.query(TrainRouteTranslation.train_route_id).distinct().all()
-            route_ids = [route[0] for route in routes_with_translations]
-            
-            if not route_ids:
+            if not db.query(TrainRouteTranslation.train_route_id).first():
                 return {
                     "success": True,
                     "message": "No train routes with translations found",
@@ -139,19 +336,41 @@ class AudioService:
             failed_routes = []
             summary = {}
             
-            for route_id in route_ids:
-                try:
-                    if not overwrite_existing:
-                        # Check if audio files already exist
-                        existing_audio = db.query(AudioFile).filter(
-                            AudioFile.train_route_id == route_id
-                        ).first()
-                        
-                        if existing_audio:
-                            print(f"⚠️ Audio files already exist for train route {route_id}, skipping...")
+            unchanged_routes = 0
+            route_ids = self._routes_with_translations(db)
+            
+            # (text, language) -> (file_path, duration) of clips already synthesized by this run
+            synthesized = {}
+            
+            if progress:
+                progress.set_total(len(route_ids))
+            
+            chunk_size = max(1, settings.BULK_JOB_CHUNK_SIZE)
+            for chunk_start in range(0, len(route_ids), chunk_size):
+                # Collect jobs from every route in the chunk before synthesizing anything
+                route_jobs = []
+                all_jobs = []
+                for route_id in route_ids[chunk_start:chunk_start + chunk_size]:
+                    try:
+                        translations, jobs, job_keys = self._collect_route_jobs(db, route_id, languages, overwrite_existing)
+                        if not jobs:
+                            unchanged_routes += 1
+                            if progress:
+                                progress.advance()
                             continue
-                    
-                    result = self.generate_audio_for_route(db, route_id, languages)
+                        route_jobs.append((route_id, translations, jobs, job_keys, len(all_jobs)))
+                        all_jobs.extend(jobs)
+                    except Exception as e:
+                        failed_routes.append({"route_id": route_id, "error": str(e)})
+                        print(f"❌ Failed to generate audio for train route {route_id}: {str(e)}")
+                        if progress:
+                            progress.fail(route_id, str(e))
+                
+                all_results = self._synthesize_unique(all_jobs, synthesized)
+                
+                for route_id, translations, jobs, job_keys, start in route_jobs:
+                    results = all_results[start:start + len(jobs)]
+                    result = self._save_route_audio(db, route_id, translations, jobs, job_keys, results)
                     total_files_generated += result["audio_files_generated"]
                     
                     # Update summary
@@ -159,20 +378,22 @@ class AudioService:
                         if lang not in summary:
                             summary[lang] = 0
                         summary[lang] += len(result["generated_files"][lang])
-                        
-                except Exception as e:
-                    failed_routes.append({"route_id": route_id, "error": str(e)})
-                    print(f"❌ Failed to generate audio for train route {route_id}: {str(e)}")
+                
+                db.commit()
+                if progress:
+                    progress.advance(len(route_jobs))
             
             return {
                 "success": True,
                 "total_routes_processed": len(route_ids),
                 "total_files_generated": total_files_generated,
+                "unchanged_routes": unchanged_routes,
                 "failed_routes": failed_routes,
                 "summary": summary
             }
             
         except Exception as e:
+            db.rollback()
             raise Exception(f"Error in bulk audio generation: {str(e)}")
 
     def get_audio_files_for_route(self, db: Session, train_route_id: int) -> List[AudioFile]:
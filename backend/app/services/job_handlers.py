@@ -0,0 +1,84 @@
+import os
+from typing import Dict
+from sqlalchemy.orm import Session
+from app.services.job_service import job_manager, JobProgress
+from app.services.audio_service import audio_service
+from app.services.announcement_service import announcement_service
+from app.services.audio_segment_service import AudioSegmentService
+from app.services.translation_service import bulk_translate_all_routes
+from app.services.route_import_service import route_import_service
+from app.services.numeral_service import numeral_service
+
+# Job results keep the shape of the synchronous bulk responses they replace
+
+def run_route_audio_job(db: Session, parameters: Dict, progress: JobProgress) -> Dict:
+    """Generate audio for every translated train route"""
+    return audio_service.generate_audio_for_all_routes(
+        db=db,
+        languages=parameters.get("languages"),
+        overwrite_existing=parameters.get("overwrite_existing", False),
+        progress=progress
+    )
+
+def run_route_translation_job(db: Session, parameters: Dict, progress: JobProgress) -> Dict:
+    """Translate every train route"""
+    return bulk_translate_all_routes(
+        db,
+        parameters.get("source_language") or "en",
+        progress=progress,
+        overwrite_existing=parameters.get("overwrite_existing", False)
+    )
+
+def run_announcement_audio_job(db: Session, parameters: Dict, progress: JobProgress) -> Dict:
+    """Generate template audio for every announcement category"""
+    result = announcement_service.generate_audio_for_all_categories(
+        db,
+        parameters.get("languages"),
+        parameters.get("overwrite_existing", False),
+        progress=progress
+    )
+    if not result["success"]:
+        raise Exception(result["error"])
+    return result
+
+def run_audio_segment_job(db: Session, parameters: Dict, progress: JobProgress) -> Dict:
+    """Generate audio segments for every announcement category"""
+    result = AudioSegmentService().generate_segments_for_all_categories(
+        db,
+        parameters.get("languages") or ["en", "hi", "mr", "gu"],
+        parameters.get("overwrite_existing", False),
+        progress=progress
+    )
+    return {
+        "message": f"Generated {result['total_generated']} audio segments across {len(result['categories_processed'])} categories",
+        "total_segments_generated": result["total_generated"],
+        "total_categories": len(result["categories_processed"]),
+        "categories_processed": result["categories_processed"],
+        "failed_categories": result["failed_categories"],
+        "failed_segments": result["failed_segments"]
+    }
+
+def run_route_import_job(db: Session, parameters: Dict, progress: JobProgress) -> Dict:
+    """Import a spooled timetable file, removing it once the import has finished"""
+    path = parameters["path"]
+    try:
+        return route_import_service.import_file(db, path, parameters["file_type"], parameters.get("mode", "skip"), progress=progress)
+    finally:
+        if os.path.exists(path):
+            os.remove(path)
+
+def run_numeral_bank_job(db: Session, parameters: Dict, progress: JobProgress) -> Dict:
+    """Synthesize the numeral clip bank"""
+    return numeral_service.generate_bank(
+        db=db,
+        languages=parameters.get("languages"),
+        overwrite_existing=parameters.get("overwrite_existing", False),
+        progress=progress
+    )
+
+job_manager.register("route_audio", run_route_audio_job)
+job_manager.register("route_translation", run_route_translation_job)
+job_manager.register("announcement_audio", run_announcement_audio_job)
+job_manager.register("audio_segments", run_audio_segment_job)
+job_manager.register("route_import", run_route_import_job)
+job_manager.register("numeral_bank", run_numeral_bank_job)
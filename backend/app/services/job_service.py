@@ -0,0 +1,302 @@
+import json
+import time
+import uuid
+import threading
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from app.core.database import SessionLocal
+from app.models.job import Job
+from app.core.config.settings import settings
+from app.utils.content_hash import content_hash
+
+ACTIVE_STATUSES = ("queued", "running")
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+def job_dedupe_key(job_type: str, parameters: Dict) -> str:
+    """Key shared by jobs of the same type with equal parameters, whatever their key order"""
+    return content_hash(job_type, json.dumps(parameters, sort_keys=True, default=str))
+
+def _elapsed_seconds(started_at: Optional[datetime], finished_at: Optional[datetime] = None) -> Optional[float]:
+    """Seconds between two timestamps; SQLite returns them without a timezone, so naive values are UTC"""
+    if not started_at:
+        return None
+    end = finished_at or _utcnow()
+    if started_at.tzinfo is None:
+        started_at = started_at.replace(tzinfo=timezone.utc)
+    if end.tzinfo is None:
+        end = end.replace(tzinfo=timezone.utc)
+    return max(0.0, (end - started_at).total_seconds())
+
+class JobProgress:
+    """
+    Progress reporter handed to bulk operations running as a job
+
+    Counters are kept in memory and written to the job row at most once per
+    JOB_PROGRESS_INTERVAL_SECONDS through a session of their own, so reporting
+    never commits (or waits on) the work the job is doing.
+    """
+
+    def __init__(self, job_id: str):
+        self.job_id = job_id
+        self.total_items = 0
+        self.completed_items = 0
+        self.failed_items = 0
+        self.failures: List[Dict] = []
+        self._last_flush = 0.0
+
+    def set_total(self, total_items: int):
+        """Set the number of items the job will process"""
+        self.total_items = total_items
+        self.flush(force=True)
+
+    def advance(self, count: int = 1):
+        """Record items that completed successfully"""
+        self.completed_items += count
+        self.flush()
+
+    def fail(self, item, error: str):
+        """Record an item that failed; the job keeps going"""
+        self.failed_items += 1
+        if len(self.failures) < settings.JOB_MAX_RECORDED_FAILURES:
+            self.failures.append({"item": str(item), "error": str(error)})
+        self.flush()
+
+    def flush(self, force: bool = False):
+        """Write counters to the job row if the reporting interval has passed"""
+        now = time.monotonic()
+        if not force and now - self._last_flush < settings.JOB_PROGRESS_INTERVAL_SECONDS:
+            return
+        self._last_flush = now
+
+        db = SessionLocal()
+        try:
+            db.query(Job).filter(Job.id == self.job_id).update({
+                Job.total_items: self.total_items,
+                Job.completed_items: self.completed_items,
+                Job.failed_items: self.failed_items,
+                Job.failures_json: list(self.failures)
+            }, synchronize_session=False)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            print(f"⚠️ Could not record progress for job {self.job_id}: {str(e)}")
+        finally:
+            db.close()
+
+class JobManager:
+    """
+    Database-backed queue for long-running bulk operations
+
+    Endpoints enqueue a job and return its ID straight away; a small worker pool
+    runs the registered handler with its own database session. Job rows hold the
+    parameters, progress, failures and result, so clients poll /jobs/{id} and jobs
+    that were queued or running when the server stopped are started again on boot.
+    """
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._handlers: Dict[str, Callable[[Session, Dict, JobProgress], Dict]] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def register(self, job_type: str, handler: Callable[[Session, Dict, JobProgress], Dict]):
+        """Register the function that runs a job type: handler(db, parameters, progress) -> result"""
+        self._handlers[job_type] = handler
+
+    def _submit(self, job_id: str):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="job")
+            self._executor.submit(self._run, job_id)
+
+    def enqueue(self, db: Session, job_type: str, parameters: Dict) -> Job:
+        """
+        Queue a job, or return the active job with the same type and parameters
+
+        A unique index on the dedupe key of queued and running jobs makes the
+        database the arbiter: when another worker or process inserts the same job
+        first, the insert fails and the job it queued is returned instead.
+
+        Raises:
+            ValueError: If no handler is registered for job_type
+        """
+        if job_type not in self._handlers:
+            raise ValueError(f"Unknown job type: {job_type}")
+
+        dedupe_key = job_dedupe_key(job_type, parameters)
+        while True:
+            job = self._active_job(db, dedupe_key)
+            if job:
+                print(f"⚠️ Job {job.id} ({job_type}) is already {job.status}, not queuing a duplicate")
+                return job
+
+            job = Job(
+                id=str(uuid.uuid4()),
+                job_type=job_type,
+                status="queued",
+                parameters_json=parameters,
+                dedupe_key=dedupe_key,
+                failures_json=[]
+            )
+            db.add(job)
+            try:
+                db.commit()
+            except IntegrityError:
+                # Lost the race; the winner is found on the next pass unless it already finished
+                db.rollback()
+                continue
+            db.refresh(job)
+            break
+
+        self._submit(job.id)
+        print(f"📋 Queued job {job.id} ({job_type})")
+        return job
+
+    def _active_job(self, db: Session, dedupe_key: str) -> Optional[Job]:
+        """Get the queued or running job with a dedupe key"""
+        return db.query(Job).filter(Job.dedupe_key == dedupe_key, Job.status.in_(ACTIVE_STATUSES)).first()
+
+    def _run(self, job_id: str):
+        """Run a job on a worker thread and record its outcome"""
+        db = SessionLocal()
+        try:
+            job = db.query(Job).filter(Job.id == job_id).first()
+            if not job or job.status not in ACTIVE_STATUSES:
+                return
+
+            handler = self._handlers.get(job.job_type)
+            if handler is None:
+                job.status = "failed"
+                job.error_message = f"Unknown job type: {job.job_type}"
+                job.finished_at = _utcnow()
+                db.commit()
+                return
+
+            job.status = "running"
+            job.started_at = _utcnow()
+            job.total_items = 0
+            job.completed_items = 0
+            job.failed_items = 0
+            job.failures_json = []
+            job.error_message = None
+            parameters = dict(job.parameters_json or {})
+            job_type = job.job_type
+            db.commit()
+
+            print(f"🚀 Running job {job_id} ({job_type})")
+            progress = JobProgress(job_id)
+            try:
+                result = handler(db, parameters, progress)
+                status, error_message = "completed", None
+            except Exception as e:
+                db.rollback()
+                result, status, error_message = None, "failed", str(e)
+                print(f"❌ Job {job_id} ({job_type}) failed: {str(e)}")
+
+            job = db.query(Job).filter(Job.id == job_id).first()
+            job.status = status
+            job.error_message = error_message
+            job.result_json = result
+            job.total_items = max(progress.total_items, progress.completed_items + progress.failed_items)
+            job.completed_items = progress.completed_items
+            job.failed_items = progress.failed_items
+            job.failures_json = list(progress.failures)
+            job.finished_at = _utcnow()
+            db.commit()
+            print(f"✅ Job {job_id} ({job_type}) {status}: {progress.completed_items} done, {progress.failed_items} failed")
+        except Exception as e:
+            db.rollback()
+            print(f"❌ Could not run job {job_id}: {str(e)}")
+        finally:
+            db.close()
+
+    def resume_incomplete(self) -> int:
+        """Start again every job that was queued or running when the process stopped"""
+        db = SessionLocal()
+        try:
+            job_ids = [
+                job_id for (job_id,) in db.query(Job.id).filter(Job.status.in_(ACTIVE_STATUSES)).order_by(Job.created_at).all()
+            ]
+            db.query(Job).filter(Job.id.in_(job_ids)).update({Job.status: "queued"}, synchronize_session=False)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            print(f"⚠️ Could not resume jobs: {str(e)}")
+            return 0
+        finally:
+            db.close()
+
+        for job_id in job_ids:
+            self._submit(job_id)
+        if job_ids:
+            print(f"🔁 Resumed {len(job_ids)} unfinished jobs")
+        return len(job_ids)
+
+    def get_submission(self, job: Job) -> Dict:
+        """Build the response returned when a job is submitted"""
+        return {
+            "success": True,
+            "job_id": job.id,
+            "job_type": job.job_type,
+            "status": job.status,
+            "status_url": f"{settings.API_V1_STR}/jobs/{job.id}",
+            "message": f"Job {job.job_type} is {job.status}; poll the status URL for progress"
+        }
+
+    def get_job(self, db: Session, job_id: str) -> Optional[Job]:
+        """Get a job by ID"""
+        return db.query(Job).filter(Job.id == job_id).first()
+
+    def list_jobs(self, db: Session, job_type: Optional[str] = None, limit: int = 50) -> List[Job]:
+        """Get the most recent jobs, newest first"""
+        query = db.query(Job)
+        if job_type:
+            query = query.filter(Job.job_type == job_type)
+        return query.order_by(Job.created_at.desc()).limit(limit).all()
+
+    def get_status(self, job: Job) -> Dict:
+        """Build the status report for a job, including throughput and ETA"""
+        processed = (job.completed_items or 0) + (job.failed_items or 0)
+        total = job.total_items or 0
+        elapsed = _elapsed_seconds(job.started_at, job.finished_at)
+
+        items_per_second = None
+        eta_seconds = None
+        if elapsed and processed:
+            items_per_second = round(processed / elapsed, 3)
+            if job.status == "running" and total > processed:
+                eta_seconds = round((total - processed) / items_per_second, 1)
+        if job.status in ("completed", "failed"):
+            eta_seconds = 0.0
+
+        if job.status == "completed":
+            progress_percent = 100.0
+        else:
+            progress_percent = round(100.0 * processed / total, 1) if total else 0.0
+
+        return {
+            "job_id": job.id,
+            "job_type": job.job_type,
+            "status": job.status,
+            "parameters": job.parameters_json or {},
+            "total_items": total,
+            "completed_items": job.completed_items or 0,
+            "failed_items": job.failed_items or 0,
+            "progress_percent": progress_percent,
+            "items_per_second": items_per_second,
+            "eta_seconds": eta_seconds,
+            "failures": job.failures_json or [],
+            "result": job.result_json,
+            "error_message": job.error_message,
+            "created_at": job.created_at,
+            "started_at": job.started_at,
+            "finished_at": job.finished_at
+        }
+
+# Create service instance
+job_manager = JobManager(max_workers=settings.JOB_MAX_WORKERS)
@@ -0,0 +1,233 @@
+import os
+from typing import Dict, List, Optional
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from app.models.numeral_clip import NumeralClip
+from app.utils.tts_executor import synthesis_executor
+from app.utils.gcp_tts_client import gcp_tts_client
+from app.utils.numerals import cardinal_words
+from app.core.config.settings import settings
+
+class NumeralBankService:
+    """
+    Pre-synthesized clips for numbers, composed into spoken values at assembly time
+
+    The bank holds one clip per number 0-999 and per unit word for every language,
+    each synthesized from the number's words in app.utils.numerals rather than
+    left for the TTS voice to read.
+    Train numbers are read digit by digit from the 0-9 clips; platforms and delay
+    minutes are read as cardinals, falling back to digits above the bank's range.
+    Clips are spoken with the same voice as the segments they are spliced
+    between, and each records that voice so a voice change regenerates the bank.
+    """
+
+    def __init__(self):
+        self.audio_base_path = "/var/www/war-ddh/ai-audio-translations/numerals"
+        self.languages = ['en', 'hi', 'mr', 'gu']
+        self.max_value = 999
+
+        # Unit words spoken after a value
+        self.unit_words = {
+            'minutes': {
+                'en': 'minutes',
+                'hi': 'मिनट',
+                'mr': 'मिनिटे',
+                'gu': 'મિનિટ'
+            }
+        }
+
+    def get_tokens(self, language_code: str) -> Dict[str, str]:
+        """Get every bank token for a language with the text spoken for it"""
+        tokens = {str(value): cardinal_words(str(value), language_code) for value in range(self.max_value + 1)}
+        for unit, texts in self.unit_words.items():
+            tokens[unit] = texts[language_code]
+        return tokens
+
+    def get_clip_path(self, language_code: str, token: str) -> str:
+        """File path of a bank clip"""
+        return os.path.join(self.audio_base_path, language_code, f"{token}.mp3")
+
+    def generate_bank(self, db: Session, languages: Optional[List[str]] = None, overwrite_existing: bool = False, progress=None) -> Dict:
+        """
+        Synthesize missing bank clips and index them
+
+        Args:
+            db: Database session
+            languages: Language codes to generate (defaults to all)
+            overwrite_existing: Regenerate clips that are already in the bank with the same text and voice
+            progress: Optional JobProgress receiving one item per clip to synthesize
+
+        Returns:
+            Dict with generation results
+        """
+        try:
+            if languages is None:
+                languages = self.languages
+
+            for language_code in languages:
+                if language_code not in self.languages:
+                    raise ValueError(f"Unsupported language code: {language_code}")
+
+            existing = {
+                (clip.language_code, clip.token): clip
+                for clip in db.query(NumeralClip).filter(NumeralClip.language_code.in_(languages)).all()
+            }
+
+            jobs = []
+            pending = []
+            clips_skipped = 0
+            for language_code in languages:
+                os.makedirs(os.path.join(self.audio_base_path, language_code), exist_ok=True)
+                voice_name = gcp_tts_client.voice_name(language_code)
+                for token, spoken_text in self.get_tokens(language_code).items():
+                    existing_clip = existing.get((language_code, token))
+                    if (
+                        existing_clip
+                        and existing_clip.spoken_text == spoken_text
+                        and existing_clip.voice_name == voice_name
+                        and not overwrite_existing
+                    ):
+                        clips_skipped += 1
+                        continue
+                    file_path = self.get_clip_path(language_code, token)
+                    jobs.append((spoken_text, language_code, file_path))
+                    pending.append((language_code, token, spoken_text, voice_name, file_path, existing_clip))
+
+            if progress:
+                progress.set_total(len(jobs))
+
+            if settings.TTS_BATCH_ENABLED:
+                results = synthesis_executor.generate_batched(jobs)
+            else:
+                results = synthesis_executor.generate_many(jobs)
+
+            failed_tokens = []
+            summary = {language_code: 0 for language_code in languages}
+            for (language_code, token, spoken_text, voice_name, file_path, existing_clip), audio_duration in zip(pending, results):
+                if not audio_duration:
+                    failed_tokens.append(f"{language_code}:{token}")
+                    if progress:
+                        progress.fail(f"{language_code}:{token}", f"Could not synthesize '{spoken_text}'")
+                    continue
+
+                if existing_clip:
+                    existing_clip.spoken_text = spoken_text
+                    existing_clip.audio_file_path = file_path
+                    existing_clip.audio_duration = audio_duration
+                    existing_clip.voice_name = voice_name
+                else:
+                    db.add(NumeralClip(
+                        language_code=language_code,
+                        token=token,
+                        spoken_text=spoken_text,
+                        audio_file_path=file_path,
+                        audio_duration=audio_duration,
+                        voice_name=voice_name
+                    ))
+                summary[language_code] += 1
+                if progress:
+                    progress.advance()
+
+            db.commit()
+
+            return {
+                "success": True,
+                "clips_generated": sum(summary.values()),
+                "clips_skipped": clips_skipped,
+                "failed_tokens": failed_tokens,
+                "summary": summary
+            }
+
+        except Exception as e:
+            db.rollback()
+            raise Exception(f"Error generating numeral bank: {str(e)}")
+
+    def tokens_for_value(self, value: str, mode: str = "cardinal") -> List[str]:
+        """
+        Split a numeric value into bank tokens
+
+        Args:
+            value: Digits to speak (e.g. "12951", "7", "045")
+            mode: "digits" to read each digit, "cardinal" to read the number (digits above the bank range)
+
+        Returns:
+            List of bank tokens
+        """
+        value = str(value).strip()
+        if not value.isdigit() or not value.isascii():
+            raise ValueError(f"Not a number: {value}")
+
+        if mode == "digits":
+            return list(value)
+        if mode == "cardinal":
+            number = int(value)
+            return [str(number)] if number <= self.max_value else list(value)
+        raise ValueError(f"Unknown numeral mode: {mode}")
+
+    def get_clip_paths(self, db: Session, language_code: str, tokens: List[str]) -> List[str]:
+        """
+        Resolve bank tokens to clip files
+
+        Raises:
+            ValueError: If any token has no clip in the bank
+        """
+        clips = {
+            clip.token: clip.audio_file_path
+            for clip in db.query(NumeralClip).filter(
+                NumeralClip.language_code == language_code,
+                NumeralClip.token.in_(set(tokens))
+            ).all()
+        }
+
+        missing = sorted(set(token for token in tokens if token not in clips))
+        if missing:
+            raise ValueError(f"Numeral bank is missing {language_code} clips for: {', '.join(missing)}")
+
+        return [clips[token] for token in tokens]
+
+    def compose(self, db: Session, value: str, language_code: str, mode: str = "cardinal", unit: Optional[str] = None) -> List[str]:
+        """Get the ordered clip files that speak a value, optionally followed by a unit word"""
+        tokens = self.tokens_for_value(value, mode)
+        if unit:
+            if unit not in self.unit_words:
+                raise ValueError(f"Unknown unit word: {unit}")
+            tokens.append(unit)
+        return self.get_clip_paths(db, language_code, tokens)
+
+    def get_clips(self, db: Session, language_code: str) -> List[NumeralClip]:
+        """Get all bank clips for a language"""
+        return db.query(NumeralClip).filter(NumeralClip.language_code == language_code).all()
+
+    def get_status(self, db: Session) -> Dict:
+        """Count bank clips per language"""
+        clips_per_language = {language_code: 0 for language_code in self.languages}
+        counts = db.query(NumeralClip.language_code, func.count(NumeralClip.id)).group_by(NumeralClip.language_code).all()
+        for language_code, count in counts:
+            clips_per_language[language_code] = count
+
+        return {
+            "success": True,
+            "max_value": self.max_value,
+            "expected_per_language": self.max_value + 1 + len(self.unit_words),
+            "clips_per_language": clips_per_language
+        }
+
+    def clear_bank(self, db: Session) -> int:
+        """Delete every bank clip from the database and filesystem"""
+        clips = db.query(NumeralClip).all()
+
+        # Delete physical files
+        for clip in clips:
+            try:
+                if os.path.exists(clip.audio_file_path):
+                    os.remove(clip.audio_file_path)
+            except Exception as e:
+                print(f"⚠️ Could not delete physical file {clip.audio_file_path}: {str(e)}")
+
+        deleted_count = db.query(NumeralClip).delete()
+        db.commit()
+
+        return deleted_count
+
+# Create service instance
+numeral_service = NumeralBankService()
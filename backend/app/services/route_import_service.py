@@ -0,0 +1,357 @@
+import time
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+import pandas as pd
+from openpyxl import load_workbook
+from sqlalchemy import insert, update
+from sqlalchemy.orm import Session
+from app.models.train_route import TrainRoute
+from app.core.config.settings import settings
+from app.services.train_route_service import invalidate_route_count
+
+# Timetable column headings and the train_routes column each fills
+COLUMN_MAPPING = {
+    'Train Number': 'train_number',
+    'Train Name': 'train_name_en',
+    'Start Station': 'start_station_en',
+    'Start Station Code': 'start_station_code',
+    'End Station': 'end_station_en',
+    'End Station Code': 'end_station_code'
+}
+
+IMPORT_MODES = ("skip", "upsert")
+
+IMPORT_FILE_TYPES = ("csv", "xlsx")
+
+class RouteImportService:
+    """
+    Imports timetables into train_routes in batches
+
+    Columns are cleaned and validated with vectorized pandas operations, rows are
+    de-duplicated within the file (the last row for a train number wins), existing
+    train numbers are fetched in a few IN queries and new or changed routes are
+    written with executemany batches of IMPORT_BATCH_SIZE rows. All writes share
+    one transaction, so a failed import leaves the table as it was.
+
+    Files are read from disk IMPORT_CHUNK_ROWS rows at a time (CSV through the
+    pandas chunked reader, XLSX through openpyxl's read-only row stream), so
+    memory stays bounded however large the timetable is.
+    """
+
+    def __init__(self):
+        self.fields = list(COLUMN_MAPPING.values())
+        self.lookup_chunk_size = 500  # stays under SQLite's bound parameter limit
+
+    def check_columns(self, columns) -> None:
+        """
+        Raises:
+            ValueError: If any expected timetable column is missing
+        """
+        expected_columns = list(COLUMN_MAPPING)
+        missing_columns = [col for col in expected_columns if col not in columns]
+        if missing_columns:
+            raise ValueError(
+                f"Missing required columns: {', '.join(missing_columns)}. Expected columns: {', '.join(expected_columns)}"
+            )
+
+    def normalize(self, df: pd.DataFrame, first_row: int = 2) -> Tuple[pd.DataFrame, List[Dict]]:
+        """
+        Clean and validate a timetable frame
+
+        Args:
+            df: Frame with the COLUMN_MAPPING headings
+            first_row: Spreadsheet row number of the frame's first row (2 below a header row)
+
+        Returns:
+            Tuple of (valid rows with database column names and a "row" column, row errors)
+        """
+        self.check_columns(df.columns)
+
+        frame = df[list(COLUMN_MAPPING)].rename(columns=COLUMN_MAPPING)
+        frame = frame.astype("string").apply(lambda column: column.str.strip())
+        frame = frame.replace("", pd.NA)
+        # Spreadsheets hand numeric train numbers over as floats when the column has blanks
+        frame["train_number"] = frame["train_number"].str.replace(r"\.0+$", "", regex=True)
+        frame.insert(0, "row", range(first_row, first_row + len(frame)))
+
+        errors = []
+        missing = frame[self.fields].isna()
+        has_missing = missing.any(axis=1)
+        for row, train_number, columns in zip(
+            frame.loc[has_missing, "row"],
+            frame.loc[has_missing, "train_number"],
+            missing[has_missing].apply(lambda flags: ", ".join(flags.index[flags]), axis=1)
+        ):
+            errors.append(self._error(row, train_number, f"Missing {columns}"))
+        frame = frame[~has_missing]
+
+        invalid_number = ~frame["train_number"].str.fullmatch(r"[0-9]{5}").astype(bool)
+        for row, train_number in zip(frame.loc[invalid_number, "row"], frame.loc[invalid_number, "train_number"]):
+            errors.append(self._error(row, train_number, "Train number must be exactly 5 digits"))
+        frame = frame[~invalid_number]
+
+        duplicated = frame.duplicated("train_number", keep="last")
+        for row, train_number in zip(frame.loc[duplicated, "row"], frame.loc[duplicated, "train_number"]):
+            errors.append(self._error(row, train_number, "Duplicate train number in file; a later row replaces it"))
+        frame = frame[~duplicated]
+
+        return frame, errors
+
+    @staticmethod
+    def _error(row, train_number, error: str) -> Dict:
+        return {
+            "row": int(row),
+            "train_number": None if pd.isna(train_number) else str(train_number),
+            "error": error
+        }
+
+    def fetch_existing(self, db: Session, train_numbers: List[str]) -> Dict[str, Dict]:
+        """Get stored routes by train number, a chunk of numbers per query"""
+        existing = {}
+        for start in range(0, len(train_numbers), self.lookup_chunk_size):
+            chunk = train_numbers[start:start + self.lookup_chunk_size]
+            rows = db.query(TrainRoute.id, *[getattr(TrainRoute, field) for field in self.fields]).filter(
+                TrainRoute.train_number.in_(chunk)
+            ).all()
+            for row in rows:
+                existing[row.train_number] = dict(row._mapping)
+        return existing
+
+    def write_frame(self, db: Session, frame: pd.DataFrame, mode: str = "skip", existing: Optional[Dict[str, Dict]] = None, replace: Optional[Set[str]] = None, written: Optional[Set[str]] = None) -> Dict[str, int]:
+        """
+        Insert new routes and, in upsert mode, update changed ones, without committing
+
+        Args:
+            db: Database session
+            frame: Rows from normalize
+            mode: "skip" leaves existing train numbers alone, "upsert" updates them when they differ
+            existing: Stored routes by train number (fetched if not given)
+            replace: Train numbers written earlier in the same file, updated even in skip mode
+            written: Extended in place with the train numbers inserted or updated
+
+        Returns:
+            Counts of inserted, updated, unchanged and skipped rows
+        """
+        if mode not in IMPORT_MODES:
+            raise ValueError(f"Unknown import mode: {mode}. Use one of: {', '.join(IMPORT_MODES)}")
+
+        replace = replace or set()
+        records = frame[self.fields].to_dict("records")
+        if existing is None:
+            existing = self.fetch_existing(db, [record["train_number"] for record in records])
+
+        inserts = []
+        updates = []
+        counts = {"inserted": 0, "updated": 0, "unchanged": 0, "skipped": 0}
+        now = datetime.now(timezone.utc)
+        for record in records:
+            stored = existing.get(record["train_number"])
+            if stored is None:
+                inserts.append(record)
+            elif mode == "skip" and record["train_number"] not in replace:
+                counts["skipped"] += 1
+            elif any(stored[field] != record[field] for field in self.fields):
+                updates.append({"id": stored["id"], **record, "updated_at": now})
+            else:
+                counts["unchanged"] += 1
+
+        batch_size = max(1, settings.IMPORT_BATCH_SIZE)
+        for start in range(0, len(inserts), batch_size):
+            db.execute(insert(TrainRoute), inserts[start:start + batch_size])
+        for start in range(0, len(updates), batch_size):
+            db.execute(update(TrainRoute), updates[start:start + batch_size])
+
+        counts["inserted"] = len(inserts)
+        counts["updated"] = len(updates)
+        if written is not None:
+            written.update(record["train_number"] for record in inserts + updates)
+        return counts
+
+    def read_csv_chunks(self, path: str) -> Iterator[pd.DataFrame]:
+        """Read a CSV file IMPORT_CHUNK_ROWS rows at a time"""
+        reader = pd.read_csv(path, dtype=str, keep_default_na=False, chunksize=max(1, settings.IMPORT_CHUNK_ROWS))
+        with reader:
+            for chunk in reader:
+                self.check_columns(chunk.columns)
+                yield chunk
+
+    def read_xlsx_chunks(self, path: str) -> Iterator[pd.DataFrame]:
+        """Stream the first worksheet of an XLSX file IMPORT_CHUNK_ROWS rows at a time"""
+        chunk_rows = max(1, settings.IMPORT_CHUNK_ROWS)
+        workbook = load_workbook(path, read_only=True, data_only=True)
+        try:
+            rows = workbook.active.iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                raise ValueError("The worksheet is empty")
+            header = [str(name).strip() if name is not None else "" for name in header]
+            self.check_columns(header)
+
+            batch = []
+            for row in rows:
+                # Read-only sheets can report trailing rows that were formatted but never filled
+                if all(value is None for value in row):
+                    continue
+                batch.append(row)
+                if len(batch) >= chunk_rows:
+                    yield pd.DataFrame(batch, columns=header)
+                    batch = []
+            if batch:
+                yield pd.DataFrame(batch, columns=header)
+        finally:
+            workbook.close()
+
+    def check_file(self, path: str, file_type: str) -> None:
+        """
+        Read only the header row of a spooled file and check its columns
+
+        Raises:
+            ValueError: If the file type is unsupported or columns are missing
+        """
+        if file_type not in IMPORT_FILE_TYPES:
+            raise ValueError(f"Unsupported file type: {file_type}")
+        if file_type == "csv":
+            self.check_columns(pd.read_csv(path, dtype=str, nrows=0).columns)
+            return
+
+        workbook = load_workbook(path, read_only=True)
+        try:
+            header = next(workbook.active.iter_rows(max_row=1, values_only=True), None)
+        finally:
+            workbook.close()
+        if header is None:
+            raise ValueError("The worksheet is empty")
+        self.check_columns([str(name).strip() if name is not None else "" for name in header])
+
+    def count_rows(self, path: str, file_type: str) -> Optional[int]:
+        """Estimate the data rows in a file for progress reporting, without parsing it"""
+        try:
+            if file_type == "xlsx":
+                workbook = load_workbook(path, read_only=True)
+                try:
+                    max_row = workbook.active.max_row
+                finally:
+                    workbook.close()
+                return max(0, max_row - 1) if max_row else None
+
+            lines = 0
+            last = b"\n"
+            with open(path, "rb") as f:
+                while block := f.read(1024 * 1024):
+                    lines += block.count(b"\n")
+                    last = block[-1:]
+            if last != b"\n":
+                lines += 1
+            return max(0, lines - 1)
+        except Exception:
+            return None
+
+    def import_chunks(self, db: Session, chunks: Iterable[pd.DataFrame], mode: str = "skip", progress=None) -> Dict:
+        """
+        Import timetable chunks in one transaction
+
+        A train number repeated in a later chunk replaces the row written from the
+        earlier one, the same as a duplicate within one chunk. In skip mode a stored
+        route the earlier row left alone is left alone by the later one too.
+
+        Args:
+            db: Database session
+            chunks: Frames with the COLUMN_MAPPING headings, in file order
+            mode: "skip" or "upsert"
+            progress: Optional JobProgress receiving one item per row
+
+        Returns:
+            Dict with row counts, the row-level error report and throughput
+        """
+        if mode not in IMPORT_MODES:
+            raise ValueError(f"Unknown import mode: {mode}. Use one of: {', '.join(IMPORT_MODES)}")
+
+        started = time.perf_counter()
+        counts = {"inserted": 0, "updated": 0, "unchanged": 0, "skipped": 0}
+        errors = []
+        error_count = 0
+        total_rows = 0
+        seen: Dict[str, int] = {}  # train number -> row it was imported from
+        written: Set[str] = set()  # train numbers this import inserted or updated
+        try:
+            for chunk in chunks:
+                frame, chunk_errors = self.normalize(chunk, first_row=total_rows + 2)
+                total_rows += len(chunk)
+
+                if progress:
+                    for error in chunk_errors:
+                        progress.fail(f"row {error['row']}", error["error"])
+                    progress.advance(len(chunk) - len(chunk_errors))
+
+                repeated = frame["train_number"].isin(seen.keys())
+                for train_number in frame.loc[repeated, "train_number"]:
+                    chunk_errors.append(self._error(seen[train_number], train_number, "Duplicate train number in file; a later row replaces it"))
+
+                chunk_counts = self.write_frame(db, frame, mode, replace=written, written=written)
+                for key, value in chunk_counts.items():
+                    counts[key] += value
+                seen.update(zip(frame["train_number"], frame["row"].astype(int)))
+
+                error_count += len(chunk_errors)
+                errors.extend(chunk_errors[:max(0, settings.IMPORT_MAX_REPORTED_ERRORS - len(errors))])
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            invalidate_route_count()
+
+        return self.build_report(total_rows, counts, errors, error_count, mode, time.perf_counter() - started)
+
+    def import_frame(self, db: Session, df: pd.DataFrame, mode: str = "skip") -> Dict:
+        """Import a timetable already read into memory, in one transaction"""
+        return self.import_chunks(db, [df], mode)
+
+    def import_file(self, db: Session, path: str, file_type: str, mode: str = "skip", progress=None) -> Dict:
+        """
+        Import a timetable file from disk in bounded memory
+
+        Args:
+            db: Database session
+            path: Path of the spooled upload
+            file_type: "csv" or "xlsx"
+            mode: "skip" or "upsert"
+            progress: Optional JobProgress receiving one item per row
+
+        Returns:
+            Dict with row counts, the row-level error report and throughput
+        """
+        if file_type not in IMPORT_FILE_TYPES:
+            raise ValueError(f"Unsupported file type: {file_type}")
+
+        if progress:
+            total_rows = self.count_rows(path, file_type)
+            if total_rows is not None:
+                progress.set_total(total_rows)
+
+        chunks = self.read_xlsx_chunks(path) if file_type == "xlsx" else self.read_csv_chunks(path)
+        return self.import_chunks(db, chunks, mode, progress)
+
+    def build_report(self, total_rows: int, counts: Dict[str, int], errors: List[Dict], error_count: int, mode: str, elapsed: float) -> Dict:
+        """Summarize an import"""
+        errors = sorted(errors, key=lambda error: error["row"])
+        return {
+            "message": (
+                f"Import completed successfully. {counts['inserted']} routes imported, "
+                f"{counts['updated']} updated, {counts['unchanged']} unchanged, {counts['skipped']} existing skipped, "
+                f"{error_count} rows rejected."
+            ),
+            "mode": mode,
+            "total_rows": total_rows,
+            "imported_count": counts["inserted"],
+            "updated_count": counts["updated"],
+            "unchanged_count": counts["unchanged"],
+            "skipped_count": counts["skipped"],
+            "error_count": error_count,
+            "errors": errors,
+            "elapsed_seconds": round(elapsed, 3),
+            "rows_per_second": round(total_rows / elapsed, 1) if elapsed > 0 else None
+        }
+
+# Create service instance
+route_import_service = RouteImportService()
@@ -0,0 +1,223 @@
+import re
+import time
+import threading
+from typing import List, Set
+from sqlalchemy import text, or_
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from app.models.train_route import TrainRoute
+from app.core.config.settings import settings
+
+# Columns covered by the index, with their bm25 weight (a train number or code hit outranks a name hit)
+SEARCH_COLUMNS = {
+    'train_number': 10.0,
+    'train_name_en': 4.0,
+    'start_station_en': 3.0,
+    'end_station_en': 3.0,
+    'start_station_code': 8.0,
+    'end_station_code': 8.0
+}
+
+def edit_distance_at_most_one(a: str, b: str) -> bool:
+    """Whether two strings differ by at most one insertion, deletion, substitution or adjacent swap"""
+    if a == b:
+        return True
+    if abs(len(a) - len(b)) > 1:
+        return False
+    if len(a) == len(b):
+        diffs = [i for i in range(len(a)) if a[i] != b[i]]
+        if len(diffs) == 1:
+            return True
+        return len(diffs) == 2 and diffs[1] == diffs[0] + 1 and a[diffs[0]] == b[diffs[1]] and a[diffs[1]] == b[diffs[0]]
+    shorter, longer = (a, b) if len(a) < len(b) else (b, a)
+    for i in range(len(longer)):
+        if longer[:i] + longer[i + 1:] == shorter:
+            return True
+    return False
+
+class RouteSearchService:
+    """
+    Full-text search over train routes
+
+    On SQLite an FTS5 table (train_routes_fts) indexes the train number, name,
+    stations and station codes, kept in step with train_routes by triggers;
+    queries are prefix matches on every term ranked by bm25. On PostgreSQL a
+    pg_trgm GIN index over the same columns serves substring matches ranked by
+    similarity. Short code-like queries also match station codes one edit away
+    ("BTC" finds "BCT"). Other databases fall back to LIKE.
+    """
+
+    def __init__(self):
+        self.fts_table = "train_routes_fts"
+        self.trigram_index = "ix_train_routes_search_trgm"
+        self._installed = False
+        self._backend = "like"
+        self._lock = threading.Lock()
+        self._station_codes: Set[str] = set()
+        self._station_codes_loaded = 0.0
+
+    def install(self, engine: Engine) -> str:
+        """
+        Create the search index and its triggers if they do not exist yet
+
+        Returns:
+            The search backend in use: "fts5", "trigram" or "like"
+        """
+        columns = list(SEARCH_COLUMNS)
+        try:
+            if engine.dialect.name == "sqlite":
+                with engine.begin() as connection:
+                    # The triggers are dropped with train_routes, so check for them rather than the table
+                    exists = connection.execute(
+                        text("SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = :name"),
+                        {"name": f"{self.fts_table}_ai"}
+                    ).first()
+                    if not exists:
+                        connection.execute(text(f"DROP TABLE IF EXISTS {self.fts_table}"))
+                        connection.execute(text(
+                            f"CREATE VIRTUAL TABLE {self.fts_table} USING fts5("
+                            f"{', '.join(columns)}, content='train_routes', content_rowid='id', "
+                            f"tokenize='unicode61 remove_diacritics 2', prefix='1 2 3')"
+                        ))
+                        new_values = ", ".join(f"new.{column}" for column in columns)
+                        old_values = ", ".join(f"old.{column}" for column in columns)
+                        delete_old = (
+                            f"INSERT INTO {self.fts_table}({self.fts_table}, rowid, {', '.join(columns)}) "
+                            f"VALUES ('delete', old.id, {old_values});"
+                        )
+                        insert_new = f"INSERT INTO {self.fts_table}(rowid, {', '.join(columns)}) VALUES (new.id, {new_values});"
+                        connection.execute(text(f"CREATE TRIGGER {self.fts_table}_ai AFTER INSERT ON train_routes BEGIN {insert_new} END"))
+                        connection.execute(text(f"CREATE TRIGGER {self.fts_table}_ad AFTER DELETE ON train_routes BEGIN {delete_old} END"))
+                        connection.execute(text(f"CREATE TRIGGER {self.fts_table}_au AFTER UPDATE ON train_routes BEGIN {delete_old} {insert_new} END"))
+                        # Index the routes that existed before the table did
+                        connection.execute(text(f"INSERT INTO {self.fts_table}({self.fts_table}) VALUES ('rebuild')"))
+                        print(f"✅ Created full-text index {self.fts_table}")
+                self._backend = "fts5"
+            elif engine.dialect.name == "postgresql":
+                with engine.begin() as connection:
+                    connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+                    connection.execute(text(
+                        f"CREATE INDEX IF NOT EXISTS {self.trigram_index} ON train_routes "
+                        f"USING gin (({self._document_sql()}) gin_trgm_ops)"
+                    ))
+                self._backend = "trigram"
+        except Exception as e:
+            print(f"⚠️ Full-text search unavailable, using LIKE: {str(e)}")
+            self._backend = "like"
+
+        self._installed = True
+        return self._backend
+
+    def _ensure_installed(self, db: Session):
+        if not self._installed:
+            with self._lock:
+                if not self._installed:
+                    self.install(db.get_bind())
+
+    @staticmethod
+    def _document_sql() -> str:
+        """Concatenated search columns, as used by the trigram index"""
+        return " || ' ' || ".join(f"lower({column})" for column in SEARCH_COLUMNS)
+
+    @staticmethod
+    def _terms(query: str) -> List[str]:
+        return re.findall(r"\w+", query.lower())
+
+    def search(self, db: Session, query: str, limit: int = 50) -> List[TrainRoute]:
+        """
+        Search routes, best matches first
+
+        Args:
+            db: Database session
+            query: Search text; every term must match the start of a word in some column
+            limit: Maximum number of routes to return
+
+        Returns:
+            Matching train routes
+        """
+        self._ensure_installed(db)
+        terms = self._terms(query)
+        if not terms:
+            return []
+
+        if self._backend == "fts5":
+            match = " AND ".join('"' + term.replace('"', '""') + '"*' for term in terms)
+            weights = ", ".join(str(weight) for weight in SEARCH_COLUMNS.values())
+            route_ids = [
+                row[0] for row in db.execute(
+                    text(
+                        f"SELECT rowid FROM {self.fts_table} WHERE {self.fts_table} MATCH :match "
+                        f"ORDER BY bm25({self.fts_table}, {weights}) LIMIT :limit"
+                    ),
+                    {"match": match, "limit": limit}
+                )
+            ]
+        elif self._backend == "trigram":
+            conditions = " AND ".join(f"{self._document_sql()} LIKE :term{index}" for index in range(len(terms)))
+            parameters = {f"term{index}": f"%{term}%" for index, term in enumerate(terms)}
+            parameters.update({"query": " ".join(terms), "limit": limit})
+            route_ids = [
+                row[0] for row in db.execute(
+                    text(
+                        f"SELECT id FROM train_routes WHERE {conditions} "
+                        f"ORDER BY similarity({self._document_sql()}, :query) DESC, id LIMIT :limit"
+                    ),
+                    parameters
+                )
+            ]
+        else:
+            return self._search_like(db, query, limit)
+
+        routes = self._load(db, route_ids)
+        if len(routes) < limit and len(terms) == 1:
+            routes += self._fuzzy_code_matches(db, terms[0], limit - len(routes), exclude={route.id for route in routes})
+        return routes
+
+    @staticmethod
+    def _load(db: Session, route_ids: List[int]) -> List[TrainRoute]:
+        """Load routes by ID, keeping the given order"""
+        if not route_ids:
+            return []
+        routes = {route.id: route for route in db.query(TrainRoute).filter(TrainRoute.id.in_(route_ids)).all()}
+        return [routes[route_id] for route_id in route_ids if route_id in routes]
+
+    def _fuzzy_code_matches(self, db: Session, term: str, limit: int, exclude: Set[int]) -> List[TrainRoute]:
+        """Routes whose station code is one edit away from a code-like search term"""
+        if limit <= 0 or not (2 <= len(term) <= 6) or not term.isalnum() or not term.isascii():
+            return []
+
+        code = term.upper()
+        codes = [candidate for candidate in self._get_station_codes(db) if candidate != code and edit_distance_at_most_one(code, candidate)]
+        if not codes:
+            return []
+
+        query = db.query(TrainRoute).filter(
+            or_(TrainRoute.start_station_code.in_(codes), TrainRoute.end_station_code.in_(codes))
+        )
+        if exclude:
+            query = query.filter(TrainRoute.id.notin_(exclude))
+        return query.order_by(TrainRoute.train_number).limit(limit).all()
+
+    def _get_station_codes(self, db: Session) -> Set[str]:
+        """Distinct station codes, refreshed every SEARCH_STATION_CODE_CACHE_SECONDS"""
+        now = time.monotonic()
+        if now - self._station_codes_loaded > settings.SEARCH_STATION_CODE_CACHE_SECONDS:
+            codes = {row[0] for row in db.query(TrainRoute.start_station_code).distinct()}
+            codes |= {row[0] for row in db.query(TrainRoute.end_station_code).distinct()}
+            self._station_codes = {code.upper() for code in codes if code}
+            self._station_codes_loaded = now
+        return self._station_codes
+
+    def _search_like(self, db: Session, query: str, limit: int) -> List[TrainRoute]:
+        """Case-insensitive substring search without an index"""
+        return db.query(TrainRoute).filter(
+            (TrainRoute.train_number.icontains(query)) |
+            (TrainRoute.train_name_en.icontains(query)) |
+            (TrainRoute.start_station_en.icontains(query)) |
+            (TrainRoute.end_station_en.icontains(query)) |
+            (TrainRoute.start_station_code.icontains(query)) |
+            (TrainRoute.end_station_code.icontains(query))
+        ).limit(limit).all()
+
+# Create service instance
+route_search_service = RouteSearchService()
@@ -1,13 +1,25 @@
+import time
+from sqlalchemy import String, type_coerce, literal
 from sqlalchemy.orm import Session
 from app.models.train_route import TrainRoute
 from app.schemas.train_route import TrainRouteCreate, TrainRouteUpdate
-from typing import List, Optional
+from typing import Dict, List, Optional
+from app.core.config.settings import settings
+from app.services.route_search_service import route_search_service
+from app.utils.pagination import encode_cursor, decode_cursor
+
+# Total number of routes, refreshed every ROUTE_COUNT_CACHE_SECONDS or after a write
+_route_count = {"value": None, "loaded_at": 0.0}
+
+# created_at as stored, so cursor values compare exactly (SQLite keeps CURRENT_TIMESTAMP text)
+_sort_key = type_coerce(TrainRoute.created_at, String)
 
 def create_train_route(db: Session, train_route: TrainRouteCreate) -> TrainRoute:
     db_train_route = TrainRoute(**train_route.dict())
     db.add(db_train_route)
     db.commit()
     db.refresh(db_train_route)
+    invalidate_route_count()
     return db_train_route
 
 def get_train_route(db: Session, train_route_id: int) -> Optional[TrainRoute]:
@@ -16,8 +28,75 @@ def get_train_route(db: Session, train_route_id: int) -> Optional[TrainRoute]:
 def get_train_route_by_number(db: Session, train_number: str) -> Optional[TrainRoute]:
     return db.query(TrainRoute).filter(TrainRoute.train_number == train_number).first()
 
-def get_train_routes(db: Session, skip: int = 0, limit: int = 100) -> List[TrainRoute]:
-    return db.query(TrainRoute).order_by(TrainRoute.created_at.desc()).offset(skip).limit(limit).all()
+def get_train_routes_page(db: Session, limit: int = 100, cursor: Optional[str] = None) -> Dict:
+    """
+    Get a page of routes, newest first, positioned by a keyset cursor
+
+    Pages are read with range seeks on ix_train_routes_created_at_id, so any
+    page costs the same as the first.
+
+    Args:
+        db: Database session
+        limit: Number of routes per page
+        cursor: next_cursor or prev_cursor from an earlier page; None for the first page
+
+    Returns:
+        Dict with routes, next_cursor and prev_cursor (None where there is no such page)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    query = db.query(TrainRoute, _sort_key)
+    direction = "after"
+    newest_first = (TrainRoute.created_at.desc(), TrainRoute.id.desc())
+    oldest_first = (TrainRoute.created_at.asc(), TrainRoute.id.asc())
+    if not cursor:
+        rows = query.order_by(*newest_first).limit(limit + 1).all()
+    else:
+        direction, values = decode_cursor(cursor)
+        if len(values) != 2 or not isinstance(values[0], str) or not isinstance(values[1], int):
+            raise ValueError("Invalid cursor")
+        created_at, route_id = literal(values[0], String), values[1]
+
+        # Rows sharing the cursor row's created_at (a whole import does) first, then the rest;
+        # SQLite only seeks on the leading column of a row-value comparison, so the ranges are read apart
+        if direction == "after":
+            order = newest_first
+            same_time = query.filter(_sort_key == created_at, TrainRoute.id < route_id)
+            beyond = query.filter(_sort_key < created_at)
+        else:
+            order = oldest_first
+            same_time = query.filter(_sort_key == created_at, TrainRoute.id > route_id)
+            beyond = query.filter(_sort_key > created_at)
+        rows = same_time.order_by(*order).limit(limit + 1).all()
+        if len(rows) <= limit:
+            rows += beyond.order_by(*order).limit(limit + 1 - len(rows)).all()
+
+    # One extra row tells whether there is a page beyond this one
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    if direction == "before":
+        rows.reverse()
+
+    has_next = has_more if direction == "after" else True
+    has_prev = bool(cursor) if direction == "after" else has_more
+    return {
+        "routes": [route for route, _ in rows],
+        "next_cursor": encode_cursor("after", [rows[-1][1], rows[-1][0].id]) if rows and has_next else None,
+        "prev_cursor": encode_cursor("before", [rows[0][1], rows[0][0].id]) if rows and has_prev else None
+    }
+
+def count_train_routes(db: Session) -> int:
+    """Total number of routes, counted at most once per ROUTE_COUNT_CACHE_SECONDS"""
+    now = time.monotonic()
+    if _route_count["value"] is None or now - _route_count["loaded_at"] > settings.ROUTE_COUNT_CACHE_SECONDS:
+        _route_count["value"] = db.query(TrainRoute).count()
+        _route_count["loaded_at"] = now
+    return _route_count["value"]
+
+def invalidate_route_count():
+    """Forget the cached total after routes are added or removed"""
+    _route_count["value"] = None
 
 def update_train_route(db: Session, train_route_id: int, train_route: TrainRouteUpdate) -> Optional[TrainRoute]:
     db_train_route = db.query(TrainRoute).filter(TrainRoute.id == train_route_id).first()
@@ -34,15 +113,9 @@ def delete_train_route(db: Session, train_route_id: int) -> bool:
     if db_train_route:
         db.delete(db_train_route)
         db.commit()
+        invalidate_route_count()
         return True
     return False
 
-def search_train_routes(db: Session, query: str) -> List[TrainRoute]:
-    return db.query(TrainRoute).filter(
-        (TrainRoute.train_number.contains(query)) |
-        (TrainRoute.train_name_en.contains(query)) |
-        (TrainRoute.start_station_en.contains(query)) |
-        (TrainRoute.end_station_en.contains(query)) |
-        (TrainRoute.start_station_code.contains(query)) |
-        (TrainRoute.end_station_code.contains(query))
-    ).all() 
\ No newline at end of file
+def search_train_routes(db: Session, query: str, limit: int = 50) -> List[TrainRoute]:
+    return route_search_service.search(db, query, limit) 
\ No newline at end of file
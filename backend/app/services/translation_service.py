@@ -1,9 +1,29 @@
+import time
 from sqlalchemy.orm import Session
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from app.models.train_route import TrainRoute
 from app.models.train_route_translation import TrainRouteTranslation
 from app.services.train_route_service import get_train_route
 from app.utils.gcp_client import gcp_client
+from app.utils.translation_memo import translation_memo
+from app.utils.bulk_plan import plan_items
+from app.utils.content_hash import content_hash
+from app.utils.transliteration import transliterator
+from app.utils.numerals import digit_words, number_words_table
+from app.core.config.settings import settings
+
+# Languages every route is translated into
+TARGET_LANGUAGES = ['en', 'hi', 'mr', 'gu']
+
+# Route fields translated from the source language
+NAME_FIELDS = {
+    'train_name': 'train_name_en',
+    'start_station_name': 'start_station_en',
+    'end_station_name': 'end_station_en'
+}
+
+# Translated fields and the route field each is derived from
+SOURCE_FIELDS = {'train_number_words': 'train_number', **NAME_FIELDS}
 
 def convert_to_english_words(number: str) -> str:
     """
@@ -15,23 +35,15 @@ def convert_to_english_words(number: str) -> str:
     Returns:
         English word representation (e.g., "one two three four five")
     """
-    digit_words = {
-        '0': 'zero', '1': 'one', '2': 'two', '3': 'three', '4': 'four',
-        '5': 'five', '6': 'six', '7': 'seven', '8': 'eight', '9': 'nine'
-    }
-    
-    # Validate input
-    if not number or len(number) != 5 or not number.isdigit():
-        raise ValueError("Train number must be exactly 5 digits")
-    
-    # Convert each digit to word
-    words = [digit_words[digit] for digit in number]
-    return " ".join(words)
+    return convert_number_to_words(number, "en")
 
 def convert_number_to_words(number: str, language: str) -> str:
     """
     Convert 5-digit train number to words in specified language
     
+    Words come from the static digit vocabularies in app.utils.numerals, so no
+    translation call is made.
+    
     Args:
         number: 5-digit train number
         language: Target language code
@@ -39,12 +51,11 @@ def convert_number_to_words(number: str, language: str) -> str:
     Returns:
         Word representation in target language
     """
-    if language == "en":
-        return convert_to_english_words(number)
-    else:
-        # Convert to English words first, then translate
-        english_words = convert_to_english_words(number)
-        return gcp_client.translate_text(english_words, "en", language)
+    # Validate input
+    if not number or len(number) != 5 or not number.isdigit():
+        raise ValueError("Train number must be exactly 5 digits")
+    
+    return digit_words(number, language)
 
 def delete_existing_translations(db: Session, train_route_id: int) -> None:
     """
@@ -82,14 +93,267 @@ def save_translations(db: Session, train_route_id: int, translations: Dict) -> N
     
     db.commit()
 
-def translate_train_route(db: Session, train_route_id: int, source_lang: str = "en") -> Dict:
+def route_source_hashes(route: TrainRoute, source_lang: str = "en") -> Tuple[str, Dict[str, str]]:
+    """
+    Hash the source fields a route's translations are derived from
+    
+    Name hashes record whether names are transliterated, so switching
+    TRANSLITERATION_ENABLED redoes the names once.
+    
+    Returns:
+        Tuple of (hash over all source fields, hash per translated field)
+    """
+    name_method = ["transliteration"] if transliterator.supports(source_lang, "hi") else []
+    field_hashes = {
+        field: content_hash(source_lang, getattr(route, source_field), *name_method) if field in NAME_FIELDS
+        else content_hash("digits", getattr(route, source_field))
+        for field, source_field in SOURCE_FIELDS.items()
+    }
+    return content_hash(*[field_hashes[field] for field in sorted(field_hashes)]), field_hashes
+
+def load_existing_translations(db: Session, train_route_ids: Optional[List[int]] = None) -> Dict[int, Dict[str, TrainRouteTranslation]]:
+    """Get stored translations by route ID and language code"""
+    query = db.query(TrainRouteTranslation)
+    if train_route_ids is not None:
+        query = query.filter(TrainRouteTranslation.train_route_id.in_(train_route_ids))
+    
+    existing = {}
+    for translation in query.yield_per(settings.DB_STREAM_BATCH_SIZE):
+        existing.setdefault(translation.train_route_id, {})[translation.language_code] = translation
+    return existing
+
+def collect_translation_items(routes: List[TrainRoute], source_lang: str = "en", existing: Optional[Dict[int, Dict[str, TrainRouteTranslation]]] = None) -> Dict:
+    """
+    List every string the routes need translated, without translating anything
+    
+    Number words are read from the static digit tables for all routes at once, and
+    names the transliterator can spell are resolved here; neither reaches the
+    translation API. With existing translations, routes whose source hash is unchanged are
+    skipped and fields whose source did not change keep their stored translation.
+    
+    Returns:
+        Dictionary with items as (text, (source, target)) with duplicates, transliterated names by
+        language pair, number words by language, reused field values and source hashes by route ID,
+        failures by route ID and the unchanged route IDs
+    """
+    existing = existing or {}
+    plan = {"items": [], "transliterated": {}, "number_words": {}, "reused": {}, "hashes": {}, "failures": {}, "unchanged": set()}
+    
+    words_table = number_words_table([route.train_number or "" for route in routes], mode="digits", length=5)
+    
+    for route in routes:
+        missing = [field for field in NAME_FIELDS.values() if not getattr(route, field)]
+        if words_table["en"][route.train_number or ""] is None:
+            plan["failures"][route.id] = "Train number must be exactly 5 digits"
+            continue
+        if missing:
+            plan["failures"][route.id] = f"Missing {', '.join(missing)}"
+            continue
+        
+        source_hash, field_hashes = route_source_hashes(route, source_lang)
+        stored = existing.get(route.id, {})
+        if all(lang in stored and stored[lang].source_hash == source_hash for lang in TARGET_LANGUAGES):
+            plan["unchanged"].add(route.id)
+            continue
+        
+        plan["number_words"][route.id] = {lang: words_table[lang][route.train_number] for lang in TARGET_LANGUAGES}
+        plan["hashes"][route.id] = (source_hash, field_hashes)
+        reused = plan["reused"].setdefault(route.id, {})
+        for lang in TARGET_LANGUAGES:
+            stored_hashes = (stored[lang].field_hashes or {}) if lang in stored else {}
+            reused[lang] = {
+                field: getattr(stored[lang], field)
+                for field in SOURCE_FIELDS
+                if stored_hashes.get(field) == field_hashes[field]
+            }
+            if lang == source_lang:
+                continue
+            pair = (source_lang, lang)
+            for field, source_field in NAME_FIELDS.items():
+                if field in reused[lang]:
+                    continue
+                text = getattr(route, source_field)
+                if transliterator.supports(source_lang, lang):
+                    transliterated = transliterator.transliterate(text, lang)
+                    if transliterated:
+                        plan["transliterated"].setdefault(pair, {})[text] = transliterated
+                        continue
+                plan["items"].append((text, pair))
+    
+    return plan
+
+def translate_unique_items(items: List[Tuple[str, Tuple[str, str]]], translated: Optional[Dict] = None) -> Tuple[Dict[Tuple[str, str], Dict[str, str]], Dict[Tuple[str, str], Dict[str, str]], int]:
+    """
+    Translate each distinct (text, language pair) once, batches running concurrently
+    
+    Args:
+        items: (text, (source, target)) pairs, duplicates allowed
+        translated: Translations already available, extended in place
+    
+    Returns:
+        Tuple of (translations by language pair and source text, error message by language pair and text, requests sent)
+    """
+    translated = translated if translated is not None else {}
+    pending = {}
+    for text, pair in items:
+        if text not in translated.get(pair, {}):
+            pending.setdefault(pair, {})[text] = None
+    
+    if not pending:
+        return translated, {}, 0
+    
+    translations, errors, requests = gcp_client.translate_pairs({pair: list(texts) for pair, texts in pending.items()})
+    for pair, pair_translations in translations.items():
+        translated.setdefault(pair, {}).update(pair_translations)
+    
+    return translated, errors, requests
+
+def assemble_route_translations(routes: List[TrainRoute], source_lang: str, plan: Dict, translated: Dict, errors: Optional[Dict] = None) -> Tuple[Dict[int, Dict], Dict[int, str]]:
+    """
+    Fan translated strings back out to the routes that reference them
+    
+    Fields reused from stored translations are kept as they are. Routes referencing
+    a string that could not be translated are reported as failures; unchanged and
+    failed routes from the plan are left out.
+    
+    Returns:
+        Tuple of (translations by route ID and language, error message by route ID)
+    """
+    errors = errors or {}
+    translations = {}
+    failures = {}
+    
+    def lookup(text: str, pair: Tuple[str, str]) -> str:
+        if text in translated.get(pair, {}):
+            return translated[pair][text]
+        raise ValueError(errors.get(pair, {}).get(text) or f"No {pair[0]}->{pair[1]} translation for '{text}'")
+    
+    for route in routes:
+        if route.id not in plan["number_words"]:
+            continue
+        try:
+            route_translations = {}
+            for lang in TARGET_LANGUAGES:
+                reused = plan["reused"][route.id][lang]
+                route_translations[lang] = {
+                    'train_number': route.train_number,
+                    'train_number_words': reused.get('train_number_words', plan["number_words"][route.id][lang])
+                }
+                for name, field in NAME_FIELDS.items():
+                    text = getattr(route, field)
+                    if name in reused:
+                        route_translations[lang][name] = reused[name]
+                    else:
+                        route_translations[lang][name] = text if lang == source_lang else lookup(text, (source_lang, lang))
+            translations[route.id] = route_translations
+        except ValueError as e:
+            failures[route.id] = str(e)
+    
+    return translations, failures
+
+def build_route_translations(routes: List[TrainRoute], source_lang: str = "en", translated: Optional[Dict] = None, existing: Optional[Dict] = None) -> Tuple[Dict[int, Dict], Dict[int, str], Dict]:
+    """
+    Translate many train routes with batched translation calls
+    
+    Strings from every route are gathered per (source, target) language pair and
+    sent through gcp_client.translate_pairs, so each pair costs a few requests
+    however many routes share it.
+    
+    Args:
+        routes: Train routes to translate
+        source_lang: Source language code of the route names (default: "en")
+        translated: Translations already available; only missing strings are requested
+        existing: Stored translations by route ID and language, for incremental re-translation
+    
+    Returns:
+        Tuple of (translations by route ID and language, error message by route ID for routes
+        that could not be translated, the plan from collect_translation_items)
+    """
+    plan = collect_translation_items(routes, source_lang, existing)
+    translated = translated if translated is not None else {}
+    for pair, names in plan["transliterated"].items():
+        translated.setdefault(pair, {}).update(names)
+    translated, errors, _ = translate_unique_items(plan["items"], translated)
+    translations, failures = assemble_route_translations(routes, source_lang, plan, translated, errors)
+    failures.update(plan["failures"])
+    return translations, failures, plan
+
+def write_route_translations(db: Session, translations_by_route: Dict[int, Dict], hashes_by_route: Optional[Dict[int, Tuple[str, Dict[str, str]]]] = None) -> Dict[int, str]:
+    """
+    Replace the stored translations of many routes in one transaction
+    
+    If the batched transaction fails, each route is written in its own
+    transaction so one bad route does not fail the rest.
+    
+    Args:
+        db: Database session
+        translations_by_route: Translations by route ID and language
+        hashes_by_route: (source hash, field hashes) by route ID, stored with each row
+    
+    Returns:
+        Error message by route ID for routes that could not be written
+    """
+    hashes_by_route = hashes_by_route or {}
+    
+    def rows_for(train_route_id: int, translations: Dict) -> List[Dict]:
+        source_hash, field_hashes = hashes_by_route.get(train_route_id, (None, None))
+        return [
+            {
+                'train_route_id': train_route_id,
+                'language_code': language_code,
+                'train_number': data['train_number'],
+                'train_number_words': data['train_number_words'],
+                'train_name': data['train_name'],
+                'start_station_name': data['start_station_name'],
+                'end_station_name': data['end_station_name'],
+                'source_hash': source_hash,
+                'field_hashes': field_hashes
+            }
+            for language_code, data in translations.items()
+        ]
+    
+    if not translations_by_route:
+        return {}
+    
+    try:
+        db.query(TrainRouteTranslation).filter(
+            TrainRouteTranslation.train_route_id.in_(list(translations_by_route.keys()))
+        ).delete(synchronize_session=False)
+        db.bulk_insert_mappings(TrainRouteTranslation, [
+            row for train_route_id, translations in translations_by_route.items() for row in rows_for(train_route_id, translations)
+        ])
+        db.commit()
+        return {}
+    except Exception as e:
+        db.rollback()
+        print(f"⚠️ Batched write of {len(translations_by_route)} routes failed, writing one by one: {str(e)}")
+    
+    failures = {}
+    for train_route_id, translations in translations_by_route.items():
+        try:
+            db.query(TrainRouteTranslation).filter(
+                TrainRouteTranslation.train_route_id == train_route_id
+            ).delete(synchronize_session=False)
+            db.bulk_insert_mappings(TrainRouteTranslation, rows_for(train_route_id, translations))
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            failures[train_route_id] = str(e)
+    return failures
+
+def translate_train_route(db: Session, train_route_id: int, source_lang: str = "en", overwrite_existing: bool = False) -> Dict:
     """
     Translate a train route to all supported languages
     
+    Train and station names are transliterated offline, with the translation API
+    as a fallback. Only fields whose source changed since the stored translations
+    were made are redone; an unchanged route makes no API calls at all.
+    
     Args:
         db: Database session
         train_route_id: ID of the train route to translate
         source_lang: Source language code (default: "en")
+        overwrite_existing: Re-translate every field even if its source is unchanged
     
     Returns:
         Dictionary containing translations for all languages
@@ -99,35 +363,18 @@ def translate_train_route(db: Session, train_route_id: int, source_lang: str = "
     if not route:
         raise ValueError(f"Train route with ID {train_route_id} not found")
     
-    # Delete existing translations
-    delete_existing_translations(db, train_route_id)
-    
-    # Define target languages
-    target_languages = ['en', 'hi', 'mr', 'gu']
-    translations = {}
-    
-    for lang in target_languages:
-        if lang == source_lang:
-            # Use original text for source language
-            translations[lang] = {
-                'train_number': route.train_number,
-                'train_number_words': convert_to_english_words(route.train_number),
-                'train_name': route.train_name_en,
-                'start_station_name': route.start_station_en,
-                'end_station_name': route.end_station_en
-            }
-        else:
-            # Translate to target language
-            translations[lang] = {
-                'train_number': route.train_number,
-                'train_number_words': convert_number_to_words(route.train_number, lang),
-                'train_name': gcp_client.translate_text(route.train_name_en, source_lang, lang),
-                'start_station_name': gcp_client.translate_text(route.start_station_en, source_lang, lang),
-                'end_station_name': gcp_client.translate_text(route.end_station_en, source_lang, lang)
-            }
+    existing = {} if overwrite_existing else load_existing_translations(db, [route.id])
+    route_translations, failures, plan = build_route_translations([route], source_lang, existing=existing)
+    if route.id in failures:
+        raise ValueError(failures[route.id])
+    if route.id in plan["unchanged"]:
+        return get_train_route_translations(db, train_route_id)
+    translations = route_translations[route.id]
     
-    # Save translations to database
-    save_translations(db, train_route_id, translations)
+    # Replace existing translations
+    write_failures = write_route_translations(db, {route.id: translations}, plan["hashes"])
+    if write_failures:
+        raise Exception(write_failures[route.id])
     
     return translations
 
@@ -161,34 +408,120 @@ def get_train_route_translations(db: Session, train_route_id: int) -> Optional[D
     
     return result
 
-def bulk_translate_all_routes(db: Session, source_lang: str = "en") -> Dict:
+def plan_bulk_translation(db: Session, source_lang: str = "en", overwrite_existing: bool = False) -> Dict:
+    """
+    Describe the work bulk_translate_all_routes would do, without translating
+    
+    Returns:
+        Dictionary with total vs unique strings, strings already in the translation memo,
+        estimated API characters and requests per language pair
+    """
+    routes = db.query(TrainRoute).all()
+    existing = {} if overwrite_existing else load_existing_translations(db)
+    route_plan = collect_translation_items(routes, source_lang, existing)
+    
+    plan = plan_items(
+        route_plan["items"],
+        is_cached=lambda texts, pair: set(translation_memo.get_many(texts, pair[0], pair[1], settings.TRANSLATION_PROVIDER)),
+        count_requests=lambda texts, pair: len(gcp_client.split_batches(texts))
+    )
+    plan.update({
+        "dry_run": True,
+        "operation": "route_translation",
+        "total_routes": len(routes),
+        "routes_to_process": len(route_plan["number_words"]),
+        "unchanged_routes": len(route_plan["unchanged"]),
+        "transliterated_items": sum(len(names) for names in route_plan["transliterated"].values()),
+        "failed_routes": [{"route_id": str(route_id), "error": error} for route_id, error in route_plan["failures"].items()]
+    })
+    return plan
+
+def bulk_translate_all_routes(db: Session, source_lang: str = "en", progress=None, overwrite_existing: bool = False) -> Dict:
     """
     Translate all train routes to all supported languages
     
+    A planning pass skips routes whose source hash matches their stored
+    translations and collects the distinct (string, language pair) items of the
+    fields that changed. They are translated once each in batched requests that run
+    concurrently (TRANSLATION_MAX_CONCURRENCY). This thread is the only database
+    writer: results fan out to every route that references them and are written
+    TRANSLATION_BULK_CHUNK_SIZE routes per transaction. A failed batch or write only
+    fails the routes it touches.
+    
     Args:
         db: Database session
         source_lang: Source language code (default: "en")
+        progress: Optional JobProgress receiving one item per route
+        overwrite_existing: Re-translate every route even if its source is unchanged
     
     Returns:
-        Dictionary with translation statistics
+        Dictionary with translation statistics and timings
     """
+    started = time.perf_counter()
+    
     # Get all train routes
     routes = db.query(TrainRoute).all()
     total_routes = len(routes)
     translated_routes = 0
     failed_routes = 0
     
-    for route in routes:
-        try:
-            translate_train_route(db, route.id, source_lang)
-            translated_routes += 1
-        except Exception as e:
-            print(f"Failed to translate route {route.id}: {str(e)}")
-            failed_routes += 1
+    if progress:
+        progress.set_total(total_routes)
+    
+    existing = {} if overwrite_existing else load_existing_translations(db)
+    plan = collect_translation_items(routes, source_lang, existing)
+    unchanged_routes = len(plan["unchanged"])
+    planned = time.perf_counter()
+    
+    transliterated_strings = sum(len(names) for names in plan["transliterated"].values())
+    translated, errors, api_requests = translate_unique_items(plan["items"], plan["transliterated"])
+    unique_strings = sum(len(texts) for texts in translated.values()) + sum(len(texts) for texts in errors.values()) - transliterated_strings
+    print(f"📋 Translation plan: {unchanged_routes} routes unchanged, {transliterated_strings} names transliterated, {len(plan['items'])} strings, {unique_strings} unique, {api_requests} requests")
+    api_done = time.perf_counter()
+    
+    def record_failure(route: TrainRoute, error: str):
+        nonlocal failed_routes
+        print(f"Failed to translate route {route.id}: {error}")
+        failed_routes += 1
+        if progress:
+            progress.fail(route.train_number, error)
+    
+    if progress and unchanged_routes:
+        progress.advance(unchanged_routes)
+    
+    chunk_size = max(1, settings.TRANSLATION_BULK_CHUNK_SIZE)
+    for chunk_start in range(0, total_routes, chunk_size):
+        chunk = [route for route in routes[chunk_start:chunk_start + chunk_size] if route.id not in plan["unchanged"]]
+        chunk_translations, failures = assemble_route_translations(chunk, source_lang, plan, translated, errors)
+        failures.update({route.id: plan["failures"][route.id] for route in chunk if route.id in plan["failures"]})
+        failures.update(write_route_translations(db, chunk_translations, plan["hashes"]))
+        
+        for route in chunk:
+            if route.id in failures:
+                record_failure(route, failures[route.id])
+        written = len(chunk) - sum(1 for route in chunk if route.id in failures)
+        translated_routes += written
+        if progress and written:
+            progress.advance(written)
+    
+    finished = time.perf_counter()
+    total_seconds = finished - started
     
     return {
         "total_routes": total_routes,
         "translated_routes": translated_routes,
+        "unchanged_routes": unchanged_routes,
         "failed_routes": failed_routes,
-        "message": f"Successfully translated {translated_routes} out of {total_routes} routes"
-    } 
\ No newline at end of file
+        "message": f"Successfully translated {translated_routes} out of {total_routes} routes ({unchanged_routes} unchanged)",
+        "timing": {
+            "planning_seconds": round(planned - started, 3),
+            "translation_seconds": round(api_done - planned, 3),
+            "database_seconds": round(finished - api_done, 3),
+            "total_seconds": round(total_seconds, 3),
+            "routes_per_second": round(total_routes / total_seconds, 1) if total_seconds > 0 else None,
+            "total_strings": len(plan["items"]),
+            "unique_strings": unique_strings,
+            "transliterated_strings": transliterated_strings,
+            "api_requests": api_requests
+        }
+    }
\ No newline at end of file
@@ -0,0 +1,132 @@
+import io
+import os
+import struct
+from typing import BinaryIO, Optional
+from app.utils.mp3 import mp3_duration
+
+# Bytes read from the end of an Ogg stream when looking for the last page
+OGG_TAIL_BYTES = 64 * 1024
+
+def wav_duration(stream: BinaryIO) -> Optional[float]:
+    """
+    Compute the duration of a RIFF/WAVE stream from its fmt and data chunks
+
+    A data chunk size of 0 or 0xFFFFFFFF (streamed writers) falls back to the
+    bytes actually present after the chunk header.
+    """
+    stream.seek(0)
+    header = stream.read(12)
+    if len(header) < 12 or header[:4] != b"RIFF" or header[8:12] != b"WAVE":
+        return None
+
+    byte_rate = None
+    while True:
+        chunk = stream.read(8)
+        if len(chunk) < 8:
+            return None
+        chunk_id, chunk_size = chunk[:4], struct.unpack("<I", chunk[4:])[0]
+
+        if chunk_id == b"fmt ":
+            fmt = stream.read(chunk_size)
+            if len(fmt) < 16:
+                return None
+            byte_rate = struct.unpack("<I", fmt[8:12])[0]
+            if chunk_size % 2:
+                stream.seek(1, io.SEEK_CUR)
+            continue
+
+        if chunk_id == b"data":
+            if not byte_rate:
+                return None
+            if chunk_size in (0, 0xFFFFFFFF):
+                start = stream.tell()
+                chunk_size = stream.seek(0, io.SEEK_END) - start
+            return chunk_size / byte_rate
+
+        # Chunks are word aligned
+        stream.seek(chunk_size + (chunk_size % 2), io.SEEK_CUR)
+
+def ogg_duration(stream: BinaryIO) -> Optional[float]:
+    """
+    Compute the duration of an Ogg Vorbis or Ogg Opus stream
+
+    The sample rate (and Opus pre-skip) comes from the identification header in
+    the first page; the length is the granule position of the last page.
+    """
+    stream.seek(0)
+    first_page = stream.read(OGG_TAIL_BYTES)
+    if first_page[:4] != b"OggS":
+        return None
+
+    # The first packet starts right after the segment table
+    segment_count = first_page[26]
+    packet = first_page[27 + segment_count:]
+    serial = first_page[14:18]
+
+    if packet[:7] == b"\x01vorbis":
+        sample_rate = struct.unpack("<I", packet[12:16])[0]
+        pre_skip = 0
+    elif packet[:8] == b"OpusHead":
+        # Opus granule positions always count 48 kHz samples
+        sample_rate = 48000
+        pre_skip = struct.unpack("<H", packet[10:12])[0]
+    else:
+        return None
+
+    size = stream.seek(0, io.SEEK_END)
+    stream.seek(max(0, size - OGG_TAIL_BYTES))
+    tail = stream.read()
+
+    position = tail.rfind(b"OggS")
+    while position != -1:
+        page = tail[position:position + 27]
+        if len(page) == 27 and page[14:18] == serial:
+            granule = struct.unpack("<q", page[6:14])[0]
+            if granule >= 0:
+                return max(0, granule - pre_skip) / sample_rate
+        position = tail.rfind(b"OggS", 0, position)
+
+    return None
+
+def get_audio_duration_from_stream(stream: BinaryIO) -> Optional[float]:
+    """Detect the container from its magic bytes and compute the duration in seconds"""
+    stream.seek(0)
+    magic = stream.read(4)
+    if magic == b"RIFF":
+        return wav_duration(stream)
+    if magic == b"OggS":
+        return ogg_duration(stream)
+    return mp3_duration(stream)
+
+def get_audio_duration(file_path: str) -> Optional[float]:
+    """
+    Get the exact duration of an MP3, WAV or Ogg file by reading its headers
+
+    Nothing is decoded; MP3 files are measured by walking frame headers (or the
+    Xing/VBRI frame count), so only a few bytes per frame are read.
+
+    Args:
+        file_path: Path to the audio file
+
+    Returns:
+        float: Duration in seconds rounded to milliseconds, or None if the file is missing or unrecognised
+    """
+    if not os.path.isfile(file_path):
+        return None
+
+    try:
+        with open(file_path, "rb") as stream:
+            duration = get_audio_duration_from_stream(stream)
+    except (OSError, struct.error, IndexError) as e:
+        print(f"⚠️ Could not read audio duration for {file_path}: {str(e)}")
+        return None
+
+    return round(duration, 3) if duration is not None else None
+
+def get_audio_duration_from_bytes(audio_content: bytes) -> Optional[float]:
+    """Same as get_audio_duration for audio already held in memory"""
+    try:
+        duration = get_audio_duration_from_stream(io.BytesIO(audio_content))
+    except (struct.error, IndexError):
+        return None
+    return round(duration, 3) if duration is not None else None
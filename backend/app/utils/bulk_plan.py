@@ -0,0 +1,48 @@
+from typing import Callable, Dict, Hashable, List, Tuple
+
+def plan_items(
+    items: List[Tuple[str, Hashable]],
+    is_cached: Callable[[List[str], Hashable], set],
+    count_requests: Callable[[List[str], Hashable], int]
+) -> Dict:
+    """
+    Summarize the work behind a bulk operation before doing any of it
+
+    Items are (text, group) pairs where the group is whatever selects the API
+    call (a language, or a (source, target) language pair). Duplicates within a
+    group are processed once and fanned back out, and texts already held in a
+    cache are not processed at all.
+
+    Args:
+        items: Every (text, group) the operation references, duplicates included
+        is_cached: Returns the subset of a group's unique texts that are already cached
+        count_requests: Returns the number of API requests needed for a group's uncached texts
+
+    Returns:
+        Dict with totals and a per-group breakdown keyed by the group label
+    """
+    texts_by_group: Dict[Hashable, List[str]] = {}
+    for text, group in items:
+        texts_by_group.setdefault(group, []).append(text)
+
+    groups = {}
+    for group, texts in texts_by_group.items():
+        unique_texts = list(dict.fromkeys(texts))
+        cached = is_cached(unique_texts, group)
+        uncached = [text for text in unique_texts if text not in cached]
+        label = group if isinstance(group, str) else "->".join(group)
+        groups[label] = {
+            "total_items": len(texts),
+            "unique_items": len(unique_texts),
+            "cached_items": len(unique_texts) - len(uncached),
+            "items_to_process": len(uncached),
+            "estimated_api_characters": sum(len(text) for text in uncached),
+            "estimated_requests": count_requests(uncached, group) if uncached else 0
+        }
+
+    totals = {
+        key: sum(group[key] for group in groups.values())
+        for key in ("total_items", "unique_items", "cached_items", "items_to_process", "estimated_api_characters", "estimated_requests")
+    }
+    totals["groups"] = groups
+    return totals
@@ -0,0 +1,12 @@
+import json
+import hashlib
+
+def content_hash(*parts) -> str:
+    """
+    SHA-256 of the given values
+
+    Rows derived from other data (translations, synthesized clips) store the hash
+    of their inputs, so a later run can tell whether they are still current.
+    """
+    payload = json.dumps(list(parts), ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
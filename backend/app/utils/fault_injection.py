@@ -0,0 +1,56 @@
+import time
+import asyncio
+import hashlib
+import threading
+from typing import Dict
+from app.core.config.settings import settings
+
+class LocalFaultInjector:
+    """
+    Deterministic latency and failure injection for local stand-in providers
+
+    Decisions are derived from a hash of (seed, text, attempt number for that text),
+    so a run is reproducible regardless of thread scheduling, and retries of a
+    failed text can succeed.
+    """
+
+    def __init__(self, seed: int, latency_ms: float, jitter_ms: float, error_rate: float):
+        self.seed = seed
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self._attempts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls) -> "LocalFaultInjector":
+        return cls(
+            seed=settings.LOCAL_PROVIDER_SEED,
+            latency_ms=settings.LOCAL_PROVIDER_LATENCY_MS,
+            jitter_ms=settings.LOCAL_PROVIDER_LATENCY_JITTER_MS,
+            error_rate=settings.LOCAL_PROVIDER_ERROR_RATE
+        )
+
+    def _draw(self, text: str) -> tuple:
+        with self._lock:
+            attempt = self._attempts.get(text, 0)
+            self._attempts[text] = attempt + 1
+        digest = hashlib.sha256(f"{self.seed}:{attempt}:{text}".encode("utf-8")).digest()
+        latency_fraction = int.from_bytes(digest[:4], "big") / 0xFFFFFFFF
+        error_fraction = int.from_bytes(digest[4:8], "big") / 0xFFFFFFFF
+        delay = max(0.0, self.latency_ms + self.jitter_ms * (2 * latency_fraction - 1)) / 1000
+        return delay, error_fraction < self.error_rate
+
+    def before_call(self, text: str):
+        delay, fail = self._draw(text)
+        if delay:
+            time.sleep(delay)
+        if fail:
+            raise Exception(f"Injected local provider failure for '{text}'")
+
+    async def before_call_async(self, text: str):
+        delay, fail = self._draw(text)
+        if delay:
+            await asyncio.sleep(delay)
+        if fail:
+            raise Exception(f"Injected local provider failure for '{text}'")
@@ -1,32 +1,31 @@
-import os
-import json
-from google.cloud import translate_v2 as translate
-from google.oauth2 import service_account
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
+from app.utils.translation_providers import get_translation_provider
+from app.utils.translation_memo import translation_memo
+from app.core.config.settings import settings
 
 class GCPTranslationClient:
     def __init__(self):
-        self.client = None
-        self._initialize_client()
+        self._provider = None
+        self._provider_lock = threading.Lock()
+        self._executor = None
+        self._executor_lock = threading.Lock()
+    
+    @property
+    def provider(self):
+        """The translation provider, created on first use so importing the app needs no credentials"""
+        if self._provider is None:
+            with self._provider_lock:
+                if self._provider is None:
+                    self._initialize_client()
+        return self._provider
     
     def _initialize_client(self):
-        """Initialize GCP Translation client with credentials from isl.json"""
+        """Initialize the translation provider selected by settings.TRANSLATION_PROVIDER"""
         try:
-            # Path to the credentials file
-            credentials_path = os.path.join(
-                os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 
-                "config", 
-                "isl.json"
-            )
-            
-            if not os.path.exists(credentials_path):
-                raise FileNotFoundError(f"GCP credentials file not found at: {credentials_path}")
-            
-            # Load credentials from file
-            credentials = service_account.Credentials.from_service_account_file(credentials_path)
-            
-            # Initialize translation client
-            self.client = translate.Client(credentials=credentials)
-            
+            self._provider = get_translation_provider()
         except Exception as e:
             raise Exception(f"Failed to initialize GCP Translation client: {str(e)}")
     
@@ -34,6 +33,8 @@ class GCPTranslationClient:
         """
         Translate text from source language to target language
         
+        Translations are memoized, so text that was translated before is not sent again.
+        
         Args:
             text: Text to translate
             source_language: Source language code (e.g., 'en')
@@ -43,17 +44,107 @@ class GCPTranslationClient:
             Translated text
         """
         try:
-            if not self.client:
+            if not self.provider:
                 raise Exception("GCP Translation client not initialized")
             
+            memoized = translation_memo.get(text, source_language, target_language, settings.TRANSLATION_PROVIDER)
+            if memoized is not None:
+                return memoized
+            
             # Perform translation
-            result = self.client.translate(
-                text, 
-                source_language=source_language, 
-                target_language=target_language
-            )
+            translated_text = self.provider.translate(text, source_language, target_language)
+            translation_memo.put(text, source_language, target_language, translated_text, settings.TRANSLATION_PROVIDER)
+            return translated_text
             
-            return result['translatedText']
+        except Exception as e:
+            raise Exception(f"Translation failed: {str(e)}")
+    
+    def split_batches(self, texts: List[str]) -> List[List[str]]:
+        """Group texts into chunks that fit in one translation request"""
+        batches = []
+        current = []
+        current_characters = 0
+        for text in texts:
+            if current and (len(current) >= settings.TRANSLATION_BATCH_MAX_SEGMENTS or current_characters + len(text) > settings.TRANSLATION_BATCH_MAX_CHARACTERS):
+                batches.append(current)
+                current = []
+                current_characters = 0
+            current.append(text)
+            current_characters += len(text)
+        if current:
+            batches.append(current)
+        return batches
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Worker pool bounding concurrent translation requests, created on first use"""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=settings.TRANSLATION_MAX_CONCURRENCY, thread_name_prefix="translate-worker")
+            return self._executor
+    
+    def translate_pairs(self, texts_by_pair: Dict[Tuple[str, str], List[str]]) -> Tuple[Dict[Tuple[str, str], Dict[str, str]], Dict[Tuple[str, str], Dict[str, str]], int]:
+        """
+        Translate texts for several language pairs with concurrent batched requests
+        
+        Duplicates are translated once and memoized texts are not sent at all. The
+        rest go out in size-bounded batches, at most TRANSLATION_MAX_CONCURRENCY at
+        a time. A failed batch only fails its own texts.
+        
+        Args:
+            texts_by_pair: Texts to translate keyed by (source_language, target_language)
+        
+        Returns:
+            Tuple of (translations by pair and text, error message by pair and text for failed texts, number of requests sent)
+        """
+        if not self.provider:
+            raise Exception("GCP Translation client not initialized")
+        
+        translations = {}
+        futures = []
+        for (source_language, target_language), texts in texts_by_pair.items():
+            unique_texts = list(dict.fromkeys(texts))
+            translations[(source_language, target_language)] = translation_memo.get_many(unique_texts, source_language, target_language, settings.TRANSLATION_PROVIDER)
+            missing = [text for text in unique_texts if text not in translations[(source_language, target_language)]]
+            for batch in self.split_batches(missing):
+                future = self._get_executor().submit(self.provider.translate_many, batch, source_language, target_language)
+                futures.append(((source_language, target_language), batch, future))
+        
+        errors = {}
+        for (source_language, target_language), batch, future in futures:
+            try:
+                translated = dict(zip(batch, future.result()))
+            except Exception as e:
+                print(f"❌ Batched translation {source_language}->{target_language} failed for {len(batch)} texts: {str(e)}")
+                error = str(e)[:300]
+                errors.setdefault((source_language, target_language), {}).update((text, error) for text in batch)
+                continue
+            translation_memo.put_many(translated, source_language, target_language, settings.TRANSLATION_PROVIDER)
+            translations[(source_language, target_language)].update(translated)
+        
+        if futures:
+            failed = sum(len(texts) for texts in errors.values())
+            print(f"✅ Batched translation: {sum(len(texts) for texts in texts_by_pair.values())} texts, {len(futures)} requests, {failed} failed")
+        
+        return translations, errors, len(futures)
+    
+    def translate_batch(self, texts: List[str], source_language: str, target_language: str) -> List[str]:
+        """
+        Translate many texts of one language pair with as few requests as possible
+        
+        Args:
+            texts: Texts to translate
+            source_language: Source language code (e.g., 'en')
+            target_language: Target language code (e.g., 'hi')
+        
+        Returns:
+            Translated texts in input order
+        """
+        try:
+            pair = (source_language, target_language)
+            translations, errors, _ = self.translate_pairs({pair: texts})
+            if errors:
+                raise Exception(next(iter(errors[pair].values())))
+            return [translations[pair][text] for text in texts]
             
         except Exception as e:
             raise Exception(f"Translation failed: {str(e)}")
@@ -69,16 +160,71 @@ class GCPTranslationClient:
             Detected language code
         """
         try:
-            if not self.client:
+            if not self.provider:
                 raise Exception("GCP Translation client not initialized")
             
             # Detect language
-            result = self.client.detect_language(text)
+            return self.provider.detect_language(text)
             
-            return result['language']
+        except Exception as e:
+            raise Exception(f"Language detection failed: {str(e)}")
+
+class AsyncGCPTranslationClient(GCPTranslationClient):
+    """
+    asyncio variant of GCPTranslationClient
+
+    Uses the provider's async path (the v3 TranslationServiceAsyncClient for
+    Google) so translations never block the event loop. Memo lookups and writes
+    query the database, so they run on a worker thread. At most
+    TRANSLATION_MAX_CONCURRENCY requests are in flight at once.
+    """
+    
+    def __init__(self):
+        self._semaphore = None
+        super().__init__()
+    
+    async def translate_text(self, text: str, source_language: str, target_language: str) -> str:
+        """
+        Translate text from source language to target language
+        
+        Args:
+            text: Text to translate
+            source_language: Source language code (e.g., 'en')
+            target_language: Target language code (e.g., 'hi')
+        
+        Returns:
+            Translated text
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(settings.TRANSLATION_MAX_CONCURRENCY)
+        
+        try:
+            memoized = await asyncio.to_thread(translation_memo.get, text, source_language, target_language, settings.TRANSLATION_PROVIDER)
+            if memoized is not None:
+                return memoized
             
+            async with self._semaphore:
+                translated_text = await self.provider.translate_async(text, source_language, target_language)
+            await asyncio.to_thread(translation_memo.put, text, source_language, target_language, translated_text, settings.TRANSLATION_PROVIDER)
+            return translated_text
+        except Exception as e:
+            raise Exception(f"Translation failed: {str(e)}")
+    
+    async def detect_language(self, text: str) -> str:
+        """
+        Detect the language of the given text
+        
+        Args:
+            text: Text to detect language for
+        
+        Returns:
+            Detected language code
+        """
+        try:
+            return await self.provider.detect_language_async(text)
         except Exception as e:
             raise Exception(f"Language detection failed: {str(e)}")
 
-# Global instance
-gcp_client = GCPTranslationClient() 
\ No newline at end of file
+# Global instances
+gcp_client = GCPTranslationClient()
+async_gcp_client = AsyncGCPTranslationClient()
@@ -1,60 +1,158 @@
 import os
-import json
-from google.cloud import texttospeech
-from google.oauth2 import service_account
+import asyncio
+import threading
+from typing import List, Optional, Tuple
+from xml.sax.saxutils import escape
+from app.utils.tts_cache import tts_cache
+from app.utils.rate_limiter import tts_rate_limiter
+from app.utils.tts_providers import get_tts_provider
+from app.utils.audio_info import get_audio_duration, get_audio_duration_from_bytes
+from app.utils.mp3 import slice_by_time
+from app.core.config.settings import settings
 
 class GCPTTSClient:
     def __init__(self):
-        self.client = None
-        self._initialize_client()
+        self._provider = None
+        self._provider_lock = threading.Lock()
+        self.cache = tts_cache
+        self.rate_limiter = tts_rate_limiter
+        
+        # Output audio format
+        self.audio_encoding = "MP3"
+        self.sample_rate_hertz = 24000
         
         # Voice configurations for Chirp 3 HD
         self.voice_configs = {
             'en': {
                 'language_code': 'en-IN',
                 'name': 'en-IN-Chirp3-HD-Achernar',
-                'ssml_gender': texttospeech.SsmlVoiceGender.NEUTRAL
+                'ssml_gender': 'NEUTRAL'
             },
             'hi': {
                 'language_code': 'hi-IN',
                 'name': 'hi-IN-Chirp3-HD-Achernar',
-                'ssml_gender': texttospeech.SsmlVoiceGender.NEUTRAL
+                'ssml_gender': 'NEUTRAL'
             },
             'mr': {
                 'language_code': 'mr-IN',
                 'name': 'mr-IN-Chirp3-HD-Achernar',
-                'ssml_gender': texttospeech.SsmlVoiceGender.NEUTRAL
+                'ssml_gender': 'NEUTRAL'
             },
             'gu': {
                 'language_code': 'gu-IN',
                 'name': 'gu-IN-Chirp3-HD-Achernar',
-                'ssml_gender': texttospeech.SsmlVoiceGender.NEUTRAL
+                'ssml_gender': 'NEUTRAL'
+            }
+        }
+        
+        # Voices used instead when TTS_BATCH_ENABLED; Chirp 3 HD voices accept neither SSML nor <mark> timepoints
+        self.batch_voice_configs = {
+            'en': {
+                'language_code': 'en-IN',
+                'name': 'en-IN-Wavenet-A',
+                'ssml_gender': 'FEMALE'
+            },
+            'hi': {
+                'language_code': 'hi-IN',
+                'name': 'hi-IN-Wavenet-A',
+                'ssml_gender': 'FEMALE'
+            },
+            'mr': {
+                'language_code': 'mr-IN',
+                'name': 'mr-IN-Wavenet-A',
+                'ssml_gender': 'FEMALE'
+            },
+            'gu': {
+                'language_code': 'gu-IN',
+                'name': 'gu-IN-Wavenet-A',
+                'ssml_gender': 'FEMALE'
             }
         }
 
+    @property
+    def provider(self):
+        """The Text-to-Speech provider, created on first use so importing the app needs no credentials"""
+        if self._provider is None:
+            with self._provider_lock:
+                if self._provider is None:
+                    self._initialize_client()
+        return self._provider
+
     def _initialize_client(self):
-        """Initialize the GCP Text-to-Speech client using isl.json credentials"""
+        """Initialize the Text-to-Speech provider selected by settings.TTS_PROVIDER"""
         try:
-            # Path to the credentials file
-            credentials_path = os.path.join(os.path.dirname(__file__), '..', '..', 'config', 'isl.json')
-            
-            if not os.path.exists(credentials_path):
-                raise FileNotFoundError(f"Credentials file not found at: {credentials_path}")
-            
-            # Load credentials
-            credentials = service_account.Credentials.from_service_account_file(credentials_path)
-            
-            # Initialize the client
-            self.client = texttospeech.TextToSpeechClient(credentials=credentials)
-            print("✅ GCP Text-to-Speech client initialized successfully")
+            self._provider = get_tts_provider()
+            print(f"✅ Text-to-Speech client initialized successfully ({self.provider.name} provider)")
             
         except Exception as e:
             print(f"❌ Error initializing GCP Text-to-Speech client: {str(e)}")
             raise
 
-    def generate_audio(self, text: str, language_code: str, output_path: str) -> float:
+    def get_voice_configs(self) -> dict:
+        """
+        Voices every clip is synthesized with
+        
+        Batched requests need SSML <mark> timepoints, which the Chirp 3 HD voices do
+        not support, so with TTS_BATCH_ENABLED all clips use the Wavenet voices,
+        batched or not. Segments, numerals and route names spliced into one
+        announcement therefore always share a voice.
+        """
+        return self.batch_voice_configs if settings.TTS_BATCH_ENABLED else self.voice_configs
+
+    def voice_name(self, language_code: str) -> str:
+        """Provider and voice a language is synthesized with, e.g. gcp:hi-IN-Chirp3-HD-Achernar"""
+        voice_configs = self.get_voice_configs()
+        if language_code not in voice_configs:
+            raise ValueError(f"Unsupported language code: {language_code}")
+        return f"{self.provider.name}:{voice_configs[language_code]['name']}"
+
+    def _prepare(self, text: str, language_code: str):
+        """Resolve the voice for a language and build its synthesis cache key"""
+        voice_configs = self.get_voice_configs()
+        if language_code not in voice_configs:
+            raise ValueError(f"Unsupported language code: {language_code}")
+        
+        voice_config = voice_configs[language_code]
+        
+        cache_key = self.cache.make_key(
+            text=text,
+            voice_name=self.voice_name(language_code),
+            language_code=voice_config['language_code'],
+            audio_encoding=self.audio_encoding,
+            sample_rate_hertz=self.sample_rate_hertz
+        )
+        
+        return voice_config, cache_key
+
+    def is_cached(self, text: str, language_code: str) -> bool:
+        """Check whether a text would be served from the synthesis cache"""
+        _, cache_key = self._prepare(text, language_code)
+        return self.cache.contains(cache_key)
+
+    def _write_output(self, cache_key: str, audio_content: bytes, output_path: str):
+        """Store in the cache and link into place, or write directly if caching is unavailable"""
+        if not self.cache.store(cache_key, audio_content, output_path):
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            if os.path.lexists(output_path):
+                os.remove(output_path)
+            with open(output_path, "wb") as out:
+                out.write(audio_content)
+
+    def _duration_of(self, output_path: str, audio_content: Optional[bytes] = None) -> float:
+        """Measure a generated clip; raises if the provider returned unreadable audio"""
+        if audio_content is not None:
+            duration = get_audio_duration_from_bytes(audio_content)
+        else:
+            duration = get_audio_duration(output_path)
+        
+        if duration is None:
+            raise Exception(f"Could not determine audio duration of {output_path}")
+        
+        return duration
+
+    def generate_audio(self, text: str, language_code: str, output_path: str) -> Optional[float]:
         """
-        Generate audio from text using GCP Text-to-Speech
+        Generate audio from text using the configured Text-to-Speech provider
         
         Args:
             text: Text to convert to speech
@@ -62,58 +160,184 @@ class GCPTTSClient:
             output_path: Path where to save the audio file
             
         Returns:
-            float: Audio duration in seconds, or 1.0 as default
+            float: Audio duration in seconds read from the encoded frames, or None if generation failed
         """
         try:
-            if not self.client:
+            if not self.provider:
                 raise Exception("GCP Text-to-Speech client not initialized")
             
-            if language_code not in self.voice_configs:
-                raise ValueError(f"Unsupported language code: {language_code}")
-            
-            voice_config = self.voice_configs[language_code]
+            voice_config, cache_key = self._prepare(text, language_code)
             
-            # Create the synthesis input
-            synthesis_input = texttospeech.SynthesisInput(text=text)
+            # Serve repeated strings from the synthesis cache
+            if self.cache.fetch(cache_key, output_path):
+                print(f"♻️ Audio served from cache: {output_path}")
+                return self._duration_of(output_path)
             
-            # Build the voice request
-            voice = texttospeech.VoiceSelectionParams(
-                language_code=voice_config['language_code'],
-                name=voice_config['name'],
-                ssml_gender=voice_config['ssml_gender']
+            # Wait for provider quota, then perform the text-to-speech request
+            self.rate_limiter.acquire(len(text))
+            audio_content = self.provider.synthesize(
+                text, voice_config, self.audio_encoding, self.sample_rate_hertz
             )
             
-            # Select the type of audio file to return
-            audio_config = texttospeech.AudioConfig(
-                audio_encoding=texttospeech.AudioEncoding.MP3,
-                sample_rate_hertz=24000
-            )
+            self._write_output(cache_key, audio_content, output_path)
+            
+            print(f"✅ Audio generated successfully: {output_path}")
+            return self._duration_of(output_path, audio_content)
+            
+        except Exception as e:
+            print(f"❌ Error generating audio for '{text}' in {language_code}: {str(e)}")
+            return None
+
+    def split_batches(self, texts: List[str]) -> List[List[str]]:
+        """Group texts into chunks that fit in one SSML request"""
+        batches = []
+        current = []
+        current_characters = 0
+        for text in texts:
+            # Escaped text plus two <mark/> tags and a <break/>
+            characters = len(escape(text)) + 64
+            if current and (len(current) >= settings.TTS_BATCH_MAX_SEGMENTS or current_characters + characters > settings.TTS_BATCH_MAX_CHARACTERS):
+                batches.append(current)
+                current = []
+                current_characters = 0
+            current.append(text)
+            current_characters += characters
+        if current:
+            batches.append(current)
+        return batches
+
+    def _build_marked_ssml(self, texts: List[str]) -> str:
+        """Wrap each text in start/end marks, separated by pauses that absorb frame rounding"""
+        pause = f'<break time="{settings.TTS_BATCH_PAUSE_MS}ms"/>'
+        parts = [
+            f'{pause}<mark name="s{index}"/>{escape(text)}<mark name="e{index}"/>'
+            for index, text in enumerate(texts)
+        ]
+        return f"<speak>{''.join(parts)}{pause}</speak>"
+
+    def generate_audio_batch(self, items: List[Tuple[str, List[str]]], language_code: str) -> List[Optional[float]]:
+        """
+        Generate many short clips for one language with a single SSML request
+        
+        Cached texts are served as usual; the rest are synthesized together with
+        <mark> timepoints and the returned MP3 is cut into per-text clips at frame
+        boundaries. Requires TTS_BATCH_ENABLED, which selects SSML-capable voices.
+        
+        Args:
+            items: List of (text, output_paths) tuples; each text is written to all its paths
+            language_code: Language code ('en', 'hi', 'mr', 'gu')
+            
+        Returns:
+            List of audio durations in item order, None for texts that failed
+        """
+        durations: List[Optional[float]] = [None] * len(items)
+        
+        try:
+            if not self.provider:
+                raise Exception("GCP Text-to-Speech client not initialized")
+            if not settings.TTS_BATCH_ENABLED:
+                raise Exception("Batched synthesis requires TTS_BATCH_ENABLED")
+            if self.audio_encoding != "MP3":
+                raise Exception(f"Batched synthesis requires MP3 output, not {self.audio_encoding}")
+            
+            pending = []
+            for index, (text, output_paths) in enumerate(items):
+                voice_config, cache_key = self._prepare(text, language_code)
+                if all(self.cache.fetch(cache_key, path) for path in output_paths):
+                    durations[index] = self._duration_of(output_paths[0])
+                else:
+                    pending.append((index, text, output_paths, cache_key))
+            
+            if not pending:
+                return durations
             
-            # Perform the text-to-speech request
-            response = self.client.synthesize_speech(
-                input=synthesis_input,
-                voice=voice,
-                audio_config=audio_config
+            ssml = self._build_marked_ssml([text for _, text, _, _ in pending])
+            self.rate_limiter.acquire(len(ssml))
+            audio_content, marks = self.provider.synthesize_ssml_with_marks(
+                ssml, voice_config, self.audio_encoding, self.sample_rate_hertz
             )
             
-            # Ensure the output directory exists
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            spans = []
+            for position in range(len(pending)):
+                if f"s{position}" not in marks or f"e{position}" not in marks:
+                    raise Exception(f"Timepoint missing for batch segment {position}")
+                spans.append((marks[f"s{position}"], marks[f"e{position}"]))
             
-            # Write the audio content to the file
-            with open(output_path, "wb") as out:
-                out.write(response.audio_content)
+            clips = slice_by_time(audio_content, spans)
+            for (index, text, output_paths, cache_key), clip in zip(pending, clips):
+                for path in output_paths:
+                    self._write_output(cache_key, clip, path)
+                durations[index] = self._duration_of(output_paths[0], clip)
             
-            print(f"✅ Audio generated successfully: {output_path}")
-            # Return a default duration of 1.0 seconds
-            return 1.0
+            print(f"✅ Batched audio generated: {len(pending)} clips in {language_code} from one request")
             
         except Exception as e:
-            print(f"❌ Error generating audio for '{text}' in {language_code}: {str(e)}")
-            return 1.0
+            print(f"❌ Error generating batched audio for {len(items)} texts in {language_code}: {str(e)}")
+        
+        return durations
 
     def get_supported_languages(self) -> dict:
         """Get supported language configurations"""
-        return self.voice_configs.copy()
+        return self.get_voice_configs().copy()
+
+    def get_cache_stats(self) -> dict:
+        """Get synthesis cache hit/miss counters"""
+        return self.cache.get_stats()
+
+class AsyncGCPTTSClient(GCPTTSClient):
+    """
+    asyncio variant of GCPTTSClient
+
+    Shares the voice configuration, synthesis cache and rate limiter with the
+    synchronous client and uses the provider's async path
+    (TextToSpeechAsyncClient for Google).
+    """
+
+    def __init__(self):
+        self._semaphore = None
+        super().__init__()
+
+    async def generate_audio(self, text: str, language_code: str, output_path: str) -> Optional[float]:
+        """
+        Generate audio from text without blocking the event loop
+        
+        Args:
+            text: Text to convert to speech
+            language_code: Language code ('en', 'hi', 'mr', 'gu')
+            output_path: Path where to save the audio file
+            
+        Returns:
+            float: Audio duration in seconds read from the encoded frames, or None if generation failed
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(settings.TTS_MAX_CONCURRENCY)
+        
+        try:
+            voice_config, cache_key = self._prepare(text, language_code)
+            
+            # Serve repeated strings from the synthesis cache
+            if self.cache.fetch(cache_key, output_path):
+                print(f"♻️ Audio served from cache: {output_path}")
+                return self._duration_of(output_path)
+            
+            async with self._semaphore:
+                # Wait for provider quota without holding up other requests
+                wait = self.rate_limiter.reserve(len(text))
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                audio_content = await self.provider.synthesize_async(
+                    text, voice_config, self.audio_encoding, self.sample_rate_hertz
+                )
+            
+            self._write_output(cache_key, audio_content, output_path)
+            
+            print(f"✅ Audio generated successfully: {output_path}")
+            return self._duration_of(output_path, audio_content)
+            
+        except Exception as e:
+            print(f"❌ Error generating audio for '{text}' in {language_code}: {str(e)}")
+            return None
 
-# Global instance
-gcp_tts_client = GCPTTSClient() 
\ No newline at end of file
+# Global instances
+gcp_tts_client = GCPTTSClient()
+async_gcp_tts_client = AsyncGCPTTSClient()
@@ -0,0 +1,351 @@
+import io
+import math
+import struct
+from typing import BinaryIO, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+# MPEG audio version ids as encoded in the frame header
+MPEG_1 = 0b11
+MPEG_2 = 0b10
+MPEG_2_5 = 0b00
+
+# Sample rates by version id and header index
+SAMPLE_RATES = {
+    MPEG_1: [44100, 48000, 32000],
+    MPEG_2: [22050, 24000, 16000],
+    MPEG_2_5: [11025, 12000, 8000],
+}
+
+# Layer III bitrates (kbps) by header index
+LAYER3_BITRATES = {
+    MPEG_1: [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+    MPEG_2: [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+}
+LAYER3_BITRATES[MPEG_2_5] = LAYER3_BITRATES[MPEG_2]
+
+CHANNEL_MODE_STEREO = 0b00
+CHANNEL_MODE_MONO = 0b11
+
+def version_for_sample_rate(sample_rate: int) -> int:
+    """Get the MPEG version id that carries the given sample rate"""
+    for version, rates in SAMPLE_RATES.items():
+        if sample_rate in rates:
+            return version
+    raise ValueError(f"Unsupported MP3 sample rate: {sample_rate}")
+
+def samples_per_frame(version: int) -> int:
+    """Layer III samples per frame"""
+    return 1152 if version == MPEG_1 else 576
+
+def side_info_size(version: int, mono: bool) -> int:
+    """Layer III side information size in bytes"""
+    if version == MPEG_1:
+        return 17 if mono else 32
+    return 9 if mono else 17
+
+def frame_length(version: int, bitrate_kbps: int, sample_rate: int, padding: int = 0) -> int:
+    """Layer III frame length in bytes including the header"""
+    coefficient = 144 if version == MPEG_1 else 72
+    return coefficient * bitrate_kbps * 1000 // sample_rate + padding
+
+def build_frame_header(version: int, bitrate_kbps: int, sample_rate: int, padding: int = 0, mono: bool = True) -> bytes:
+    """Build a Layer III frame header without CRC protection"""
+    bitrate_index = LAYER3_BITRATES[version].index(bitrate_kbps)
+    sample_rate_index = SAMPLE_RATES[version].index(sample_rate)
+    channel_mode = CHANNEL_MODE_MONO if mono else CHANNEL_MODE_STEREO
+    header = (
+        (0x7FF << 21)
+        | (version << 19)
+        | (0b01 << 17)  # Layer III
+        | (1 << 16)  # no CRC
+        | (bitrate_index << 12)
+        | (sample_rate_index << 10)
+        | (padding << 9)
+        | (channel_mode << 6)
+    )
+    return struct.pack(">I", header)
+
+def build_silence_frames(duration: float, sample_rate: int = 24000, bitrate_kbps: int = 32, mono: bool = True) -> bytes:
+    """
+    Build pre-encoded Layer III frames that decode to silence
+
+    Each frame carries zeroed side information (no main data), which every
+    decoder renders as digital silence. Padding slots are distributed so the
+    average bitrate matches ``bitrate_kbps`` exactly.
+
+    Args:
+        duration: Requested length in seconds (rounded up to whole frames)
+        sample_rate: Output sample rate in Hz
+        bitrate_kbps: Nominal bitrate; must be valid for the sample rate's MPEG version
+        mono: Single channel if True, stereo otherwise
+
+    Returns:
+        bytes: Concatenated MP3 frames
+    """
+    version = version_for_sample_rate(sample_rate)
+    frame_samples = samples_per_frame(version)
+    frame_count = max(0, int(-(-duration * sample_rate // frame_samples)))
+    coefficient = 144 if version == MPEG_1 else 72
+    exact_numerator = coefficient * bitrate_kbps * 1000
+    side_info = bytes(side_info_size(version, mono))
+
+    frames: List[bytes] = []
+    remainder = 0
+    for _ in range(frame_count):
+        remainder += exact_numerator % sample_rate
+        padding = 0
+        if remainder >= sample_rate:
+            remainder -= sample_rate
+            padding = 1
+        length = frame_length(version, bitrate_kbps, sample_rate, padding)
+        header = build_frame_header(version, bitrate_kbps, sample_rate, padding, mono)
+        frames.append(header + side_info + bytes(length - len(header) - len(side_info)))
+
+    return b"".join(frames)
+
+def build_wav(pcm: bytes, sample_rate: int, channels: int = 1, bits_per_sample: int = 16) -> bytes:
+    """Wrap raw little-endian PCM samples in a RIFF/WAVE container"""
+    block_align = channels * bits_per_sample // 8
+    byte_rate = sample_rate * block_align
+    return (
+        b"RIFF" + struct.pack("<I", 36 + len(pcm)) + b"WAVE"
+        + b"fmt " + struct.pack("<IHHIIHH", 16, 1, channels, sample_rate, byte_rate, block_align, bits_per_sample)
+        + b"data" + struct.pack("<I", len(pcm)) + pcm
+    )
+
+class FrameHeader(NamedTuple):
+    version: int
+    bitrate_kbps: int
+    sample_rate: int
+    padding: int
+    protected: bool
+    mono: bool
+    frame_length: int
+    samples: int
+
+def parse_frame_header(header: bytes) -> Optional[FrameHeader]:
+    """
+    Parse a 4-byte Layer III frame header
+
+    Returns:
+        FrameHeader, or None if the bytes are not a valid Layer III header
+    """
+    if len(header) < 4:
+        return None
+    value = struct.unpack(">I", header[:4])[0]
+    if (value >> 21) & 0x7FF != 0x7FF:
+        return None
+
+    version = (value >> 19) & 0b11
+    layer = (value >> 17) & 0b11
+    bitrate_index = (value >> 12) & 0xF
+    sample_rate_index = (value >> 10) & 0b11
+    if version == 0b01 or layer != 0b01 or bitrate_index in (0, 0xF) or sample_rate_index == 0b11:
+        return None
+
+    bitrate_kbps = LAYER3_BITRATES[version][bitrate_index]
+    sample_rate = SAMPLE_RATES[version][sample_rate_index]
+    padding = (value >> 9) & 1
+    return FrameHeader(
+        version=version,
+        bitrate_kbps=bitrate_kbps,
+        sample_rate=sample_rate,
+        padding=padding,
+        protected=not (value >> 16) & 1,
+        mono=((value >> 6) & 0b11) == CHANNEL_MODE_MONO,
+        frame_length=frame_length(version, bitrate_kbps, sample_rate, padding),
+        samples=samples_per_frame(version)
+    )
+
+def skip_id3v2(stream: BinaryIO) -> int:
+    """Position the stream after any leading ID3v2 tags and return that offset"""
+    offset = 0
+    while True:
+        stream.seek(offset)
+        tag = stream.read(10)
+        if len(tag) < 10 or tag[:3] != b"ID3":
+            stream.seek(offset)
+            return offset
+        # Tag size is a 28-bit synchsafe integer; a footer adds another 10 bytes
+        size = (tag[6] << 21) | (tag[7] << 14) | (tag[8] << 7) | tag[9]
+        offset += 10 + size + (10 if tag[5] & 0x10 else 0)
+
+def _find_sync(stream: BinaryIO, offset: int, limit: int = 64 * 1024) -> Optional[int]:
+    """Find the next offset holding two consecutive valid frame headers, or a lone frame ending at EOF"""
+    stream.seek(offset)
+    window = stream.read(limit)
+    position = window.find(b"\xff")
+    while position != -1 and position + 4 <= len(window):
+        header = parse_frame_header(window[position:position + 4])
+        if header:
+            stream.seek(offset + position + header.frame_length - 1)
+            if stream.read(1):
+                following = stream.read(4)
+                if not following or parse_frame_header(following):
+                    return offset + position
+        position = window.find(b"\xff", position + 1)
+    return None
+
+def iter_frames(stream: BinaryIO) -> Iterator[Tuple[int, FrameHeader]]:
+    """
+    Yield (offset, header) for every Layer III frame in a stream
+
+    Only the 4-byte headers are read; frame payloads are skipped with seeks.
+    Leading ID3v2 tags are skipped and garbage between frames is resynchronised.
+    """
+    offset = _find_sync(stream, skip_id3v2(stream))
+    while offset is not None:
+        stream.seek(offset)
+        header = parse_frame_header(stream.read(4))
+        if header is None:
+            offset = _find_sync(stream, offset + 1)
+            continue
+        stream.seek(offset + header.frame_length - 1)
+        if not stream.read(1):
+            # Truncated final frame
+            return
+        yield offset, header
+        offset += header.frame_length
+
+def _xing_offset(header: FrameHeader) -> int:
+    return 4 + (2 if header.protected else 0) + side_info_size(header.version, header.mono)
+
+def read_vbr_header(frame: bytes, header: FrameHeader) -> Optional[Dict]:
+    """
+    Read a Xing/Info (with optional LAME extension) or VBRI header from the first frame
+
+    Returns:
+        Dict with "frames" and, when known, encoder "delay" and "padding" samples,
+        or None if the frame carries no VBR header
+    """
+    position = _xing_offset(header)
+    tag = frame[position:position + 4]
+    if tag in (b"Xing", b"Info"):
+        flags = struct.unpack(">I", frame[position + 4:position + 8])[0]
+        cursor = position + 8
+        info: Dict = {}
+        if flags & 0x1:
+            info["frames"] = struct.unpack(">I", frame[cursor:cursor + 4])[0]
+            cursor += 4
+        if flags & 0x2:
+            cursor += 4  # byte count
+        if flags & 0x4:
+            cursor += 100  # seek table
+        if flags & 0x8:
+            cursor += 4  # quality
+        # LAME extension: encoder delay and padding are 12 bits each, 21 bytes in
+        if frame[cursor:cursor + 4] in (b"LAME", b"Lavf", b"Lavc") and len(frame) >= cursor + 24:
+            delay_padding = frame[cursor + 21:cursor + 24]
+            info["delay"] = (delay_padding[0] << 4) | (delay_padding[1] >> 4)
+            info["padding"] = ((delay_padding[1] & 0x0F) << 8) | delay_padding[2]
+        return info if "frames" in info else None
+
+    # VBRI sits at a fixed 32 bytes after the header
+    if frame[36:40] == b"VBRI":
+        return {"frames": struct.unpack(">I", frame[50:54])[0]}
+
+    return None
+
+def mp3_duration(stream: BinaryIO) -> Optional[float]:
+    """
+    Compute the exact duration of an MP3 stream in seconds
+
+    Uses the Xing/Info or VBRI frame count when present (subtracting LAME
+    encoder delay and padding); otherwise sums the samples of every frame.
+    """
+    frames = iter_frames(stream)
+    first = next(frames, None)
+    if first is None:
+        return None
+
+    offset, header = first
+    stream.seek(offset)
+    vbr = read_vbr_header(stream.read(header.frame_length), header)
+    if vbr:
+        samples = vbr["frames"] * header.samples - vbr.get("delay", 0) - vbr.get("padding", 0)
+        return max(0, samples) / header.sample_rate
+
+    total_samples = header.samples
+    for _, frame in frames:
+        total_samples += frame.samples
+    return total_samples / header.sample_rate
+
+def slice_by_time(audio: bytes, spans: List[Tuple[float, float]], lead_in_frames: int = 1) -> List[bytes]:
+    """
+    Cut an MP3 stream into clips at frame boundaries without re-encoding
+
+    Each span is widened outwards to whole frames. ``lead_in_frames`` extra frames
+    are kept before each clip so the decoder can fill its bit reservoir; callers
+    should leave a short pause before each span so those frames are silent.
+    A leading Xing/Info/VBRI frame is dropped, as it carries no audio.
+
+    Args:
+        audio: Complete MP3 stream
+        spans: (start_seconds, end_seconds) per clip
+        lead_in_frames: Frames kept before each span start
+
+    Returns:
+        List of MP3 byte strings, one per span
+    """
+    frames = list(iter_frames(io.BytesIO(audio)))
+    if not frames:
+        raise ValueError("No MP3 frames found in audio")
+
+    offset, header = frames[0]
+    if read_vbr_header(audio[offset:offset + header.frame_length], header):
+        frames = frames[1:]
+
+    seconds_per_frame = header.samples / header.sample_rate
+    clips = []
+    for start, end in spans:
+        first = max(0, int(start / seconds_per_frame) - lead_in_frames)
+        last = min(len(frames), max(first + 1, math.ceil(end / seconds_per_frame)))
+        clip_start = frames[first][0]
+        clip_end = frames[last - 1][0] + frames[last - 1][1].frame_length
+        clips.append(audio[clip_start:clip_end])
+    return clips
+
+def audio_frames(audio: bytes) -> Tuple[FrameHeader, bytes]:
+    """
+    Strip tags and any Xing/Info/VBRI frame from an MP3 stream
+
+    Returns:
+        Tuple of (first audio frame header, concatenated audio frames)
+    """
+    frames = list(iter_frames(io.BytesIO(audio)))
+    if not frames:
+        raise ValueError("No MP3 frames found in audio")
+
+    offset, header = frames[0]
+    if read_vbr_header(audio[offset:offset + header.frame_length], header):
+        frames = frames[1:]
+        if not frames:
+            raise ValueError("MP3 contains no audio frames")
+
+    # Frames are contiguous unless the stream had junk between them
+    if frames[-1][0] + frames[-1][1].frame_length - frames[0][0] == sum(frame.frame_length for _, frame in frames):
+        return frames[0][1], audio[frames[0][0]:frames[-1][0] + frames[-1][1].frame_length]
+    return frames[0][1], b"".join(audio[offset:offset + frame.frame_length] for offset, frame in frames)
+
+def concat_clips(clips: List[bytes], gap_seconds: float = 0.0, edge_seconds: float = 0.0) -> bytes:
+    """
+    Join MP3 clips into one gapless stream by concatenating frames, without re-encoding
+
+    Silence frames matching the clips' sample rate and channel mode are inserted
+    between clips (``gap_seconds``) and at both ends (``edge_seconds``). All clips
+    must share the same MPEG version, sample rate and channel mode.
+    """
+    if not clips:
+        raise ValueError("No clips to concatenate")
+
+    parsed = [audio_frames(clip) for clip in clips]
+    first = parsed[0][0]
+    for header, _ in parsed[1:]:
+        if (header.version, header.sample_rate, header.mono) != (first.version, first.sample_rate, first.mono):
+            raise ValueError(
+                f"Incompatible MP3 clips: {header.sample_rate} Hz mono={header.mono} "
+                f"vs {first.sample_rate} Hz mono={first.mono}"
+            )
+
+    gap = build_silence_frames(gap_seconds, first.sample_rate, mono=first.mono) if gap_seconds > 0 else b""
+    edge = build_silence_frames(edge_seconds, first.sample_rate, mono=first.mono) if edge_seconds > 0 else b""
+    return edge + gap.join(frames for _, frames in parsed) + edge
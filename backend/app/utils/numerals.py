@@ -0,0 +1,194 @@
+from typing import Dict, List, Optional
+import pandas as pd
+
+# Number words 0-99 per language; Indic languages have a distinct word for every number below 100
+_EN_ONES = ['zero', 'one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine',
+            'ten', 'eleven', 'twelve', 'thirteen', 'fourteen', 'fifteen', 'sixteen', 'seventeen', 'eighteen', 'nineteen']
+_EN_TENS = ['', '', 'twenty', 'thirty', 'forty', 'fifty', 'sixty', 'seventy', 'eighty', 'ninety']
+
+NUMBER_WORDS = {
+    'en': _EN_ONES + [
+        _EN_TENS[value // 10] + (f" {_EN_ONES[value % 10]}" if value % 10 else "")
+        for value in range(20, 100)
+    ],
+    'hi': (
+        'शून्य एक दो तीन चार पाँच छह सात आठ नौ '
+        'दस ग्यारह बारह तेरह चौदह पंद्रह सोलह सत्रह अठारह उन्नीस '
+        'बीस इक्कीस बाईस तेईस चौबीस पच्चीस छब्बीस सत्ताईस अट्ठाईस उनतीस '
+        'तीस इकतीस बत्तीस तैंतीस चौंतीस पैंतीस छत्तीस सैंतीस अड़तीस उनतालीस '
+        'चालीस इकतालीस बयालीस तैंतालीस चौवालीस पैंतालीस छियालीस सैंतालीस अड़तालीस उनचास '
+        'पचास इक्यावन बावन तिरपन चौवन पचपन छप्पन सत्तावन अट्ठावन उनसठ '
+        'साठ इकसठ बासठ तिरसठ चौंसठ पैंसठ छियासठ सड़सठ अड़सठ उनहत्तर '
+        'सत्तर इकहत्तर बहत्तर तिहत्तर चौहत्तर पचहत्तर छिहत्तर सतहत्तर अठहत्तर उनासी '
+        'अस्सी इक्यासी बयासी तिरासी चौरासी पचासी छियासी सत्तासी अट्ठासी नवासी '
+        'नब्बे इक्यानबे बानबे तिरानबे चौरानबे पंचानबे छियानबे सत्तानबे अट्ठानबे निन्यानबे'
+    ).split(),
+    'mr': (
+        'शून्य एक दोन तीन चार पाच सहा सात आठ नऊ '
+        'दहा अकरा बारा तेरा चौदा पंधरा सोळा सतरा अठरा एकोणीस '
+        'वीस एकवीस बावीस तेवीस चोवीस पंचवीस सव्वीस सत्तावीस अठ्ठावीस एकोणतीस '
+        'तीस एकतीस बत्तीस तेहेतीस चौतीस पस्तीस छत्तीस सदतीस अडतीस एकोणचाळीस '
+        'चाळीस एक्केचाळीस बेचाळीस त्रेचाळीस चव्वेचाळीस पंचेचाळीस सेहेचाळीस सत्तेचाळीस अठ्ठेचाळीस एकोणपन्नास '
+        'पन्नास एक्कावन्न बावन्न त्रेपन्न चोपन्न पंचावन्न छप्पन्न सत्तावन्न अठ्ठावन्न एकोणसाठ '
+        'साठ एकसष्ट बासष्ट त्रेसष्ट चौसष्ट पासष्ट सहासष्ट सदुसष्ट अडुसष्ट एकोणसत्तर '
+        'सत्तर एक्काहत्तर बाहत्तर त्र्याहत्तर चौऱ्याहत्तर पंच्याहत्तर शहात्तर सत्याहत्तर अठ्ठ्याहत्तर एकोणऐंशी '
+        'ऐंशी एक्क्याऐंशी ब्याऐंशी त्र्याऐंशी चौऱ्याऐंशी पंच्याऐंशी शहाऐंशी सत्त्याऐंशी अठ्ठ्याऐंशी एकोणनव्वद '
+        'नव्वद एक्क्याण्णव ब्याण्णव त्र्याण्णव चौऱ्याण्णव पंच्याण्णव शहाण्णव सत्त्याण्णव अठ्ठ्याण्णव नव्व्याण्णव'
+    ).split(),
+    'gu': (
+        'શૂન્ય એક બે ત્રણ ચાર પાંચ છ સાત આઠ નવ '
+        'દસ અગિયાર બાર તેર ચૌદ પંદર સોળ સત્તર અઢાર ઓગણીસ '
+        'વીસ એકવીસ બાવીસ તેવીસ ચોવીસ પચ્ચીસ છવ્વીસ સત્તાવીસ અઠ્ઠાવીસ ઓગણત્રીસ '
+        'ત્રીસ એકત્રીસ બત્રીસ તેત્રીસ ચોત્રીસ પાંત્રીસ છત્રીસ સાડત્રીસ આડત્રીસ ઓગણચાલીસ '
+        'ચાલીસ એકતાલીસ બેતાલીસ તેતાલીસ ચુંમાલીસ પિસ્તાલીસ છેતાલીસ સુડતાલીસ અડતાલીસ ઓગણપચાસ '
+        'પચાસ એકાવન બાવન ત્રેપન ચોપન પંચાવન છપ્પન સત્તાવન અઠ્ઠાવન ઓગણસાઠ '
+        'સાઠ એકસઠ બાસઠ ત્રેસઠ ચોસઠ પાંસઠ છાસઠ સડસઠ અડસઠ અગણોસિત્તેર '
+        'સિત્તેર એકોતેર બોતેર તોતેર ચુમોતેર પંચોતેર છોતેર સિત્યોતેર ઇઠ્યોતેર ઓગણાએંસી '
+        'એંસી એક્યાસી બ્યાસી ત્યાસી ચોર્યાસી પંચાસી છ્યાસી સિત્યાસી ઈઠ્યાસી નેવ્યાસી '
+        'નેવું એકાણું બાણું ત્રાણું ચોરાણું પંચાણું છન્નું સત્તાણું અઠ્ઠાણું નવ્વાણું'
+    ).split()
+}
+
+# Words for hundreds and thousands: (hundred, thousand)
+SCALE_WORDS = {
+    'en': ('hundred', 'thousand'),
+    'hi': ('सौ', 'हज़ार'),
+    'mr': ('शे', 'हजार'),
+    'gu': ('સો', 'હજાર')
+}
+
+LANGUAGES = list(NUMBER_WORDS)
+
+# Largest value read as a cardinal; longer values are read digit by digit
+MAX_CARDINAL = 99999
+
+def _cardinal(value: int, language_code: str) -> str:
+    """Compose the cardinal words for 0-99999"""
+    words = NUMBER_WORDS[language_code]
+    hundred, thousand = SCALE_WORDS[language_code]
+    if value < 100:
+        return words[value]
+
+    parts = []
+    thousands, value = divmod(value, 1000)
+    hundreds, rest = divmod(value, 100)
+    if thousands:
+        parts += [words[thousands], thousand]
+    if hundreds:
+        if language_code == 'mr':
+            # Marathi joins the multiplier to "शे" (दोनशे), and a bare hundred is "शंभर"
+            parts.append('शंभर' if hundreds == 1 and not rest and not thousands else f"{words[hundreds]}{hundred}")
+        else:
+            parts += [words[hundreds], hundred]
+    if rest:
+        parts.append(words[rest])
+    return " ".join(parts)
+
+# Precomputed readings, so converting a value is a table lookup
+CARDINAL_TABLE = {
+    language_code: [_cardinal(value, language_code) for value in range(1000)]
+    for language_code in LANGUAGES
+}
+DIGIT_TRANSLATION = {
+    language_code: str.maketrans({str(digit): NUMBER_WORDS[language_code][digit] for digit in range(10)})
+    for language_code in LANGUAGES
+}
+
+def _check(value: str, language_code: str) -> str:
+    value = str(value).strip()
+    if not value.isdigit() or not value.isascii():
+        raise ValueError(f"Not a number: {value}")
+    if language_code not in NUMBER_WORDS:
+        raise ValueError(f"Unsupported language code: {language_code}")
+    return value
+
+def digit_words(value: str, language_code: str) -> str:
+    """
+    Read a number digit by digit (train numbers)
+
+    Example: digit_words("12951", "en") -> "one two nine five one"
+    """
+    value = _check(value, language_code)
+    return " ".join(value).translate(DIGIT_TRANSLATION[language_code])
+
+def cardinal_words(value: str, language_code: str) -> str:
+    """
+    Read a number as a cardinal (platforms, delay minutes), digit by digit above MAX_CARDINAL
+
+    Example: cardinal_words("45", "hi") -> "पैंतालीस"
+    """
+    value = _check(value, language_code)
+    number = int(value)
+    if number < 1000:
+        return CARDINAL_TABLE[language_code][number]
+    if number <= MAX_CARDINAL:
+        return _cardinal(number, language_code)
+    return digit_words(value, language_code)
+
+def number_words(value: str, language_code: str, mode: str = "digits") -> str:
+    """Read a number in the given mode: "digits" or "cardinal" """
+    if mode == "digits":
+        return digit_words(value, language_code)
+    if mode == "cardinal":
+        return cardinal_words(value, language_code)
+    raise ValueError(f"Unknown numeral mode: {mode}")
+
+def digit_words_series(values: pd.Series, language_code: str, length: Optional[int] = None) -> pd.Series:
+    """
+    Read a whole column of numbers digit by digit
+
+    Args:
+        values: Numbers as strings (e.g. the train_number column of an import)
+        language_code: Language code ('en', 'hi', 'mr', 'gu')
+        length: Required number of digits, if any
+
+    Returns:
+        Series of words aligned with values; None where a value is not a valid number
+    """
+    if language_code not in DIGIT_TRANSLATION:
+        raise ValueError(f"Unsupported language code: {language_code}")
+
+    values = values.astype("string").str.strip()
+    pattern = r"[0-9]+" if length is None else rf"[0-9]{{{length}}}"
+    valid = values.str.fullmatch(pattern).fillna(False).astype(bool)
+    words = values.where(valid).str.join(" ").str.translate(DIGIT_TRANSLATION[language_code])
+    return words.astype(object).where(valid, None)
+
+def cardinal_words_series(values: pd.Series, language_code: str) -> pd.Series:
+    """Read a whole column of numbers as cardinals; None where a value is not a valid number"""
+    if language_code not in CARDINAL_TABLE:
+        raise ValueError(f"Unsupported language code: {language_code}")
+
+    values = values.astype("string").str.strip()
+    valid = values.str.fullmatch(r"[0-9]+").fillna(False).astype(bool)
+    numbers = pd.to_numeric(values.where(valid), errors="coerce")
+    table = pd.Series(CARDINAL_TABLE[language_code])
+    words = numbers.map(table).astype(object)
+
+    # Values outside the table are rare; read them one at a time
+    large = valid & (numbers >= len(table))
+    if large.any():
+        words[large] = [cardinal_words(value, language_code) for value in values[large]]
+    return words.where(valid, None)
+
+def number_words_table(values: List[str], mode: str = "digits", length: Optional[int] = None) -> Dict[str, Dict[str, Optional[str]]]:
+    """
+    Read many numbers in every language at once
+
+    Args:
+        values: Numbers as strings, duplicates allowed
+        mode: "digits" or "cardinal"
+        length: Required number of digits in "digits" mode, if any
+
+    Returns:
+        Words by language code and value; None for values that are not valid numbers
+    """
+    unique = list(dict.fromkeys(values))
+    series = pd.Series(unique, dtype="string")
+    if mode == "digits":
+        convert = lambda language_code: digit_words_series(series, language_code, length)
+    elif mode == "cardinal":
+        convert = lambda language_code: cardinal_words_series(series, language_code)
+    else:
+        raise ValueError(f"Unknown numeral mode: {mode}")
+    return {language_code: dict(zip(unique, convert(language_code).tolist())) for language_code in LANGUAGES}
@@ -0,0 +1,35 @@
+import json
+import base64
+from typing import Any, List, Tuple
+
+CURSOR_DIRECTIONS = ("after", "before")
+
+def encode_cursor(direction: str, values: List[Any]) -> str:
+    """
+    Opaque token for a keyset position
+
+    Args:
+        direction: "after" for the page following the row, "before" for the page preceding it
+        values: Sort key of the row, e.g. [created_at, id] as stored
+
+    Returns:
+        URL-safe token to pass back as ?cursor=
+    """
+    payload = json.dumps([direction, values], separators=(",", ":"), default=str)
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[str, List[Any]]:
+    """
+    Read a token made by encode_cursor
+
+    Raises:
+        ValueError: If the token is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        direction, values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+    except Exception:
+        raise ValueError("Invalid cursor")
+    if direction not in CURSOR_DIRECTIONS or not isinstance(values, list):
+        raise ValueError("Invalid cursor")
+    return direction, values
@@ -0,0 +1,94 @@
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# callback(statement, parameters, executemany, elapsed_ms)
+StatementCallback = Callable[[str, object, bool, float], None]
+
+def listen_statements(bind: Engine, callback: StatementCallback) -> Callable[[], None]:
+    """
+    Call callback after every statement executed on an engine, with its duration
+
+    All connections of the engine are covered, whichever thread uses them. Both
+    count_queries and the per-request statistics (app.core.query_stats) are
+    built on this.
+
+    Returns:
+        A function that removes the listeners again
+    """
+    key = object()  # each listener keeps its own start time on the connection
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info[key] = time.perf_counter()
+
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info.pop(key, None)
+        if started is not None:
+            callback(statement, parameters, executemany, (time.perf_counter() - started) * 1000)
+
+    event.listen(bind, "before_cursor_execute", before_cursor_execute)
+    event.listen(bind, "after_cursor_execute", after_cursor_execute)
+
+    def remove():
+        event.remove(bind, "before_cursor_execute", before_cursor_execute)
+        event.remove(bind, "after_cursor_execute", after_cursor_execute)
+    return remove
+
+class QueryCounter:
+    """SQL statements executed on an engine while a count_queries block is open"""
+
+    def __init__(self):
+        self.statements: List[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def report(self) -> str:
+        """The statements, numbered, for an assertion message"""
+        return "\n".join(f"{number}. {statement}" for number, statement in enumerate(self.statements, 1))
+
+@contextmanager
+def count_queries(bind: Optional[Engine] = None) -> Iterator[QueryCounter]:
+    """
+    Record every statement executed on an engine inside the block
+
+    All connections of the engine are counted, whichever thread uses them, so a
+    request served by TestClient's worker thread is included. Keep other work on
+    the engine (background jobs) out of the block.
+
+    Example:
+        with count_queries(engine) as queries:
+            client.get("/api/v1/announcements/templates/")
+        print(queries.count)
+    """
+    if bind is None:
+        from app.core.database import engine as bind
+    counter = QueryCounter()
+
+    def record(statement, parameters, executemany, elapsed_ms):
+        counter.statements.append(" ".join(statement.split()))
+
+    remove = listen_statements(bind, record)
+    try:
+        yield counter
+    finally:
+        remove()
+
+@contextmanager
+def assert_max_queries(max_count: int, bind: Optional[Engine] = None) -> Iterator[QueryCounter]:
+    """
+    Fail if the block executes more than max_count statements
+
+    Guards listing endpoints against N+1 regressions: the statement count of a
+    listing should not grow with the number of rows it returns.
+
+    Raises:
+        AssertionError: Listing the statements that ran, if there were too many
+    """
+    with count_queries(bind) as counter:
+        yield counter
+    if counter.count > max_count:
+        raise AssertionError(f"Expected at most {max_count} queries, got {counter.count}:\n{counter.report()}")
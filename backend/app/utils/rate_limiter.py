@@ -0,0 +1,91 @@
+import time
+import threading
+from typing import Dict
+from app.core.config.settings import settings
+
+class TokenBucket:
+    """
+    Thread-safe token bucket
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``. A request
+    larger than the capacity is admitted once the bucket is full and drives it
+    negative, so oversized requests are delayed rather than rejected forever.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        Reserve tokens without blocking
+
+        Returns:
+            float: Seconds the caller must wait before using the reservation
+        """
+        if self.rate <= 0:
+            return 0.0
+
+        with self._lock:
+            self._refill()
+            needed = min(tokens, self.capacity)
+            wait = max(0.0, (needed - self._tokens) / self.rate)
+            self._tokens -= tokens
+            return wait
+
+    def acquire(self, tokens: float = 1.0):
+        """Block until the requested tokens are available"""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+
+class SynthesisRateLimiter:
+    """Combined requests/second and characters/minute limit for TTS calls"""
+
+    def __init__(self, requests_per_second: float, characters_per_minute: float):
+        self.requests = TokenBucket(rate=requests_per_second, capacity=max(1.0, requests_per_second))
+        self.characters = TokenBucket(rate=characters_per_minute / 60.0, capacity=characters_per_minute)
+        self.total_requests = 0
+        self.total_characters = 0
+        self.total_wait_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self, characters: int) -> float:
+        """Reserve one request and the given characters, returning the required wait"""
+        wait = max(self.requests.reserve(1), self.characters.reserve(characters))
+        with self._lock:
+            self.total_requests += 1
+            self.total_characters += characters
+            self.total_wait_seconds += wait
+        return wait
+
+    def acquire(self, characters: int):
+        """Block until one request of the given length may be sent"""
+        wait = self.reserve(characters)
+        if wait > 0:
+            time.sleep(wait)
+
+    def get_stats(self) -> Dict:
+        """Get usage counters"""
+        with self._lock:
+            return {
+                "requests_per_second": self.requests.rate,
+                "characters_per_minute": self.characters.capacity,
+                "total_requests": self.total_requests,
+                "total_characters": self.total_characters,
+                "total_wait_seconds": round(self.total_wait_seconds, 3)
+            }
+
+# Global instance shared by every TTS caller
+tts_rate_limiter = SynthesisRateLimiter(
+    requests_per_second=settings.TTS_REQUESTS_PER_SECOND,
+    characters_per_minute=settings.TTS_CHARACTERS_PER_MINUTE
+)
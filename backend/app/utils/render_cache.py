@@ -0,0 +1,137 @@
+import os
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+from app.utils.tts_cache import TTSCache
+from app.core.config.settings import settings
+
+class RenderCache:
+    """
+    Two-tier LRU cache of assembled announcements
+
+    Rendered MP3 bytes are kept in a byte-bounded in-memory LRU in front of a
+    byte-bounded on-disk LRU (a TTSCache directory). Keys cover the announcement
+    parameters and the content of every source clip, so regenerating a segment or
+    route clip changes the key and stale renders simply age out.
+    """
+
+    def __init__(self, memory_max_bytes: int, cache_dir: str, disk_max_bytes: int, enabled: bool = True):
+        self.enabled = enabled
+        self.memory_max_bytes = memory_max_bytes
+        self.disk = TTSCache(cache_dir, disk_max_bytes, enabled, label="Render")
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()  # oldest first
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        self._clip_digests: Dict[str, Tuple[Tuple[int, int, int, int], str]] = {}  # path -> (stat signature, sha256)
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def clip_version(self, path: str) -> List:
+        """
+        Version of a source clip: its path and a SHA-256 of its bytes
+
+        The digest is reused while the file's device, inode, size and modification
+        time (st_mtime_ns) are unchanged, so a clip rewritten in place is hashed
+        again. Hashing the bytes rather than keying on the modification time keeps
+        renders valid when a synthesis cache hit only touches the clip.
+        """
+        stat = os.stat(path)
+        signature = (stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        known = self._clip_digests.get(path)
+        if known is not None and known[0] == signature:
+            return [path, known[1]]
+        with open(path, "rb") as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        self._clip_digests[path] = (signature, digest)
+        return [path, digest]
+
+    def make_key(self, parameters: Dict, clip_paths: List[str]) -> str:
+        """Build the render key from announcement parameters and source clip versions"""
+        payload = json.dumps(
+            [parameters, [self.clip_version(path) for path in clip_paths]],
+            ensure_ascii=False,
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _remember(self, key: str, audio: bytes):
+        """Insert into the memory tier and evict down to its bound (called with the lock held)"""
+        if len(audio) > self.memory_max_bytes:
+            return
+        self._memory_bytes -= len(self._memory.pop(key, b""))
+        self._memory[key] = audio
+        self._memory_bytes += len(audio)
+        while self._memory_bytes > self.memory_max_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Get rendered audio from memory, then disk"""
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            audio = self._memory.get(key)
+            if audio is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return audio
+
+        audio = self.disk.read(key)
+
+        with self._lock:
+            if audio is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._remember(key, audio)
+            return audio
+
+    def put(self, key: str, audio: bytes, output_path: str) -> bool:
+        """
+        Store rendered audio in both tiers and materialize it at output_path
+
+        Returns:
+            bool: True if output_path was written from the disk tier
+        """
+        if not self.enabled:
+            return False
+
+        with self._lock:
+            self._remember(key, audio)
+        return self.disk.store(key, audio, output_path)
+
+    def get_stats(self) -> Dict:
+        """Get hit/miss counters and occupancy of both tiers"""
+        with self._lock:
+            lookups = self.memory_hits + self.disk_hits + self.misses
+            stats = {
+                "enabled": self.enabled,
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+                "memory_max_bytes": self.memory_max_bytes,
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": round((self.memory_hits + self.disk_hits) / lookups, 4) if lookups else 0.0
+            }
+        disk = self.disk.get_stats()
+        stats.update({
+            "disk_entries": disk["entries"],
+            "disk_bytes": disk["size_bytes"],
+            "disk_max_bytes": disk["max_bytes"],
+            "disk_evictions": disk["evictions"]
+        })
+        return stats
+
+# Global instance
+render_cache = RenderCache(
+    memory_max_bytes=settings.RENDER_CACHE_MEMORY_MAX_BYTES,
+    cache_dir=settings.RENDER_CACHE_DIR,
+    disk_max_bytes=settings.RENDER_CACHE_MAX_BYTES,
+    enabled=settings.RENDER_CACHE_ENABLED
+)
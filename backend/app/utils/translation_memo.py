@@ -0,0 +1,235 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy.exc import IntegrityError
+from app.core.database import SessionLocal
+from app.models.translation_memo import TranslationMemo
+from app.core.config.settings import settings
+
+class TranslationMemoCache:
+    """
+    Translation memo keyed by (text, source language, target language, provider)
+
+    Every translation the provider returns is stored in the translation_memo
+    table and looked up before the next API call, with a bounded in-process LRU
+    in front of the table. Entries are only served to the provider that made
+    them, so pseudo-translations from the local stand-in never reach a GCP run.
+    Station and train names repeat across many routes, so re-running a bulk
+    translation only pays for strings that were never seen.
+    """
+
+    def __init__(self, max_entries: int, enabled: bool = True):
+        self.enabled = enabled
+        self.max_entries = max_entries
+        self._memory: "OrderedDict[Tuple[str, str, str, str], str]" = OrderedDict()  # oldest first
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.db_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def text_hash(text: str) -> str:
+        """Hash of the source text used as the memo key"""
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def _remember(self, key: Tuple[str, str, str, str], translated_text: str):
+        """Insert into the LRU and evict down to its bound (called with the lock held)"""
+        self._memory[key] = translated_text
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, text: str, source_language: str, target_language: str, provider: str) -> Optional[str]:
+        """Get a translation memoized from the given provider, from memory, then the database"""
+        if not self.enabled or not text:
+            return None
+
+        key = (self.text_hash(text), source_language, target_language, provider)
+        with self._lock:
+            translated_text = self._memory.get(key)
+            if translated_text is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return translated_text
+
+        db = SessionLocal()
+        try:
+            memo = db.query(TranslationMemo).filter(
+                TranslationMemo.text_hash == key[0],
+                TranslationMemo.source_language == source_language,
+                TranslationMemo.target_language == target_language,
+                TranslationMemo.provider == provider
+            ).first()
+            # Guard against hash collisions
+            translated_text = memo.translated_text if memo and memo.source_text == text else None
+        except Exception as e:
+            print(f"⚠️ Translation memo lookup failed: {str(e)}")
+            translated_text = None
+        finally:
+            db.close()
+
+        with self._lock:
+            if translated_text is None:
+                self.misses += 1
+                return None
+            self.db_hits += 1
+            self._remember(key, translated_text)
+            return translated_text
+
+    def get_many(self, texts: List[str], source_language: str, target_language: str, provider: str) -> Dict[str, str]:
+        """Get translations memoized from the given provider for many texts with one database query; unknown texts are left out"""
+        if not self.enabled:
+            return {}
+
+        found = {}
+        remaining = {}
+        with self._lock:
+            for text in set(texts):
+                if not text:
+                    continue
+                key = (self.text_hash(text), source_language, target_language, provider)
+                translated_text = self._memory.get(key)
+                if translated_text is not None:
+                    self._memory.move_to_end(key)
+                    self.memory_hits += 1
+                    found[text] = translated_text
+                else:
+                    remaining[key[0]] = text
+
+        if remaining:
+            db = SessionLocal()
+            try:
+                hashes = list(remaining.keys())
+                memos = []
+                # Stay well under the bound-parameter limit of SQLite
+                for start in range(0, len(hashes), 500):
+                    memos.extend(db.query(TranslationMemo).filter(
+                        TranslationMemo.text_hash.in_(hashes[start:start + 500]),
+                        TranslationMemo.source_language == source_language,
+                        TranslationMemo.target_language == target_language,
+                        TranslationMemo.provider == provider
+                    ).all())
+            except Exception as e:
+                print(f"⚠️ Translation memo lookup failed: {str(e)}")
+                memos = []
+            finally:
+                db.close()
+
+            with self._lock:
+                for memo in memos:
+                    text = remaining.get(memo.text_hash)
+                    if text is not None and memo.source_text == text:
+                        found[text] = memo.translated_text
+                        self._remember((memo.text_hash, source_language, target_language, provider), memo.translated_text)
+                        self.db_hits += 1
+                self.misses += len(remaining) - sum(1 for text in remaining.values() if text in found)
+
+        return found
+
+    def put_many(self, translations: Dict[str, str], source_language: str, target_language: str, provider: str):
+        """Store many translations in memory and the database with one commit"""
+        if not self.enabled:
+            return
+
+        entries = {text: translated_text for text, translated_text in translations.items() if text and translated_text is not None}
+        if not entries:
+            return
+
+        with self._lock:
+            for text, translated_text in entries.items():
+                self._remember((self.text_hash(text), source_language, target_language, provider), translated_text)
+
+        db = SessionLocal()
+        try:
+            db.add_all([
+                TranslationMemo(
+                    text_hash=self.text_hash(text),
+                    source_language=source_language,
+                    target_language=target_language,
+                    source_text=text,
+                    translated_text=translated_text,
+                    provider=provider
+                )
+                for text, translated_text in entries.items()
+            ])
+            db.commit()
+        except IntegrityError:
+            # Some entries were stored concurrently; fall back to storing them one by one
+            db.rollback()
+            for text, translated_text in entries.items():
+                self.put(text, source_language, target_language, translated_text, provider)
+        except Exception as e:
+            db.rollback()
+            print(f"⚠️ Could not store translation memo: {str(e)}")
+        finally:
+            db.close()
+
+    def put(self, text: str, source_language: str, target_language: str, translated_text: str, provider: str):
+        """Store a translation in memory and the database"""
+        if not self.enabled or not text or translated_text is None:
+            return
+
+        key = (self.text_hash(text), source_language, target_language, provider)
+        with self._lock:
+            self._remember(key, translated_text)
+
+        db = SessionLocal()
+        try:
+            db.add(TranslationMemo(
+                text_hash=key[0],
+                source_language=source_language,
+                target_language=target_language,
+                source_text=text,
+                translated_text=translated_text,
+                provider=provider
+            ))
+            db.commit()
+        except IntegrityError:
+            # Another worker stored the same translation first
+            db.rollback()
+        except Exception as e:
+            db.rollback()
+            print(f"⚠️ Could not store translation memo: {str(e)}")
+        finally:
+            db.close()
+
+    def clear(self) -> int:
+        """Delete every memoized translation"""
+        with self._lock:
+            self._memory.clear()
+
+        db = SessionLocal()
+        try:
+            deleted_count = db.query(TranslationMemo).delete()
+            db.commit()
+            return deleted_count
+        finally:
+            db.close()
+
+    def get_stats(self) -> Dict:
+        """Get hit/miss counters and the number of memoized translations"""
+        db = SessionLocal()
+        try:
+            stored_entries = db.query(TranslationMemo).count()
+        finally:
+            db.close()
+
+        with self._lock:
+            lookups = self.memory_hits + self.db_hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "memory_entries": len(self._memory),
+                "memory_max_entries": self.max_entries,
+                "stored_entries": stored_entries,
+                "memory_hits": self.memory_hits,
+                "db_hits": self.db_hits,
+                "misses": self.misses,
+                "hit_rate": round((self.memory_hits + self.db_hits) / lookups, 4) if lookups else 0.0
+            }
+
+# Global instance
+translation_memo = TranslationMemoCache(
+    max_entries=settings.TRANSLATION_MEMO_MEMORY_MAX_ENTRIES,
+    enabled=settings.TRANSLATION_MEMO_ENABLED
+)
@@ -0,0 +1,182 @@
+import os
+import threading
+from typing import List, Optional
+from app.core.config.settings import settings
+from app.utils.fault_injection import LocalFaultInjector
+
+class TranslationProvider:
+    """Interface for translation backends used by GCPTranslationClient"""
+
+    name = "base"
+
+    def translate(self, text: str, source_language: str, target_language: str) -> str:
+        """Translate a single text"""
+        raise NotImplementedError
+
+    def translate_many(self, texts: List[str], source_language: str, target_language: str) -> List[str]:
+        """Translate several texts with one request, results in input order"""
+        raise NotImplementedError
+
+    def detect_language(self, text: str) -> str:
+        """Detect the language code of a text"""
+        raise NotImplementedError
+
+    async def translate_async(self, text: str, source_language: str, target_language: str) -> str:
+        """asyncio variant of translate"""
+        raise NotImplementedError
+
+    async def detect_language_async(self, text: str) -> str:
+        """asyncio variant of detect_language"""
+        raise NotImplementedError
+
+class GoogleTranslationProvider(TranslationProvider):
+    """
+    Google Cloud Translation using credentials from config/isl.json
+
+    Synchronous calls use the v2 client; asyncio calls use the v3
+    TranslationServiceAsyncClient because v2 has no async client.
+    """
+
+    name = "gcp"
+
+    def __init__(self):
+        from google.cloud import translate_v2 as translate
+        from google.cloud import translate_v3
+        from google.oauth2 import service_account
+
+        self._translate_v3 = translate_v3
+
+        # Path to the credentials file
+        credentials_path = os.path.join(
+            os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
+            "config",
+            "isl.json"
+        )
+
+        if not os.path.exists(credentials_path):
+            raise FileNotFoundError(f"GCP credentials file not found at: {credentials_path}")
+
+        # Load credentials from file
+        self._credentials = service_account.Credentials.from_service_account_file(credentials_path)
+        self._parent = f"projects/{self._credentials.project_id}/locations/global"
+
+        # Initialize translation client; the async client binds to the event loop on first use
+        self.client = translate.Client(credentials=self._credentials)
+        self.async_client = None
+
+    def _get_async_client(self):
+        if self.async_client is None:
+            self.async_client = self._translate_v3.TranslationServiceAsyncClient(credentials=self._credentials)
+        return self.async_client
+
+    def translate(self, text: str, source_language: str, target_language: str) -> str:
+        result = self.client.translate(
+            text,
+            source_language=source_language,
+            target_language=target_language
+        )
+        return result['translatedText']
+
+    def translate_many(self, texts: List[str], source_language: str, target_language: str) -> List[str]:
+        # The v2 client sends a list as repeated q parameters and answers in order
+        results = self.client.translate(
+            texts,
+            source_language=source_language,
+            target_language=target_language
+        )
+        return [result['translatedText'] for result in results]
+
+    def detect_language(self, text: str) -> str:
+        result = self.client.detect_language(text)
+        return result['language']
+
+    async def translate_async(self, text: str, source_language: str, target_language: str) -> str:
+        response = await self._get_async_client().translate_text(
+            request={
+                "parent": self._parent,
+                "contents": [text],
+                "mime_type": "text/plain",
+                "source_language_code": source_language,
+                "target_language_code": target_language
+            }
+        )
+        return response.translations[0].translated_text
+
+    async def detect_language_async(self, text: str) -> str:
+        response = await self._get_async_client().detect_language(
+            request={
+                "parent": self._parent,
+                "content": text,
+                "mime_type": "text/plain"
+            }
+        )
+        return response.languages[0].language_code
+
+class LocalTranslationProvider(TranslationProvider):
+    """
+    Offline stand-in returning deterministic pseudo-translations
+
+    The target language is prefixed to the source text (``"[hi] Mumbai Central"``),
+    which keeps results unique per language and easy to recognise in fixtures.
+    """
+
+    name = "local"
+
+    # Unicode blocks used for language detection
+    SCRIPT_RANGES = [
+        ("hi", 0x0900, 0x097F),  # Devanagari (Hindi and Marathi share it)
+        ("gu", 0x0A80, 0x0AFF),  # Gujarati
+    ]
+
+    def __init__(self, faults: Optional[LocalFaultInjector] = None):
+        self.faults = faults or LocalFaultInjector.from_settings()
+
+    @staticmethod
+    def pseudo_translate(text: str, source_language: str, target_language: str) -> str:
+        if source_language == target_language:
+            return text
+        return f"[{target_language}] {text}"
+
+    def _detect(self, text: str) -> str:
+        for char in text:
+            for language_code, start, end in self.SCRIPT_RANGES:
+                if start <= ord(char) <= end:
+                    return language_code
+        return "en"
+
+    def translate(self, text: str, source_language: str, target_language: str) -> str:
+        self.faults.before_call(text)
+        return self.pseudo_translate(text, source_language, target_language)
+
+    def translate_many(self, texts: List[str], source_language: str, target_language: str) -> List[str]:
+        # One simulated round-trip per request, like the real batch call
+        self.faults.before_call("\n".join(texts))
+        return [self.pseudo_translate(text, source_language, target_language) for text in texts]
+
+    def detect_language(self, text: str) -> str:
+        self.faults.before_call(text)
+        return self._detect(text)
+
+    async def translate_async(self, text: str, source_language: str, target_language: str) -> str:
+        await self.faults.before_call_async(text)
+        return self.pseudo_translate(text, source_language, target_language)
+
+    async def detect_language_async(self, text: str) -> str:
+        await self.faults.before_call_async(text)
+        return self._detect(text)
+
+_translation_provider = None
+_translation_provider_lock = threading.Lock()
+
+def get_translation_provider() -> TranslationProvider:
+    """Get the shared translation provider selected by settings.TRANSLATION_PROVIDER"""
+    global _translation_provider
+    with _translation_provider_lock:
+        if _translation_provider is None:
+            if settings.TRANSLATION_PROVIDER == "gcp":
+                _translation_provider = GoogleTranslationProvider()
+            elif settings.TRANSLATION_PROVIDER == "local":
+                _translation_provider = LocalTranslationProvider()
+            else:
+                raise ValueError(f"Unknown translation provider: {settings.TRANSLATION_PROVIDER}")
+        return _translation_provider
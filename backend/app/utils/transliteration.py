@@ -0,0 +1,214 @@
+import re
+from functools import lru_cache
+from typing import Dict, Optional
+from app.core.config.settings import settings
+
+# Romanized consonants and the Devanagari consonant they stand for
+CONSONANTS = {
+    'ksh': 'क्ष', 'chh': 'छ', 'tch': 'च',
+    'kh': 'ख', 'gh': 'घ', 'ch': 'च', 'jh': 'झ', 'th': 'थ', 'dh': 'ध', 'ph': 'फ', 'bh': 'भ', 'sh': 'श',
+    'k': 'क', 'g': 'ग', 'c': 'क', 'q': 'क', 'j': 'ज', 't': 'त', 'd': 'द', 'n': 'न', 'p': 'प', 'b': 'ब',
+    'm': 'म', 'y': 'य', 'r': 'र', 'l': 'ल', 'v': 'व', 'w': 'व', 's': 'स', 'h': 'ह',
+    'f': 'फ़', 'z': 'ज़', 'x': 'क्स'
+}
+
+# Romanized vowels: (independent letter, sign after a consonant); 'a' after a consonant is inherent
+VOWELS = {
+    'aa': ('आ', 'ा'), 'ai': ('ऐ', 'ै'), 'au': ('औ', 'ौ'), 'ee': ('ई', 'ी'), 'ii': ('ई', 'ी'),
+    'oo': ('ऊ', 'ू'), 'uu': ('ऊ', 'ू'), 'ou': ('औ', 'ौ'), 'ei': ('ऐ', 'ै'),
+    'a': ('अ', ''), 'e': ('ए', 'े'), 'i': ('इ', 'ि'), 'o': ('ओ', 'ो'), 'u': ('उ', 'ु')
+}
+
+# Word-final vowels as Indian place names are usually read ("Agra", "Mumbai", "Bhopali")
+FINAL_VOWELS = {'a': 'ा', 'ai': 'ई', 'i': 'ी'}
+
+# Nasal + consonant of the same class is written with an anusvara ("Mumbai", "Bangalore")
+ANUSVARA_BEFORE = {
+    'n': {'k', 'kh', 'g', 'gh', 'ch', 'chh', 'j', 'jh', 't', 'th', 'd', 'dh'},
+    'm': {'p', 'ph', 'b', 'bh'}
+}
+
+# Spoken names of letters, for abbreviations such as "LTT" or "CSMT"
+LETTER_NAMES = {
+    'a': 'ए', 'b': 'बी', 'c': 'सी', 'd': 'डी', 'e': 'ई', 'f': 'एफ', 'g': 'जी', 'h': 'एच', 'i': 'आई',
+    'j': 'जे', 'k': 'के', 'l': 'एल', 'm': 'एम', 'n': 'एन', 'o': 'ओ', 'p': 'पी', 'q': 'क्यू', 'r': 'आर',
+    's': 'एस', 't': 'टी', 'u': 'यू', 'v': 'वी', 'w': 'डब्ल्यू', 'x': 'एक्स', 'y': 'वाई', 'z': 'ज़ेड'
+}
+
+# Curated spellings that the rules would get wrong: English words used in names, and
+# stations whose romanization hides long vowels or retroflex consonants. A plain string
+# is Devanagari for hi and mr (Gujarati is derived from it); a dict overrides individual
+# languages.
+OVERRIDES = {
+    # Multi-word names
+    'new delhi': {'hi': 'नई दिल्ली', 'mr': 'नवी दिल्ली', 'gu': 'નવી દિલ્હી'},
+    'hazrat nizamuddin': 'हज़रत निज़ामुद्दीन',
+    'lokmanya tilak': 'लोकमान्य तिलक',
+    'chhatrapati shivaji maharaj': 'छत्रपति शिवाजी महाराज',
+    'vande bharat': 'वंदे भारत',
+    'garib rath': 'गरीब रथ',
+    'jan shatabdi': 'जन शताब्दी',
+    # Words used in station and train names
+    'central': 'सेंट्रल', 'junction': 'जंक्शन', 'jn': 'जंक्शन', 'terminus': 'टर्मिनस', 'terminal': 'टर्मिनल',
+    'road': 'रोड', 'cantt': 'कैंट', 'city': 'सिटी', 'town': 'टाउन', 'halt': 'हॉल्ट', 'station': 'स्टेशन',
+    'nagar': 'नगर', 'new': 'न्यू', 'old': 'ओल्ड', 'east': 'ईस्ट', 'west': 'वेस्ट', 'north': 'नॉर्थ',
+    'south': 'साउथ', 'port': 'पोर्ट', 'bridge': 'ब्रिज', 'express': 'एक्सप्रेस', 'exp': 'एक्सप्रेस',
+    'mail': 'मेल', 'superfast': 'सुपरफास्ट', 'sf': 'सुपरफास्ट', 'special': 'स्पेशल', 'spl': 'स्पेशल',
+    'passenger': 'पैसेंजर', 'local': 'लोकल', 'fast': 'फास्ट', 'intercity': 'इंटरसिटी', 'queen': 'क्वीन',
+    'duronto': 'दुरंतो', 'rajdhani': 'राजधानी', 'shatabdi': 'शताब्दी', 'janshatabdi': 'जनशताब्दी',
+    'sampark': 'संपर्क', 'kranti': 'क्रांति', 'humsafar': 'हमसफ़र', 'tejas': 'तेजस', 'antyodaya': 'अंत्योदय',
+    'memu': 'मेमू', 'demu': 'डेमू', 'deccan': 'डेक्कन',
+    # Stations
+    'mumbai': 'मुंबई', 'delhi': {'hi': 'दिल्ली', 'mr': 'दिल्ली', 'gu': 'દિલ્હી'}, 'chennai': 'चेन्नई',
+    'kolkata': 'कोलकाता', 'howrah': 'हावड़ा', 'bengaluru': 'बेंगलुरु', 'bangalore': 'बैंगलोर',
+    'hyderabad': 'हैदराबाद', 'secunderabad': 'सिकंदराबाद',
+    'ahmedabad': {'hi': 'अहमदाबाद', 'mr': 'अहमदाबाद', 'gu': 'અમદાવાદ'},
+    'pune': 'पुणे', 'surat': {'hi': 'सूरत', 'mr': 'सुरत', 'gu': 'સુરત'}, 'vadodara': 'वडोदरा',
+    'jaipur': 'जयपुर', 'lucknow': 'लखनऊ', 'kanpur': 'कानपुर', 'patna': 'पटना', 'bhopal': 'भोपाल',
+    'indore': 'इंदौर', 'nagpur': 'नागपुर', 'nashik': 'नाशिक', 'rajkot': 'राजकोट', 'bhavnagar': 'भावनगर',
+    'jamnagar': 'जामनगर', 'dadar': 'दादर', 'thane': 'ठाणे', 'kalyan': 'कल्याण', 'borivali': 'बोरीवली',
+    'bandra': 'बांद्रा', 'andheri': 'अंधेरी', 'churchgate': 'चर्चगेट', 'csmt': 'सीएसएमटी', 'ltt': 'एलटीटी',
+    'anand': 'आणंद', 'varanasi': 'वाराणसी', 'amritsar': 'अमृतसर', 'guwahati': 'गुवाहाटी', 'goa': 'गोवा',
+    'madgaon': 'मडगांव', 'okha': 'ओखा', 'porbandar': 'पोरबंदर', 'dwarka': 'द्वारका', 'veraval': 'वेरावल',
+    'gandhidham': 'गांधीधाम', 'bhuj': 'भुज', 'udaipur': 'उदयपुर', 'jodhpur': 'जोधपुर', 'agra': 'आगरा',
+    'mathura': 'मथुरा', 'gwalior': 'ग्वालियर', 'jhansi': 'झांसी', 'ujjain': 'उज्जैन', 'ratlam': 'रतलाम',
+    'kota': 'कोटा', 'ajmer': 'अजमेर', 'valsad': 'वलसाड', 'vapi': 'वापी', 'navsari': 'नवसारी',
+    'bharuch': 'भरूच', 'ankleshwar': 'अंकलेश्वर', 'mangaluru': 'मंगलुरु', 'mangalore': 'मैंगलोर',
+    'trivandrum': 'त्रिवेंद्रम', 'thiruvananthapuram': 'तिरुवनंतपुरम', 'ernakulam': 'एर्नाकुलम',
+    'coimbatore': 'कोयंबटूर', 'madurai': 'मदुरै', 'visakhapatnam': 'विशाखापत्तनम', 'vijayawada': 'विजयवाड़ा',
+    'bhubaneswar': 'भुवनेश्वर', 'puri': 'पुरी', 'ranchi': 'रांची', 'dehradun': 'देहरादून', 'haridwar': 'हरिद्वार',
+    'chandigarh': 'चंडीगढ़', 'jammu': 'जम्मू', 'tawi': 'तवी', 'katra': 'कटरा', 'kolhapur': 'कोल्हापुर',
+    'solapur': 'सोलापुर', 'aurangabad': 'औरंगाबाद', 'jalgaon': 'जलगांव', 'bhusaval': 'भुसावल', 'akola': 'अकोला',
+    'amravati': 'अमरावती', 'karmali': 'करमाली', 'sawantwadi': 'सावंतवाड़ी', 'ratnagiri': 'रत्नागिरी',
+    'panvel': 'पनवेल', 'vasai': 'वसई', 'virar': 'विरार', 'tilak': 'तिलक', 'shivaji': 'शिवाजी',
+    'maharaj': 'महाराज', 'chhatrapati': 'छत्रपति', 'gujarat': 'गुजरात', 'saurashtra': 'सौराष्ट्र',
+    'kutch': 'कच्छ', 'karnavati': 'कर्णावती', 'sabarmati': 'साबरमती', 'gandhinagar': 'गांधीनगर',
+    'capital': 'कैपिटल', 'palanpur': 'पालनपुर', 'mehsana': 'महेसाणा', 'hapa': 'हापा', 'janta': 'जनता',
+    'rampur': 'रामपुर', 'ghatkopar': 'घाटकोपर', 'kanyakumari': 'कन्याकुमारी', 'bilaspur': 'बिलासपुर',
+    'mata': 'माता'
+}
+
+NUKTA = '़'
+VIRAMA = '्'
+ANUSVARA = 'ं'
+
+def devanagari_to_gujarati(text: str) -> str:
+    """
+    Map Devanagari to Gujarati
+
+    The Gujarati Unicode block mirrors Devanagari's layout 0x180 code points higher.
+    Gujarati spelling does not use the nukta, so it is dropped.
+    """
+    return ''.join(
+        chr(ord(char) + 0x180) if 'ऀ' <= char <= 'ॿ' else char
+        for char in text.replace(NUKTA, '')
+    )
+
+class IndicTransliterator:
+    """
+    Offline transliteration of romanized proper nouns into Devanagari and Gujarati
+
+    Station and train names are names, not sentences: machine translation is slow,
+    costs money and sometimes translates their meaning. Names are looked up in the
+    curated OVERRIDES first, then spelled phonetically by greedy longest match over
+    the romanized consonant and vowel tables. Every table is compiled once per
+    language at start-up, and words are memoized, so a name takes microseconds.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.languages = ['hi', 'mr', 'gu']
+        self._tables = {language_code: self._compile(language_code) for language_code in self.languages}
+        self._units = re.compile('|'.join(sorted(list(CONSONANTS) + list(VOWELS), key=len, reverse=True)))
+        phrases = sorted((key for key in OVERRIDES if ' ' in key), key=len, reverse=True)
+        self._phrases = re.compile(r'\b(' + '|'.join(re.escape(phrase).replace(r'\ ', r'\s+') for phrase in phrases) + r')\b', re.IGNORECASE)
+        self._words = re.compile(r'[A-Za-z]+')
+
+    def _compile(self, language_code: str) -> Dict:
+        """Build the lookup tables for one language, already in its script"""
+        convert = devanagari_to_gujarati if language_code == 'gu' else (lambda text: text)
+
+        overrides = {}
+        for key, value in OVERRIDES.items():
+            if isinstance(value, dict):
+                overrides[key] = value[language_code]
+            else:
+                overrides[key] = convert(value)
+
+        return {
+            'consonants': {unit: convert(letter) for unit, letter in CONSONANTS.items()},
+            'vowels': {unit: (convert(letter), convert(sign)) for unit, (letter, sign) in VOWELS.items()},
+            'final_vowels': {unit: convert(letter) for unit, letter in FINAL_VOWELS.items()},
+            'letters': {letter: convert(name) for letter, name in LETTER_NAMES.items()},
+            'overrides': overrides,
+            'virama': convert(VIRAMA),
+            'anusvara': convert(ANUSVARA)
+        }
+
+    def supports(self, source_lang: str, target_lang: str) -> bool:
+        """Whether names in source_lang can be transliterated into target_lang"""
+        return self.enabled and source_lang == 'en' and target_lang in self._tables
+
+    def transliterate(self, text: str, target_lang: str) -> Optional[str]:
+        """
+        Transliterate a romanized name
+
+        Args:
+            text: Name in Latin script (e.g. "Mumbai Central")
+            target_lang: Target language code ('hi', 'mr', 'gu')
+
+        Returns:
+            The name in the target script, or None if the name cannot be transliterated
+            (unsupported language, or characters outside ASCII) and should be translated
+        """
+        if target_lang not in self._tables or not text or not text.isascii():
+            return None
+        if not self._words.search(text):
+            return None
+
+        table = self._tables[target_lang]
+        text = self._phrases.sub(lambda match: table['overrides'][' '.join(match.group(0).lower().split())], text)
+        return self._words.sub(lambda match: self._word(match.group(0), target_lang), text)
+
+    @lru_cache(maxsize=65536)
+    def _word(self, word: str, target_lang: str) -> str:
+        """Transliterate one Latin word"""
+        table = self._tables[target_lang]
+        key = word.lower()
+        if key in table['overrides']:
+            return table['overrides'][key]
+
+        # Short all-capital words are abbreviations, read letter by letter
+        if word.isupper() and 1 < len(word) <= 5:
+            return ''.join(table['letters'][letter] for letter in key)
+
+        units = self._units.findall(key)
+        # A doubled final consonant is pronounced once ("Express" -> "...प्रेस")
+        if len(units) > 1 and units[-1] == units[-2] and units[-1] in CONSONANTS:
+            units.pop()
+
+        output = []
+        pending = None  # consonant written without a vowel yet
+        for index, unit in enumerate(units):
+            last = index == len(units) - 1
+            if unit in CONSONANTS:
+                if pending:
+                    if pending in ANUSVARA_BEFORE and unit in ANUSVARA_BEFORE[pending] and len(output) > 1:
+                        output[-1] = table['anusvara']
+                    else:
+                        output.append(table['virama'])
+                output.append(table['consonants'][unit])
+                pending = unit
+            elif pending:
+                if last and unit in table['final_vowels']:
+                    output.append(table['final_vowels'][unit])
+                else:
+                    output.append(table['vowels'][unit][1])
+                pending = None
+            else:
+                output.append(table['vowels'][unit][0])
+
+        return ''.join(output)
+
+# Global instance
+transliterator = IndicTransliterator(enabled=settings.TRANSLITERATION_ENABLED)
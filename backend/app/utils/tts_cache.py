@@ -0,0 +1,292 @@
+import os
+import re
+import json
+import shutil
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+from app.core.config.settings import settings
+
+CACHE_KEY = re.compile(r"[0-9a-f]{64}")  # SHA-256 hex digest
+
+class TTSCache:
+    """
+    Persistent, content-addressed cache of synthesized audio.
+
+    Entries are stored as ``<cache_dir>/<key[:2]>/<key>.<ext>`` where the key is a
+    hash of everything that influences the synthesized bytes. Recency is tracked
+    through file modification times so the LRU order survives restarts.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int, enabled: bool = True, label: str = "TTS"):
+        self.cache_dir = cache_dir
+        self.label = label
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, int]" = OrderedDict()  # key -> size in bytes, oldest first
+        self._paths: Dict[str, str] = {}
+        self._size_bytes = 0
+        self._loaded = False
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(text: str, voice_name: str, language_code: str, audio_encoding: str, sample_rate_hertz: int) -> str:
+        """Build the cache key for a synthesis request"""
+        payload = json.dumps(
+            [text, voice_name, language_code, audio_encoding, sample_rate_hertz],
+            ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _load_index(self):
+        """
+        Scan the cache directory and rebuild the LRU index (called with the lock held)
+
+        Only files named after a cache key are indexed; anything else in the
+        directory is neither counted nor evicted.
+        """
+        if self._loaded:
+            return
+        self._loaded = True
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+        except Exception as e:
+            print(f"⚠️ {self.label} cache disabled, could not create {self.cache_dir}: {str(e)}")
+            self.enabled = False
+            return
+
+        found = []
+        for root, _, files in os.walk(self.cache_dir):
+            for filename in files:
+                key = os.path.splitext(filename)[0]
+                if not CACHE_KEY.fullmatch(key):
+                    continue
+                path = os.path.join(root, filename)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                found.append((stat.st_mtime, key, stat.st_size, path))
+
+        for _, key, size, path in sorted(found):
+            self._entries[key] = size
+            self._paths[key] = path
+            self._size_bytes += size
+
+        self._evict()
+
+    def _evict(self):
+        """Drop least recently used entries until the cache fits its size bound"""
+        while self._entries and self._size_bytes > self.max_bytes:
+            key, size = self._entries.popitem(last=False)
+            path = self._paths.pop(key, None)
+            self._size_bytes -= size
+            self.evictions += 1
+            try:
+                if path and os.path.exists(path):
+                    os.remove(path)
+            except OSError as e:
+                print(f"⚠️ Could not evict {self.label} cache entry {path}: {str(e)}")
+
+    def _entry_path(self, key: str, extension: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.{extension}")
+
+    @staticmethod
+    def _materialize(source_path: str, output_path: str):
+        """Hardlink the cached file to the output path, falling back to a copy"""
+        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+        # Unlink first so an existing output (possibly itself a link into the cache) is never written through
+        if os.path.lexists(output_path):
+            os.remove(output_path)
+        try:
+            os.link(source_path, output_path)
+        except OSError:
+            shutil.copyfile(source_path, output_path)
+
+    def fetch(self, key: str, output_path: str) -> bool:
+        """
+        Materialize a cached entry at output_path
+
+        Returns:
+            bool: True on a cache hit, False on a miss
+        """
+        if not self.enabled:
+            return False
+
+        with self._lock:
+            self._load_index()
+            path = self._paths.get(key)
+            if path is None or not os.path.exists(path):
+                if path is not None:
+                    self._size_bytes -= self._entries.pop(key, 0)
+                    self._paths.pop(key, None)
+                self.misses += 1
+                return False
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+        try:
+            os.utime(path, None)
+            self._materialize(path, output_path)
+            return True
+        except OSError as e:
+            print(f"⚠️ Could not materialize {self.label} cache entry {path}: {str(e)}")
+            return False
+
+    def contains(self, key: str) -> bool:
+        """Check for an entry without touching its LRU position or the hit counters"""
+        if not self.enabled:
+            return False
+
+        with self._lock:
+            self._load_index()
+            path = self._paths.get(key)
+        return path is not None and os.path.exists(path)
+
+    def read(self, key: str) -> Optional[bytes]:
+        """
+        Read a cached entry's bytes
+
+        Returns:
+            bytes on a cache hit, None on a miss
+        """
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            self._load_index()
+            path = self._paths.get(key)
+            if path is not None:
+                self._entries.move_to_end(key)
+
+        try:
+            if path is None:
+                raise FileNotFoundError(key)
+            with open(path, "rb") as f:
+                content = f.read()
+            os.utime(path, None)
+        except OSError:
+            with self._lock:
+                if path is not None and self._paths.get(key) == path:
+                    self._size_bytes -= self._entries.pop(key, 0)
+                    self._paths.pop(key, None)
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+        return content
+
+    def store(self, key: str, audio_content: bytes, output_path: str, extension: str = "mp3") -> bool:
+        """
+        Store synthesized audio under key and materialize it at output_path
+
+        Returns:
+            bool: True if the audio was cached and written to output_path
+        """
+        if not self.enabled:
+            return False
+
+        with self._lock:
+            self._load_index()
+            if not self.enabled:
+                return False
+
+        path = self._entry_path(key, extension)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write atomically so concurrent readers never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+            with os.fdopen(fd, "wb") as tmp:
+                tmp.write(audio_content)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"⚠️ Could not store {self.label} cache entry {path}: {str(e)}")
+            return False
+
+        with self._lock:
+            self._size_bytes -= self._entries.pop(key, 0)
+            self._entries[key] = len(audio_content)
+            self._paths[key] = path
+            self._size_bytes += len(audio_content)
+            self._evict()
+
+        try:
+            self._materialize(path, output_path)
+            return True
+        except OSError as e:
+            print(f"⚠️ Could not materialize {self.label} cache entry {path}: {str(e)}")
+            return False
+
+    def track(self, key: str, path: str):
+        """
+        Index a file the caller wrote under cache_dir, evicting older entries to stay in bounds
+
+        Tracking a known key again marks it as recently used.
+        """
+        if not self.enabled:
+            return
+
+        try:
+            os.utime(path, None)
+            size = os.path.getsize(path)
+        except OSError as e:
+            print(f"⚠️ Could not track {self.label} cache entry {path}: {str(e)}")
+            return
+
+        with self._lock:
+            self._load_index()
+            self._size_bytes -= self._entries.pop(key, 0)
+            self._entries[key] = size
+            self._paths[key] = path
+            self._size_bytes += size
+            self._evict()
+
+    def clear(self) -> int:
+        """Remove every cached entry and reset the counters"""
+        with self._lock:
+            self._load_index()
+            removed = len(self._entries)
+            for path in self._paths.values():
+                try:
+                    if os.path.exists(path):
+                        os.remove(path)
+                except OSError as e:
+                    print(f"⚠️ Could not delete {self.label} cache entry {path}: {str(e)}")
+            self._entries.clear()
+            self._paths.clear()
+            self._size_bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            return removed
+
+    def get_stats(self) -> Dict:
+        """Get cache hit/miss counters and occupancy"""
+        with self._lock:
+            self._load_index()
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "cache_dir": self.cache_dir,
+                "entries": len(self._entries),
+                "size_bytes": self._size_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+            }
+
+# Global instance
+tts_cache = TTSCache(
+    cache_dir=settings.TTS_CACHE_DIR,
+    max_bytes=settings.TTS_CACHE_MAX_BYTES,
+    enabled=settings.TTS_CACHE_ENABLED
+)
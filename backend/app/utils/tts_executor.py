@@ -0,0 +1,88 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from app.core.config.settings import settings
+from app.utils.gcp_tts_client import gcp_tts_client
+
+class SynthesisExecutor:
+    """
+    Shared worker pool for Text-to-Speech requests
+
+    Workers run ``GCPTTSClient.generate_audio`` concurrently; pacing is enforced by the
+    client's token-bucket rate limiter, so only cache misses consume provider quota.
+    Callers must keep database work on their own thread and only submit synthesis here.
+    """
+
+    def __init__(self, tts_client, max_workers: int):
+        self.tts_client = tts_client
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="tts-worker")
+
+    def submit(self, text: str, language_code: str, output_path: str) -> Future:
+        """Queue a single synthesis job, returning a future for its audio duration"""
+        return self._executor.submit(self.tts_client.generate_audio, text, language_code, output_path)
+
+    def generate_many(self, jobs: List[Tuple[str, str, str]]) -> List[Optional[float]]:
+        """
+        Synthesize many clips concurrently
+
+        Args:
+            jobs: List of (text, language_code, output_path) tuples
+
+        Returns:
+            List of audio durations in job order, None for jobs that raised
+        """
+        futures = [self.submit(text, language_code, output_path) for text, language_code, output_path in jobs]
+        results = []
+        for (text, language_code, output_path), future in zip(jobs, futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                print(f"❌ Synthesis failed for '{text}' in {language_code}: {str(e)}")
+                results.append(None)
+        return results
+
+    def generate_batched(self, jobs: List[Tuple[str, str, str]]) -> List[Optional[float]]:
+        """
+        Synthesize many short clips with batched SSML requests
+        
+        Jobs are grouped by language and identical texts are synthesized once and
+        written to every requested path. Batches run concurrently on the pool.
+        
+        Args:
+            jobs: List of (text, language_code, output_path) tuples
+            
+        Returns:
+            List of audio durations in job order, None for jobs that failed
+        """
+        # language -> text -> indexes of the jobs that need it
+        grouped: Dict[str, Dict[str, List[int]]] = {}
+        for index, (text, language_code, _) in enumerate(jobs):
+            grouped.setdefault(language_code, {}).setdefault(text, []).append(index)
+        
+        batches = []
+        for language_code, texts in grouped.items():
+            for batch_texts in self.tts_client.split_batches(list(texts)):
+                items = [(text, [jobs[index][2] for index in texts[text]]) for text in batch_texts]
+                future = self._executor.submit(self.tts_client.generate_audio_batch, items, language_code)
+                batches.append((future, [texts[text] for text in batch_texts]))
+        
+        results: List[Optional[float]] = [None] * len(jobs)
+        for future, indexes_per_text in batches:
+            try:
+                durations = future.result()
+            except Exception as e:
+                print(f"❌ Batched synthesis failed: {str(e)}")
+                continue
+            for indexes, duration in zip(indexes_per_text, durations):
+                for index in indexes:
+                    results[index] = duration
+        
+        print(f"✅ Batched synthesis: {len(jobs)} clips, {sum(len(texts) for texts in grouped.values())} unique texts, {len(batches)} batches")
+        return results
+
+    def shutdown(self):
+        """Stop accepting work and wait for queued jobs"""
+        self._executor.shutdown(wait=True)
+
+# Global instance
+synthesis_executor = SynthesisExecutor(gcp_tts_client, settings.TTS_MAX_CONCURRENCY)
@@ -0,0 +1,196 @@
+import os
+import math
+import struct
+import hashlib
+import threading
+import xml.etree.ElementTree as ElementTree
+from typing import Dict, Optional, Tuple
+from app.core.config.settings import settings
+from app.utils.fault_injection import LocalFaultInjector
+from app.utils.mp3 import build_silence_frames, build_wav
+
+class TTSProvider:
+    """
+    Interface for Text-to-Speech backends used by GCPTTSClient
+
+    Providers only turn text into audio bytes; caching, rate limiting and file
+    handling stay in the client so every backend is measured the same way.
+    """
+
+    name = "base"
+
+    def synthesize(self, text: str, voice_config: Dict, audio_encoding: str, sample_rate_hertz: int) -> bytes:
+        """Synthesize text and return the encoded audio bytes"""
+        raise NotImplementedError
+
+    async def synthesize_async(self, text: str, voice_config: Dict, audio_encoding: str, sample_rate_hertz: int) -> bytes:
+        """asyncio variant of synthesize"""
+        raise NotImplementedError
+
+    def synthesize_ssml_with_marks(self, ssml: str, voice_config: Dict, audio_encoding: str, sample_rate_hertz: int) -> Tuple[bytes, Dict[str, float]]:
+        """
+        Synthesize an SSML document and report when each ``<mark>`` is reached
+
+        Returns:
+            Tuple of (audio bytes, {mark name: seconds from start of audio})
+        """
+        raise NotImplementedError
+
+class GoogleTTSProvider(TTSProvider):
+    """Google Cloud Text-to-Speech using credentials from config/isl.json"""
+
+    name = "gcp"
+
+    def __init__(self):
+        from google.cloud import texttospeech
+        from google.oauth2 import service_account
+
+        self._texttospeech = texttospeech
+
+        # Path to the credentials file
+        credentials_path = os.path.join(os.path.dirname(__file__), '..', '..', 'config', 'isl.json')
+
+        if not os.path.exists(credentials_path):
+            raise FileNotFoundError(f"Credentials file not found at: {credentials_path}")
+
+        # Load credentials
+        self._credentials = service_account.Credentials.from_service_account_file(credentials_path)
+
+        # Initialize the client; the async client binds to the event loop on first use
+        self.client = texttospeech.TextToSpeechClient(credentials=self._credentials)
+        self.async_client = None
+        # Timepoints are only exposed by the v1beta1 API
+        self.beta_client = None
+
+    def _build_request(self, text: str, voice_config: Dict, audio_encoding: str, sample_rate_hertz: int) -> Dict:
+        texttospeech = self._texttospeech
+        return {
+            "input": texttospeech.SynthesisInput(text=text),
+            "voice": texttospeech.VoiceSelectionParams(
+                language_code=voice_config['language_code'],
+                name=voice_config['name'],
+                ssml_gender=texttospeech.SsmlVoiceGender[voice_config['ssml_gender']]
+            ),
+            "audio_config": texttospeech.AudioConfig(
+                audio_encoding=texttospeech.AudioEncoding[audio_encoding],
+                sample_rate_hertz=sample_rate_hertz
+            )
+        }
+
+    def synthesize(self, text: str, voice_config: Dict, audio_encoding: str, sample_rate_hertz: int) -> bytes:
+        response = self.client.synthesize_speech(
+            **self._build_request(text, voice_config, audio_encoding, sample_rate_hertz)
+        )
+        return response.audio_content
+
+    async def synthesize_async(self, text: str, voice_config: Dict, audio_encoding: str, sample_rate_hertz: int) -> bytes:
+        if self.async_client is None:
+            self.async_client = self._texttospeech.TextToSpeechAsyncClient(credentials=self._credentials)
+        response = await self.async_client.synthesize_speech(
+            **self._build_request(text, voice_config, audio_encoding, sample_rate_hertz)
+        )
+        return response.audio_content
+
+    def synthesize_ssml_with_marks(self, ssml: str, voice_config: Dict, audio_encoding: str, sample_rate_hertz: int) -> Tuple[bytes, Dict[str, float]]:
+        from google.cloud import texttospeech_v1beta1
+        
+        if self.beta_client is None:
+            self.beta_client = texttospeech_v1beta1.TextToSpeechClient(credentials=self._credentials)
+        
+        request = texttospeech_v1beta1.SynthesizeSpeechRequest(
+            input=texttospeech_v1beta1.SynthesisInput(ssml=ssml),
+            voice=texttospeech_v1beta1.VoiceSelectionParams(
+                language_code=voice_config['language_code'],
+                name=voice_config['name'],
+                ssml_gender=texttospeech_v1beta1.SsmlVoiceGender[voice_config['ssml_gender']]
+            ),
+            audio_config=texttospeech_v1beta1.AudioConfig(
+                audio_encoding=texttospeech_v1beta1.AudioEncoding[audio_encoding],
+                sample_rate_hertz=sample_rate_hertz
+            ),
+            enable_time_pointing=[texttospeech_v1beta1.SynthesizeSpeechRequest.TimepointType.SSML_MARK]
+        )
+        response = self.beta_client.synthesize_speech(request=request)
+        marks = {timepoint.mark_name: timepoint.time_seconds for timepoint in response.timepoints}
+        return response.audio_content, marks
+
+class LocalTTSProvider(TTSProvider):
+    """
+    Offline stand-in producing valid audio whose length is proportional to the text
+
+    MP3 output is a stream of pre-encoded silent Layer III frames; LINEAR16 output
+    is a WAV file carrying a quiet tone whose pitch is derived from the text.
+    """
+
+    name = "local"
+
+    def __init__(self, faults: Optional[LocalFaultInjector] = None):
+        self.faults = faults or LocalFaultInjector.from_settings()
+
+    @staticmethod
+    def duration_for_text(text: str) -> float:
+        """Spoken length used for a text, in seconds"""
+        return max(0.3, len(text.strip()) * settings.LOCAL_TTS_SECONDS_PER_CHARACTER)
+
+    def render(self, text: str, audio_encoding: str, sample_rate_hertz: int) -> bytes:
+        """Render the deterministic audio for a text"""
+        duration = self.duration_for_text(text)
+
+        if audio_encoding == "MP3":
+            return build_silence_frames(duration, sample_rate=sample_rate_hertz)
+
+        if audio_encoding == "LINEAR16":
+            digest = hashlib.sha256(text.encode("utf-8")).digest()
+            frequency = 220 + int.from_bytes(digest[:2], "big") % 440
+            sample_count = int(duration * sample_rate_hertz)
+            step = 2 * math.pi * frequency / sample_rate_hertz
+            pcm = struct.pack(
+                f"<{sample_count}h",
+                *(int(3000 * math.sin(step * i)) for i in range(sample_count))
+            )
+            return build_wav(pcm, sample_rate_hertz)
+
+        raise ValueError(f"Unsupported audio encoding for local provider: {audio_encoding}")
+
+    def synthesize(self, text: str, voice_config: Dict, audio_encoding: str, sample_rate_hertz: int) -> bytes:
+        self.faults.before_call(text)
+        return self.render(text, audio_encoding, sample_rate_hertz)
+
+    async def synthesize_async(self, text: str, voice_config: Dict, audio_encoding: str, sample_rate_hertz: int) -> bytes:
+        await self.faults.before_call_async(text)
+        return self.render(text, audio_encoding, sample_rate_hertz)
+
+    def synthesize_ssml_with_marks(self, ssml: str, voice_config: Dict, audio_encoding: str, sample_rate_hertz: int) -> Tuple[bytes, Dict[str, float]]:
+        if audio_encoding != "MP3":
+            raise ValueError(f"Unsupported audio encoding for local SSML synthesis: {audio_encoding}")
+        self.faults.before_call(ssml)
+        
+        # Walk the document, advancing a clock by each text run and <break>
+        marks = {}
+        elapsed = 0.0
+        for element in ElementTree.fromstring(ssml).iter():
+            if element.tag == "mark":
+                marks[element.get("name")] = elapsed
+            elif element.tag == "break":
+                elapsed += float(element.get("time", "0ms").rstrip("ms")) / 1000.0
+            for text in (element.text, element.tail):
+                if text and text.strip():
+                    elapsed += self.duration_for_text(text)
+        
+        return build_silence_frames(elapsed, sample_rate=sample_rate_hertz), marks
+
+_tts_provider = None
+_tts_provider_lock = threading.Lock()
+
+def get_tts_provider() -> TTSProvider:
+    """Get the shared TTS provider selected by settings.TTS_PROVIDER"""
+    global _tts_provider
+    with _tts_provider_lock:
+        if _tts_provider is None:
+            if settings.TTS_PROVIDER == "gcp":
+                _tts_provider = GoogleTTSProvider()
+            elif settings.TTS_PROVIDER == "local":
+                _tts_provider = LocalTTSProvider()
+            else:
+                raise ValueError(f"Unknown TTS provider: {settings.TTS_PROVIDER}")
+        return _tts_provider
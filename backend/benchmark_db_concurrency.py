@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Benchmark for reads during bulk writes on SQLite
+
+A writer commits one route per transaction, the way the bulk generators write,
+while reader threads page through the route list as the UI does. The same run
+is made with SQLite's default settings (rollback journal, synchronous=FULL) and
+with the PRAGMAs from app.core.db_engine, reporting read latency for each.
+
+Usage: python benchmark_db_concurrency.py [seconds] [readers]
+"""
+
+import sys
+import os
+import time
+import shutil
+import tempfile
+import threading
+import statistics
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import insert
+from sqlalchemy.orm import sessionmaker
+from app.core.database import Base
+from app.core.db_engine import create_app_engine
+from app.models.train_route import TrainRoute
+from app.services.train_route_service import get_train_routes_page
+
+SEED_ROUTES = 20000
+
+def route_row(number: int) -> dict:
+    return {
+        "train_number": str(number),
+        "train_name_en": f"Benchmark Express {number}",
+        "start_station_en": "Mumbai Central",
+        "start_station_code": "BCT",
+        "end_station_en": "Ahmedabad Junction",
+        "end_station_code": "ADI"
+    }
+
+def run(label: str, pragmas, seconds: float, readers: int) -> dict:
+    directory = tempfile.mkdtemp(prefix="wras-bench-")
+    engine = create_app_engine(f"sqlite:///{os.path.join(directory, 'bench.db')}", pragmas=pragmas)
+    Session = sessionmaker(bind=engine)
+    try:
+        Base.metadata.create_all(bind=engine)
+        with engine.begin() as connection:
+            connection.execute(insert(TrainRoute), [route_row(100000 + i) for i in range(SEED_ROUTES)])
+
+        stop = threading.Event()
+        read_latencies = []
+        read_errors = []
+        write_count = [0]
+        write_errors = []
+        lock = threading.Lock()
+
+        def writer():
+            number = 500000
+            while not stop.is_set():
+                db = Session()
+                try:
+                    db.add(TrainRoute(**route_row(number)))
+                    db.commit()
+                    write_count[0] += 1
+                except Exception as e:
+                    db.rollback()
+                    write_errors.append(str(e))
+                finally:
+                    db.close()
+                number += 1
+
+        def reader():
+            while not stop.is_set():
+                db = Session()
+                started = time.perf_counter()
+                try:
+                    get_train_routes_page(db, limit=25)
+                    db.query(TrainRoute).filter(TrainRoute.start_station_code == "BCT").count()
+                    elapsed = (time.perf_counter() - started) * 1000
+                    with lock:
+                        read_latencies.append(elapsed)
+                except Exception as e:
+                    read_errors.append(str(e))
+                finally:
+                    db.close()
+
+        threads = [threading.Thread(target=writer)] + [threading.Thread(target=reader) for _ in range(readers)]
+        for thread in threads:
+            thread.start()
+        time.sleep(seconds)
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+        latencies = sorted(read_latencies) or [0.0]
+        result = {
+            "label": label,
+            "reads": len(read_latencies),
+            "read_p50_ms": statistics.median(latencies),
+            "read_p99_ms": latencies[int(len(latencies) * 0.99) - 1] if len(latencies) > 1 else latencies[0],
+            "read_max_ms": latencies[-1],
+            "read_errors": len(read_errors),
+            "writes": write_count[0],
+            "write_errors": len(write_errors)
+        }
+        return result
+    finally:
+        engine.dispose()
+        shutil.rmtree(directory, ignore_errors=True)
+
+def print_result(result: dict, seconds: float):
+    print(f"{result['label']}:")
+    print(f"   reads: {result['reads']} ({result['reads'] / seconds:.0f}/s), "
+          f"p50 {result['read_p50_ms']:.1f} ms, p99 {result['read_p99_ms']:.1f} ms, max {result['read_max_ms']:.1f} ms, "
+          f"{result['read_errors']} errors")
+    print(f"   writes: {result['writes']} ({result['writes'] / seconds:.0f}/s), {result['write_errors']} errors")
+
+if __name__ == "__main__":
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 10.0
+    readers = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+
+    print("=== SQLite Read/Write Concurrency Benchmark ===\n")
+    print(f"{readers} readers paging routes while one writer commits a route per transaction, {seconds:.0f}s each\n")
+
+    defaults = run("SQLite defaults (rollback journal, synchronous=FULL)", {}, seconds, readers)
+    print_result(defaults, seconds)
+    tuned = run("Tuned PRAGMAs (WAL, synchronous=NORMAL, mmap, cache, busy_timeout)", None, seconds, readers)
+    print_result(tuned, seconds)
+
+    print("\n=== Benchmark Complete ===")
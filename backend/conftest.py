@@ -0,0 +1,20 @@
+"""
+Shared pytest setup for the backend test scripts
+
+Pins the speech and translation providers to the local stand-ins before any app
+module is imported, so plain pytest needs no GCP credentials and never calls the
+real APIs. Caches and generated files go to a scratch directory instead of
+/var/www.
+"""
+
+import os
+import tempfile
+
+os.environ["TTS_PROVIDER"] = "local"
+os.environ["TRANSLATION_PROVIDER"] = "local"
+
+_scratch = tempfile.mkdtemp(prefix="wras-pytest-")
+os.environ["TTS_CACHE_DIR"] = os.path.join(_scratch, "tts-cache")
+os.environ["RENDER_CACHE_DIR"] = os.path.join(_scratch, "render-cache")
+os.environ["ANNOUNCEMENT_OUTPUT_DIR"] = os.path.join(_scratch, "announcements")
+os.environ["IMPORT_SPOOL_DIR"] = os.path.join(_scratch, "import-spool")
@@ -7,18 +7,18 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from app.core.database import engine, SessionLocal
+from app.core.database import SessionLocal
 from app.models.announcement_category import AnnouncementCategory
 from app.models.announcement_template import AnnouncementTemplate
 from app.models.announcement_audio_file import AnnouncementAudioFile
 from app.models.generated_announcement import GeneratedAnnouncement
-from app.core.database import Base
+from app.core.init_db import migrate_schema
 from app.services.announcement_service import announcement_service
 
 def create_tables():
     """Create all announcement tables"""
     print("Creating announcement tables...")
-    Base.metadata.create_all(bind=engine)
+    migrate_schema()
     print("✅ Announcement tables created successfully!")
 
 def initialize_default_data():
@@ -9,14 +9,14 @@ import os
 # Add the app directory to the Python path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'app'))
 
-from app.core.database import engine, Base
-from app.models.audio_file import AudioFile
+from app.core.database import engine
+from app.core.init_db import migrate_schema
 
 def create_audio_table():
     """Create the audio_files table"""
     try:
         print("Creating audio_files table...")
-        Base.metadata.create_all(bind=engine, tables=[AudioFile.__table__])
+        migrate_schema()
         print("✅ audio_files table created successfully!")
         
         # Verify the table was created
@@ -0,0 +1,60 @@
+from logging.config import fileConfig
+from alembic import context
+from app.core.database import Base, engine
+import app.models.user
+import app.models.train_route
+import app.models.train_route_translation
+import app.models.audio_file
+import app.models.announcement_category
+import app.models.announcement_template
+import app.models.announcement_audio_file
+import app.models.announcement_audio_segment
+import app.models.generated_announcement
+import app.models.numeral_clip
+import app.models.job
+import app.models.translation_memo
+
+config = context.config
+
+# Only configure logging from alembic.ini when run from the alembic command
+# line; init_db runs the migrations with the application's own logging
+if config.config_file_name is not None and config.attributes.get("configure_logger", True):
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+def run_migrations_offline():
+    """Emit the migration SQL for the configured database without connecting to it"""
+    context.configure(
+        url=engine.url.render_as_string(hide_password=False),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        render_as_batch=engine.dialect.name == "sqlite",
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+def run_migrations_online():
+    """Run the migrations on the connection init_db passes in, or on a new one from the application engine"""
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        do_run_migrations(connection)
+        return
+    with engine.connect() as connection:
+        do_run_migrations(connection)
+        connection.commit()
+
+def do_run_migrations(connection):
+    # SQLite cannot alter columns in place; batch mode recreates the table instead
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        render_as_batch=connection.dialect.name == "sqlite",
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,155 @@
+"""baseline schema
+
+The tables as the application created them before migrations were introduced.
+Databases from that time have no alembic_version table; every table and index
+here is created only if missing, so those databases are adopted as they stand.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17 03:32:34.494657
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_table('announcement_categories',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('category_code', sa.String(), nullable=False),
+        sa.Column('description', sa.String(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('category_code'),
+        if_not_exists=True
+    )
+    op.create_index('ix_announcement_categories_id', 'announcement_categories', ['id'], if_not_exists=True)
+
+    op.create_table('train_routes',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('train_number', sa.String(), nullable=False),
+        sa.Column('train_name_en', sa.String(), nullable=False),
+        sa.Column('start_station_en', sa.String(), nullable=False),
+        sa.Column('start_station_code', sa.String(), nullable=False),
+        sa.Column('end_station_en', sa.String(), nullable=False),
+        sa.Column('end_station_code', sa.String(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        if_not_exists=True
+    )
+    op.create_index('ix_train_routes_id', 'train_routes', ['id'], if_not_exists=True)
+    op.create_index('ix_train_routes_train_number', 'train_routes', ['train_number'], if_not_exists=True)
+    op.create_index('ix_train_routes_start_station_code', 'train_routes', ['start_station_code'], if_not_exists=True)
+    op.create_index('ix_train_routes_end_station_code', 'train_routes', ['end_station_code'], if_not_exists=True)
+
+    op.create_table('users',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('username', sa.String(), nullable=False),
+        sa.Column('hashed_password', sa.String(), nullable=False),
+        sa.Column('is_active', sa.Boolean(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        if_not_exists=True
+    )
+    op.create_index('ix_users_id', 'users', ['id'], if_not_exists=True)
+    op.create_index('ix_users_username', 'users', ['username'], unique=True, if_not_exists=True)
+
+    op.create_table('announcement_audio_segments',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('category_id', sa.Integer(), nullable=False),
+        sa.Column('segment_name', sa.String(length=50), nullable=False),
+        sa.Column('segment_text', sa.Text(), nullable=False),
+        sa.Column('language_code', sa.String(length=10), nullable=False),
+        sa.Column('audio_file_path', sa.String(length=500), nullable=False),
+        sa.Column('audio_duration', sa.Float(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['category_id'], ['announcement_categories.id']),
+        sa.PrimaryKeyConstraint('id'),
+        if_not_exists=True
+    )
+    op.create_index('ix_announcement_audio_segments_id', 'announcement_audio_segments', ['id'], if_not_exists=True)
+
+    op.create_table('announcement_templates',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('category_id', sa.Integer(), nullable=False),
+        sa.Column('language_code', sa.String(), nullable=False),
+        sa.Column('template_text', sa.Text(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.ForeignKeyConstraint(['category_id'], ['announcement_categories.id']),
+        sa.PrimaryKeyConstraint('id'),
+        if_not_exists=True
+    )
+    op.create_index('ix_announcement_templates_id', 'announcement_templates', ['id'], if_not_exists=True)
+
+    op.create_table('audio_files',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('train_route_id', sa.Integer(), nullable=False),
+        sa.Column('language_code', sa.String(), nullable=False),
+        sa.Column('audio_type', sa.String(), nullable=False),
+        sa.Column('audio_file_path', sa.String(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.ForeignKeyConstraint(['train_route_id'], ['train_routes.id']),
+        sa.PrimaryKeyConstraint('id'),
+        if_not_exists=True
+    )
+    op.create_index('ix_audio_files_id', 'audio_files', ['id'], if_not_exists=True)
+
+    op.create_table('generated_announcements',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('category_id', sa.Integer(), nullable=False),
+        sa.Column('language_code', sa.String(), nullable=False),
+        sa.Column('parameters_json', sa.JSON(), nullable=False),
+        sa.Column('generated_text', sa.Text(), nullable=False),
+        sa.Column('audio_file_path', sa.String(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.ForeignKeyConstraint(['category_id'], ['announcement_categories.id']),
+        sa.PrimaryKeyConstraint('id'),
+        if_not_exists=True
+    )
+    op.create_index('ix_generated_announcements_id', 'generated_announcements', ['id'], if_not_exists=True)
+
+    op.create_table('train_route_translations',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('train_route_id', sa.Integer(), nullable=False),
+        sa.Column('language_code', sa.String(), nullable=False),
+        sa.Column('train_number', sa.String(), nullable=False),
+        sa.Column('train_number_words', sa.String(), nullable=False),
+        sa.Column('train_name', sa.String(), nullable=False),
+        sa.Column('start_station_name', sa.String(), nullable=False),
+        sa.Column('end_station_name', sa.String(), nullable=False),
+        sa.ForeignKeyConstraint(['train_route_id'], ['train_routes.id']),
+        sa.PrimaryKeyConstraint('id'),
+        if_not_exists=True
+    )
+    op.create_index('ix_train_route_translations_id', 'train_route_translations', ['id'], if_not_exists=True)
+
+    op.create_table('announcement_audio_files',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('template_id', sa.Integer(), nullable=False),
+        sa.Column('language_code', sa.String(), nullable=False),
+        sa.Column('audio_file_path', sa.String(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.ForeignKeyConstraint(['template_id'], ['announcement_templates.id']),
+        sa.PrimaryKeyConstraint('id'),
+        if_not_exists=True
+    )
+    op.create_index('ix_announcement_audio_files_id', 'announcement_audio_files', ['id'], if_not_exists=True)
+
+def downgrade():
+    op.drop_table('announcement_audio_files')
+    op.drop_table('train_route_translations')
+    op.drop_table('generated_announcements')
+    op.drop_table('audio_files')
+    op.drop_table('announcement_templates')
+    op.drop_table('announcement_audio_segments')
+    op.drop_table('users')
+    op.drop_table('train_routes')
+    op.drop_table('announcement_categories')
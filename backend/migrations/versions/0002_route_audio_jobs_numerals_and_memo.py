@@ -0,0 +1,91 @@
+"""route audio and translation hashes, jobs, numeral clips and translation memo
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 03:32:46.075299
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.add_column('announcement_audio_files', sa.Column('audio_duration', sa.Float(), nullable=True))
+    op.add_column('audio_files', sa.Column('audio_duration', sa.Float(), nullable=True))
+    op.add_column('audio_files', sa.Column('source_hash', sa.String(length=64), nullable=True))
+    op.add_column('train_route_translations', sa.Column('source_hash', sa.String(length=64), nullable=True))
+    op.add_column('train_route_translations', sa.Column('field_hashes', sa.JSON(), nullable=True))
+
+    # create_audio_segments_table.py created these two by hand on older databases
+    op.create_index('idx_audio_segments_category_lang', 'announcement_audio_segments', ['category_id', 'language_code'], if_not_exists=True)
+    op.create_index('idx_audio_segments_segment_name', 'announcement_audio_segments', ['segment_name'], if_not_exists=True)
+    op.create_index('ix_train_routes_created_at_id', 'train_routes', ['created_at', 'id'])
+
+    op.create_table('jobs',
+        sa.Column('id', sa.String(length=36), nullable=False),
+        sa.Column('job_type', sa.String(length=50), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('parameters_json', sa.JSON(), nullable=False),
+        sa.Column('total_items', sa.Integer(), nullable=False),
+        sa.Column('completed_items', sa.Integer(), nullable=False),
+        sa.Column('failed_items', sa.Integer(), nullable=False),
+        sa.Column('failures_json', sa.JSON(), nullable=True),
+        sa.Column('result_json', sa.JSON(), nullable=True),
+        sa.Column('error_message', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_jobs_job_type', 'jobs', ['job_type'])
+    op.create_index('ix_jobs_status', 'jobs', ['status'])
+
+    op.create_table('numeral_clips',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('language_code', sa.String(length=10), nullable=False),
+        sa.Column('token', sa.String(length=16), nullable=False),
+        sa.Column('spoken_text', sa.String(), nullable=False),
+        sa.Column('audio_file_path', sa.String(length=500), nullable=False),
+        sa.Column('audio_duration', sa.Float(), nullable=True),
+        sa.Column('voice_name', sa.String(length=100), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_numeral_clips_id', 'numeral_clips', ['id'])
+    op.create_index('ix_numeral_clips_language_token', 'numeral_clips', ['language_code', 'token'], unique=True)
+
+    op.create_table('translation_memo',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('text_hash', sa.String(length=64), nullable=False),
+        sa.Column('source_language', sa.String(length=10), nullable=False),
+        sa.Column('target_language', sa.String(length=10), nullable=False),
+        sa.Column('source_text', sa.Text(), nullable=False),
+        sa.Column('translated_text', sa.Text(), nullable=False),
+        sa.Column('provider', sa.String(length=20), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_translation_memo_id', 'translation_memo', ['id'])
+    op.create_index('ix_translation_memo_key', 'translation_memo', ['text_hash', 'source_language', 'target_language', 'provider'], unique=True)
+
+def downgrade():
+    op.drop_table('translation_memo')
+    op.drop_table('numeral_clips')
+    op.drop_table('jobs')
+
+    op.drop_index('ix_train_routes_created_at_id', table_name='train_routes')
+    op.drop_index('idx_audio_segments_segment_name', table_name='announcement_audio_segments')
+    op.drop_index('idx_audio_segments_category_lang', table_name='announcement_audio_segments')
+
+    with op.batch_alter_table('train_route_translations') as batch_op:
+        batch_op.drop_column('field_hashes')
+        batch_op.drop_column('source_hash')
+    with op.batch_alter_table('audio_files') as batch_op:
+        batch_op.drop_column('source_hash')
+        batch_op.drop_column('audio_duration')
+    with op.batch_alter_table('announcement_audio_files') as batch_op:
+        batch_op.drop_column('audio_duration')
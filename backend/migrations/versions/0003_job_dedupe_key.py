@@ -0,0 +1,44 @@
+"""unique dedupe key on active jobs
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 09:12:20.514837
+"""
+from alembic import context, op
+import sqlalchemy as sa
+from app.services.job_service import job_dedupe_key
+
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+ACTIVE = "status IN ('queued', 'running')"
+
+def upgrade():
+    op.add_column('jobs', sa.Column('dedupe_key', sa.String(length=64), nullable=True))
+    if not context.is_offline_mode():
+        key_active_jobs()
+    op.create_index(
+        'uq_jobs_active_dedupe_key', 'jobs', ['dedupe_key'], unique=True,
+        sqlite_where=sa.text(ACTIVE), postgresql_where=sa.text(ACTIVE)
+    )
+
+def key_active_jobs():
+    """Key the jobs that are still active; a duplicate left over from before the index keeps a null key so it still runs"""
+    jobs = sa.table('jobs', sa.column('id'), sa.column('dedupe_key'), sa.column('job_type'), sa.column('status'), sa.column('parameters_json', sa.JSON()), sa.column('created_at'))
+    connection = op.get_bind()
+    keyed = set()
+    for job_id, job_type, parameters in connection.execute(
+        sa.select(jobs.c.id, jobs.c.job_type, jobs.c.parameters_json).where(sa.text(ACTIVE)).order_by(jobs.c.created_at)
+    ).all():
+        key = job_dedupe_key(job_type, parameters or {})
+        if key in keyed:
+            continue
+        keyed.add(key)
+        connection.execute(jobs.update().where(jobs.c.id == job_id).values(dedupe_key=key))
+
+def downgrade():
+    op.drop_index('uq_jobs_active_dedupe_key', table_name='jobs')
+    with op.batch_alter_table('jobs') as batch_op:
+        batch_op.drop_column('dedupe_key')
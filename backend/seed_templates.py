@@ -8,16 +8,16 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from app.core.database import SessionLocal, engine
+from app.core.database import SessionLocal
 from app.models.announcement_category import AnnouncementCategory
 from app.models.announcement_template import AnnouncementTemplate
-from app.core.database import Base
+from app.core.init_db import migrate_schema
 from app.utils.gcp_client import gcp_client
 
 def create_tables():
     """Create all tables if they don't exist"""
     print("Creating database tables...")
-    Base.metadata.create_all(bind=engine)
+    migrate_schema()
     print("✅ Database tables created successfully!")
 
 def get_translate_client():
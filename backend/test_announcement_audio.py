@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Test script for assembled announcement audio
+
+Assembles announcements from silent clips on a scratch database with the render
+cache turned off, then checks the audio URL still serves the output file and the
+output directory stays within its byte bound. Render keys must change when a clip
+is rewritten in place.
+"""
+
+import sys
+import os
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+from app.main import app
+from app.core.database import Base
+from app.core.db_engine import create_app_engine
+from app.models.announcement_category import AnnouncementCategory
+from app.models.announcement_audio_segment import AnnouncementAudioSegment
+from app.models.audio_file import AudioFile
+from app.models.numeral_clip import NumeralClip
+from app.models.train_route import TrainRoute
+from app.services.announcement_assembler import announcement_assembler
+from app.utils.mp3 import build_silence_frames
+from app.utils.render_cache import render_cache
+from app.utils.tts_cache import TTSCache
+
+engine = create_app_engine("sqlite://")
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def write_clip(path: str, seconds: float = 0.3) -> str:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(build_silence_frames(seconds))
+    return path
+
+def seed(db, audio_root: str) -> AnnouncementCategory:
+    """One category with English segments, one route with its clips and the digit clips"""
+    category = AnnouncementCategory(category_code="arriving", description="Train arrival announcements")
+    db.add(category)
+    route = TrainRoute(
+        train_number="12951", train_name_en="Mumbai Rajdhani Express",
+        start_station_en="Mumbai Central", start_station_code="BCT",
+        end_station_en="New Delhi", end_station_code="NDLS"
+    )
+    db.add(route)
+    db.flush()
+    for segment in ("prefix", "from", "to", "suffix"):
+        relative = f"/announcements/arriving/en/{segment}.mp3"
+        write_clip(os.path.join(audio_root, relative.lstrip("/")))
+        db.add(AnnouncementAudioSegment(category_id=category.id, segment_name=segment, segment_text=segment, language_code="en", audio_file_path=relative))
+    for audio_type in ("train_name", "start_station_name", "end_station_name"):
+        path = write_clip(os.path.join(audio_root, f"train_{route.id}", "en", f"{audio_type}.mp3"))
+        db.add(AudioFile(train_route_id=route.id, language_code="en", audio_type=audio_type, audio_file_path=path))
+    for token in [str(value) for value in range(10)] + ["minutes"]:
+        path = write_clip(os.path.join(audio_root, "numerals", "en", f"{token}.mp3"), 0.1)
+        db.add(NumeralClip(language_code="en", token=token, spoken_text=token, audio_file_path=path))
+    db.commit()
+    return category
+
+def test_announcement_audio_without_render_cache():
+    """Rendered announcements are served from their output files, which are bounded by least-recent use"""
+    print("Testing announcement audio without the render cache...")
+    directory = tempfile.mkdtemp(prefix="wras-announcements-")
+    saved = (announcement_assembler.audio_root, announcement_assembler.output_dir, announcement_assembler.output_files, render_cache.enabled)
+    announcement_assembler.audio_root = directory
+    announcement_assembler.output_dir = os.path.join(directory, "generated")
+    render_cache.enabled = False
+    Base.metadata.create_all(bind=engine)
+    db = TestingSessionLocal()
+    try:
+        category = seed(db, directory)
+        client = TestClient(app)
+
+        first = announcement_assembler.assemble(db, category, "en", {"train_number": "12951", "delay_time": "5"})
+        assert not first["cached"] and os.path.exists(first["audio_file_path"])
+        response = client.get(first["audio_url"])
+        assert response.status_code == 200, response.text
+        with open(first["audio_file_path"], "rb") as f:
+            assert response.content == f.read()
+        assert client.get(first["audio_url"], headers={"If-None-Match": f'"{first["etag"]}"'}).status_code == 304
+        print(f"✅ {first['audio_url']} served from {first['audio_file_path']}")
+
+        # Room for two renders: rendering three evicts the least recently used
+        size = os.path.getsize(first["audio_file_path"])
+        announcement_assembler.output_files = TTSCache(announcement_assembler.output_dir, size * 2 + size // 2, label="Announcement output")
+        renders = [announcement_assembler.assemble(db, category, "en", {"train_number": "12951", "delay_time": str(delay)}) for delay in (6, 7, 8)]
+        assert len({render["etag"] for render in renders + [first]}) == 4
+        kept = [render for render in [first] + renders if os.path.exists(render["audio_file_path"])]
+        assert [render["etag"] for render in kept] == [renders[1]["etag"], renders[2]["etag"]], kept
+        assert client.get(first["audio_url"]).status_code == 404
+        assert client.get(renders[2]["audio_url"]).status_code == 200
+        print("✅ Output directory evicts the least recently used renders")
+    finally:
+        db.close()
+        Base.metadata.drop_all(bind=engine)
+        announcement_assembler.audio_root, announcement_assembler.output_dir, announcement_assembler.output_files, render_cache.enabled = saved
+
+def test_render_key_follows_clip_content():
+    """Rewriting a clip in place changes the render key; touching it does not"""
+    print("Testing render keys against clip changes...")
+    directory = tempfile.mkdtemp(prefix="wras-render-key-")
+    clip = write_clip(os.path.join(directory, "prefix.mp3"))
+    parameters = {"category": "arriving", "language": "en", "train_number": "12951"}
+    stat = os.stat(clip)
+    key = render_cache.make_key(parameters, [clip])
+
+    # A synthesis cache hit only updates the modification time
+    os.utime(clip, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+    assert render_cache.make_key(parameters, [clip]) == key
+
+    # Same inode and size, different bytes
+    with open(clip, "r+b") as f:
+        f.seek(stat.st_size // 2)
+        f.write(b"\x55")
+    os.utime(clip, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000_000))
+    rewritten = os.stat(clip)
+    assert (rewritten.st_ino, rewritten.st_size) == (stat.st_ino, stat.st_size)
+    assert render_cache.make_key(parameters, [clip]) != key
+    print("✅ Render keys follow clip content, not modification times")
+
+if __name__ == "__main__":
+    print("=== Announcement Audio Test ===\n")
+
+    test_announcement_audio_without_render_cache()
+    test_render_key_follows_clip_content()
+
+    print("\n=== Test Complete ===")
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Test script for the asyncio TTS and translation clients
+
+Fires many concurrent requests at fresh AsyncGCPTTSClient and
+AsyncGCPTranslationClient instances backed by the local providers, and checks
+no more than the configured number reach the provider at once and repeated
+strings are served from the synthesis cache and the translation memo.
+"""
+
+import sys
+import os
+import uuid
+import asyncio
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy.orm import sessionmaker
+from app.core.config.settings import settings
+from app.core.database import Base
+from app.core.db_engine import create_app_engine
+from app.utils import translation_memo as translation_memo_module
+from app.utils.gcp_client import AsyncGCPTranslationClient
+from app.utils.gcp_tts_client import AsyncGCPTTSClient
+from app.utils.translation_memo import translation_memo
+
+engine = create_app_engine("sqlite://")
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+class ConcurrencyProbe:
+    """Wraps a provider coroutine to count calls and the most that were in flight together"""
+
+    def __init__(self, provider, name: str):
+        self.provider = provider
+        self.name = name
+        self.original = getattr(provider, name)
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+
+    def __enter__(self):
+        async def probe(text, *args):
+            self.calls.append(text)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            try:
+                await asyncio.sleep(0.01)
+                return await self.original(text, *args)
+            finally:
+                self.active -= 1
+        setattr(self.provider, self.name, probe)
+        return self
+
+    def __exit__(self, *exc_info):
+        delattr(self.provider, self.name)
+
+def test_async_tts_client():
+    """Concurrent synthesis is bounded by TTS_MAX_CONCURRENCY and repeats come from the cache"""
+    print("Testing AsyncGCPTTSClient...")
+    saved = settings.TTS_MAX_CONCURRENCY
+    settings.TTS_MAX_CONCURRENCY = 2
+    directory = tempfile.mkdtemp(prefix="wras-async-tts-")
+    run = uuid.uuid4().hex[:8]  # keeps the texts out of the shared cache's earlier entries
+    texts = [f"Platform {number} run {run}" for number in range(8)]
+    try:
+        client = AsyncGCPTTSClient()
+
+        async def speak(texts, prefix):
+            return await asyncio.gather(*(
+                client.generate_audio(text, "en", os.path.join(directory, f"{prefix}-{index}.mp3"))
+                for index, text in enumerate(texts)
+            ))
+
+        with ConcurrencyProbe(client.provider, "synthesize_async") as probe:
+            durations = asyncio.run(speak(texts, "first"))
+            assert all(duration and duration > 0 for duration in durations)
+            assert sorted(probe.calls) == sorted(texts)
+            assert probe.peak == 2, probe.peak
+            print(f"✅ {len(texts)} concurrent requests, at most {probe.peak} at the provider")
+
+            repeated = asyncio.run(speak(texts + texts[:2], "again"))
+            assert len(probe.calls) == len(texts)
+            assert repeated[:len(texts)] == durations
+        assert all(os.path.exists(os.path.join(directory, f"again-{index}.mp3")) for index in range(len(texts) + 2))
+        print("✅ Repeated strings served from the synthesis cache")
+    finally:
+        settings.TTS_MAX_CONCURRENCY = saved
+
+def test_async_translation_client():
+    """Concurrent translations are bounded by TRANSLATION_MAX_CONCURRENCY and repeats come from the memo"""
+    print("Testing AsyncGCPTranslationClient...")
+    saved = (translation_memo_module.SessionLocal, settings.TRANSLATION_MAX_CONCURRENCY)
+    translation_memo_module.SessionLocal = TestingSessionLocal
+    settings.TRANSLATION_MAX_CONCURRENCY = 3
+    Base.metadata.create_all(bind=engine)
+    texts = [f"Platform {number}" for number in range(9)]
+    try:
+        translation_memo.clear()
+        client = AsyncGCPTranslationClient()
+
+        async def translate(texts):
+            return await asyncio.gather(*(client.translate_text(text, "en", "hi") for text in texts))
+
+        with ConcurrencyProbe(client.provider, "translate_async") as probe:
+            translated = asyncio.run(translate(texts))
+            assert translated == [f"[hi] {text}" for text in texts]
+            assert sorted(probe.calls) == sorted(texts)
+            assert probe.peak == 3, probe.peak
+            print(f"✅ {len(texts)} concurrent translations, at most {probe.peak} at the provider")
+
+            assert asyncio.run(translate(texts[::-1])) == translated[::-1]
+            assert len(probe.calls) == len(texts)
+        print("✅ Repeated strings served from the translation memo")
+    finally:
+        translation_memo.clear()
+        Base.metadata.drop_all(bind=engine)
+        translation_memo_module.SessionLocal, settings.TRANSLATION_MAX_CONCURRENCY = saved
+
+if __name__ == "__main__":
+    print("=== Async Client Test ===\n")
+
+    test_async_tts_client()
+    test_async_translation_client()
+
+    print("\n=== Test Complete ===")
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Test script for bulk planning and dry runs
+
+Three routes sharing stations are planned on a scratch database with the local
+providers. Shared (string, language) items must be counted and processed once
+and fanned back out to every route, and dry_run must return the plan without
+queuing a job.
+"""
+
+import sys
+import os
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+from app.main import app
+from app.core.database import Base, get_db
+from app.core.db_engine import create_app_engine
+from app.models.job import Job
+from app.models.train_route import TrainRoute
+from app.services import translation_service
+from app.services.audio_service import audio_service
+from app.utils import translation_memo as translation_memo_module
+from app.utils.bulk_plan import plan_items
+from app.utils.gcp_client import gcp_client
+from app.utils.translation_memo import translation_memo
+from app.utils.transliteration import transliterator
+
+engine = create_app_engine("sqlite://")
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def override_get_db():
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+ROUTES = [
+    ("12951", "Mumbai Rajdhani Express", "Mumbai Central", "New Delhi"),
+    ("12009", "Shatabdi Express", "Mumbai Central", "Ahmedabad Junction"),
+    ("22953", "Gujarat Superfast Express", "Mumbai Central", "Ahmedabad Junction"),
+]
+# Three names and three distinct stations per language
+UNIQUE_TEXTS = ["Mumbai Rajdhani Express", "Shatabdi Express", "Gujarat Superfast Express", "Mumbai Central", "New Delhi", "Ahmedabad Junction"]
+TARGETS = ["hi", "mr", "gu"]
+
+def test_plan_items():
+    """Duplicates within a group are counted once and cached texts are not processed"""
+    print("Testing plan_items...")
+    items = [("Dadar", "hi"), ("Dadar", "hi"), ("Thane", "hi"), ("Dadar", ("en", "mr"))]
+    plan = plan_items(items, is_cached=lambda texts, group: {"Thane"} & set(texts), count_requests=lambda texts, group: len(texts))
+    assert plan["groups"]["hi"] == {
+        "total_items": 3, "unique_items": 2, "cached_items": 1, "items_to_process": 1,
+        "estimated_api_characters": 5, "estimated_requests": 1
+    }
+    assert plan["groups"]["en->mr"]["unique_items"] == 1
+    assert (plan["total_items"], plan["unique_items"], plan["items_to_process"], plan["estimated_api_characters"]) == (4, 3, 2, 10)
+    print("✅ Duplicates counted once, cached texts skipped")
+
+def test_bulk_translation_plan_and_fan_out():
+    """The translation dry run counts unique strings; the run sends each once and fans it out"""
+    print("Testing bulk translation plan...")
+    saved = (translation_memo_module.SessionLocal, transliterator.enabled)
+    translate_many = gcp_client.provider.translate_many
+    translation_memo_module.SessionLocal = TestingSessionLocal
+    transliterator.enabled = False  # every name goes through the translation API
+    app.dependency_overrides[get_db] = override_get_db
+    Base.metadata.create_all(bind=engine)
+    sent = []
+    def recording_translate_many(texts, source_language, target_language):
+        sent.extend((text, target_language) for text in texts)
+        return translate_many(texts, source_language, target_language)
+    gcp_client.provider.translate_many = recording_translate_many
+    db = TestingSessionLocal()
+    try:
+        translation_memo.clear()
+        translation_memo.put("New Delhi", "en", "hi", "नई दिल्ली", "local")
+        for number, name, start, end in ROUTES:
+            db.add(TrainRoute(train_number=number, train_name_en=name, start_station_en=start, start_station_code="S", end_station_en=end, end_station_code="E"))
+        db.commit()
+        client = TestClient(app)
+
+        response = client.post("/api/v1/translate/bulk/", json={"dry_run": True})
+        assert response.status_code == 200, response.text
+        plan = response.json()
+        characters = sum(len(text) for text in UNIQUE_TEXTS)
+        assert plan["dry_run"] and plan["operation"] == "route_translation"
+        assert (plan["total_routes"], plan["routes_to_process"]) == (3, 3)
+        assert (plan["total_items"], plan["unique_items"], plan["cached_items"]) == (27, 18, 1)
+        assert plan["estimated_api_characters"] == 3 * characters - len("New Delhi")
+        assert plan["groups"]["en->hi"] == {
+            "total_items": 9, "unique_items": 6, "cached_items": 1, "items_to_process": 5,
+            "estimated_api_characters": characters - len("New Delhi"), "estimated_requests": 1
+        }
+        assert plan["estimated_requests"] == 3
+        assert not sent and db.query(Job).count() == 0
+        print(f"✅ Dry run: {plan['total_items']} strings, {plan['unique_items']} unique, nothing queued")
+
+        result = translation_service.bulk_translate_all_routes(db)
+        assert result["translated_routes"] == 3 and result["timing"]["api_requests"] == 3
+        assert sorted(sent) == sorted((text, lang) for text in UNIQUE_TEXTS for lang in TARGETS if (text, lang) != ("New Delhi", "hi"))
+        for route in db.query(TrainRoute).all():
+            stored = translation_service.get_train_route_translations(db, route.id)
+            assert stored["mr"]["start_station_name"] == "[mr] Mumbai Central"
+            assert stored["gu"]["train_name"] == f"[gu] {route.train_name_en}"
+        assert translation_service.get_train_route_translations(db, 1)["hi"]["end_station_name"] == "नई दिल्ली"
+        print(f"✅ {len(sent)} strings sent once each and fanned out to every route")
+
+        # Everything is translated now, so a second dry run has nothing to do
+        plan = client.post("/api/v1/translate/bulk/", json={"dry_run": True}).json()
+        assert (plan["unchanged_routes"], plan["total_items"], plan["estimated_requests"]) == (3, 0, 0)
+    finally:
+        db.close()
+        translation_memo.clear()
+        app.dependency_overrides.clear()
+        Base.metadata.drop_all(bind=engine)
+        del gcp_client.provider.translate_many
+        translation_memo_module.SessionLocal, transliterator.enabled = saved
+
+def test_bulk_audio_plan():
+    """The audio dry run counts unique clips, and the run links shared clips instead of synthesizing them again"""
+    print("Testing bulk audio plan...")
+    saved = (translation_memo_module.SessionLocal, transliterator.enabled, audio_service.audio_base_path)
+    translation_memo_module.SessionLocal = TestingSessionLocal
+    transliterator.enabled = False
+    audio_service.audio_base_path = tempfile.mkdtemp(prefix="wras-route-audio-")
+    app.dependency_overrides[get_db] = override_get_db
+    Base.metadata.create_all(bind=engine)
+    db = TestingSessionLocal()
+    try:
+        for number, name, start, end in ROUTES:
+            db.add(TrainRoute(train_number=number, train_name_en=name, start_station_en=start, start_station_code="S", end_station_en=end, end_station_code="E"))
+        db.commit()
+        translation_service.bulk_translate_all_routes(db)
+        client = TestClient(app)
+
+        response = client.post("/api/v1/audio/generate-bulk/", json={"dry_run": True})
+        assert response.status_code == 200, response.text
+        plan = response.json()
+        assert plan["operation"] == "route_audio" and plan["routes_to_process"] == 3
+        # Three clips per route in English and the three target languages
+        assert (plan["total_items"], plan["unique_items"]) == (36, 24), plan
+        assert plan["groups"]["en"]["estimated_api_characters"] == sum(len(text) for text in UNIQUE_TEXTS)
+        assert db.query(Job).count() == 0
+        print(f"✅ Dry run: {plan['total_items']} clips, {plan['unique_items']} unique")
+
+        result = audio_service.generate_audio_for_all_routes(db)
+        assert result["total_files_generated"] == 36
+        shared = [os.path.join(audio_service.audio_base_path, f"train_{route_id}", "hi", "start_station_name.mp3") for route_id in (1, 2, 3)]
+        assert len({os.stat(path).st_ino for path in shared}) == 1
+        plan = client.post("/api/v1/audio/generate-bulk/", json={"dry_run": True}).json()
+        assert (plan["unchanged_routes"], plan["total_items"]) == (3, 0)
+        print("✅ Shared clips synthesized once and linked into every route")
+    finally:
+        db.close()
+        translation_memo.clear()
+        app.dependency_overrides.clear()
+        Base.metadata.drop_all(bind=engine)
+        translation_memo_module.SessionLocal, transliterator.enabled, audio_service.audio_base_path = saved
+
+if __name__ == "__main__":
+    print("=== Bulk Plan Test ===\n")
+
+    test_plan_items()
+    test_bulk_translation_plan_and_fan_out()
+    test_bulk_audio_plan()
+
+    print("\n=== Test Complete ===")
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Test script for the parallel bulk translator
+
+Translates routes on a scratch database with the local provider, one string per
+request, and checks a route whose string fails is reported while the others are
+written, requests run on the worker pool, writes happen in chunked transactions
+on the calling thread, and the result carries its timings.
+"""
+
+import sys
+import os
+import threading
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy.orm import sessionmaker
+from app.core.config.settings import settings
+from app.core.database import Base
+from app.core.db_engine import create_app_engine
+from app.models.train_route import TrainRoute
+from app.models.train_route_translation import TrainRouteTranslation
+from app.services import translation_service
+from app.utils import translation_memo as translation_memo_module
+from app.utils.gcp_client import gcp_client
+from app.utils.translation_memo import translation_memo
+from app.utils.transliteration import transliterator
+
+engine = create_app_engine("sqlite://")
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+ROUTES = [
+    ("12951", "Mumbai Rajdhani Express", "Mumbai Central", "New Delhi"),
+    ("12009", "Shatabdi Express", "Mumbai Central", "Ahmedabad Junction"),
+    ("19015", "Broken Express", "Dadar", "Porbandar"),
+    ("12267", "Duronto Express", "Mumbai Central", "Hapa"),
+    ("22953", "Gujarat Superfast Express", "Mumbai Central", "Ahmedabad Junction"),
+]
+
+def test_bulk_translation_isolates_failures():
+    """A failed string fails only its route; the rest are written in chunked transactions"""
+    print("Testing parallel bulk translation...")
+    saved = (
+        translation_memo_module.SessionLocal, transliterator.enabled, translation_service.write_route_translations,
+        settings.TRANSLATION_BATCH_MAX_SEGMENTS, settings.TRANSLATION_BULK_CHUNK_SIZE
+    )
+    translate_many = gcp_client.provider.translate_many
+    translation_memo_module.SessionLocal = TestingSessionLocal
+    transliterator.enabled = False  # every name goes through the translation API
+    settings.TRANSLATION_BATCH_MAX_SEGMENTS = 1  # one string per request, so a failure stays with its string
+    settings.TRANSLATION_BULK_CHUNK_SIZE = 2
+    Base.metadata.create_all(bind=engine)
+
+    request_threads = set()
+    def failing_translate_many(texts, source_language, target_language):
+        request_threads.add(threading.current_thread().name)
+        if "Broken Express" in texts and target_language == "mr":
+            raise RuntimeError("quota exceeded")
+        return translate_many(texts, source_language, target_language)
+
+    writes = []
+    def recording_write(db, translations_by_route, hashes_by_route=None):
+        failures = saved[2](db, translations_by_route, hashes_by_route)
+        writes.append((threading.current_thread().name, sorted(translations_by_route), failures))
+        return failures
+
+    gcp_client.provider.translate_many = failing_translate_many
+    translation_service.write_route_translations = recording_write
+    db = TestingSessionLocal()
+    try:
+        translation_memo.clear()
+        for number, name, start, end in ROUTES:
+            db.add(TrainRoute(train_number=number, train_name_en=name, start_station_en=start, start_station_code="S", end_station_en=end, end_station_code="E"))
+        db.commit()
+        broken = db.query(TrainRoute).filter(TrainRoute.train_number == "19015").one().id
+
+        result = translation_service.bulk_translate_all_routes(db)
+        assert (result["total_routes"], result["translated_routes"], result["failed_routes"]) == (5, 4, 1), result
+        stored = {route_id for (route_id,) in db.query(TrainRouteTranslation.train_route_id).distinct()}
+        assert stored == {1, 2, 4, 5} and broken not in stored
+        print("✅ The failing route is reported and the other four are written")
+
+        # Requests ran on the translation pool; every write ran on this thread, two routes per transaction
+        assert request_threads and all(name.startswith("translate-worker") for name in request_threads)
+        assert [routes for _, routes, _ in writes] == [[1, 2], [4], [5]]
+        assert all(name == threading.current_thread().name and not failures for name, _, failures in writes)
+        print(f"✅ {len(writes)} batched write transactions on the calling thread")
+
+        timing = result["timing"]
+        for key in ("planning_seconds", "translation_seconds", "database_seconds", "total_seconds", "routes_per_second"):
+            assert timing[key] is not None and timing[key] >= 0, (key, timing)
+        # 11 distinct strings to each of hi, mr and gu, one per request
+        assert (timing["total_strings"], timing["unique_strings"], timing["api_requests"]) == (45, 33, 33), timing
+        print(f"✅ Timings reported: {timing['total_seconds']}s for {timing['api_requests']} requests")
+
+        # A second run only retries the failed route
+        gcp_client.provider.translate_many = translate_many
+        result = translation_service.bulk_translate_all_routes(db)
+        assert (result["translated_routes"], result["unchanged_routes"], result["failed_routes"]) == (1, 4, 0), result
+    finally:
+        db.close()
+        translation_memo.clear()
+        Base.metadata.drop_all(bind=engine)
+        del gcp_client.provider.translate_many
+        (translation_memo_module.SessionLocal, transliterator.enabled, translation_service.write_route_translations,
+         settings.TRANSLATION_BATCH_MAX_SEGMENTS, settings.TRANSLATION_BULK_CHUNK_SIZE) = saved
+
+if __name__ == "__main__":
+    print("=== Bulk Translation Test ===\n")
+
+    test_bulk_translation_isolates_failures()
+
+    print("\n=== Test Complete ===")
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Test script for the SQLite connection setup in app/core/db_engine.py
+
+Opens a scratch database file and checks the PRAGMA hook has configured every
+new connection from Settings, and that foreign keys are enforced.
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from fastapi.testclient import TestClient
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+from app.main import app
+from app.core.config.settings import settings
+from app.core.database import Base, get_db
+from app.core.db_engine import create_app_engine
+from app.models.train_route import TrainRoute
+from app.models.train_route_translation import TrainRouteTranslation
+from app.models.audio_file import AudioFile
+
+def pragma(connection, name: str):
+    return connection.exec_driver_sql(f"PRAGMA {name}").scalar()
+
+def test_sqlite_pragmas_on_new_connections():
+    """Each pooled connection comes up in WAL mode with the configured busy timeout and foreign keys on"""
+    print("Testing SQLite connection PRAGMAs...")
+    directory = tempfile.mkdtemp(prefix="wras-pragmas-")
+    saved = settings.SQLITE_BUSY_TIMEOUT_MS
+    settings.SQLITE_BUSY_TIMEOUT_MS = 2500
+    try:
+        engine = create_app_engine(f"sqlite:///{os.path.join(directory, 'pragmas.db')}")
+        # Held open together, so the pool has to open two DBAPI connections
+        with engine.connect() as first, engine.connect() as second:
+            assert first.connection.dbapi_connection is not second.connection.dbapi_connection
+            for connection in (first, second):
+                assert pragma(connection, "journal_mode") == "wal"
+                assert pragma(connection, "busy_timeout") == 2500
+                assert pragma(connection, "foreign_keys") == 1
+                assert pragma(connection, "synchronous") == 1  # NORMAL
+                assert pragma(connection, "temp_store") == 2  # MEMORY
+                assert pragma(connection, "cache_size") == -settings.SQLITE_CACHE_SIZE_KB
+        engine.dispose()
+        print("✅ WAL, busy_timeout and foreign_keys are set on every connection")
+    finally:
+        settings.SQLITE_BUSY_TIMEOUT_MS = saved
+        shutil.rmtree(directory, ignore_errors=True)
+
+def test_foreign_keys_are_enforced():
+    """A row pointing at a missing route is rejected, and clearing routes removes the rows that reference them"""
+    print("Testing foreign key enforcement...")
+    directory = tempfile.mkdtemp(prefix="wras-foreign-keys-")
+    engine = create_app_engine(f"sqlite:///{os.path.join(directory, 'foreign_keys.db')}")
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    def override_get_db():
+        db = TestingSessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    Base.metadata.create_all(bind=engine)
+    app.dependency_overrides[get_db] = override_get_db
+    db = TestingSessionLocal()
+    try:
+        db.add(TrainRouteTranslation(
+            train_route_id=999, language_code="hi", train_number="12951", train_number_words="12951",
+            train_name="राजधानी", start_station_name="मुंबई", end_station_name="दिल्ली"
+        ))
+        try:
+            db.commit()
+            raise AssertionError("A translation of a missing route was stored")
+        except IntegrityError:
+            db.rollback()
+        print("✅ Rows referencing a missing route are rejected")
+
+        route = TrainRoute(
+            train_number="12951", train_name_en="Mumbai Rajdhani Express",
+            start_station_en="Mumbai Central", start_station_code="BCT",
+            end_station_en="New Delhi", end_station_code="NDLS"
+        )
+        db.add(route)
+        db.flush()
+        db.add(TrainRouteTranslation(
+            train_route_id=route.id, language_code="hi", train_number="12951", train_number_words="12951",
+            train_name="राजधानी", start_station_name="मुंबई", end_station_name="दिल्ली"
+        ))
+        db.add(AudioFile(train_route_id=route.id, language_code="hi", audio_type="train_name", audio_file_path="/tmp/12951.mp3"))
+        db.commit()
+
+        response = TestClient(app).delete("/api/v1/train-routes/")
+        assert response.status_code == 200, response.text
+        assert response.json()["deleted_count"] == 1
+        db.expire_all()
+        assert db.query(TrainRouteTranslation).count() == 0
+        assert db.query(AudioFile).count() == 0
+        print("✅ Clearing routes also clears their translations and audio rows")
+    finally:
+        db.close()
+        app.dependency_overrides.pop(get_db, None)
+        engine.dispose()
+        shutil.rmtree(directory, ignore_errors=True)
+
+if __name__ == "__main__":
+    print("=== Database Engine Test ===\n")
+
+    test_sqlite_pragmas_on_new_connections()
+    test_foreign_keys_are_enforced()
+
+    print("\n=== Test Complete ===")
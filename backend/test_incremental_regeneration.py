@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Test script for incremental re-translation and audio regeneration
+
+Translates and voices a route on a scratch database with the local providers,
+then runs both again unchanged and after editing the train name. An unchanged
+route must make no requests; an edit must redo only the field it touched.
+"""
+
+import sys
+import os
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy.orm import sessionmaker
+from app.core.database import Base
+from app.core.db_engine import create_app_engine
+from app.models.audio_file import AudioFile
+from app.models.train_route import TrainRoute
+from app.models.train_route_translation import TrainRouteTranslation
+from app.services import translation_service
+from app.services.audio_service import audio_service
+from app.utils import translation_memo as translation_memo_module
+from app.utils.gcp_client import gcp_client
+from app.utils.translation_memo import translation_memo
+from app.utils.transliteration import transliterator
+from app.utils.tts_executor import synthesis_executor
+
+engine = create_app_engine("sqlite://")
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def test_only_edited_fields_are_regenerated():
+    """Unchanged routes are skipped; an edited name is re-translated and re-voiced alone"""
+    print("Testing incremental regeneration...")
+    saved = (translation_memo_module.SessionLocal, transliterator.enabled, audio_service.audio_base_path)
+    translation_memo_module.SessionLocal = TestingSessionLocal
+    transliterator.enabled = False  # names go through the translation API
+    audio_service.audio_base_path = tempfile.mkdtemp(prefix="wras-route-audio-")
+    Base.metadata.create_all(bind=engine)
+
+    translate_many = gcp_client.provider.translate_many
+    generate_many = synthesis_executor.generate_many
+    requests = []
+    synthesized = []
+    def recording_translate_many(texts, source_language, target_language):
+        requests.append((target_language, list(texts)))
+        return translate_many(texts, source_language, target_language)
+    def recording_generate_many(jobs):
+        synthesized.extend((text, language) for text, language, _ in jobs)
+        return generate_many(jobs)
+    gcp_client.provider.translate_many = recording_translate_many
+    synthesis_executor.generate_many = recording_generate_many
+
+    db = TestingSessionLocal()
+    try:
+        translation_memo.clear()
+        route = TrainRoute(
+            train_number="12951", train_name_en="Mumbai Rajdhani Express",
+            start_station_en="Mumbai Central", start_station_code="BCT",
+            end_station_en="New Delhi", end_station_code="NDLS"
+        )
+        db.add(route)
+        db.commit()
+
+        translation_service.translate_train_route(db, route.id)
+        result = audio_service.generate_audio_for_route(db, route.id)
+        # Name and both stations in en, hi, mr and gu
+        assert result["audio_files_generated"] == 12 and len(synthesized) == 12
+        assert requests
+        stored_hashes = {row.language_code: row.source_hash for row in db.query(TrainRouteTranslation)}
+        clips = {(clip.language_code, clip.audio_type): (clip.id, clip.source_hash) for clip in db.query(AudioFile)}
+        station_clip = next(clip.audio_file_path for clip in db.query(AudioFile) if (clip.language_code, clip.audio_type) == ("hi", "start_station_name"))
+        station_inode = os.stat(station_clip).st_ino
+        print(f"✅ First run: {len(requests)} translation requests, {len(synthesized)} clips")
+
+        # Nothing changed: no requests, no synthesis, rows and clips kept as they were
+        requests.clear()
+        synthesized.clear()
+        translation_service.translate_train_route(db, route.id)
+        result = audio_service.generate_audio_for_route(db, route.id)
+        assert requests == [] and synthesized == [] and result["audio_files_generated"] == 0
+        assert {row.language_code: row.source_hash for row in db.query(TrainRouteTranslation)} == stored_hashes
+        assert {(clip.language_code, clip.audio_type): (clip.id, clip.source_hash) for clip in db.query(AudioFile)} == clips
+        print("✅ Unchanged route skipped by both translation and audio")
+
+        # Only the train name changed: only it is translated and voiced again
+        route.train_name_en = "Mumbai New Delhi Rajdhani Express"
+        db.commit()
+        translation_service.translate_train_route(db, route.id)
+        assert sorted(requests) == [(language, ["Mumbai New Delhi Rajdhani Express"]) for language in ("gu", "hi", "mr")]
+        hindi = db.query(TrainRouteTranslation).filter(TrainRouteTranslation.language_code == "hi").one()
+        assert hindi.train_name == "[hi] Mumbai New Delhi Rajdhani Express"
+        assert (hindi.start_station_name, hindi.end_station_name) == ("[hi] Mumbai Central", "[hi] New Delhi")
+        assert hindi.source_hash != stored_hashes["hi"]
+
+        result = audio_service.generate_audio_for_route(db, route.id)
+        assert result["audio_files_generated"] == 4
+        assert sorted(language for _, language in synthesized) == ["en", "gu", "hi", "mr"]
+        assert all("Mumbai New Delhi Rajdhani Express" in text for text, _ in synthesized)
+        regenerated = {(clip.language_code, clip.audio_type): (clip.id, clip.source_hash) for clip in db.query(AudioFile)}
+        assert len(regenerated) == 12
+        for key, value in regenerated.items():
+            assert (value == clips[key]) == (key[1] != "train_name"), key
+        assert os.stat(station_clip).st_ino == station_inode
+        print("✅ Only the edited name was re-translated and re-voiced")
+    finally:
+        db.close()
+        translation_memo.clear()
+        Base.metadata.drop_all(bind=engine)
+        del gcp_client.provider.translate_many
+        del synthesis_executor.generate_many
+        translation_memo_module.SessionLocal, transliterator.enabled, audio_service.audio_base_path = saved
+
+if __name__ == "__main__":
+    print("=== Incremental Regeneration Test ===\n")
+
+    test_only_edited_fields_are_regenerated()
+
+    print("\n=== Test Complete ===")
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Test script for the job queue
+
+Runs jobs on a scratch SQLite file (worker threads need their own connections)
+and checks duplicate submissions return the active job, even from separate
+managers racing each other, progress and outcomes are recorded, and jobs left
+queued or running are started again on boot.
+"""
+
+import sys
+import os
+import tempfile
+import threading
+from datetime import datetime, timezone
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+from app.core.database import Base
+from app.core.db_engine import create_app_engine
+from app.models.job import Job
+from app.services import job_service as job_service_module
+from app.services.job_service import JobManager, job_dedupe_key
+
+engine = create_app_engine(f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='wras-jobs-'), 'jobs.db')}")
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+class CountingHandler:
+    """Job handler that waits for a release, reports progress and fails on request"""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.calls = []
+
+    def __call__(self, db, parameters, progress):
+        self.calls.append(parameters)
+        self.release.wait(timeout=10)
+        if parameters.get("fail"):
+            raise RuntimeError("handler failed")
+        progress.set_total(3)
+        progress.advance(2)
+        progress.fail("route 3", "missing audio")
+        return {"routes": parameters.get("routes")}
+
+def wait_for_jobs(manager: JobManager):
+    """Let the worker pool drain; the next submission starts a fresh pool"""
+    if manager._executor is not None:
+        manager._executor.shutdown(wait=True)
+        manager._executor = None
+
+def with_scratch_database(test):
+    def run():
+        saved = job_service_module.SessionLocal
+        job_service_module.SessionLocal = TestingSessionLocal
+        Base.metadata.create_all(bind=engine)
+        try:
+            test()
+        finally:
+            job_service_module.SessionLocal = saved
+            Base.metadata.drop_all(bind=engine)
+    run.__name__ = test.__name__
+    run.__doc__ = test.__doc__
+    return run
+
+@with_scratch_database
+def test_enqueue_deduplicates_active_jobs():
+    """The same type and parameters return the active job; the outcome is recorded on the row"""
+    print("Testing job deduplication...")
+    manager = JobManager(max_workers=2)
+    handler = CountingHandler()
+    manager.register("route_audio", handler)
+    db = TestingSessionLocal()
+    try:
+        first = manager.enqueue(db, "route_audio", {"routes": [1, 2, 3]})
+        assert manager.enqueue(db, "route_audio", {"routes": [1, 2, 3]}).id == first.id
+        other = manager.enqueue(db, "route_audio", {"routes": [4]})
+        assert other.id != first.id
+        with pytest.raises(ValueError):
+            manager.enqueue(db, "unknown", {})
+
+        handler.release.set()
+        wait_for_jobs(manager)
+        db.expire_all()
+        job = manager.get_job(db, first.id)
+        status = manager.get_status(job)
+        assert (status["status"], status["result"], status["progress_percent"]) == ("completed", {"routes": [1, 2, 3]}, 100.0)
+        assert (status["total_items"], status["completed_items"], status["failed_items"]) == (3, 2, 1)
+        assert status["failures"] == [{"item": "route 3", "error": "missing audio"}]
+        assert len(handler.calls) == 2
+
+        # Once finished, the same parameters queue a new job
+        again = manager.enqueue(db, "route_audio", {"routes": [1, 2, 3]})
+        assert again.id != first.id
+        wait_for_jobs(manager)
+        print("✅ Duplicates return the active job")
+    finally:
+        db.close()
+
+@with_scratch_database
+def test_database_rejects_duplicate_active_jobs():
+    """The unique index, not the process, decides which of two racing submissions is queued"""
+    print("Testing database-enforced deduplication...")
+    key = job_dedupe_key("route_audio", {"routes": [1], "overwrite_existing": False})
+    assert key == job_dedupe_key("route_audio", {"overwrite_existing": False, "routes": [1]})
+
+    db = TestingSessionLocal()
+    try:
+        db.add(Job(id="first", job_type="route_audio", status="running", parameters_json={}, dedupe_key=key, failures_json=[]))
+        db.commit()
+        db.add(Job(id="second", job_type="route_audio", status="queued", parameters_json={}, dedupe_key=key, failures_json=[]))
+        with pytest.raises(IntegrityError):
+            db.commit()
+        db.rollback()
+        # Finished jobs leave the index, so their key can be queued again
+        db.add(Job(id="done", job_type="route_audio", status="completed", parameters_json={}, dedupe_key=key, failures_json=[]))
+        db.commit()
+        print("✅ A second active job with the same key is rejected")
+
+        # Another process queues the job between this manager's check and its insert
+        manager = JobManager(max_workers=1)
+        handler = CountingHandler()
+        manager.register("route_audio", handler)
+        check = manager._active_job
+        checks = []
+        def racing_check(db, dedupe_key):
+            checks.append(dedupe_key)
+            return None if len(checks) == 1 else check(db, dedupe_key)
+        manager._active_job = racing_check
+        duplicate = manager.enqueue(db, "route_audio", {"overwrite_existing": False, "routes": [1]})
+        assert duplicate.id == "first" and len(checks) == 2
+        assert db.query(Job).filter(Job.status.in_(("queued", "running"))).count() == 1
+        print("✅ Losing the insert race returns the job that won it")
+
+        # Managers in separate threads, each with its own session, submit together
+        managers = [JobManager(max_workers=1) for _ in range(4)]
+        for other in managers:
+            other.register("route_audio", handler)
+        start = threading.Barrier(len(managers))
+        job_ids = []
+        def submit(other):
+            session = TestingSessionLocal()
+            try:
+                start.wait(timeout=10)
+                job_ids.append(other.enqueue(session, "route_audio", {"routes": [2]}).id)
+            finally:
+                session.close()
+        threads = [threading.Thread(target=submit, args=(other,)) for other in managers]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=20)
+        assert len(job_ids) == len(managers) and len(set(job_ids)) == 1, job_ids
+        handler.release.set()
+        for other in managers:
+            wait_for_jobs(other)
+        assert db.query(Job).filter(Job.parameters_json == {"routes": [2]}).count() == 1
+        print(f"✅ {len(managers)} concurrent submissions queued one job")
+    finally:
+        db.close()
+
+@with_scratch_database
+def test_resume_incomplete_jobs():
+    """Jobs left queued or running are run again from scratch; finished jobs are left alone"""
+    print("Testing job resume on startup...")
+    db = TestingSessionLocal()
+    try:
+        started = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        db.add_all([
+            Job(id="running", job_type="route_audio", status="running", parameters_json={"routes": [1]},
+                started_at=started, total_items=10, completed_items=4, failures_json=[]),
+            Job(id="queued", job_type="route_audio", status="queued", parameters_json={"fail": True}, failures_json=[]),
+            Job(id="done", job_type="route_audio", status="completed", parameters_json={"routes": [2]},
+                total_items=1, completed_items=1, failures_json=[], result_json={"routes": [2]})
+        ])
+        db.commit()
+
+        manager = JobManager(max_workers=1)
+        handler = CountingHandler()
+        handler.release.set()
+        manager.register("route_audio", handler)
+        assert manager.resume_incomplete() == 2
+        wait_for_jobs(manager)
+
+        db.expire_all()
+        jobs = {job.id: job for job in manager.list_jobs(db)}
+        assert sorted(handler.calls, key=str) == sorted([{"routes": [1]}, {"fail": True}], key=str)
+        assert jobs["running"].status == "completed" and jobs["running"].started_at.replace(tzinfo=timezone.utc) > started
+        assert (jobs["running"].total_items, jobs["running"].completed_items) == (3, 2)
+        assert jobs["queued"].status == "failed" and jobs["queued"].error_message == "handler failed"
+        assert jobs["done"].status == "completed" and jobs["done"].completed_items == 1
+        assert JobManager(max_workers=1).resume_incomplete() == 0
+        print("✅ Unfinished jobs resumed on startup")
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    print("=== Job Service Test ===\n")
+
+    test_enqueue_deduplicates_active_jobs()
+    test_database_rejects_duplicate_active_jobs()
+    test_resume_incomplete_jobs()
+
+    print("\n=== Test Complete ===")
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Test script for the schema migrations
+
+Applies the Alembic migrations to a scratch database and checks they build what
+the models define, that a database at the baseline revision keeps its rows
+when it is upgraded, and that active jobs are keyed for deduplication.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.config import Config
+from alembic.migration import MigrationContext
+from sqlalchemy import inspect, text
+from app.core import init_db as init_db_module
+from app.core.database import Base
+from app.core.db_engine import create_app_engine
+from app.core.init_db import ALEMBIC_INI, migrate_schema
+from app.services.job_service import job_dedupe_key
+
+def test_migrations_match_models():
+    """An empty database migrated to head has exactly the tables, columns and indexes of the models"""
+    print("Testing migrations against the models...")
+    engine = create_app_engine("sqlite://")
+    saved = init_db_module.engine
+    init_db_module.engine = engine
+    try:
+        migrate_schema()
+        # A second run finds nothing to do
+        migrate_schema()
+        with engine.connect() as connection:
+            assert compare_metadata(MigrationContext.configure(connection), Base.metadata) == []
+        print("✅ Migrated schema matches the models")
+    finally:
+        init_db_module.engine = saved
+
+def test_upgrade_from_baseline_keeps_rows():
+    """Upgrading a baseline database adds the new columns and tables without touching its rows"""
+    print("Testing upgrade from the baseline revision...")
+    engine = create_app_engine("sqlite://")
+    saved = init_db_module.engine
+    init_db_module.engine = engine
+    try:
+        config = Config(ALEMBIC_INI)
+        config.attributes["configure_logger"] = False
+        with engine.begin() as connection:
+            config.attributes["connection"] = connection
+            command.upgrade(config, "0001")
+            connection.execute(text(
+                "INSERT INTO train_routes (train_number, train_name_en, start_station_en, start_station_code, end_station_en, end_station_code) "
+                "VALUES ('12951', 'Mumbai Rajdhani', 'Mumbai Central', 'BCT', 'New Delhi', 'NDLS')"
+            ))
+        assert "source_hash" not in {column["name"] for column in inspect(engine).get_columns("audio_files")}
+
+        migrate_schema()
+
+        inspector = inspect(engine)
+        assert {"source_hash", "audio_duration"} <= {column["name"] for column in inspector.get_columns("audio_files")}
+        assert {"source_hash", "field_hashes"} <= {column["name"] for column in inspector.get_columns("train_route_translations")}
+        assert {"jobs", "numeral_clips", "translation_memo"} <= set(inspector.get_table_names())
+        with engine.connect() as connection:
+            assert connection.execute(text("SELECT train_number FROM train_routes")).scalars().all() == ["12951"]
+        print("✅ Baseline database upgraded with its rows intact")
+    finally:
+        init_db_module.engine = saved
+
+def test_upgrade_keys_active_jobs():
+    """Active jobs get a dedupe key; an older duplicate is left unkeyed so the unique index can be built"""
+    print("Testing the job dedupe key migration...")
+    engine = create_app_engine("sqlite://")
+    saved = init_db_module.engine
+    init_db_module.engine = engine
+    try:
+        config = Config(ALEMBIC_INI)
+        config.attributes["configure_logger"] = False
+        with engine.begin() as connection:
+            config.attributes["connection"] = connection
+            command.upgrade(config, "0002")
+            for job_id, status, created_at in (("a", "running", "2026-01-01"), ("b", "queued", "2026-01-02"), ("c", "completed", "2026-01-03")):
+                connection.execute(text(
+                    "INSERT INTO jobs (id, job_type, status, parameters_json, total_items, completed_items, failed_items, created_at) "
+                    "VALUES (:id, 'route_audio', :status, '{\"routes\": [1]}', 0, 0, 0, :created_at)"
+                ), {"id": job_id, "status": status, "created_at": created_at})
+
+        migrate_schema()
+
+        with engine.connect() as connection:
+            keys = dict(connection.execute(text("SELECT id, dedupe_key FROM jobs")).all())
+            index_sql = connection.execute(text("SELECT sql FROM sqlite_master WHERE name = 'uq_jobs_active_dedupe_key'")).scalar()
+        assert keys == {"a": job_dedupe_key("route_audio", {"routes": [1]}), "b": None, "c": None}, keys
+        assert "UNIQUE" in index_sql and "WHERE status IN ('queued', 'running')" in index_sql, index_sql
+        print("✅ Active jobs keyed and the partial unique index built")
+    finally:
+        init_db_module.engine = saved
+
+if __name__ == "__main__":
+    print("=== Schema Migration Test ===\n")
+
+    test_migrations_match_models()
+    test_upgrade_from_baseline_keeps_rows()
+    test_upgrade_keys_active_jobs()
+
+    print("\n=== Test Complete ===")
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Test script for MP3 frame parsing, duration, slicing and concatenation
+
+Streams are built from the silence frames in app.utils.mp3, so no audio files
+or encoder are needed.
+"""
+
+import io
+import sys
+import os
+import struct
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+from app.utils.mp3 import (
+    MPEG_1, MPEG_2, build_frame_header, build_silence_frames, parse_frame_header,
+    mp3_duration, slice_by_time, concat_clips, frame_length
+)
+
+SAMPLE_RATE = 24000
+FRAME_SECONDS = 576 / SAMPLE_RATE
+
+def duration_of(audio: bytes) -> float:
+    return mp3_duration(io.BytesIO(audio))
+
+def vbr_frame(tag: bytes, frames: int, delay: int = 0, padding: int = 0) -> bytes:
+    """A 32 kbps MPEG-2 mono frame carrying a Xing/Info (with LAME delay/padding) or VBRI header"""
+    header = build_frame_header(MPEG_2, 32, SAMPLE_RATE)
+    frame = bytearray(frame_length(MPEG_2, 32, SAMPLE_RATE))
+    frame[:4] = header
+    if tag == b"VBRI":
+        frame[36:40] = b"VBRI"
+        frame[50:54] = struct.pack(">I", frames)
+    else:
+        position = 4 + 9  # header + mono MPEG-2 side information
+        frame[position:position + 12] = tag + struct.pack(">II", 0x1, frames)
+        lame = position + 12
+        frame[lame:lame + 4] = b"LAME"
+        frame[lame + 21:lame + 24] = bytes([delay >> 4, ((delay & 0x0F) << 4) | (padding >> 8), padding & 0xFF])
+    return bytes(frame)
+
+def test_parse_frame_header():
+    """Headers built by build_frame_header parse back; invalid headers are rejected"""
+    print("Testing MP3 frame headers...")
+    header = parse_frame_header(build_frame_header(MPEG_1, 128, 44100, padding=1, mono=False))
+    assert header.version == MPEG_1 and header.bitrate_kbps == 128 and header.sample_rate == 44100
+    assert header.padding == 1 and not header.mono and not header.protected
+    assert header.frame_length == 418 and header.samples == 1152
+
+    header = parse_frame_header(build_frame_header(MPEG_2, 32, SAMPLE_RATE))
+    assert header.version == MPEG_2 and header.mono and header.frame_length == 96 and header.samples == 576
+
+    valid = struct.unpack(">I", build_frame_header(MPEG_2, 32, SAMPLE_RATE))[0]
+    assert parse_frame_header(b"\x00\x00\x00\x00") is None
+    assert parse_frame_header(build_frame_header(MPEG_2, 32, SAMPLE_RATE)[:3]) is None
+    assert parse_frame_header(struct.pack(">I", valid | (0xF << 12))) is None  # bad bitrate index
+    assert parse_frame_header(struct.pack(">I", valid | (0b11 << 10))) is None  # reserved sample rate
+    assert parse_frame_header(struct.pack(">I", valid | (0b11 << 17))) is None  # layer I
+    print("✅ Frame headers parse and reject as expected")
+
+def test_duration_from_frames():
+    """Without a VBR header the duration is the sum of frame samples, down to a single frame"""
+    print("Testing MP3 duration from frames...")
+    assert duration_of(build_silence_frames(0.02)) == pytest.approx(FRAME_SECONDS)
+    assert duration_of(build_silence_frames(1.0)) == pytest.approx(42 * FRAME_SECONDS)
+    assert duration_of(b"ID3\x03\x00\x00\x00\x00\x00\x04junk" + build_silence_frames(0.5)) == pytest.approx(21 * FRAME_SECONDS)
+    assert duration_of(b"") is None
+    assert duration_of(build_silence_frames(0.02)[:50]) is None  # truncated frame
+    print("✅ Frame-summed durations are exact")
+
+def test_duration_from_vbr_headers():
+    """Xing/Info frame counts (less LAME delay and padding) and VBRI frame counts set the duration"""
+    print("Testing MP3 duration from Xing/VBRI headers...")
+    audio = build_silence_frames(0.1)
+    assert duration_of(vbr_frame(b"Xing", 100, delay=576, padding=300) + audio) == pytest.approx((100 * 576 - 576 - 300) / SAMPLE_RATE)
+    assert duration_of(vbr_frame(b"Info", 50) + audio) == pytest.approx(50 * FRAME_SECONDS)
+    assert duration_of(vbr_frame(b"VBRI", 80) + audio) == pytest.approx(80 * FRAME_SECONDS)
+    print("✅ VBR header durations are exact")
+
+def test_slice_by_time():
+    """Spans are widened to whole frames with one lead-in frame, and a leading Xing frame is skipped"""
+    print("Testing MP3 slicing...")
+    audio = build_silence_frames(1.0)
+    clips = slice_by_time(audio, [(0.1, 0.2), (0.5, 0.9)])
+    # 0.1 s falls in frame 4, less one lead-in frame, and 0.2 s ends in frame 8; 0.5-0.9 s is frames 19-37
+    assert duration_of(clips[0]) == pytest.approx(6 * FRAME_SECONDS)
+    assert duration_of(clips[1]) == pytest.approx(19 * FRAME_SECONDS)
+    assert clips[0] == audio[3 * 96:9 * 96]
+
+    assert slice_by_time(vbr_frame(b"Info", 42) + audio, [(0.1, 0.2)]) == clips[:1]
+    with pytest.raises(ValueError):
+        slice_by_time(b"not audio", [(0.0, 1.0)])
+    print("✅ Slices land on frame boundaries")
+
+def test_concat_clips():
+    """Clips join with silence gaps and edges; VBR frames are dropped and mismatched clips refused"""
+    print("Testing MP3 concatenation...")
+    clip = build_silence_frames(0.1)  # 5 frames
+    joined = concat_clips([clip, vbr_frame(b"Xing", 5) + clip], gap_seconds=0.05, edge_seconds=FRAME_SECONDS)
+    # 1 edge + 5 + 3 gap + 5 + 1 edge frames
+    assert duration_of(joined) == pytest.approx(15 * FRAME_SECONDS)
+    assert b"Xing" not in joined
+
+    with pytest.raises(ValueError):
+        concat_clips([clip, build_silence_frames(0.1, sample_rate=44100)])
+    with pytest.raises(ValueError):
+        concat_clips([])
+    print("✅ Clips concatenate without re-encoding")
+
+if __name__ == "__main__":
+    print("=== MP3 Test ===\n")
+
+    test_parse_frame_header()
+    test_duration_from_frames()
+    test_duration_from_vbr_headers()
+    test_slice_by_time()
+    test_concat_clips()
+
+    print("\n=== Test Complete ===")
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Test script for the numeral bank
+
+Generates a small bank with the local TTS provider on a scratch database and
+checks clips record their voice, are skipped when current and regenerated when
+the voice changes, and that the API queues generation as a job.
+"""
+
+import sys
+import os
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+from app.main import app
+from app.core.config.settings import settings
+from app.core.database import Base, get_db
+from app.core.db_engine import create_app_engine
+from app.models.numeral_clip import NumeralClip
+from app.services import job_service as job_service_module
+from app.services.job_service import job_manager
+from app.services.numeral_service import numeral_service
+from app.utils.gcp_tts_client import gcp_tts_client
+
+engine = create_app_engine("sqlite://")
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def test_bank_follows_segment_voice():
+    """Bank clips carry the segment voice and are regenerated when it changes"""
+    print("Testing numeral bank voices...")
+    saved = (numeral_service.audio_base_path, numeral_service.max_value, settings.TTS_BATCH_ENABLED)
+    numeral_service.audio_base_path = tempfile.mkdtemp(prefix="wras-numerals-")
+    numeral_service.max_value = 12
+    Base.metadata.create_all(bind=engine)
+    db = TestingSessionLocal()
+    try:
+        settings.TTS_BATCH_ENABLED = False
+        result = numeral_service.generate_bank(db, ["en"])
+        assert result["clips_generated"] == 14 and not result["failed_tokens"], result
+        voices = {clip.voice_name for clip in numeral_service.get_clips(db, "en")}
+        assert voices == {gcp_tts_client.voice_name("en")}, voices
+
+        result = numeral_service.generate_bank(db, ["en"])
+        assert result["clips_generated"] == 0 and result["clips_skipped"] == 14, result
+        print(f"✅ Bank spoken with {voices.pop()} and skipped when current")
+
+        # Batching switches every path to the SSML voices, so the bank must follow
+        settings.TTS_BATCH_ENABLED = True
+        result = numeral_service.generate_bank(db, ["en"])
+        assert result["clips_generated"] == 14, result
+        voices = {clip.voice_name for clip in db.query(NumeralClip).all()}
+        assert voices == {gcp_tts_client.voice_name("en")} and "Wavenet" in voices.pop()
+        assert numeral_service.compose(db, "7", "en", unit="minutes") == [
+            numeral_service.get_clip_path("en", "7"), numeral_service.get_clip_path("en", "minutes")
+        ]
+        print("✅ Bank regenerated when the voice changed")
+    finally:
+        db.close()
+        Base.metadata.drop_all(bind=engine)
+        numeral_service.audio_base_path, numeral_service.max_value, settings.TTS_BATCH_ENABLED = saved
+
+def test_generate_endpoint_queues_a_job():
+    """POST /numerals/generate/ returns a job id at once; the job records the bank result"""
+    print("Testing queued numeral bank generation...")
+    # Worker threads open their own connections, so the job needs a database file
+    job_engine = create_app_engine(f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='wras-numeral-jobs-'), 'jobs.db')}")
+    JobSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=job_engine)
+
+    def override_get_db():
+        db = JobSessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    saved = (numeral_service.audio_base_path, numeral_service.max_value, job_service_module.SessionLocal)
+    numeral_service.audio_base_path = tempfile.mkdtemp(prefix="wras-numerals-")
+    numeral_service.max_value = 12
+    job_service_module.SessionLocal = JobSessionLocal
+    Base.metadata.create_all(bind=job_engine)
+    app.dependency_overrides[get_db] = override_get_db
+    try:
+        client = TestClient(app)
+        response = client.post("/api/v1/numerals/generate/", json={"languages": ["en"]})
+        assert response.status_code == 202, response.text
+        job_id = response.json()["job_id"]
+        assert response.json()["job_type"] == "numeral_bank"
+
+        # Drain the worker pool; the next submission starts a fresh one
+        job_manager._executor.shutdown(wait=True)
+        job_manager._executor = None
+        status = client.get(f"/api/v1/jobs/{job_id}").json()
+        assert status["status"] == "completed", status
+        assert (status["total_items"], status["completed_items"], status["failed_items"]) == (14, 14, 0)
+        assert status["result"]["clips_generated"] == 14 and status["result"]["summary"] == {"en": 14}
+        print(f"✅ Job {job_id} generated {status['result']['clips_generated']} clips")
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        Base.metadata.drop_all(bind=job_engine)
+        job_engine.dispose()
+        numeral_service.audio_base_path, numeral_service.max_value, job_service_module.SessionLocal = saved
+
+if __name__ == "__main__":
+    print("=== Numeral Bank Test ===\n")
+
+    test_bank_follows_segment_voice()
+    test_generate_endpoint_queues_a_job()
+
+    print("\n=== Test Complete ===")
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Test script for number words
+
+Checks the word tables against known readings in every language, and that the
+vectorised column readers agree with the single-value functions.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+from app.utils.numerals import (
+    LANGUAGES, NUMBER_WORDS, cardinal_words, digit_words, number_words, number_words_table
+)
+
+# (value, en, hi, mr, gu)
+CARDINALS = [
+    ("0", "zero", "शून्य", "शून्य", "શૂન્ય"),
+    ("7", "seven", "सात", "सात", "સાત"),
+    ("45", "forty five", "पैंतालीस", "पंचेचाळीस", "પિસ્તાલીસ"),
+    ("99", "ninety nine", "निन्यानबे", "नव्व्याण्णव", "નવ્વાણું"),
+    ("100", "one hundred", "एक सौ", "शंभर", "એક સો"),
+    ("205", "two hundred five", "दो सौ पाँच", "दोनशे पाच", "બે સો પાંચ"),
+    ("1100", "one thousand one hundred", "एक हज़ार एक सौ", "एक हजार एकशे", "એક હજાર એક સો"),
+    ("12000", "twelve thousand", "बारह हज़ार", "बारा हजार", "બાર હજાર"),
+]
+
+def test_word_tables():
+    """Every language has a distinct word for each number below 100"""
+    print("Testing number word tables...")
+    for language_code in LANGUAGES:
+        words = NUMBER_WORDS[language_code]
+        assert len(words) == 100 and len(set(words)) == 100, language_code
+    assert NUMBER_WORDS["en"][21] == "twenty one" and NUMBER_WORDS["en"][90] == "ninety"
+    print(f"✅ 100 words in each of {', '.join(LANGUAGES)}")
+
+def test_cardinal_words():
+    """Cardinals match known readings, and values above MAX_CARDINAL are read digit by digit"""
+    print("Testing cardinal readings...")
+    for value, *expected in CARDINALS:
+        for language_code, words in zip(["en", "hi", "mr", "gu"], expected):
+            assert cardinal_words(value, language_code) == words, (value, language_code)
+    assert cardinal_words(" 012 ", "en") == "twelve"
+    assert cardinal_words("123456", "en") == digit_words("123456", "en")
+    print(f"✅ {len(CARDINALS)} cardinals read in every language")
+
+def test_digit_words():
+    """Train numbers are read digit by digit"""
+    print("Testing digit readings...")
+    assert digit_words("12951", "en") == "one two nine five one"
+    assert digit_words("12951", "hi") == "एक दो नौ पाँच एक"
+    assert digit_words("09", "mr") == "शून्य नऊ"
+    assert digit_words("30", "gu") == "ત્રણ શૂન્ય"
+    assert number_words("45", "en", mode="digits") == "four five"
+    assert number_words("45", "en", mode="cardinal") == "forty five"
+    for value, language_code, mode in [("4a", "en", "digits"), ("-1", "en", "cardinal"), ("١٢", "en", "digits"), ("12", "ta", "digits"), ("12", "en", "ordinal")]:
+        with pytest.raises(ValueError):
+            number_words(value, language_code, mode)
+    print("✅ Digits read one by one, invalid input rejected")
+
+def test_number_words_table():
+    """The column readers agree with the single-value functions and mark invalid values None"""
+    print("Testing number word tables for many values...")
+    values = ["12951", "12951", "0042", "1234", "abc", ""]
+    table = number_words_table(values, mode="digits", length=5)
+    assert set(table) == set(LANGUAGES)
+    assert table["hi"] == {"12951": digit_words("12951", "hi"), "0042": None, "1234": None, "abc": None, "": None}
+
+    values = ["0", "45", "999", "1000", "123456", "x"]
+    table = number_words_table(values, mode="cardinal")
+    for language_code in LANGUAGES:
+        for value in values[:-1]:
+            assert table[language_code][value] == cardinal_words(value, language_code), (value, language_code)
+        assert table[language_code]["x"] is None
+    with pytest.raises(ValueError):
+        number_words_table(values, mode="ordinal")
+    print("✅ Column readers match single values")
+
+if __name__ == "__main__":
+    print("=== Numerals Test ===\n")
+
+    test_word_tables()
+    test_cardinal_words()
+    test_digit_words()
+    test_number_words_table()
+
+    print("\n=== Test Complete ===")
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Test script guarding listing endpoints against N+1 queries
+
+Each endpoint is called against a scratch database (TEST_DATABASE_URL, in-memory
+SQLite by default) holding a few templates and then many more; the number of
+SQL statements must stay the same. The X-DB-* debug headers must report the
+same statements.
+"""
+
+import sys
+import os
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+from app.main import app
+from app.core.config.settings import settings
+from app.core.database import Base, get_db
+from app.core.query_stats import install_query_stats
+from app.core.db_engine import create_app_engine
+from app.models.announcement_category import AnnouncementCategory
+from app.models.announcement_template import AnnouncementTemplate
+from app.models.announcement_audio_file import AnnouncementAudioFile
+from app.utils.query_counter import count_queries, assert_max_queries
+
+engine = create_app_engine(os.environ.get("TEST_DATABASE_URL", "sqlite://"))
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def override_get_db():
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+def seed_templates(count: int) -> int:
+    """Replace the scratch data with one category of count templates, every other one with audio"""
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    db = TestingSessionLocal()
+    try:
+        category = AnnouncementCategory(category_code="arriving", description="Train arrival announcements")
+        db.add(category)
+        db.flush()
+        for number in range(count):
+            template = AnnouncementTemplate(category_id=category.id, language_code="en", template_text=f"Template {number}")
+            db.add(template)
+            db.flush()
+            if number % 2 == 0:
+                db.add(AnnouncementAudioFile(template_id=template.id, language_code="en", audio_file_path=f"/tmp/{number}.mp3"))
+        db.commit()
+        return category.id
+    finally:
+        db.close()
+
+def statements_for(client: TestClient, path: str) -> int:
+    with count_queries(engine) as queries:
+        response = client.get(path)
+    assert response.status_code == 200, response.text
+    return queries.count
+
+def test_template_listing_query_count():
+    """Listing templates runs one query, however many templates there are"""
+    print("Testing /announcements/templates/ query count...")
+    app.dependency_overrides[get_db] = override_get_db
+    try:
+        client = TestClient(app)
+
+        counts = []
+        for template_count in (4, 40):
+            seed_templates(template_count)
+            counts.append(statements_for(client, "/api/v1/announcements/templates/"))
+            print(f"{template_count} templates → {counts[-1]} queries")
+        assert counts[0] == counts[1], f"Query count grows with templates: {counts}"
+
+        with assert_max_queries(1, engine):
+            response = client.get("/api/v1/announcements/templates/")
+        templates = response.json()["templates"]
+        assert [template["has_audio"] for template in templates[:4]] == [True, False, True, False]
+        print("✅ Template listing runs a single query")
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+
+def test_category_template_listing_query_count():
+    """Listing a category's templates runs two queries: the category and its templates"""
+    print("Testing /announcements/templates/{category_id} query count...")
+    app.dependency_overrides[get_db] = override_get_db
+    try:
+        client = TestClient(app)
+
+        counts = []
+        for template_count in (4, 40):
+            category_id = seed_templates(template_count)
+            counts.append(statements_for(client, f"/api/v1/announcements/templates/{category_id}"))
+            print(f"{template_count} templates → {counts[-1]} queries")
+        assert counts[0] == counts[1], f"Query count grows with templates: {counts}"
+
+        with assert_max_queries(2, engine):
+            client.get(f"/api/v1/announcements/templates/{category_id}")
+        print("✅ Category template listing runs two queries")
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+
+def test_query_stats_headers():
+    """The X-DB-* headers of a debug response describe the statements the request ran"""
+    print("Testing X-DB-* query statistics headers...")
+    app.dependency_overrides[get_db] = override_get_db
+    saved = (settings.DEBUG, settings.SLOW_QUERY_THRESHOLD_MS, settings.SLOW_QUERY_LOG_FILE)
+    log_directory = tempfile.mkdtemp(prefix="wras-slow-log-")
+    remove_stats = install_query_stats(engine)
+    try:
+        client = TestClient(app)
+        category_id = seed_templates(4)
+        path = f"/api/v1/announcements/templates/{category_id}"
+
+        settings.DEBUG = False
+        assert not any(name.startswith("x-db-") for name in client.get(path).headers)
+        print("✅ No headers outside debug mode")
+
+        settings.DEBUG = True
+        settings.SLOW_QUERY_THRESHOLD_MS = 0.0
+        settings.SLOW_QUERY_LOG_FILE = os.path.join(log_directory, "slow.log")
+        with count_queries(engine) as queries:
+            response = client.get(path)
+        assert response.status_code == 200, response.text
+        assert response.headers["X-DB-Query-Count"] == str(queries.count) == "2"
+
+        slowest = [float(value) for value in response.headers["X-DB-Slowest-Ms"].split(", ")]
+        assert len(slowest) == 2 and slowest == sorted(slowest, reverse=True)
+        assert float(response.headers["X-DB-Time-Ms"]) >= slowest[0]
+        # The statement is cut to 200 characters for the header
+        slowest_statement = response.headers["X-DB-Slowest-Statement"].removesuffix("...")
+        assert any(statement.startswith(slowest_statement) for statement in queries.statements)
+        print(f"✅ Headers report {queries.count} statements in {response.headers['X-DB-Time-Ms']} ms")
+
+        with open(settings.SLOW_QUERY_LOG_FILE, encoding="utf-8") as f:
+            logged = [line for line in f if f"[GET {path}]" in line]
+        assert len(logged) == 2
+        print("✅ Statements over the threshold are written to the slow-query log")
+    finally:
+        remove_stats()
+        settings.DEBUG, settings.SLOW_QUERY_THRESHOLD_MS, settings.SLOW_QUERY_LOG_FILE = saved
+        app.dependency_overrides.pop(get_db, None)
+
+if __name__ == "__main__":
+    print("=== Query Count Test ===\n")
+
+    test_template_listing_query_count()
+    test_category_template_listing_query_count()
+    test_query_stats_headers()
+
+    print("\n=== Test Complete ===")
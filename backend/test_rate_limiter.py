@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Test script for the TTS rate limiter
+
+Checks the token buckets hand out reservations at their rate, delay oversized
+requests instead of rejecting them, and that the combined limiter waits for the
+tighter of its two limits.
+"""
+
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+from app.utils.rate_limiter import TokenBucket, SynthesisRateLimiter
+
+def test_token_bucket_reservations():
+    """Reservations beyond the capacity wait one token interval each"""
+    print("Testing token bucket reservations...")
+    bucket = TokenBucket(rate=10, capacity=2)
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+    # An oversized request waits for a full bucket and leaves it in debt
+    bucket = TokenBucket(rate=10, capacity=2)
+    assert bucket.reserve(5) == 0.0
+    assert bucket.reserve() == pytest.approx(0.4, abs=0.01)
+
+    # Idle time refills the bucket, but never beyond its capacity
+    bucket = TokenBucket(rate=100, capacity=1)
+    bucket.reserve()
+    time.sleep(0.05)
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.01, abs=0.005)
+
+    assert TokenBucket(rate=0, capacity=1).reserve(100) == 0.0
+    print("✅ Reservations wait their turn")
+
+def test_token_bucket_acquire_blocks():
+    """acquire sleeps for the reserved wait"""
+    print("Testing token bucket acquire...")
+    bucket = TokenBucket(rate=20, capacity=1)
+    started = time.monotonic()
+    for _ in range(3):
+        bucket.acquire()
+    assert time.monotonic() - started == pytest.approx(0.1, abs=0.05)
+    print("✅ acquire paces callers")
+
+def test_synthesis_limiter_uses_tighter_limit():
+    """The combined limiter waits for whichever of requests and characters runs out first"""
+    print("Testing synthesis rate limiter...")
+    limiter = SynthesisRateLimiter(requests_per_second=100, characters_per_minute=600)
+    assert limiter.reserve(600) == 0.0
+    # 60 characters refill at 10 per second, long before the request bucket matters
+    assert limiter.reserve(60) == pytest.approx(6.0, abs=0.05)
+
+    limiter = SynthesisRateLimiter(requests_per_second=2, characters_per_minute=60000)
+    assert limiter.reserve(10) == 0.0 and limiter.reserve(10) == 0.0
+    assert limiter.reserve(10) == pytest.approx(0.5, abs=0.02)
+
+    stats = limiter.get_stats()
+    assert (stats["total_requests"], stats["total_characters"]) == (3, 30)
+    assert stats["total_wait_seconds"] == pytest.approx(0.5, abs=0.02)
+    print("✅ Tighter limit wins")
+
+if __name__ == "__main__":
+    print("=== Rate Limiter Test ===\n")
+
+    test_token_bucket_reservations()
+    test_token_bucket_acquire_blocks()
+    test_synthesis_limiter_uses_tighter_limit()
+
+    print("\n=== Test Complete ===")
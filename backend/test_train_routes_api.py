@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Test script for the train route API on the configured test database
+
+Runs against TEST_DATABASE_URL (an in-memory SQLite database by default), so
+run_test_matrix.py can repeat it on PostgreSQL. The database's tables are
+dropped and recreated: never point TEST_DATABASE_URL at real data.
+"""
+
+import sys
+import os
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+from app.main import app
+from app.core.config.settings import settings
+from app.core.database import Base, get_db
+from app.core.db_engine import create_app_engine
+from app.services.route_search_service import route_search_service
+
+engine = create_app_engine(os.environ.get("TEST_DATABASE_URL", "sqlite://"))
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+settings.IMPORT_SPOOL_DIR = tempfile.mkdtemp(prefix="wras-import-")
+
+def override_get_db():
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+def route(number: int, name: str, start: tuple, end: tuple) -> dict:
+    return {
+        "train_number": str(number),
+        "train_name_en": name,
+        "start_station_en": start[0],
+        "start_station_code": start[1],
+        "end_station_en": end[0],
+        "end_station_code": end[1]
+    }
+
+ROUTES = [
+    route(12951, "Mumbai Rajdhani Express", ("Mumbai Central", "BCT"), ("New Delhi", "NDLS")),
+    route(12009, "Shatabdi Express", ("Mumbai Central", "BCT"), ("Ahmedabad Junction", "ADI")),
+    route(19015, "Saurashtra Express", ("Dadar", "DDR"), ("Porbandar", "PBR")),
+    route(12267, "Duronto Express", ("Mumbai Central", "BCT"), ("Hapa", "HAPA")),
+    route(22953, "Gujarat Superfast Express", ("Mumbai Central", "BCT"), ("Ahmedabad Junction", "ADI")),
+    route(12833, "Howrah Express", ("Ahmedabad Junction", "ADI"), ("Howrah Junction", "HWH")),
+    route(11301, "Udyan Express", ("Mumbai CST", "CSMT"), ("Bengaluru", "SBC"))
+]
+
+def reset_database():
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    route_search_service.install(engine)
+
+def test_train_routes_api():
+    """Create, page, search, import and delete routes through the API"""
+    print(f"Testing train route API on {engine.dialect.name}...")
+    app.dependency_overrides[get_db] = override_get_db
+    try:
+        reset_database()
+        client = TestClient(app)
+
+        for data in ROUTES:
+            response = client.post("/api/v1/train-routes/", json=data)
+            assert response.status_code == 200, response.text
+        print(f"✅ Created {len(ROUTES)} routes")
+
+        # Walk forward three routes at a time, then back
+        pages = []
+        response = client.get("/api/v1/train-routes/", params={"limit": 3}).json()
+        assert response["total"] == len(ROUTES) and response["total_pages"] == 3
+        pages.append(response)
+        while response["next_cursor"]:
+            response = client.get("/api/v1/train-routes/", params={"limit": 3, "cursor": response["next_cursor"]}).json()
+            pages.append(response)
+        numbers = [r["train_number"] for page in pages for r in page["routes"]]
+        assert numbers == [r["train_number"] for r in reversed(ROUTES)], numbers
+        previous = client.get("/api/v1/train-routes/", params={"limit": 3, "cursor": pages[-1]["prev_cursor"]}).json()
+        assert [r["id"] for r in previous["routes"]] == [r["id"] for r in pages[-2]["routes"]]
+        assert client.get("/api/v1/train-routes/", params={"cursor": "not-a-cursor"}).status_code == 400
+        print(f"✅ Paged through {len(pages)} pages in both directions")
+
+        results = client.get("/api/v1/train-routes/search/", params={"query": "rajdhani"}).json()
+        assert results and results[0]["train_number"] == "12951", results
+        results = client.get("/api/v1/train-routes/search/", params={"query": "ahmedabad"}).json()
+        assert {r["train_number"] for r in results} == {"12009", "22953", "12833"}, results
+        print("✅ Search finds routes by name and station")
+
+        csv = (
+            "Train Number,Train Name,Start Station,Start Station Code,End Station,End Station Code\n"
+            "12951,Mumbai Rajdhani Express,Mumbai Central,MMCT,New Delhi,NDLS\n"
+            "12953,August Kranti Rajdhani,Mumbai Central,MMCT,Hazrat Nizamuddin,NZM\n"
+        )
+        response = client.post(
+            "/api/v1/train-routes/import/",
+            params={"mode": "upsert"},
+            files={"file": ("routes.csv", csv.encode("utf-8"), "text/csv")}
+        )
+        assert response.status_code == 200, response.text
+        report = response.json()
+        assert report["imported_count"] == 1 and report["updated_count"] == 1, report
+        assert client.get("/api/v1/train-routes/").json()["total"] == len(ROUTES) + 1
+        print("✅ Upsert import added one route and updated another")
+
+        route_id = client.get("/api/v1/train-routes/", params={"limit": 1}).json()["routes"][0]["id"]
+        assert client.delete(f"/api/v1/train-routes/{route_id}").status_code == 200
+        assert client.get(f"/api/v1/train-routes/{route_id}").status_code == 404
+        assert client.get("/api/v1/train-routes/").json()["total"] == len(ROUTES)
+        print("✅ Deleted a route")
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+
+def test_chunked_import_keeps_existing_routes_in_skip_mode():
+    """A stored train number repeated across chunks of a skip-mode import is never overwritten"""
+    print(f"Testing chunked skip-mode import on {engine.dialect.name}...")
+    app.dependency_overrides[get_db] = override_get_db
+    chunk_rows = settings.IMPORT_CHUNK_ROWS
+    settings.IMPORT_CHUNK_ROWS = 2
+    try:
+        reset_database()
+        client = TestClient(app)
+        assert client.post("/api/v1/train-routes/", json=ROUTES[0]).status_code == 200
+
+        # 12951 exists already and appears in the first and third chunks; 12953 is new and repeated
+        csv = (
+            "Train Number,Train Name,Start Station,Start Station Code,End Station,End Station Code\n"
+            "12951,Renamed Rajdhani,Mumbai Central,MMCT,New Delhi,NDLS\n"
+            "12953,August Kranti Rajdhani,Mumbai Central,MMCT,Hazrat Nizamuddin,NZM\n"
+            "12009,Shatabdi Express,Mumbai Central,BCT,Ahmedabad Junction,ADI\n"
+            "12953,August Kranti Rajdhani Express,Mumbai Central,MMCT,Hazrat Nizamuddin,NZM\n"
+            "12951,Renamed Again Rajdhani,Mumbai Central,MMCT,New Delhi,NDLS\n"
+        )
+        response = client.post("/api/v1/train-routes/import/", files={"file": ("routes.csv", csv.encode("utf-8"), "text/csv")})
+        assert response.status_code == 200, response.text
+        report = response.json()
+        assert (report["imported_count"], report["updated_count"], report["skipped_count"]) == (2, 1, 2), report
+
+        names = {route["train_number"]: route["train_name_en"] for route in client.get("/api/v1/train-routes/").json()["routes"]}
+        assert names == {
+            "12951": "Mumbai Rajdhani Express",
+            "12953": "August Kranti Rajdhani Express",
+            "12009": "Shatabdi Express"
+        }, names
+        print("✅ Existing route kept; a route new to the import takes its last row")
+    finally:
+        settings.IMPORT_CHUNK_ROWS = chunk_rows
+        app.dependency_overrides.pop(get_db, None)
+
+if __name__ == "__main__":
+    print("=== Train Route API Test ===\n")
+
+    test_train_routes_api()
+    test_chunked_import_keeps_existing_routes_in_skip_mode()
+
+    print("\n=== Test Complete ===")
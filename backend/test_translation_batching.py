@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Test script for batched translation requests
+
+Uses the local provider with a small per-request cap and records every request,
+checking texts over the cap are split into several requests and each result is
+mapped back to the text and route field it was translated from.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy.orm import sessionmaker
+from app.core.config.settings import settings
+from app.core.database import Base
+from app.core.db_engine import create_app_engine
+from app.models.train_route import TrainRoute
+from app.models.train_route_translation import TrainRouteTranslation
+from app.services import translation_service
+from app.utils import translation_memo as translation_memo_module
+from app.utils.gcp_client import gcp_client
+from app.utils.translation_memo import translation_memo
+from app.utils.transliteration import transliterator
+
+engine = create_app_engine("sqlite://")
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+STATIONS = ["Mumbai Central", "New Delhi", "Ahmedabad Junction", "Dadar", "Porbandar", "Hapa", "Howrah Junction", "Bengaluru"]
+
+class RecordingProvider:
+    """Records the batches sent to the local provider's translate_many"""
+
+    def __init__(self):
+        self.translate_many = gcp_client.provider.translate_many
+        self.batches = []
+
+    def __enter__(self):
+        def recording_translate_many(texts, source_language, target_language):
+            self.batches.append((target_language, list(texts)))
+            return self.translate_many(texts, source_language, target_language)
+        gcp_client.provider.translate_many = recording_translate_many
+        return self
+
+    def __exit__(self, *exc_info):
+        del gcp_client.provider.translate_many
+
+def test_batches_respect_the_request_caps():
+    """More texts than fit in one request are split by segment count and by characters"""
+    print("Testing batch splitting...")
+    saved = (translation_memo_module.SessionLocal, settings.TRANSLATION_BATCH_MAX_SEGMENTS, settings.TRANSLATION_BATCH_MAX_CHARACTERS)
+    translation_memo_module.SessionLocal = TestingSessionLocal
+    Base.metadata.create_all(bind=engine)
+    try:
+        translation_memo.clear()
+        settings.TRANSLATION_BATCH_MAX_SEGMENTS = 3
+        texts = STATIONS + ["Dadar", "Mumbai Central"]
+        with RecordingProvider() as provider:
+            translated = gcp_client.translate_batch(texts, "en", "hi")
+        # Duplicates are sent once: eight stations in requests of three
+        assert [len(batch) for _, batch in provider.batches] == [3, 3, 2]
+        assert sorted(text for _, batch in provider.batches for text in batch) == sorted(STATIONS)
+        assert translated == [f"[hi] {text}" for text in texts]
+        print(f"✅ {len(texts)} texts sent in {len(provider.batches)} requests of at most 3, results in input order")
+
+        translation_memo.clear()
+        settings.TRANSLATION_BATCH_MAX_SEGMENTS = 128
+        settings.TRANSLATION_BATCH_MAX_CHARACTERS = 30
+        with RecordingProvider() as provider:
+            translations, errors, requests = gcp_client.translate_pairs({("en", "mr"): STATIONS, ("en", "gu"): STATIONS[:2]})
+        assert not errors and requests == len(provider.batches)
+        for _, batch in provider.batches:
+            assert sum(len(text) for text in batch) <= 30 or len(batch) == 1, batch
+        assert translations[("en", "mr")] == {text: f"[mr] {text}" for text in STATIONS}
+        assert translations[("en", "gu")] == {text: f"[gu] {text}" for text in STATIONS[:2]}
+        print(f"✅ Character cap respected across {requests} requests for two language pairs")
+    finally:
+        translation_memo.clear()
+        Base.metadata.drop_all(bind=engine)
+        translation_memo_module.SessionLocal, settings.TRANSLATION_BATCH_MAX_SEGMENTS, settings.TRANSLATION_BATCH_MAX_CHARACTERS = saved
+
+def test_route_fields_map_back_from_split_batches():
+    """translate_train_route batches a route's fields per language and stores each result in its own field"""
+    print("Testing translate_train_route batching...")
+    saved = (translation_memo_module.SessionLocal, transliterator.enabled, settings.TRANSLATION_BATCH_MAX_SEGMENTS)
+    translation_memo_module.SessionLocal = TestingSessionLocal
+    transliterator.enabled = False  # names go through the translation API
+    settings.TRANSLATION_BATCH_MAX_SEGMENTS = 2
+    Base.metadata.create_all(bind=engine)
+    db = TestingSessionLocal()
+    try:
+        translation_memo.clear()
+        route = TrainRoute(
+            train_number="12951", train_name_en="Mumbai Rajdhani Express",
+            start_station_en="Mumbai Central", start_station_code="BCT",
+            end_station_en="New Delhi", end_station_code="NDLS"
+        )
+        db.add(route)
+        db.commit()
+
+        with RecordingProvider() as provider:
+            translations = translation_service.translate_train_route(db, route.id)
+        # Three fields for each of hi, mr and gu, two per request
+        assert sorted((language, len(batch)) for language, batch in provider.batches) == [
+            ("gu", 1), ("gu", 2), ("hi", 1), ("hi", 2), ("mr", 1), ("mr", 2)
+        ]
+        for language in ("hi", "mr", "gu"):
+            row = db.query(TrainRouteTranslation).filter(
+                TrainRouteTranslation.train_route_id == route.id,
+                TrainRouteTranslation.language_code == language
+            ).one()
+            assert row.train_name == translations[language]["train_name"] == f"[{language}] Mumbai Rajdhani Express"
+            assert row.start_station_name == f"[{language}] Mumbai Central"
+            assert row.end_station_name == f"[{language}] New Delhi"
+        print("✅ Each field gets its own translation back from split requests")
+    finally:
+        db.close()
+        translation_memo.clear()
+        Base.metadata.drop_all(bind=engine)
+        translation_memo_module.SessionLocal, transliterator.enabled, settings.TRANSLATION_BATCH_MAX_SEGMENTS = saved
+
+if __name__ == "__main__":
+    print("=== Translation Batching Test ===\n")
+
+    test_batches_respect_the_request_caps()
+    test_route_fields_map_back_from_split_batches()
+
+    print("\n=== Test Complete ===")
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Test script for the translation memo
+
+Runs the memo against a scratch database and checks entries are only served to
+the provider that produced them, from both the in-process LRU and the table.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy.orm import sessionmaker
+from app.core.database import Base
+from app.core.db_engine import create_app_engine
+from app.utils import translation_memo as translation_memo_module
+from app.utils.translation_memo import TranslationMemoCache
+
+engine = create_app_engine("sqlite://")
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def test_memo_is_keyed_by_provider():
+    """A pseudo-translation from the local provider is never returned to a gcp lookup"""
+    print("Testing translation memo provider keys...")
+    saved = translation_memo_module.SessionLocal
+    translation_memo_module.SessionLocal = TestingSessionLocal
+    Base.metadata.create_all(bind=engine)
+    try:
+        memo = TranslationMemoCache(max_entries=100)
+        memo.put("Mumbai Central", "en", "hi", "[hi] Mumbai Central", "local")
+        memo.put_many({"New Delhi": "[hi] New Delhi"}, "en", "hi", "local")
+
+        assert memo.get("Mumbai Central", "en", "hi", "local") == "[hi] Mumbai Central"
+        assert memo.get("Mumbai Central", "en", "hi", "gcp") is None
+        assert memo.get_many(["Mumbai Central", "New Delhi"], "en", "hi", "gcp") == {}
+        print("✅ Local entries are not served to gcp from memory")
+
+        memo.put("Mumbai Central", "en", "hi", "मुंबई सेंट्रल", "gcp")
+        memo.put_many({"New Delhi": "नई दिल्ली"}, "en", "hi", "gcp")
+
+        # A fresh cache has an empty LRU, so these come from the table
+        fresh = TranslationMemoCache(max_entries=100)
+        assert fresh.get("Mumbai Central", "en", "hi", "gcp") == "मुंबई सेंट्रल"
+        assert fresh.get_many(["Mumbai Central", "New Delhi"], "en", "hi", "gcp") == {
+            "Mumbai Central": "मुंबई सेंट्रल", "New Delhi": "नई दिल्ली"
+        }
+        assert fresh.get_many(["Mumbai Central", "New Delhi"], "en", "hi", "local") == {
+            "Mumbai Central": "[hi] Mumbai Central", "New Delhi": "[hi] New Delhi"
+        }
+        assert fresh.get("Mumbai Central", "en", "mr", "gcp") is None
+        print("✅ Each provider gets its own entries from the table")
+    finally:
+        translation_memo_module.SessionLocal = saved
+        Base.metadata.drop_all(bind=engine)
+
+if __name__ == "__main__":
+    print("=== Translation Memo Test ===\n")
+
+    test_memo_is_keyed_by_provider()
+
+    print("\n=== Test Complete ===")
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Test script for offline name transliteration
+
+Known station names are spelled from the curated table, other names are spelled
+by the phonetic rules, and nothing here reaches the translation API.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.utils.transliteration import IndicTransliterator
+
+transliterator = IndicTransliterator()
+
+# (name, Hindi, Marathi, Gujarati)
+KNOWN_STATIONS = [
+    ("Rampur", "रामपुर", "रामपुर", "રામપુર"),
+    ("Ghatkopar", "घाटकोपर", "घाटकोपर", "ઘાટકોપર"),
+    ("Kanyakumari", "कन्याकुमारी", "कन्याकुमारी", "કન્યાકુમારી"),
+    ("Bilaspur", "बिलासपुर", "बिलासपुर", "બિલાસપુર"),
+    ("Mumbai Central", "मुंबई सेंट्रल", "मुंबई सेंट्रल", "મુંબઈ સેંટ્રલ"),
+    ("New Delhi", "नई दिल्ली", "नवी दिल्ली", "નવી દિલ્હી"),
+    ("Hazrat Nizamuddin", "हज़रत निज़ामुद्दीन", "हज़रत निज़ामुद्दीन", "હજરત નિજામુદ્દીન"),
+    ("Ahmedabad Jn", "अहमदाबाद जंक्शन", "अहमदाबाद जंक्शन", "અમદાવાદ જંક્શન"),
+    ("Pune", "पुणे", "पुणे", "પુણે"),
+    ("Thane", "ठाणे", "ठाणे", "ઠાણે"),
+    ("Agra Cantt", "आगरा कैंट", "आगरा कैंट", "આગરા કૈંટ"),
+    ("Jammu Tawi", "जम्मू तवी", "जम्मू तवी", "જમ્મૂ તવી"),
+    ("Mumbai CSMT", "मुंबई सीएसएमटी", "मुंबई सीएसएमटी", "મુંબઈ સીએસએમટી"),
+    ("Lokmanya Tilak Terminus", "लोकमान्य तिलक टर्मिनस", "लोकमान्य तिलक टर्मिनस", "લોકમાન્ય તિલક ટર્મિનસ"),
+]
+
+# Names the rules spell without a curated entry: (name, Hindi, Gujarati)
+RULE_SPELLED = [
+    ("Kurla", "कुर्ला", "કુર્લા"),
+    ("Karjat", "कर्जत", "કર્જત"),
+    ("Khopoli", "खोपोली", "ખોપોલી"),
+    ("Neral", "नेरल", "નેરલ"),
+    ("Roha", "रोहा", "રોહા"),
+    ("Shri Mata Vaishno Devi Katra", "श्री माता वैश्नो देवी कटरा", "શ્રી માતા વૈશ્નો દેવી કટરા"),
+]
+
+def test_known_stations():
+    """Every known station is spelled from the curated table in each language"""
+    print("Testing known station names...")
+    for name, *expected in KNOWN_STATIONS:
+        for language_code, spelling in zip(["hi", "mr", "gu"], expected):
+            assert transliterator.transliterate(name, language_code) == spelling, (name, language_code)
+    assert transliterator.transliterate("RAMPUR", "hi") == "रामपुर"
+    print(f"✅ {len(KNOWN_STATIONS)} stations spelled in hi, mr and gu")
+
+def test_rules_spell_other_names():
+    """Names outside the table are spelled offline by the phonetic rules"""
+    print("Testing rule-based spellings...")
+    for name, hindi, gujarati in RULE_SPELLED:
+        assert transliterator.transliterate(name, "hi") == hindi, name
+        assert transliterator.transliterate(name, "gu") == gujarati, name
+
+    # Only non-Latin text and unsupported languages are left to the translation API
+    assert transliterator.transliterate("मुंबई", "hi") is None
+    assert transliterator.transliterate("Kurla", "ta") is None
+    assert not IndicTransliterator(enabled=False).supports("en", "hi")
+    print(f"✅ {len(RULE_SPELLED)} names spelled by the rules")
+
+if __name__ == "__main__":
+    print("=== Transliteration Test ===\n")
+
+    test_known_stations()
+    test_rules_spell_other_names()
+
+    print("\n=== Test Complete ===")
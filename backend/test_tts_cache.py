@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Test script for the TTS cache
+
+Stores entries in a scratch directory and checks hits are hardlinked into place,
+the least recently used entries are evicted by size, and the LRU order is
+rebuilt from file modification times after a restart, from files named by key.
+"""
+
+import sys
+import os
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.utils.tts_cache import TTSCache
+
+def key_for(text: str) -> str:
+    return TTSCache.make_key(text, "hi-IN-Chirp3-HD-Kore", "hi-IN", "MP3", 24000)
+
+def test_store_and_fetch():
+    """A stored entry is hardlinked to every output path and counted as a hit"""
+    print("Testing TTS cache store and fetch...")
+    directory = tempfile.mkdtemp(prefix="wras-tts-cache-")
+    cache = TTSCache(os.path.join(directory, "cache"), max_bytes=1000)
+    key = key_for("नमस्ते")
+    assert key != key_for("नमस्कार") and len(key) == 64
+
+    first = os.path.join(directory, "out", "first.mp3")
+    second = os.path.join(directory, "out", "second.mp3")
+    assert not cache.contains(key)
+    assert not cache.fetch(key, first)
+    assert cache.store(key, b"a" * 100, first)
+    assert cache.contains(key)
+    assert cache.fetch(key, second)
+    entry = os.path.join(cache.cache_dir, key[:2], f"{key}.mp3")
+    assert os.stat(first).st_ino == os.stat(second).st_ino == os.stat(entry).st_ino
+    assert cache.read(key) == b"a" * 100
+
+    # An existing output file is replaced by the link
+    stale = os.path.join(directory, "out", "stale.mp3")
+    with open(stale, "wb") as f:
+        f.write(b"stale")
+    assert cache.fetch(key, stale)
+    assert os.stat(stale).st_ino == os.stat(entry).st_ino
+
+    stats = cache.get_stats()
+    assert (stats["entries"], stats["size_bytes"], stats["hits"], stats["misses"]) == (1, 100, 3, 1), stats
+    assert not TTSCache(cache.cache_dir, 1000, enabled=False).fetch(key, second)
+    print("✅ Hits are hardlinked from the cache")
+
+def test_lru_eviction():
+    """The cache stays within max_bytes by dropping the least recently used entries"""
+    print("Testing TTS cache eviction...")
+    directory = tempfile.mkdtemp(prefix="wras-tts-cache-")
+    cache = TTSCache(os.path.join(directory, "cache"), max_bytes=250)
+    output = os.path.join(directory, "out.mp3")
+    keys = [key_for(text) for text in ("one", "two", "three")]
+
+    cache.store(keys[0], b"1" * 100, output)
+    cache.store(keys[1], b"2" * 100, output)
+    assert cache.fetch(keys[0], output)  # "one" is now the most recently used
+    cache.store(keys[2], b"3" * 100, output)
+
+    assert cache.contains(keys[0]) and not cache.contains(keys[1]) and cache.contains(keys[2])
+    stats = cache.get_stats()
+    assert (stats["entries"], stats["size_bytes"], stats["evictions"]) == (2, 200, 1), stats
+    assert not os.path.exists(os.path.join(cache.cache_dir, keys[1][:2], f"{keys[1]}.mp3"))
+    print("✅ Least recently used entry evicted")
+
+def test_index_rebuilt_from_mtimes():
+    """A new instance orders existing entries by modification time and evicts the oldest"""
+    print("Testing TTS cache index rebuild...")
+    directory = tempfile.mkdtemp(prefix="wras-tts-cache-")
+    cache_dir = os.path.join(directory, "cache")
+    cache = TTSCache(cache_dir, max_bytes=1000)
+    output = os.path.join(directory, "out.mp3")
+    keys = [key_for(text) for text in ("one", "two", "three")]
+    for index, key in enumerate(keys):
+        cache.store(key, b"x" * 100, output)
+        path = os.path.join(cache_dir, key[:2], f"{key}.mp3")
+        os.utime(path, (1000 + index, 1000 + [2, 0, 1][index]))  # "two" is the oldest
+
+    restarted = TTSCache(cache_dir, max_bytes=250)
+    assert restarted.get_stats()["entries"] == 2
+    assert restarted.contains(keys[0]) and not restarted.contains(keys[1]) and restarted.contains(keys[2])
+
+    # A file the caller wrote is indexed and bounded too
+    tracked = os.path.join(cache_dir, "rendered.mp3")
+    with open(tracked, "wb") as f:
+        f.write(b"r" * 100)
+    restarted.track("rendered", tracked)
+    assert restarted.read("rendered") == b"r" * 100
+    assert not restarted.contains(keys[2]) and restarted.get_stats()["size_bytes"] == 200
+    assert restarted.clear() == 2 and not os.path.exists(tracked)
+    print("✅ LRU order survives restarts")
+
+def test_index_skips_files_not_named_by_key():
+    """Files in the directory that are not named after a cache key are neither indexed nor evicted"""
+    print("Testing TTS cache index filtering...")
+    directory = tempfile.mkdtemp(prefix="wras-tts-cache-")
+    cache_dir = os.path.join(directory, "cache")
+    cache = TTSCache(cache_dir, max_bytes=1000)
+    key = key_for("one")
+    cache.store(key, b"x" * 100, os.path.join(directory, "out.mp3"))
+    others = [os.path.join(cache_dir, "en", "arriving_0123456789abcdef.mp3"), os.path.join(cache_dir, "tmp1a2b3c.tmp")]
+    for path in others:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(b"o" * 500)
+
+    restarted = TTSCache(cache_dir, max_bytes=150)
+    stats = restarted.get_stats()
+    assert (stats["entries"], stats["size_bytes"], stats["evictions"]) == (1, 100, 0)
+    assert restarted.contains(key) and all(os.path.exists(path) for path in others)
+    print("✅ Only files named by a key are indexed")
+
+if __name__ == "__main__":
+    print("=== TTS Cache Test ===\n")
+
+    test_store_and_fetch()
+    test_lru_eviction()
+    test_index_rebuilt_from_mtimes()
+    test_index_skips_files_not_named_by_key()
+
+    print("\n=== Test Complete ===")
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Test script for the synthesis executor
+
+Runs the executor against a recording client, so no provider is called, and
+checks results keep job order, failures stay isolated and batched jobs
+synthesize each distinct text once per language.
+"""
+
+import sys
+import os
+import threading
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.utils.tts_executor import SynthesisExecutor
+
+class RecordingClient:
+    """Stands in for GCPTTSClient: durations are text lengths, "boom" raises"""
+
+    def __init__(self, batch_size: int = 2):
+        self.batch_size = batch_size
+        self.single_calls = []
+        self.batch_calls = []
+        self._lock = threading.Lock()
+
+    def generate_audio(self, text, language_code, output_path):
+        with self._lock:
+            self.single_calls.append((text, language_code, output_path))
+        if text == "boom":
+            raise RuntimeError("provider error")
+        return float(len(text))
+
+    def split_batches(self, texts):
+        return [texts[index:index + self.batch_size] for index in range(0, len(texts), self.batch_size)]
+
+    def generate_audio_batch(self, items, language_code):
+        with self._lock:
+            self.batch_calls.append((language_code, items))
+        if any(text == "boom" for text, _ in items):
+            raise RuntimeError("provider error")
+        return [float(len(text)) for text, _ in items]
+
+def test_generate_many():
+    """Durations come back in job order, with None only for the job that raised"""
+    print("Testing concurrent synthesis...")
+    client = RecordingClient()
+    executor = SynthesisExecutor(client, max_workers=4)
+    try:
+        jobs = [("one", "en", "/tmp/1.mp3"), ("boom", "en", "/tmp/2.mp3"), ("three", "hi", "/tmp/3.mp3")]
+        assert executor.generate_many(jobs) == [3.0, None, 5.0]
+        assert sorted(client.single_calls) == sorted(jobs)
+        print("✅ Results in job order, failures isolated")
+    finally:
+        executor.shutdown()
+
+def test_generate_batched_dedups_texts():
+    """Identical texts in a language are synthesized once and written to every path"""
+    print("Testing batched synthesis...")
+    client = RecordingClient(batch_size=2)
+    executor = SynthesisExecutor(client, max_workers=4)
+    try:
+        jobs = [
+            ("1", "en", "a.mp3"), ("22", "en", "b.mp3"), ("1", "en", "c.mp3"),
+            ("1", "hi", "d.mp3"), ("333", "en", "e.mp3"), ("boom", "hi", "f.mp3")
+        ]
+        assert executor.generate_batched(jobs) == [1.0, 2.0, 1.0, None, 3.0, None]
+
+        batches = sorted(client.batch_calls)
+        assert batches == [
+            ("en", [("1", ["a.mp3", "c.mp3"]), ("22", ["b.mp3"])]),
+            ("en", [("333", ["e.mp3"])]),
+            ("hi", [("1", ["d.mp3"]), ("boom", ["f.mp3"])])
+        ], batches
+        assert not client.single_calls
+        print("✅ Each text synthesized once per language")
+    finally:
+        executor.shutdown()
+
+if __name__ == "__main__":
+    print("=== Synthesis Executor Test ===\n")
+
+    test_generate_many()
+    test_generate_batched_dedups_texts()
+
+    print("\n=== Test Complete ===")
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Test script checking every synthesis path uses the same voice
+
+Batched and single-clip synthesis must pick the same voice for a language, and
+a route clip's source hash must change when the voice does.
+"""
+
+import sys
+import os
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.core.config.settings import settings
+from app.utils.gcp_tts_client import gcp_tts_client
+from app.services.audio_service import AudioService
+
+def test_voice_follows_batch_setting():
+    """Single and batched clips share a voice, and switching batching changes the clip hash"""
+    print("Testing synthesis voices...")
+    original = settings.TTS_BATCH_ENABLED
+    try:
+        settings.TTS_BATCH_ENABLED = False
+        single_voice = gcp_tts_client.voice_name("hi")
+        single_hash = AudioService._clip_hash("hi", "मुंबई सेंट्रल")
+        assert "Chirp3-HD" in single_voice, single_voice
+
+        settings.TTS_BATCH_ENABLED = True
+        batch_voice = gcp_tts_client.voice_name("hi")
+        assert "Wavenet" in batch_voice, batch_voice
+        assert AudioService._clip_hash("hi", "मुंबई सेंट्रल") != single_hash
+
+        # A clip cached by the batched path is served to a single request for the same text
+        directory = tempfile.mkdtemp(prefix="wras-voice-")
+        batch_path = os.path.join(directory, "batch.mp3")
+        single_path = os.path.join(directory, "single.mp3")
+        assert gcp_tts_client.generate_audio_batch([("नमस्ते", [batch_path])], "hi")[0]
+        assert gcp_tts_client.is_cached("नमस्ते", "hi") == gcp_tts_client.cache.enabled
+        assert gcp_tts_client.generate_audio("नमस्ते", "hi", single_path)
+
+        settings.TTS_BATCH_ENABLED = False
+        assert gcp_tts_client.voice_name("hi") == single_voice
+        assert gcp_tts_client.generate_audio_batch([("नमस्ते", [batch_path])], "hi") == [None]
+        print(f"✅ Voices: {single_voice} without batching, {batch_voice} with")
+    finally:
+        settings.TTS_BATCH_ENABLED = original
+
+if __name__ == "__main__":
+    print("=== TTS Voice Test ===\n")
+
+    test_voice_follows_batch_setting()
+
+    print("\n=== Test Complete ===")
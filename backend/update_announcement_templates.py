@@ -3,18 +3,21 @@
 Script to update announcement templates with multilingual versions
 """
 
-import sqlite3
-import json
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.core.database import SessionLocal
+from app.models.announcement_category import AnnouncementCategory
+from app.models.announcement_template import AnnouncementTemplate
+from app.services.announcement_service import announcement_service
 
 def update_announcement_templates():
     """Update announcement templates with multilingual versions"""
     print("🚀 Updating Announcement Templates with Multilingual Versions...")
     print("=" * 60)
     
-    # Connect to database
-    db_path = "wras_dhh.db"
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
+    db = SessionLocal()
     
     try:
         # Multilingual templates data
@@ -52,41 +55,24 @@ def update_announcement_templates():
             print(f"\n📝 Processing category: {category_code}")
             
             # Get category ID
-            cursor.execute("SELECT id FROM announcement_categories WHERE category_code = ?", (category_code,))
-            category_result = cursor.fetchone()
+            category = db.query(AnnouncementCategory).filter(AnnouncementCategory.category_code == category_code).first()
             
-            if not category_result:
+            if not category:
                 print(f"❌ Category '{category_code}' not found!")
                 continue
                 
-            category_id = category_result[0]
+            category_id = category.id
             
             for language_code, template_text in languages.items():
-                # Check if template already exists
-                cursor.execute(
-                    "SELECT id FROM announcement_templates WHERE category_id = ? AND language_code = ?",
-                    (category_id, language_code)
-                )
-                existing_template = cursor.fetchone()
-                
-                if existing_template:
-                    # Update existing template
-                    cursor.execute(
-                        "UPDATE announcement_templates SET template_text = ? WHERE id = ?",
-                        (template_text, existing_template[0])
-                    )
-                    templates_updated += 1
-                    print(f"   ✅ Updated {language_code} template")
-                else:
-                    # Insert new template
-                    cursor.execute(
-                        "INSERT INTO announcement_templates (category_id, language_code, template_text) VALUES (?, ?, ?)",
-                        (category_id, language_code, template_text)
-                    )
+                # Update the template, or create it if it does not exist
+                if announcement_service.upsert_template(db, category_id, language_code, template_text):
                     templates_created += 1
                     print(f"   ✅ Created {language_code} template")
+                else:
+                    templates_updated += 1
+                    print(f"   ✅ Updated {language_code} template")
         
-        conn.commit()
+        db.commit()
         
         print("\n" + "=" * 60)
         print(f"✅ Templates Update Complete!")
@@ -96,23 +82,20 @@ def update_announcement_templates():
         
         # Show summary of all templates
         print("\n📋 Current Templates Summary:")
-        cursor.execute("""
-            SELECT ac.category_code, at.language_code, at.template_text 
-            FROM announcement_templates at 
-            JOIN announcement_categories ac ON at.category_id = ac.id 
-            ORDER BY ac.id, at.language_code
-        """)
+        templates = db.query(
+            AnnouncementCategory.category_code, AnnouncementTemplate.language_code, AnnouncementTemplate.template_text
+        ).join(AnnouncementTemplate, AnnouncementTemplate.category_id == AnnouncementCategory.id).order_by(
+            AnnouncementCategory.id, AnnouncementTemplate.language_code
+        ).all()
         
-        templates = cursor.fetchall()
-        for template in templates:
-            category_code, language_code, template_text = template
+        for category_code, language_code, template_text in templates:
             print(f"   {category_code} ({language_code}): {template_text[:50]}...")
         
     except Exception as e:
-        conn.rollback()
+        db.rollback()
         print(f"❌ Error: {str(e)}")
     finally:
-        conn.close()
+        db.close()
     
     print("\n" + "=" * 60)
     print("✅ Announcement Templates Update Completed!")
@@ -3,77 +3,61 @@
 Script to update Hindi template for Delay category
 """
 
-import sqlite3
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.core.database import SessionLocal
+from app.models.announcement_category import AnnouncementCategory
+from app.models.announcement_template import AnnouncementTemplate
+from app.services.announcement_service import announcement_service
 
 def update_delay_hindi():
     """Update Hindi template for Delay category"""
     print("🚀 Updating Hindi Template for Delay Category...")
     print("=" * 50)
     
-    # Connect to database
-    db_path = "wras_dhh.db"
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
+    db = SessionLocal()
     
     try:
         # Get Delay category ID
-        cursor.execute("SELECT id FROM announcement_categories WHERE category_code = 'delay'")
-        category_result = cursor.fetchone()
+        category = db.query(AnnouncementCategory).filter(AnnouncementCategory.category_code == 'delay').first()
         
-        if not category_result:
+        if not category:
             print("❌ Delay category not found!")
             return
             
-        category_id = category_result[0]
+        category_id = category.id
         print(f"✅ Found Delay category (ID: {category_id})")
         
         # Updated Hindi template for Delay
         hindi_template = "कृपया ध्यान दें! ट्रेन संख्या {train_number} {train_name} {start_station} से {end_station} देर से चल रही है। हमें असुविधा के लिए खेद है।"
         
-        # Check if Hindi template exists
-        cursor.execute(
-            "SELECT id FROM announcement_templates WHERE category_id = ? AND language_code = 'hi'",
-            (category_id,)
-        )
-        existing_template = cursor.fetchone()
-        
-        if existing_template:
-            # Update existing template
-            cursor.execute(
-                "UPDATE announcement_templates SET template_text = ? WHERE id = ?",
-                (hindi_template, existing_template[0])
-            )
-            print("   ✅ Updated Hindi template")
-        else:
-            # Insert new template
-            cursor.execute(
-                "INSERT INTO announcement_templates (category_id, language_code, template_text) VALUES (?, 'hi', ?)",
-                (category_id, hindi_template)
-            )
+        # Update the Hindi template, or create it if it does not exist
+        if announcement_service.upsert_template(db, category_id, 'hi', hindi_template):
             print("   ✅ Created Hindi template")
+        else:
+            print("   ✅ Updated Hindi template")
         
-        conn.commit()
+        db.commit()
         
         print("\n" + "=" * 50)
         print("✅ Hindi Template Update Complete!")
         
         # Show updated Hindi template
         print("\n📋 Updated Hindi Template:")
-        cursor.execute("""
-            SELECT template_text 
-            FROM announcement_templates 
-            WHERE category_id = ? AND language_code = 'hi'
-        """, (category_id,))
-        
-        template = cursor.fetchone()
+        template = db.query(AnnouncementTemplate).filter(
+            AnnouncementTemplate.category_id == category_id,
+            AnnouncementTemplate.language_code == 'hi'
+        ).first()
         if template:
-            print(f"   Hindi: {template[0]}")
+            print(f"   Hindi: {template.template_text}")
         
     except Exception as e:
-        conn.rollback()
+        db.rollback()
         print(f"❌ Error: {str(e)}")
     finally:
-        conn.close()
+        db.close()
     
     print("\n" + "=" * 50)
     print("✅ Hindi Template Update Completed!")
@@ -3,28 +3,31 @@
 Script to update Delay category templates with corrected versions
 """
 
-import sqlite3
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.core.database import SessionLocal
+from app.models.announcement_category import AnnouncementCategory
+from app.models.announcement_template import AnnouncementTemplate
+from app.services.announcement_service import announcement_service
 
 def update_delay_templates():
     """Update Delay category templates with corrected versions"""
     print("🚀 Updating Delay Category Templates...")
     print("=" * 50)
     
-    # Connect to database
-    db_path = "wras_dhh.db"
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
+    db = SessionLocal()
     
     try:
         # Get Delay category ID
-        cursor.execute("SELECT id FROM announcement_categories WHERE category_code = 'delay'")
-        category_result = cursor.fetchone()
+        category = db.query(AnnouncementCategory).filter(AnnouncementCategory.category_code == 'delay').first()
         
-        if not category_result:
+        if not category:
             print("❌ Delay category not found!")
             return
             
-        category_id = category_result[0]
+        category_id = category.id
         print(f"✅ Found Delay category (ID: {category_id})")
         
         # Updated Delay templates
@@ -38,31 +41,14 @@ def update_delay_templates():
         templates_updated = 0
         
         for language_code, template_text in delay_templates.items():
-            # Check if template exists
-            cursor.execute(
-                "SELECT id FROM announcement_templates WHERE category_id = ? AND language_code = ?",
-                (category_id, language_code)
-            )
-            existing_template = cursor.fetchone()
-            
-            if existing_template:
-                # Update existing template
-                cursor.execute(
-                    "UPDATE announcement_templates SET template_text = ? WHERE id = ?",
-                    (template_text, existing_template[0])
-                )
-                templates_updated += 1
-                print(f"   ✅ Updated {language_code} template")
-            else:
-                # Insert new template
-                cursor.execute(
-                    "INSERT INTO announcement_templates (category_id, language_code, template_text) VALUES (?, ?, ?)",
-                    (category_id, language_code, template_text)
-                )
-                templates_updated += 1
+            # Update the template, or create it if it does not exist
+            if announcement_service.upsert_template(db, category_id, language_code, template_text):
                 print(f"   ✅ Created {language_code} template")
+            else:
+                print(f"   ✅ Updated {language_code} template")
+            templates_updated += 1
         
-        conn.commit()
+        db.commit()
         
         print("\n" + "=" * 50)
         print(f"✅ Delay Templates Update Complete!")
@@ -70,23 +56,18 @@ def update_delay_templates():
         
         # Show updated Delay templates
         print("\n📋 Updated Delay Templates:")
-        cursor.execute("""
-            SELECT language_code, template_text 
-            FROM announcement_templates 
-            WHERE category_id = ? 
-            ORDER BY language_code
-        """, (category_id,))
+        templates = db.query(AnnouncementTemplate).filter(
+            AnnouncementTemplate.category_id == category_id
+        ).order_by(AnnouncementTemplate.language_code).all()
         
-        templates = cursor.fetchall()
         for template in templates:
-            language_code, template_text = template
-            print(f"   {language_code}: {template_text[:80]}...")
+            print(f"   {template.language_code}: {template.template_text[:80]}...")
         
     except Exception as e:
-        conn.rollback()
+        db.rollback()
         print(f"❌ Error: {str(e)}")
     finally:
-        conn.close()
+        db.close()
     
     print("\n" + "=" * 50)
     print("✅ Delay Templates Update Completed!")
@@ -1723,11 +1723,17 @@ const AIDatabase: React.FC = () => {
                     return order[a.segment_name as keyof typeof order] - order[b.segment_name as keyof typeof order];
                   });
                   
-                  sortedSegments.forEach((segment, index) => {
-                    setTimeout(() => {
-                      playAudioSegment(segment.audio_file_path);
-                    }, index * 1000); // 1 second delay between segments
-                  });
+                  // Start each segment when the previous one ends so there are no gaps or overlaps
+                  const playFrom = (index: number) => {
+                    if (index >= sortedSegments.length) return;
+                    const audio = new Audio(`http://localhost:5001/ai-audio-translations${sortedSegments[index].audio_file_path}`);
+                    audio.onended = () => playFrom(index + 1);
+                    audio.play().catch(error => {
+                      console.error('Error playing audio segment:', error);
+                      showToast('error', 'Failed to play audio segment');
+                    });
+                  };
+                  playFrom(0);
                 }}
                 className="w-full px-4 py-2 bg-purple-600 text-white rounded-lg hover:bg-purple-700 transition-colors text-sm font-medium flex items-center justify-center space-x-2"
               >
@@ -1,6 +1,7 @@
 import React, { useState, useEffect } from 'react';
 import { Megaphone, Languages, Volume2, ArrowLeft, Search, RefreshCw, Edit, Play } from 'lucide-react';
 import { useToast } from './ToastContainer';
+import { waitForJob, formatEta } from '../utils/jobs';
 
 interface AnnouncementCategory {
   id: number;
@@ -218,7 +219,19 @@ const AnnouncementTemplates: React.FC = () => {
       });
 
       if (response.ok) {
-        const result = await response.json();
+        const job = await response.json();
+
+        // Segment generation runs as a background job; poll it for progress
+        const finished = await waitForJob(job.status_url, status => {
+          setAudioProgress(prev => ({
+            ...prev,
+            totalCategories: status.total_items || prev.totalCategories,
+            generatedCategories: status.completed_items,
+            failedCategories: status.failed_items,
+            currentStep: `Generating audio segments... ${status.progress_percent}%${formatEta(status)}`
+          }));
+        });
+        const result = finished.result;
         setAudioProgress(prev => ({
           ...prev,
           generatedCategories: result.total_categories,
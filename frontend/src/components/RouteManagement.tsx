@@ -3,6 +3,7 @@ import { Plus, Edit, Trash2, Search, Languages, Volume2 } from 'lucide-react';
 import RouteModal from './RouteModal';
 import ImportModal from './ImportModal';
 import { useToast } from './ToastContainer';
+import { waitForJob, formatEta } from '../utils/jobs';
 
 interface Route {
   id: number;
@@ -53,6 +54,9 @@ const RouteManagement: React.FC = () => {
   const [currentPage, setCurrentPage] = useState(1);
   const [totalPages, setTotalPages] = useState(1);
   const [totalRecords, setTotalRecords] = useState(0);
+  const [pageCursor, setPageCursor] = useState<string | null>(null);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [prevCursor, setPrevCursor] = useState<string | null>(null);
   const [isRefreshing, setIsRefreshing] = useState(false);
   const recordsPerPage = 7;
 
@@ -203,8 +207,9 @@ const RouteManagement: React.FC = () => {
       });
       
       if (response.ok) {
+        const result = await response.json();
         await fetchRoutes();
-        showToast('success', 'Routes imported successfully!');
+        showToast(result.error_count ? 'warning' : 'success', result.message || 'Routes imported successfully!');
       } else {
         const errorData = await response.json();
         showToast('error', `Import failed: ${errorData.detail || 'Unknown error'}`);
@@ -218,15 +223,20 @@ const RouteManagement: React.FC = () => {
     fetchRoutes(1);
   }, []);
 
-  const fetchRoutes = async (page: number = 1) => {
+  const fetchRoutes = async (page: number = 1, cursor: string | null = null) => {
     try {
       setIsRefreshing(true);
-      const response = await fetch(`http://localhost:5001/api/v1/train-routes/?page=${page}&limit=${recordsPerPage}`);
+      // Pages are keyset cursors from the previous response, so deep pages load as fast as the first
+      const cursorParam = cursor ? `&cursor=${encodeURIComponent(cursor)}` : '';
+      const response = await fetch(`http://localhost:5001/api/v1/train-routes/?limit=${recordsPerPage}${cursorParam}`);
       if (response.ok) {
         const data = await response.json();
         setRoutes(data.routes || data);
         setTotalPages(data.total_pages || 1);
         setTotalRecords(data.total || data.length || 0);
+        setPageCursor(cursor);
+        setNextCursor(data.next_cursor || null);
+        setPrevCursor(data.prev_cursor || null);
         setCurrentPage(page);
         
         // Check AI statuses after fetching routes
@@ -310,7 +320,7 @@ const RouteManagement: React.FC = () => {
   };
 
   const handleRefreshRoutes = async () => {
-    await fetchRoutes(currentPage);
+    await fetchRoutes(currentPage, pageCursor);
     await checkRouteStatuses();
   };
 
@@ -372,7 +382,19 @@ const RouteManagement: React.FC = () => {
       });
       
       if (response.ok) {
-        const result = await response.json();
+        const job = await response.json();
+        
+        // Translation runs as a background job; poll it for progress
+        const finished = await waitForJob(job.status_url, status => {
+          setTranslationProgress({
+            isTranslating: true,
+            currentStep: `Translating routes... ${status.progress_percent}%${formatEta(status)}`,
+            totalRoutes: status.total_items,
+            translatedRoutes: status.completed_items,
+            failedRoutes: status.failed_items
+          });
+        });
+        const result = finished.result;
         
         // Update final progress
         setTranslationProgress({
@@ -405,16 +427,17 @@ const RouteManagement: React.FC = () => {
         }, 3000);
       }
     } catch (error) {
+      const errorMessage = error instanceof Error ? error.message : 'Network error';
       setTranslationProgress({
         isTranslating: false,
-        currentStep: 'Translation failed: Network error',
+        currentStep: `Translation failed: ${errorMessage}`,
         totalRoutes: 0,
         translatedRoutes: 0,
         failedRoutes: 0
       });
       
       setTimeout(() => {
-        showToast('error', 'Translation failed: Network error');
+        showToast('error', `Translation failed: ${errorMessage}`);
         setIsTranslationModalOpen(false);
       }, 3000);
     }
@@ -448,7 +471,19 @@ const RouteManagement: React.FC = () => {
       });
 
       if (response.ok) {
-        const result = await response.json();
+        const job = await response.json();
+        
+        // Audio generation runs as a background job; poll it for progress
+        const finished = await waitForJob(job.status_url, status => {
+          setAudioProgress(prev => ({
+            ...prev,
+            totalRoutes: status.total_items,
+            generatedRoutes: status.completed_items,
+            failedRoutes: status.failed_items,
+            currentStep: `Generating audio... ${status.progress_percent}%${formatEta(status)}`
+          }));
+        });
+        const result = finished.result;
         
         setAudioProgress(prev => ({ 
           ...prev, 
@@ -735,10 +770,10 @@ const RouteManagement: React.FC = () => {
             {totalPages > 1 && (
               <div className="flex items-center space-x-2">
               <button
-                onClick={() => fetchRoutes(currentPage - 1)}
-                disabled={currentPage === 1}
+                onClick={() => fetchRoutes(currentPage - 1, prevCursor)}
+                disabled={!prevCursor}
                 className={`px-3 py-1 text-sm rounded border ${
-                  currentPage === 1
+                  !prevCursor
                     ? 'text-gray-400 border-gray-200 cursor-not-allowed'
                     : 'text-gray-700 border-gray-300 hover:bg-gray-50'
                 }`}
@@ -746,38 +781,15 @@ const RouteManagement: React.FC = () => {
                 Previous
               </button>
               
-              {Array.from({ length: Math.min(5, totalPages) }, (_, i) => {
-                let pageNum;
-                if (totalPages <= 5) {
-                  pageNum = i + 1;
-                } else if (currentPage <= 3) {
-                  pageNum = i + 1;
-                } else if (currentPage >= totalPages - 2) {
-                  pageNum = totalPages - 4 + i;
-                } else {
-                  pageNum = currentPage - 2 + i;
-                }
-                
-                return (
-                  <button
-                    key={pageNum}
-                    onClick={() => fetchRoutes(pageNum)}
-                    className={`px-3 py-1 text-sm rounded border ${
-                      currentPage === pageNum
-                        ? 'bg-blue-600 text-white border-blue-600'
-                        : 'text-gray-700 border-gray-300 hover:bg-gray-50'
-                    }`}
-                  >
-                    {pageNum}
-                  </button>
-                );
-              })}
+              <span className="px-3 py-1 text-sm text-gray-700">
+                Page {currentPage} of {totalPages}
+              </span>
               
               <button
-                onClick={() => fetchRoutes(currentPage + 1)}
-                disabled={currentPage === totalPages}
+                onClick={() => fetchRoutes(currentPage + 1, nextCursor)}
+                disabled={!nextCursor}
                 className={`px-3 py-1 text-sm rounded border ${
-                  currentPage === totalPages
+                  !nextCursor
                     ? 'text-gray-400 border-gray-200 cursor-not-allowed'
                     : 'text-gray-700 border-gray-300 hover:bg-gray-50'
                 }`}
@@ -34,12 +34,15 @@ const TrainSearch: React.FC = () => {
   const [isModalOpen, setIsModalOpen] = useState(false);
   const [allRoutes, setAllRoutes] = useState<Train[]>([]);
   const [selectedRoutes, setSelectedRoutes] = useState<number[]>([]);
+  const [selectedRouteData, setSelectedRouteData] = useState<{ [key: number]: Train }>({});
   const [isLoadingRoutes, setIsLoadingRoutes] = useState(false);
   
   // Pagination state
   const [currentPage, setCurrentPage] = useState(1);
   const [routesPerPage] = useState(5);
   const [totalRoutes, setTotalRoutes] = useState(0);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [prevCursor, setPrevCursor] = useState<string | null>(null);
 
   const handleSearch = async () => {
     console.log('handleSearch called with query:', searchQuery);
@@ -103,14 +106,18 @@ const TrainSearch: React.FC = () => {
     }
   };
 
-  const fetchAllRoutes = async (page: number = 1) => {
+  const fetchAllRoutes = async (page: number = 1, cursor: string | null = null) => {
     setIsLoadingRoutes(true);
     try {
-      const response = await fetch(`http://localhost:5001/api/v1/train-routes/?skip=${(page - 1) * routesPerPage}&limit=${routesPerPage}`);
+      // Pages are keyset cursors from the previous response, so deep pages load as fast as the first
+      const cursorParam = cursor ? `&cursor=${encodeURIComponent(cursor)}` : '';
+      const response = await fetch(`http://localhost:5001/api/v1/train-routes/?limit=${routesPerPage}${cursorParam}`);
       if (response.ok) {
         const data = await response.json();
         setAllRoutes(data.routes || []);
         setTotalRoutes(data.total || 0);
+        setNextCursor(data.next_cursor || null);
+        setPrevCursor(data.prev_cursor || null);
         setCurrentPage(page);
       } else {
         console.error('Failed to fetch routes');
@@ -134,58 +141,51 @@ const TrainSearch: React.FC = () => {
         ? prev.filter(id => id !== routeId)
         : [...prev, routeId]
     );
+    // Keep the selected route itself, since its page may not be loaded when the selection is applied
+    const route = allRoutes.find(r => r.id === routeId);
+    if (route) {
+      setSelectedRouteData(prev => ({ ...prev, [routeId]: route }));
+    }
   };
 
   const handleApplySelection = () => {
-    // Get all selected routes from all pages by fetching them individually
-    const fetchSelectedRoutes = async () => {
-      const selectedTrainData: Train[] = [];
-      
-      // Group selected route IDs by page to minimize API calls
-      const routeIds = [...selectedRoutes];
-      
-      // Fetch all selected routes in batches
-      for (let i = 0; i < routeIds.length; i += routesPerPage) {
-        const batch = routeIds.slice(i, i + routesPerPage);
-        try {
-          const response = await fetch(`http://localhost:5001/api/v1/train-routes/?limit=1000`);
-          if (response.ok) {
-            const data = await response.json();
-            const allRoutesData = data.routes || [];
-            const batchRoutes = allRoutesData.filter((route: Train) => batch.includes(route.id));
-            selectedTrainData.push(...batchRoutes);
-          }
-        } catch (error) {
-          console.error('Error fetching selected routes:', error);
-        }
-      }
-      
-      setSearchResults(selectedTrainData);
-      
-      // Initialize platform and category values for selected routes
-      const newPlatformValues: { [key: number]: string } = {};
-      const newCategoryValues: { [key: number]: number } = {};
-      selectedTrainData.forEach((train: Train) => {
-        newPlatformValues[train.id] = platformValues[train.id] || "1";
-        newCategoryValues[train.id] = categoryValues[train.id] || (announcementCategories.length > 0 ? announcementCategories[0].id : 0);
-      });
-      setPlatformValues(newPlatformValues);
-      setCategoryValues(newCategoryValues);
-      
-      setIsModalOpen(false);
-      setSelectedRoutes([]);
-    };
+    const selectedTrainData: Train[] = selectedRoutes
+      .map(id => selectedRouteData[id])
+      .filter((route): route is Train => Boolean(route));
+    
+    setSearchResults(selectedTrainData);
+    
+    // Initialize platform and category values for selected routes
+    const newPlatformValues: { [key: number]: string } = {};
+    const newCategoryValues: { [key: number]: number } = {};
+    selectedTrainData.forEach((train: Train) => {
+      newPlatformValues[train.id] = platformValues[train.id] || "1";
+      newCategoryValues[train.id] = categoryValues[train.id] || (announcementCategories.length > 0 ? announcementCategories[0].id : 0);
+    });
+    setPlatformValues(newPlatformValues);
+    setCategoryValues(newCategoryValues);
     
-    fetchSelectedRoutes();
+    setIsModalOpen(false);
+    setSelectedRoutes([]);
+    setSelectedRouteData({});
   };
 
   const handleCloseModal = () => {
     setIsModalOpen(false);
     setSelectedRoutes([]);
+    setSelectedRouteData({});
   };
 
-  const handlePageChange = (page: number) => {
-    fetchAllRoutes(page);
+  const handleNextPage = () => {
+    if (nextCursor) {
+      fetchAllRoutes(currentPage + 1, nextCursor);
+    }
+  };
+
+  const handlePreviousPage = () => {
+    if (prevCursor) {
+      fetchAllRoutes(currentPage - 1, prevCursor);
+    }
   };
 
   const totalPages = Math.ceil(totalRoutes / routesPerPage);
@@ -382,31 +382,18 @@ const TrainSearch: React.FC = () => {
                 </div>
                 <div className="flex items-center space-x-1">
                   <button
-                    onClick={() => handlePageChange(currentPage - 1)}
-                    disabled={currentPage === 1}
+                    onClick={handlePreviousPage}
+                    disabled={!prevCursor}
                     className="px-2 py-1 text-xs text-gray-600 bg-gray-200 rounded hover:bg-gray-300 disabled:opacity-50 disabled:cursor-not-allowed"
                   >
                     Previous
                   </button>
-                  {Array.from({ length: Math.min(5, totalPages) }, (_, i) => {
-                    const page = i + 1;
-                    return (
-                      <button
-                        key={page}
-                        onClick={() => handlePageChange(page)}
-                        className={`px-2 py-1 text-xs rounded ${
-                          currentPage === page
-                            ? 'bg-blue-600 text-white'
-                            : 'text-gray-600 bg-gray-200 hover:bg-gray-300'
-                        }`}
-                      >
-                        {page}
-                      </button>
-                    );
-                  })}
+                  <span className="px-2 py-1 text-xs text-gray-600">
+                    Page {currentPage} of {totalPages}
+                  </span>
                   <button
-                    onClick={() => handlePageChange(currentPage + 1)}
-                    disabled={currentPage === totalPages}
+                    onClick={handleNextPage}
+                    disabled={!nextCursor}
                     className="px-2 py-1 text-xs text-gray-600 bg-gray-200 rounded hover:bg-gray-300 disabled:opacity-50 disabled:cursor-not-allowed"
                   >
                     Next
@@ -0,0 +1,51 @@
+export interface JobStatus {
+  job_id: string;
+  job_type: string;
+  status: 'queued' | 'running' | 'completed' | 'failed';
+  total_items: number;
+  completed_items: number;
+  failed_items: number;
+  progress_percent: number;
+  items_per_second: number | null;
+  eta_seconds: number | null;
+  failures: { item: string; error: string }[];
+  result: any;
+  error_message: string | null;
+}
+
+const API_ORIGIN = 'http://localhost:5001';
+
+// Poll a bulk job until it finishes, reporting each status update
+export const waitForJob = async (
+  statusUrl: string,
+  onProgress?: (status: JobStatus) => void,
+  intervalMs: number = 1000
+): Promise<JobStatus> => {
+  while (true) {
+    const response = await fetch(`${API_ORIGIN}${statusUrl}`);
+    if (!response.ok) {
+      const errorData = await response.json().catch(() => ({}));
+      throw new Error(errorData.detail || 'Failed to fetch job status');
+    }
+
+    const status: JobStatus = await response.json();
+    onProgress?.(status);
+
+    if (status.status === 'completed') {
+      return status;
+    }
+    if (status.status === 'failed') {
+      throw new Error(status.error_message || 'Job failed');
+    }
+
+    await new Promise(resolve => setTimeout(resolve, intervalMs));
+  }
+};
+
+export const formatEta = (status: JobStatus): string => {
+  if (status.eta_seconds === null || status.status !== 'running') {
+    return '';
+  }
+  const seconds = Math.round(status.eta_seconds);
+  return seconds >= 60 ? ` (about ${Math.ceil(seconds / 60)} min left)` : ` (about ${seconds}s left)`;
+};